@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+"""
+Arc throughput of svgpath2mpl. None of the packaged glyphs use arc commands,
+so this builds a parametric plasmid-like glyph path made of elliptical arcs
+and times building its Matplotlib path, as drawing the glyph does, for the
+same parameters each time and for a different width each time.
+"""
+
+import timeit
+import parasbolv as psv
+from parasbolv.svgpath2mpl import parse_path
+
+REPEATS = 2000
+
+plasmid = psv.ParametricPath('M{-width/2},0 A{width/2},{height/2} 0 0,1 {width/2},0 '
+                             'A{width/2},{height/2} 0 0,1 {-width/2},0 '
+                             'M{-width/2+3},0 a{width/2-3},{height/2-3} 0 1,0 {width-6},0 '
+                             'a{width/2-3},{height/2-3} 0 1,0 {-width+6},0 '
+                             'M0,{-height/2} A{width/4},{height/4} 30 0,1 {width/4},{height/4} z')
+n_arcs = plasmid.text.count('A') + plasmid.text.count('a')
+
+def same_parameters():
+    for _ in range(REPEATS):
+        plasmid.to_path({'width': 40.0, 'height': 30.0})
+
+def varying_parameters():
+    for i in range(REPEATS):
+        plasmid.to_path({'width': 40.0 + i * 0.01, 'height': 30.0})
+
+for name, fn in [('same parameters', same_parameters),
+                 ('varying parameters', varying_parameters)]:
+    t = min(timeit.repeat(fn, number=1, repeat=3)) / (REPEATS * n_arcs)
+    print(f'{name:>18}: {t*1e6:6.2f} us per arc')
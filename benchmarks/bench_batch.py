@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+"""
+Drawing a 4,000 CDS construct (similar to the genbank2sbolv example) with
+one patch per path, compared to batched PathCollection artists. Reports the
+number of artists, the time to draw the construct and the time to save it.
+"""
+
+import io
+import random
+import time
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import parasbolv as psv
+
+N_PARTS = 4000
+
+random.seed(1)
+colors = [(0.9, 0.9, 0.9), (0.56, 0.79, 0.53), (0.32, 0.54, 0.78), (0.86, 0.02, 0.05)]
+part_list = []
+for _ in range(N_PARTS):
+    width = random.uniform(5, 40)
+    part_list.append(['CDS',
+                      random.choice(['forward', 'reverse']),
+                      {'width': width, 'arrowhead_width': min(7.0, width)},
+                      {'cds': {'facecolor': random.choice(colors), 'edgecolor': (0, 0, 0), 'linewidth': 1.5}}])
+
+renderer = psv.GlyphRenderer()
+for batch in [False, True]:
+    fig, ax = plt.subplots()
+    construct = psv.Construct(part_list, renderer, fig=fig, ax=ax, gapsize=2, batch=batch)
+    start = time.perf_counter()
+    construct.draw()
+    draw_time = time.perf_counter() - start
+    start = time.perf_counter()
+    fig.savefig(io.BytesIO(), format='png', dpi=50)
+    save_time = time.perf_counter() - start
+    n_artists = len(ax.patches) + len(ax.collections)
+    print(f'batch={batch!s:>5}: {n_artists:>5} artists, draw {draw_time:.2f} s, savefig {save_time:.2f} s')
+    plt.close(fig)
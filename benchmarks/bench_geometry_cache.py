@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+"""
+Redrawing the same glyphs many times, as an interactive tool or animation
+does, with and without the geometry cache. Each frame draws every packaged
+glyph with one of three widths into a GlyphBatch (so patch creation does not
+dominate) and computes its bounds.
+"""
+
+import time
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import parasbolv as psv
+
+N_FRAMES = 20
+WIDTHS = [10, 20, 30]
+
+for cache_size in [0, 512]:
+    renderer = psv.GlyphRenderer(geometry_cache_size=cache_size)
+    glyph_types = sorted(renderer.glyphs_library)
+    fig, ax = plt.subplots()
+    calls = 0
+    start = time.perf_counter()
+    for frame in range(N_FRAMES):
+        batch = psv.GlyphBatch()
+        for index, glyph_type in enumerate(glyph_types):
+            user_parameters = {'width': WIDTHS[(index + frame) % len(WIDTHS)]}
+            renderer.draw_glyph(ax, glyph_type, (index * 50, 0), rotation=0.1 * frame,
+                                user_parameters=user_parameters, batch=batch)
+            renderer.get_glyph_bounds(glyph_type, (index * 50, 0), user_parameters=user_parameters)
+            calls += 2
+    elapsed = time.perf_counter() - start
+    plt.close(fig)
+    stats = renderer.geometry_cache.stats() if renderer.geometry_cache is not None else None
+    print(f'cache size {cache_size:>4}: {elapsed / calls * 1e6:6.1f} us per call, stats {stats}')
@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+"""
+Time to import parasbolv and compute the bounds of a glyph in a fresh
+interpreter, compared with importing matplotlib.pyplot alongside it.
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+REPEATS = 10
+
+env = dict(os.environ)
+env['PYTHONPATH'] = os.pathsep.join([os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                     env.get('PYTHONPATH', '')])
+
+def run(code):
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], env=env, check=True)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+baseline = run('pass')
+for name, code in [('import', 'import parasbolv'),
+                   ('bounds', 'import parasbolv as psv; psv.GlyphRenderer().get_glyph_bounds("CDS", (0, 0))'),
+                   ('pyplot', 'import parasbolv, matplotlib.pyplot')]:
+    print(f'{name:>7}: {(run(code) - baseline)*1000:.1f} ms')
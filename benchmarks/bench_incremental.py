@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+"""
+Animating one parameter of a glyph, as the animated CDS example and editors
+do: every frame changes a single parameter and evaluates all paths of the
+glyph. Compares re-evaluating every path with reusing the paths that do not
+depend on the changed parameter.
+"""
+
+import time
+import parasbolv as psv
+
+N_FRAMES = 5000
+
+renderer = psv.GlyphRenderer()
+for glyph_type, parameter in [('Promoter', 'arrowhead_width'), ('Signature', 'width'),
+                              ('Polypeptide Region', 'height'), ('CDS', 'arrowhead_width')]:
+    glyph = renderer.glyphs_library[glyph_type]
+    dependencies = renderer.get_glyph_parameters(glyph_type, dependencies=True)
+    affected = [path_id for path_id, names in dependencies.items() if parameter in names]
+    times = []
+    for incremental in [False, True]:
+        parameters = glyph['defaults'].copy()
+        start = time.perf_counter()
+        for frame in range(N_FRAMES):
+            parameters[parameter] = glyph['defaults'][parameter] + frame * 1e-3
+            for path in glyph['paths']:
+                if not incremental:
+                    path['parametric_path'].last_evaluation = None
+                path['parametric_path'].to_path(parameters)
+        times.append((time.perf_counter() - start) / N_FRAMES)
+    print(f'{glyph_type:>20} ({parameter} changes {len(affected)} of {len(glyph["paths"])} paths): '
+          f'all {times[0]*1e6:5.1f} us, incremental {times[1]*1e6:5.1f} us per frame')
@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+"""
+Drawing 4,000 CDS glyphs with eight distinct widths, using one draw_glyph
+call per glyph compared to a single draw_glyph_instances call. Both are
+timed with patches and with a GlyphBatch.
+"""
+
+import random
+import time
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import parasbolv as psv
+
+N_GLYPHS = 4000
+WIDTHS = [10, 15, 20, 25, 30, 35, 40, 45]
+
+random.seed(1)
+positions = [(60 * i, 0) for i in range(N_GLYPHS)]
+orientations = [random.choice(['forward', 'reverse']) for _ in range(N_GLYPHS)]
+params_array = [{'width': random.choice(WIDTHS)} for _ in range(N_GLYPHS)]
+
+renderer = psv.GlyphRenderer()
+for batched in [False, True]:
+    for instanced in [False, True]:
+        fig, ax = plt.subplots()
+        batch = psv.GlyphBatch() if batched else None
+        start = time.perf_counter()
+        if instanced:
+            renderer.draw_glyph_instances(ax, 'CDS', positions, orientations,
+                                          params_array=params_array, batch=batch)
+        else:
+            for instance in zip(positions, orientations, [0.0] * N_GLYPHS, params_array):
+                renderer.draw_glyph(ax, 'CDS', *instance, batch=batch)
+        if batch is not None:
+            batch.draw(ax)
+        elapsed = time.perf_counter() - start
+        print(f'batch={batched!s:>5} instanced={instanced!s:>5}: {elapsed * 1e3:7.1f} ms')
+        plt.close(fig)
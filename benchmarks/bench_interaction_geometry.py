@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+"""
+Computing the geometry of many interactions one at a time with
+interaction_geometry and interaction_head_paths, compared with one call
+to interaction_geometry_arrays.
+"""
+
+import random
+import time
+import parasbolv as psv
+
+SIZES = [100, 1000, 10000, 100000]
+INTERACTIONS = ['control', 'degradation', 'inhibition', 'process', 'stimulation']
+
+rng = random.Random(0)
+
+def random_bounds():
+    x, y = rng.uniform(-1000, 1000), rng.uniform(-10, 10)
+    return ((x, y), (x + rng.uniform(5, 30), y + rng.uniform(5, 20)))
+
+for size in SIZES:
+    sending = [random_bounds() for _ in range(size)]
+    receiving = [random_bounds() for _ in range(size)]
+    types = [rng.choice(INTERACTIONS) for _ in range(size)]
+    directions = [rng.choice(['forward', 'reverse']) for _ in range(size)]
+    start = time.perf_counter()
+    for i in range(size):
+        geometry = psv.interaction_geometry(sending[i], receiving[i], types[i],
+                                            {'direction': directions[i]}, rotation=0.2)
+        psv.interaction_head_paths(types[i], geometry['end'][0], geometry['end'][1],
+                                   geometry['parameters'], geometry['head_rotation'])
+    scalar = time.perf_counter() - start
+    start = time.perf_counter()
+    psv.interaction_geometry_arrays(sending, receiving, types, {'direction': directions}, rotation=0.2)
+    vectorized = time.perf_counter() - start
+    print(f'{size:>6} interactions: scalar {scalar*1000:9.1f} ms, arrays {vectorized*1000:7.1f} ms '
+          f'({scalar/vectorized:5.1f}x)')
@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+"""
+Assigning lanes to many interactions with assign_interaction_lanes, and
+laying out a construct with routed interactions compared with unrouted.
+"""
+
+import random
+import time
+import parasbolv as psv
+
+SIZES = [1000, 10000, 100000]
+INTERACTIONS = ['control', 'degradation', 'inhibition', 'process', 'stimulation']
+
+rng = random.Random(0)
+renderer = psv.GlyphRenderer()
+
+for size in SIZES:
+    part_count = size // 2
+    part_list = [['CDS', 'forward', None, None] for _ in range(part_count)]
+    interaction_list = []
+    for _ in range(size):
+        sending = rng.randrange(part_count)
+        receiving = min(max(sending + rng.randint(-20, 20), 0), part_count - 1)
+        interaction_list.append([sending, receiving, rng.choice(INTERACTIONS),
+                                 {'direction': rng.choice(['forward', 'reverse'])}])
+    intervals = [(interaction[0], interaction[1]) for interaction in interaction_list]
+    start = time.perf_counter()
+    lanes = psv.assign_interaction_lanes(intervals)
+    assign = time.perf_counter() - start
+    start = time.perf_counter()
+    psv.layout_part_list(part_list, renderer, interaction_list=interaction_list)
+    unrouted = time.perf_counter() - start
+    start = time.perf_counter()
+    psv.layout_part_list(part_list, renderer, interaction_list=interaction_list, route_interactions=True)
+    routed = time.perf_counter() - start
+    print(f'{size:>6} interactions: lanes {assign*1000:8.1f} ms ({max(lanes) + 1} lanes), '
+          f'layout {unrouted*1000:8.1f} ms, routed layout {routed*1000:8.1f} ms')
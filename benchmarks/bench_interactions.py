@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+"""
+Drawing and rendering a construct with many interactions, counting the
+artists added to the axes.
+"""
+
+import random
+import time
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import parasbolv as psv
+
+SIZES = [100, 1000, 5000]
+INTERACTIONS = ['control', 'degradation', 'inhibition', 'process', 'stimulation']
+
+renderer = psv.GlyphRenderer(geometry_cache_size=64)
+rng = random.Random(0)
+
+for size in SIZES:
+    part_list = [['CDS', 'forward', None, None] for _ in range(size)]
+    interaction_list = [[rng.randrange(size), rng.randrange(size), rng.choice(INTERACTIONS), None]
+                        for _ in range(size)]
+    layout = psv.layout_part_list(part_list, renderer, interaction_list=interaction_list)
+    fig, ax = plt.subplots()
+    start = time.perf_counter()
+    psv.render_part_list(part_list, renderer, fig=fig, ax=ax, interaction_list=interaction_list,
+                         layout=layout, batch=True)
+    draw_time = time.perf_counter() - start
+    start = time.perf_counter()
+    fig.canvas.draw()
+    render_time = time.perf_counter() - start
+    artists = len(ax.lines) + len(ax.patches) + len(ax.collections)
+    print(f'{size:>5} interactions: draw {draw_time*1000:8.1f} ms, render {render_time*1000:8.1f} ms, '
+          f'{artists} artists')
+    plt.close(fig)
@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+"""
+Placing many densely packed labels with place_labels, which sweeps them
+in order of their left edge so the time grows as O(n log n).
+"""
+
+import random
+import time
+import parasbolv as psv
+
+SIZES = [1000, 10000, 100000]
+
+rng = random.Random(0)
+
+for size in SIZES:
+    labels = []
+    x = 0.0
+    for index in range(size):
+        # Labels wider than the glyphs they belong to, as for short parts
+        width = rng.uniform(15, 30)
+        y = 12.0 if index % 7 else -12.0
+        labels.append({'index': index,
+                       'label_parameters': {'text': 'gene', 'xy_skew': (0, y)},
+                       'text_parameters': {'x': x, 'y': y},
+                       'bounds': ((x - width/2, y - 4), (x + width/2, y + 4))})
+        x += rng.uniform(5, 20)
+    start = time.perf_counter()
+    placed = psv.place_labels(labels, leader_lines=True)
+    elapsed = time.perf_counter() - start
+    moved = sum(1 for label in placed if label['tier'] > 0)
+    print(f'{size:>6} labels: {elapsed*1000:8.1f} ms ({elapsed/size*1e6:5.1f} us per label, {moved} moved)')
@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+"""
+Rendering constructs with many labelled parts, labelling each glyph as it
+is drawn compared with laying out all labels in one pass (include_labels),
+and the time GlyphRenderer.layout_labels takes on its own.
+"""
+
+import time
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import parasbolv as psv
+
+SIZES = [100, 1000, 5000]
+GLYPHS = ['CDS', 'Promoter', 'RibosomeEntrySite', 'Terminator']
+
+renderer = psv.GlyphRenderer()
+
+for size in SIZES:
+    part_list = [[GLYPHS[i % len(GLYPHS)], 'forward',
+                  {'label_parameters': {'text': 'gene' + str(i % 50),
+                                        'userfont': {'family': 'sans-serif', 'size': 8}}}, None]
+                 for i in range(size)]
+    timings = []
+    for include_labels in (False, True):
+        start = time.perf_counter()
+        fig, ax, baseline_start, baseline_end, bounds = psv.render_part_list(part_list, renderer, batch=True,
+                                                                             include_labels=include_labels)
+        timings.append(time.perf_counter() - start)
+        plt.close(fig)
+    layout = psv.layout_part_list(part_list, renderer)
+    start = time.perf_counter()
+    renderer.layout_labels(part_list, layout['part_positions'])
+    labels = time.perf_counter() - start
+    print(f'{size:>6} labels: render {timings[0]*1000:8.1f} ms, with include_labels {timings[1]*1000:8.1f} ms, '
+          f'layout_labels {labels*1000:7.1f} ms')
@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+"""
+Loading a large glyph directory (copies of the packaged glyphs under new
+glyph types) sequentially and with thread and process pools, and listing
+the slowest files.
+"""
+
+import glob
+import os
+import shutil
+import tempfile
+import time
+import parasbolv as psv
+
+COPIES = 10
+WORKERS = 4
+
+glyph_dir = tempfile.mkdtemp()
+for copy in range(COPIES):
+    for infile in glob.glob(os.path.join(psv.GlyphRenderer.package_glyph_path(), '*.svg')):
+        with open(infile) as f:
+            text = f.read().replace('glyphtype="', f'glyphtype="{copy} ')
+        name = os.path.basename(infile).replace('.svg', f'_{copy}.svg')
+        with open(os.path.join(glyph_dir, name), 'w') as f:
+            f.write(text)
+
+for name, kwargs in [('sequential', {}),
+                     ('threads', {'workers': WORKERS}),
+                     ('processes', {'workers': WORKERS, 'processes': True})]:
+    times = []
+    for _ in range(3):
+        start = time.perf_counter()
+        renderer = psv.GlyphRenderer(glyph_path=glyph_dir, **kwargs)
+        times.append(time.perf_counter() - start)
+    print(f'{name:>10}: {min(times)*1000:.1f} ms for {len(renderer.glyphs_library)} glyphs')
+
+slowest = sorted(renderer.glyph_load_times.items(), key=lambda item: item[1], reverse=True)[:3]
+for infile, load_time in slowest:
+    print(f'{os.path.basename(infile):>40}: {load_time*1000:.2f} ms')
+shutil.rmtree(glyph_dir)
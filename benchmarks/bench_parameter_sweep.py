@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+"""
+Evaluating the paths of a glyph for 5,000 sets of parameters, as parameter
+sweeps such as the glyph sampler do: one ParametricPath.to_path call per path
+and set, compared to one GlyphRenderer.evaluate_glyph_paths call over arrays
+of parameter values.
+"""
+
+import time
+import numpy as np
+import parasbolv as psv
+from parasbolv import svgpath2mpl
+
+N_SETS = 5000
+
+rng = np.random.default_rng(1)
+renderer = psv.GlyphRenderer()
+for glyph_type in ['CDS', 'Promoter', 'Terminator']:
+    glyph = renderer.glyphs_library[glyph_type]
+    parameter_arrays = {'width': rng.uniform(5, 40, N_SETS)}
+    if 'height' in glyph['defaults']:
+        parameter_arrays['height'] = rng.uniform(5, 40, N_SETS)
+    svgpath2mpl.cache_clear()
+    start = time.perf_counter()
+    for index in range(N_SETS):
+        parameters = glyph['defaults'].copy()
+        for name, values in parameter_arrays.items():
+            parameters[name] = values[index]
+        for path in glyph['paths']:
+            path['parametric_path'].to_path(parameters)
+    loop_time = time.perf_counter() - start
+    start = time.perf_counter()
+    renderer.evaluate_glyph_paths(glyph_type, parameter_arrays)
+    array_time = time.perf_counter() - start
+    print(f'{glyph_type:>10}: per set {loop_time*1e3:7.1f} ms, arrays {array_time*1e3:6.2f} ms '
+          f'({loop_time/array_time:.0f}x)')
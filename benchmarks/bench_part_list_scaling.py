@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+"""
+Scaling of layout_part_list and render_part_list with the number of parts,
+with one interaction per ten parts, given as part objects and as indices.
+"""
+
+import random
+import time
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import parasbolv as psv
+
+SIZES = [1000, 10000, 100000]
+GLYPHS = ['Promoter', 'RibosomeEntrySite', 'CDS', 'Terminator']
+INTERACTIONS = ['control', 'degradation', 'inhibition', 'process', 'stimulation']
+
+renderer = psv.GlyphRenderer(geometry_cache_size=64)
+rng = random.Random(0)
+
+for size in SIZES:
+    part_list = [[GLYPHS[i % len(GLYPHS)], 'forward', None, None] for i in range(size)]
+    pairs = [(rng.randrange(size), rng.randrange(size)) for _ in range(size // 10)]
+    by_part = [[part_list[a], part_list[b], rng.choice(INTERACTIONS), None] for a, b in pairs]
+    by_index = [[a, b, interaction[2], None] for (a, b), interaction in zip(pairs, by_part)]
+    for name, interaction_list in [('parts', by_part), ('indices', by_index)]:
+        start = time.perf_counter()
+        layout = psv.layout_part_list(part_list, renderer, interaction_list=interaction_list)
+        layout_time = time.perf_counter() - start
+        print(f'{size:>7} parts, {name:>7}: layout {layout_time*1000:9.1f} ms')
+    fig, ax = plt.subplots()
+    start = time.perf_counter()
+    psv.render_part_list(part_list, renderer, fig=fig, ax=ax, interaction_list=by_index,
+                         layout=layout, batch=True)
+    print(f'{size:>7} parts, {"render":>7}: draw   {(time.perf_counter() - start)*1000:9.1f} ms')
+    plt.close(fig)
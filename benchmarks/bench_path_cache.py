@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+"""
+Hit rate of the parsed path cache shared by svgpath2mpl.parse_path and
+parse_tokens, for each gallery example and for a synthetic 10,000 part
+construct. Gallery scripts are run in a temporary copy of their directory,
+so the figures they save are discarded. The animated CDS example is skipped
+as writing its GIF takes minutes.
+"""
+
+import glob
+import os
+import random
+import runpy
+import shutil
+import tempfile
+import time
+import warnings
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import parasbolv as psv
+from parasbolv import svgpath2mpl
+
+GALLERY = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'gallery')
+N_PARTS = 10000
+SKIP = ['02_animated_CDS.py']
+
+def report(name, elapsed):
+    info = svgpath2mpl.cache_info()
+    lookups = info['hits'] + info['misses']
+    hit_rate = info['hits'] / lookups if lookups else 0.0
+    print(f'{name:>28}: {lookups:>6} lookups, hit rate {hit_rate:6.1%}, '
+          f'{info["evictions"]:>5} evictions, {elapsed:.2f} s')
+
+plt.show = lambda *args, **kwargs: None
+for script in sorted(glob.glob(os.path.join(GALLERY, '0*', '0*.py'))):
+    if os.path.basename(script) in SKIP:
+        continue
+    svgpath2mpl.cache_clear()
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = os.path.join(tmp, 'example')
+        shutil.copytree(os.path.dirname(script), work_dir)
+        cwd = os.getcwd()
+        os.chdir(work_dir)
+        start = time.perf_counter()
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                runpy.run_path(os.path.basename(script), run_name='__main__')
+        except Exception as e:
+            print(f'{os.path.basename(script):>28}: failed ({e!r})')
+            continue
+        finally:
+            os.chdir(cwd)
+            plt.close('all')
+        report(os.path.basename(script), time.perf_counter() - start)
+
+random.seed(1)
+glyph_types = ['Promoter', 'RibosomeEntrySite', 'CDS', 'Terminator']
+part_list = []
+for _ in range(N_PARTS):
+    glyph_type = random.choice(glyph_types)
+    user_parameters = None
+    if glyph_type == 'CDS':
+        user_parameters = {'width': random.choice([15, 20, 25, 30])}
+    part_list.append([glyph_type, random.choice(['forward', 'reverse']), user_parameters, None])
+svgpath2mpl.cache_clear()
+renderer = psv.GlyphRenderer()
+fig, ax = plt.subplots()
+start = time.perf_counter()
+psv.Construct(part_list, renderer, fig=fig, ax=ax, batch=True).draw()
+report(f'{N_PARTS} part construct', time.perf_counter() - start)
@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+"""
+Picking up an edit to one glyph file in a copy of the packaged glyphs:
+building a new GlyphRenderer compared with refreshing the existing one.
+"""
+
+import os
+import shutil
+import tempfile
+import timeit
+import parasbolv as psv
+
+REPEATS = 20
+
+glyph_dir = tempfile.mkdtemp()
+for name in os.listdir(psv.GlyphRenderer.package_glyph_path()):
+    shutil.copy(os.path.join(psv.GlyphRenderer.package_glyph_path(), name), glyph_dir)
+cds_file = os.path.join(glyph_dir, 'CDS.svg')
+with open(cds_file) as f:
+    cds_text = f.read()
+renderer = psv.GlyphRenderer(glyph_path=glyph_dir)
+edits = 0
+
+def edit():
+    global edits
+    edits += 1
+    with open(cds_file, 'w') as f:
+        f.write(cds_text.replace('width=30', f'width={30 + edits}'))
+
+def rebuild():
+    edit()
+    psv.GlyphRenderer(glyph_path=glyph_dir)
+
+def refresh():
+    edit()
+    assert renderer.refresh()['updated'] == ['CDS']
+
+for name, function in [('rebuild', rebuild), ('refresh', refresh)]:
+    t = min(timeit.repeat(function, number=REPEATS, repeat=3)) / REPEATS
+    print(f'{name:>8}: {t*1000:.2f} ms per edit')
+unchanged = min(timeit.repeat(renderer.refresh, number=REPEATS, repeat=3)) / REPEATS
+print(f'{"no edit":>8}: {unchanged*1000:.2f} ms per refresh')
+shutil.rmtree(glyph_dir)
@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+"""
+Time to first render: creating a GlyphRenderer and drawing a single glyph,
+using the compiled glyphs, eager loading of the SVG files, lazy loading and
+the on-disk glyph cache.
+"""
+
+import tempfile
+import timeit
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import parasbolv as psv
+
+REPEATS = 50
+
+fig, ax = plt.subplots()
+cache_dir = tempfile.mkdtemp()
+# Populate the cache before timing
+psv.GlyphRenderer(use_cache=True, cache_dir=cache_dir)
+
+def first_render(**kwargs):
+    renderer = psv.GlyphRenderer(**kwargs)
+    renderer.draw_glyph(ax, 'CDS', (0, 0))
+    ax.patches[0].remove()
+
+for name, kwargs in [('compiled', {}),
+                     ('eager', {'use_compiled': False}),
+                     ('lazy', {'lazy': True}),
+                     ('cache', {'use_cache': True, 'cache_dir': cache_dir})]:
+    t = min(timeit.repeat(lambda: first_render(**kwargs), number=REPEATS, repeat=3)) / REPEATS
+    print(f'{name:>8}: {t*1000:.2f} ms to first render')
@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+"""
+Parsing SVG path data with svgpath2mpl.parse_path: the evaluated path data of
+every packaged glyph, and a long path using every command (except arcs).
+"""
+
+import timeit
+import parasbolv as psv
+from parasbolv.svgpath2mpl import parse_path
+
+REPEATS = 200
+
+renderer = psv.GlyphRenderer()
+glyph_paths = []
+for glyph in renderer.glyphs_library.values():
+    for path in glyph['paths']:
+        glyph_paths.append(path['parametric_path'].svg_text(dict(glyph['defaults'])))
+long_path = 'M0,0 ' + ' '.join(['L10,5 h3 v-2 c1,2 3,4 5,6 s1,2 3,4 q1,1 2,0 t3,0 l-1.5e0,2.25'] * 50) + ' z'
+
+def parse_glyph_paths():
+    for pathdef in glyph_paths:
+        parse_path(pathdef)
+
+def parse_long_path():
+    parse_path(long_path)
+
+t = min(timeit.repeat(parse_glyph_paths, number=REPEATS, repeat=3)) / (REPEATS * len(glyph_paths))
+print(f'packaged glyph paths: {t*1e6:7.2f} us per path')
+t = min(timeit.repeat(parse_long_path, number=REPEATS, repeat=3)) / REPEATS
+print(f'{len(parse_path(long_path).codes)} vertex path: {t*1e6:7.2f} us per path')
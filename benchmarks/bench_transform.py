@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+"""
+Flipping, rotating and positioning the paths of a glyph: the original
+per-vertex loop compared to a single affine matrix applied with NumPy.
+"""
+
+import math
+import timeit
+import numpy as np
+from matplotlib.path import Path
+import parasbolv as psv
+
+REPEATS = 2000
+
+def loop_transform(path, baseline_y, position, orientation, rotation):
+    # Per-vertex implementation replaced by GlyphRenderer.glyph_transform
+    if orientation == 'reverse':
+        rotation += math.radians(180)
+    new_verts = []
+    new_codes = []
+    for v_idx in range(np.size(path.vertices, 0)):
+        cur_vert = path.vertices[v_idx]
+        new_codes.append(path.codes[v_idx])
+        org_x = cur_vert[0]
+        org_flipped_y = baseline_y-(cur_vert[1]-baseline_y)
+        rot_x = org_x * np.cos(rotation) - org_flipped_y * np.sin(rotation)
+        rot_y = org_x * np.sin(rotation) + org_flipped_y * np.cos(rotation)
+        new_verts.append([rot_x+position[0], rot_y+position[1]])
+    return Path(new_verts, new_codes)
+
+renderer = psv.GlyphRenderer()
+for glyph_type in ['CDS', "Circular Plasmid 5' end", 'OriginOfReplication', 'Promoter']:
+    glyph = renderer.glyphs_library[glyph_type]
+    paths = [p['parametric_path'].to_path(glyph['defaults']) for p in glyph['paths']
+             if p['class'] not in ['baseline', 'bounding-box']]
+    n_verts = sum(len(p.vertices) for p in paths)
+
+    def run_loop():
+        for p in paths:
+            loop_transform(p, 0.0, (10, 5), 'reverse', 0.3)
+
+    def run_matrix():
+        transform = psv.GlyphRenderer.glyph_transform(0.0, (10, 5), 'reverse', 0.3)
+        psv.GlyphRenderer.transform_paths(paths, transform)
+
+    print(f'{glyph_type} ({len(paths)} paths, {n_verts} vertices)')
+    for name, fn in [('loop', run_loop), ('matrix', run_matrix)]:
+        t = min(timeit.repeat(fn, number=REPEATS, repeat=3)) / REPEATS
+        print(f'  {name:>6}: {t*1e6:.1f} us per glyph')
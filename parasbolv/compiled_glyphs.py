@@ -0,0 +1,4693 @@
+"""
+Glyphs compiled from parametric SVG files by scripts/compile_glyphs.py.
+Generated file, do not edit.
+"""
+
+import builtins
+import numpy as np
+from parasbolv.svgpath2mpl import arc_to_beziers
+
+# SHA-1 digest of each compiled SVG file
+SOURCES = {'Aptamer.svg': '0fa9c3d4e9f1510bb12388443c038cd7548151db', 'AssemblyScar.svg': '377b3bbde8f2965e63e770a8dd8f8f627c14c3a4', 'BluntRestrictionSite.svg': '3141dc603bd7453a21bb58a1dcf50962b0336f18', 'CDS.svg': '08c6afa74b5b211b7bbdd9ffd97d8b0f4a8402c8', 'ChromosomalLocus3.svg': 'c099e72b1bd5db2683b03aedd8d71518cf86754a', 'ChromosomalLocus5.svg': '37083ce5a89253c90c778fa1142716002c9e59e4', 'CircularPlasmid3.svg': 'a4f776b86cc0ace0de82dc4e4545217005c83b5a', 'CircularPlasmid5.svg': 'c3a3bce5937c9f453d4a052640644dedda2bc12e', 'Composite.svg': 'd9b540eead2a140cbad0504f10203477e4731ddc', 'DNACleavageSite.svg': '6185e01b6a29ce7f1c433645895533f3e9fa495e', 'DNALocation.svg': '2cb979634bd337ed2a3b47d63db3d83bcc59b1a8', 'DNAStabilityElement.svg': '4e912c824207027ba6191b3a51fc553ddc5d612c', 'DNAStopSite.svg': '98d47a7d0b347197cc203e8ca9f9f048c7c4ac9c', 'DoubleStrandedNucleicAcid.svg': 'aa9e333be6b4c73b89fa5e1d4226356639a313ed', 'EngineeredRegion.svg': 'f2b09b324de8a3a4181e5f1c1521143db9683c41', 'Insulator.svg': '36d4ef768a49377e728787aa6fa343986f1ab514', 'Macromolecule.svg': '1a4960b264d5e7be57bb2e8a5c548546b0029dae', 'NoGlyph.svg': 'a87a7161fe245ff74a1a0509635a3f7b96ed4e0f', 'NonCodingRNA.svg': 'c7239b9a8d8cc1f8fd80e0d11b4cfe064f911d8f', 'NucleicAcidOneStrand.svg': '6ba9ac9835a060ef564ab46d1d97424172a850c1', 'OmittedDetail.svg': '514e04d3f052fc65663ce3bf931e53e427c6fad3', 'Operator.svg': '7a3c36d4dff0ddaf7230c807d35e4e6a83ec421c', 'OriginOfReplication.svg': 'ab000187f8ce427159dc548ad9b089d23e436743', 'OriginOfTransfer.svg': '11ded91e8642ec9b04fbc870fdb90f1857b4a416', 'OverhangSite3.svg': 'c264eddd2be863bede9c918ec109bab85f4f4b9d', 'OverhangSite5.svg': '794001fde038efaf5d80f501ba282c60c32c3a22', 'PolyASite.svg': 'f71e0c306ef7f56b0c3e70277096af68f9da73f8', 'PolypeptideRegion.svg': '28c551e0255aa47dbd1ed313017253124dac4872', 'Primer.svg': 'b79175d058631e48d7530a2f438a27e36c913d7a', 'Promoter.svg': 'd0819e1634a674b9e007afdf91358f0b089fa166', 'Protein.svg': 'f02059d3f18f018291c1723f1e259b9ff6906986', 'ProteinCleavageSite.svg': 'cad01fb13000bb067daf5a620099ce402f6a34f1', 'ProteinLocation.svg': 'b6e7ece866aa0e0f2ff921c92b04a32149480223', 'ProteinLocationAlternate.svg': '7794868e694b9fa0d13f81e438fa26d215b25056', 'ProteinStabilityElement.svg': '820ae61ffc95c1055054d43e916d3ed640c0f3ce', 'RNACleavageSite.svg': 'e6e3d2f010473e401ecbdd00a76dd39ba5453975', 'RNALocation.svg': '5e3d276619ce850d7b84b9bf281e2f5af4be6d4a', 'RNALocationAlternate.svg': '2abcce501efb9572c17fe4a3f961f69145b56972', 'RNAStabilityElement.svg': '7d007c09b4bf024ccb22a769b34b955cf9a3fac0', 'RNAStopSite.svg': 'fd38d84d87b04bb6bd026d73e7b3df7a6a322535', 'RecombinationSite.svg': '63073df380f650c8081159065c1c149c6eda47b0', 'RibosomeEntrySite.svg': '5a3aa824b9da005e0300ff8a3e3fcf37e77ab1ff', 'Signature.svg': '4144657396087c35b17e135ee699f3bcb4a3707b', 'SimpleChemical.svg': '514af1320b31ccc33e6f749087d8859dabf58e45', 'SingleStrandedNucleicAcid.svg': 'e93a94bbfab2bb13853e86b164a218125f78e759', 'Spacer.svg': '6971ac1f4e53ce32d33aa39bc4ccd1ba8f26d6ce', 'StickyEndRestrictionEnzymeCleavageSite3.svg': '27de40eb46e373d1c8e04aaa86fc55c9fe77e035', 'StickyEndRestrictionEnzymeCleavageSite5.svg': 'caedefd03fc13f66062e572dfa346cf563336140', 'Terminator.svg': 'b9861bb2c3af361666136aaeb22a8ab54d800220', 'Unspecified.svg': '69cf8cdd5e36494049600e93be4f3955f406453a'}
+
+# Glyph type and terms declared by each compiled SVG file
+FILES = {'Aptamer.svg': ('Spacer', ['SO:0000031']), 'AssemblyScar.svg': ('Assembly Scar', ['SO:0001953']), 'BluntRestrictionSite.svg': ('Blunt Restriction Site', ['SO:0001691']), 'CDS.svg': ('CDS', ['SO:0000316']), 'ChromosomalLocus3.svg': ("Chromosome Part 3' End", ['SO:0000830']), 'ChromosomalLocus5.svg': ("Chromosome Part 3' End", ['SO:0000830']), 'CircularPlasmid3.svg': ("Circular Plasmid 3' end", ['SO:0002211']), 'CircularPlasmid5.svg': ("Circular Plasmid 5' end", ['SO:0002211']), 'Composite.svg': ('Spacer', ['']), 'DNACleavageSite.svg': ('DNA Cleavage Site', ['SO:0001688,SO:0001687']), 'DNALocation.svg': ('DNA Location', ['SO:0001236,SO:0000699']), 'DNAStabilityElement.svg': ('DNA Stability Element', ['']), 'DNAStopSite.svg': ('DNA Stop Site', ['SO:0000616']), 'DoubleStrandedNucleicAcid.svg': ('Double-Stranded Nucleic Acid', ['SBO:0000251']), 'EngineeredRegion.svg': ('Engineered Region', ['SO:0000804']), 'Insulator.svg': ('Insulator', ['SO:0000627']), 'Macromolecule.svg': ('Macromolecule', ['SBO:0000245']), 'NoGlyph.svg': ('No Glyph', ['']), 'NonCodingRNA.svg': ('Spacer', ['']), 'NucleicAcidOneStrand.svg': ('Spacer', ['']), 'OmittedDetail.svg': ('Omitted Detail', ['']), 'Operator.svg': ('Operator', ['SO:0000057,SO:0000409']), 'OriginOfReplication.svg': ('OriginOfReplication', ['SO:0000296']), 'OriginOfTransfer.svg': ('OriginOfTransfer', ['SO:0000724']), 'OverhangSite3.svg': ("3' Overhang Site", ['SO:0001933']), 'OverhangSite5.svg': ("5' Overhang Site", ['SO:0001932']), 'PolyASite.svg': ('PolyA Site', ['SO:0000553']), 'PolypeptideRegion.svg': ('Polypeptide Region', ['SO:0000839']), 'Primer.svg': ('PrimerBindingSite', ['SO:0005850']), 'Promoter.svg': ('Promoter', ['SO:0000167']), 'Protein.svg': ('Polypeptide Chain', ['SBO:0000252']), 'ProteinCleavageSite.svg': ('Protein Cleavage Site', ['SO:0001956']), 'ProteinLocation.svg': ('Protein Location', ['SO:0001237,SO:0000699']), 'ProteinLocationAlternate.svg': ('Protein Location', ['SO:0001237,SO:0000699']), 'ProteinStabilityElement.svg': ('Protein Stability Element', ['SO:0001955,SO:0001546']), 'RNACleavageSite.svg': ('RNA Cleavage Site', ['SO:0001688,SO:0001687,SO:0001977']), 'RNALocation.svg': ('RNA Location', ['SO:0001236,SO:0000699']), 'RNALocationAlternate.svg': ('RNA Location', ['SO:0001236,SO:0000699']), 'RNAStabilityElement.svg': ('RNA Stability Element', ['SO:0001979']), 'RNAStopSite.svg': ('RNA Stop Site', ['SO:0000319,SO:0000327']), 'RecombinationSite.svg': ('Recombination Site', ['']), 'RibosomeEntrySite.svg': ('RibosomeEntrySite', ['SO:0000139']), 'Signature.svg': ('Signature', ['SO:0001978']), 'SimpleChemical.svg': ('Simple Chemical (Circle)', ['SBO:0000247']), 'SingleStrandedNucleicAcid.svg': ('Single-Stranded Nucleic Acid', ['SBO:0000250']), 'Spacer.svg': ('InertDNASpacer', ['SO:0002223']), 'StickyEndRestrictionEnzymeCleavageSite3.svg': ("3' Sticky Restriction Site", ['SO:0001976']), 'StickyEndRestrictionEnzymeCleavageSite5.svg': ("5' Sticky Restriction Site", ['SO:0001975']), 'Terminator.svg': ('Terminator', ['SO:0000141']), 'Unspecified.svg': ('Unspecified', ['SO:0000110'])}
+
+GLYPH_TERM_MAP = {'SO:0000031': 'Spacer', 'SO:0001953': 'Assembly Scar', 'SO:0001691': 'Blunt Restriction Site', 'SO:0000316': 'CDS', 'SO:0000830': "Chromosome Part 3' End", 'SO:0002211': "Circular Plasmid 3' end", '': 'Spacer', 'SO:0001688,SO:0001687': 'DNA Cleavage Site', 'SO:0001236,SO:0000699': 'DNA Location', 'SO:0000616': 'DNA Stop Site', 'SBO:0000251': 'Double-Stranded Nucleic Acid', 'SO:0000804': 'Engineered Region', 'SO:0000627': 'Insulator', 'SBO:0000245': 'Macromolecule', 'SO:0000057,SO:0000409': 'Operator', 'SO:0000296': 'OriginOfReplication', 'SO:0000724': 'OriginOfTransfer', 'SO:0001933': "3' Overhang Site", 'SO:0001932': "5' Overhang Site", 'SO:0000553': 'PolyA Site', 'SO:0000839': 'Polypeptide Region', 'SO:0005850': 'PrimerBindingSite', 'SO:0000167': 'Promoter', 'SBO:0000252': 'Polypeptide Chain', 'SO:0001956': 'Protein Cleavage Site', 'SO:0001237,SO:0000699': 'Protein Location', 'SO:0001955,SO:0001546': 'Protein Stability Element', 'SO:0001688,SO:0001687,SO:0001977': 'RNA Cleavage Site', 'SO:0001979': 'RNA Stability Element', 'SO:0000319,SO:0000327': 'RNA Stop Site', 'SO:0000139': 'RibosomeEntrySite', 'SO:0001978': 'Signature', 'SBO:0000247': 'Simple Chemical (Circle)', 'SBO:0000250': 'Single-Stranded Nucleic Acid', 'SO:0002223': 'InertDNASpacer', 'SO:0001976': "3' Sticky Restriction Site", 'SO:0001975': "5' Sticky Restriction Site", 'SO:0000141': 'Terminator', 'SO:0000110': 'Unspecified'}
+
+
+def _spacer_0_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _spacer_0_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _spacer_0_1_values(p):
+    width = p['width']
+    return ((0.35*width), (0), (0.35*width), (-0.3*width), (0), (-0.4*width), (0.3*width), (-0.9*width), (0.55*width), (-0.65*width), (0.75*width), (-0.8*width), (0.72*width), (-0.95*width), (0.9*width), (-1.0*width), (0.97*width), (-0.92*width), (1.05*width), (-0.72*width), (0.9*width), (-0.7*width), (0.82*width), (-0.68*width), (0.6*width), (-0.5*width), (0.63*width), (-0.37*width), (0.5*width), (-0.35*width), (0.5*width), (-0.3*width), (0.5*width), (0), )
+
+def _spacer_0_1_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0.35*width)
+    v1 = float(0)
+    v2 = float(0.35*width)
+    v3 = float(-0.3*width)
+    v4 = float(0)
+    v5 = float(-0.4*width)
+    v6 = float(0.3*width)
+    v7 = float(-0.9*width)
+    v8 = float(0.55*width)
+    v9 = float(-0.65*width)
+    v10 = float(0.75*width)
+    v11 = float(-0.8*width)
+    v12 = float(0.72*width)
+    v13 = float(-0.95*width)
+    v14 = float(0.9*width)
+    v15 = float(-1.0*width)
+    v16 = float(0.97*width)
+    v17 = float(-0.92*width)
+    v18 = float(1.05*width)
+    v19 = float(-0.72*width)
+    v20 = float(0.9*width)
+    v21 = float(-0.7*width)
+    v22 = float(0.82*width)
+    v23 = float(-0.68*width)
+    v24 = float(0.6*width)
+    v25 = float(-0.5*width)
+    v26 = float(0.63*width)
+    v27 = float(-0.37*width)
+    v28 = float(0.5*width)
+    v29 = float(-0.35*width)
+    v30 = float(0.5*width)
+    v31 = float(-0.3*width)
+    v32 = float(0.5*width)
+    v33 = float(0)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7), (v8, v9), (v10, v11), (v12, v13), (v14, v15), (v16, v17), (v18, v19), (v20, v21), (v22, v23), (v24, v25), (v26, v27), (v28, v29), (v30, v31), (v32, v33)]
+    codes += [1, 2, 4, 4, 4, 2, 4, 4, 4, 4, 4, 4, 2, 4, 4, 4, 2]
+    if v32 != v0 or v33 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _spacer_0_box_x_values(p):
+    return ((0), )
+
+def _spacer_0_box_y_values(p):
+    width = p['width']
+    return ((-width), )
+
+def _spacer_0_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _spacer_0_box_height_values(p):
+    width = p['width']
+    return ((width), )
+
+def _assembly_scar_1_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _assembly_scar_1_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _assembly_scar_1_1_values(p):
+    height = p['height']
+    width = p['width']
+    return ((0), (-0.5*height), (width), (-0.5*height), (width), (0.5*height), (0), (0.5*height), )
+
+def _assembly_scar_1_1_path(p):
+    height = p['height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-0.5*height)
+    v2 = float(width)
+    v3 = float(-0.5*height)
+    v4 = float(width)
+    v5 = float(0.5*height)
+    v6 = float(0)
+    v7 = float(0.5*height)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7)]
+    codes += [1, 2, 2, 2]
+    if v6 != v0 or v7 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _assembly_scar_1_2_values(p):
+    height = p['height']
+    width = p['width']
+    return ((0), (-0.5*height), (width), (-0.5*height), )
+
+def _assembly_scar_1_2_path(p):
+    height = p['height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-0.5*height)
+    v2 = float(width)
+    v3 = float(-0.5*height)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _assembly_scar_1_3_values(p):
+    height = p['height']
+    width = p['width']
+    return ((0), (0.5*height), (width), (0.5*height), )
+
+def _assembly_scar_1_3_path(p):
+    height = p['height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0.5*height)
+    v2 = float(width)
+    v3 = float(0.5*height)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _assembly_scar_1_box_x_values(p):
+    return ((0), )
+
+def _assembly_scar_1_box_y_values(p):
+    height = p['height']
+    return ((-0.5*height), )
+
+def _assembly_scar_1_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _assembly_scar_1_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _blunt_restriction_site_2_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _blunt_restriction_site_2_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _blunt_restriction_site_2_1_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0.3*width), (-0.5*height), (0.7*width), (-0.5*height), (0.7*width), (0.5*height), (0.3*width), (0.5*height), )
+
+def _blunt_restriction_site_2_1_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0.3*width)
+    v1 = float(-0.5*height)
+    v2 = float(0.7*width)
+    v3 = float(-0.5*height)
+    v4 = float(0.7*width)
+    v5 = float(0.5*height)
+    v6 = float(0.3*width)
+    v7 = float(0.5*height)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7)]
+    codes += [1, 2, 2, 2]
+    if v6 != v0 or v7 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _blunt_restriction_site_2_2_values(p):
+    height = p['height']
+    width = p['width']
+    return ((0), (-0.5*height), (0.3*width), (-0.5*height), (0.3*width), (0.5*height), (0), (0.5*height), )
+
+def _blunt_restriction_site_2_2_path(p):
+    height = p['height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-0.5*height)
+    v2 = float(0.3*width)
+    v3 = float(-0.5*height)
+    v4 = float(0.3*width)
+    v5 = float(0.5*height)
+    v6 = float(0)
+    v7 = float(0.5*height)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7)]
+    codes += [1, 2, 2, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _blunt_restriction_site_2_3_values(p):
+    width = p['width']
+    height = p['height']
+    return ((width), (-0.5*height), (0.7*width), (-0.5*height), (0.7*width), (0.5*height), (width), (0.5*height), )
+
+def _blunt_restriction_site_2_3_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(width)
+    v1 = float(-0.5*height)
+    v2 = float(0.7*width)
+    v3 = float(-0.5*height)
+    v4 = float(0.7*width)
+    v5 = float(0.5*height)
+    v6 = float(width)
+    v7 = float(0.5*height)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7)]
+    codes += [1, 2, 2, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _blunt_restriction_site_2_box_x_values(p):
+    return ((0), )
+
+def _blunt_restriction_site_2_box_y_values(p):
+    height = p['height']
+    return ((-0.5*height), )
+
+def _blunt_restriction_site_2_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _blunt_restriction_site_2_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _cds_3_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _cds_3_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _cds_3_1_values(p):
+    arrowbody_height = p['arrowbody_height']
+    width = p['width']
+    arrowhead_width = p['arrowhead_width']
+    height = p['height']
+    return ((0), (0), (0), (-arrowbody_height/2), (width - arrowhead_width), (-arrowbody_height/2), (width - arrowhead_width), (-height/2), (width), (0), (width - arrowhead_width), (height/2), (width - arrowhead_width), (arrowbody_height/2), (0), (arrowbody_height/2), )
+
+def _cds_3_1_path(p):
+    arrowbody_height = p['arrowbody_height']
+    width = p['width']
+    arrowhead_width = p['arrowhead_width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(0)
+    v3 = float(-arrowbody_height/2)
+    v4 = float(width - arrowhead_width)
+    v5 = float(-arrowbody_height/2)
+    v6 = float(width - arrowhead_width)
+    v7 = float(-height/2)
+    v8 = float(width)
+    v9 = float(0)
+    v10 = float(width - arrowhead_width)
+    v11 = float(height/2)
+    v12 = float(width - arrowhead_width)
+    v13 = float(arrowbody_height/2)
+    v14 = float(0)
+    v15 = float(arrowbody_height/2)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7), (v8, v9), (v10, v11), (v12, v13), (v14, v15)]
+    codes += [1, 2, 2, 2, 2, 2, 2, 2]
+    if v14 != v0 or v15 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _cds_3_box_x_values(p):
+    return ((0), )
+
+def _cds_3_box_y_values(p):
+    height = p['height']
+    return ((-height/2), )
+
+def _cds_3_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _cds_3_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _chromosome_part_3_end_4_0_values(p):
+    return ((0), (0), (0), (0), )
+
+def _chromosome_part_3_end_4_0_path(p):
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(0)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _chromosome_part_3_end_4_1_values(p):
+    width = p['width']
+    height = p['height']
+    return ((width), (width), (height/2.0), (width*0.5), (height/2.0), (height/2.0), (height), (width), (height), )
+
+def _chromosome_part_3_end_4_1_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(width)
+    v1 = float(width)
+    v2 = float(height/2.0)
+    v3 = float(width*0.5)
+    v4 = float(height/2.0)
+    v5 = float(height/2.0)
+    v6 = float(height)
+    v7 = float(width)
+    v8 = float(height)
+    vertices += [(0.0, 0.0), (v0, 0.0), (v1, v2), (v3, v4), (0.0, v5), (0.0, v6), (v7, v8)]
+    codes += [1, 4, 4, 4, 4, 4, 4]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _chromosome_part_3_end_4_box_x_values(p):
+    return ()
+
+def _chromosome_part_3_end_4_box_y_values(p):
+    return ()
+
+def _chromosome_part_3_end_4_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _chromosome_part_3_end_4_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _circular_plasmid_3_end_5_0_values(p):
+    return ((0), (0), (0), (0), )
+
+def _circular_plasmid_3_end_5_0_path(p):
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(0)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _circular_plasmid_3_end_5_1_values(p):
+    width = p['width']
+    height = p['height']
+    return ((width), (width), (height), (width*0.2), (height), )
+
+def _circular_plasmid_3_end_5_1_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(width)
+    v1 = float(width)
+    v2 = float(height)
+    v3 = float(width*0.2)
+    v4 = float(height)
+    vertices += [(0.0, 0.0), (v0, 0.0), (v1, v2), (v3, v4)]
+    codes += [1, 4, 4, 4]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _circular_plasmid_3_end_5_box_x_values(p):
+    return ()
+
+def _circular_plasmid_3_end_5_box_y_values(p):
+    return ()
+
+def _circular_plasmid_3_end_5_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _circular_plasmid_3_end_5_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _circular_plasmid_5_end_6_0_values(p):
+    return ((0), (0), (0), (0), )
+
+def _circular_plasmid_5_end_6_0_path(p):
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(0)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _circular_plasmid_5_end_6_1_values(p):
+    width = p['width']
+    height = p['height']
+    return ((-width), (-width), (height), (-width*0.2), (height), )
+
+def _circular_plasmid_5_end_6_1_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(-width)
+    v1 = float(-width)
+    v2 = float(height)
+    v3 = float(-width*0.2)
+    v4 = float(height)
+    vertices += [(0.0, 0.0), (v0, 0.0), (v1, v2), (v3, v4)]
+    codes += [1, 4, 4, 4]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _circular_plasmid_5_end_6_box_x_values(p):
+    return ()
+
+def _circular_plasmid_5_end_6_box_y_values(p):
+    return ()
+
+def _circular_plasmid_5_end_6_box_width_values(p):
+    width = p['width']
+    return ((-width), )
+
+def _circular_plasmid_5_end_6_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _dna_cleavage_site_7_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _dna_cleavage_site_7_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _dna_cleavage_site_7_1_values(p):
+    height = p['height']
+    width = p['width']
+    return ((0), (-height), (width), (-height+width), )
+
+def _dna_cleavage_site_7_1_path(p):
+    height = p['height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-height)
+    v2 = float(width)
+    v3 = float(-height+width)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _dna_cleavage_site_7_2_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0), (-height+width), (width), (-height), )
+
+def _dna_cleavage_site_7_2_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-height+width)
+    v2 = float(width)
+    v3 = float(-height)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _dna_cleavage_site_7_3_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0.5*width), (0), (0.5*width), (-height + 0.5*width), )
+
+def _dna_cleavage_site_7_3_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0.5*width)
+    v1 = float(0)
+    v2 = float(0.5*width)
+    v3 = float(-height + 0.5*width)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _dna_cleavage_site_7_box_x_values(p):
+    return ((0), )
+
+def _dna_cleavage_site_7_box_y_values(p):
+    height = p['height']
+    return ((-height), )
+
+def _dna_cleavage_site_7_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _dna_cleavage_site_7_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _dna_location_8_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _dna_location_8_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _dna_location_8_1_values(p):
+    height = p['height']
+    width = p['width']
+    return ((0), (-height + 0.5*width), (0), (-height - 0.16666666666667*width), (width), (-height - 0.16666666666667*width), (width), (-height + 0.5*width), (width), (-height + 1.166666666666667*width), (0), (-height + 1.166666666666667*width), (0), (-height + 0.5*width), )
+
+def _dna_location_8_1_path(p):
+    height = p['height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-height + 0.5*width)
+    v2 = float(0)
+    v3 = float(-height - 0.16666666666667*width)
+    v4 = float(width)
+    v5 = float(-height - 0.16666666666667*width)
+    v6 = float(width)
+    v7 = float(-height + 0.5*width)
+    v8 = float(width)
+    v9 = float(-height + 1.166666666666667*width)
+    v10 = float(0)
+    v11 = float(-height + 1.166666666666667*width)
+    v12 = float(0)
+    v13 = float(-height + 0.5*width)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7), (v8, v9), (v10, v11), (v12, v13)]
+    codes += [1, 4, 4, 4, 4, 4, 4]
+    if v12 != v0 or v13 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _dna_location_8_2_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0.5*width), (0), (0.5*width), (-height + width), )
+
+def _dna_location_8_2_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0.5*width)
+    v1 = float(0)
+    v2 = float(0.5*width)
+    v3 = float(-height + width)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _dna_location_8_box_x_values(p):
+    return ((0), )
+
+def _dna_location_8_box_y_values(p):
+    height = p['height']
+    return ((-height), )
+
+def _dna_location_8_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _dna_location_8_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _dna_stability_element_9_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _dna_stability_element_9_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _dna_stability_element_9_1_values(p):
+    height = p['height']
+    width = p['width']
+    return ((0), (-height), (width), (-height), (width), (-height + 0.7*width), (0.5*width), (-height + width), (0), (-height + 0.7*width), )
+
+def _dna_stability_element_9_1_path(p):
+    height = p['height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-height)
+    v2 = float(width)
+    v3 = float(-height)
+    v4 = float(width)
+    v5 = float(-height + 0.7*width)
+    v6 = float(0.5*width)
+    v7 = float(-height + width)
+    v8 = float(0)
+    v9 = float(-height + 0.7*width)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7), (v8, v9)]
+    codes += [1, 2, 2, 2, 2]
+    if v8 != v0 or v9 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _dna_stability_element_9_2_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0.5*width), (0), (0.5*width), (-height + width), )
+
+def _dna_stability_element_9_2_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0.5*width)
+    v1 = float(0)
+    v2 = float(0.5*width)
+    v3 = float(-height + width)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _dna_stability_element_9_box_x_values(p):
+    return ((0), )
+
+def _dna_stability_element_9_box_y_values(p):
+    height = p['height']
+    return ((-height), )
+
+def _dna_stability_element_9_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _dna_stability_element_9_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _dna_stop_site_10_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _dna_stop_site_10_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _dna_stop_site_10_1_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0), (-height + width - 0.5*width), (0), (-height + width - 1.16666666666667*width), (width), (-height + width - 1.16666666666667*width), (width), (-height + width - 0.5*width), (width), (-height + width + 0.166666666666667*width), (0), (-height + width + 0.166666666666667*width), (0), (-height + width - 0.5*width), )
+
+def _dna_stop_site_10_1_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-height + width - 0.5*width)
+    v2 = float(0)
+    v3 = float(-height + width - 1.16666666666667*width)
+    v4 = float(width)
+    v5 = float(-height + width - 1.16666666666667*width)
+    v6 = float(width)
+    v7 = float(-height + width - 0.5*width)
+    v8 = float(width)
+    v9 = float(-height + width + 0.166666666666667*width)
+    v10 = float(0)
+    v11 = float(-height + width + 0.166666666666667*width)
+    v12 = float(0)
+    v13 = float(-height + width - 0.5*width)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7), (v8, v9), (v10, v11), (v12, v13)]
+    codes += [1, 4, 4, 4, 4, 4, 4]
+    if v12 != v0 or v13 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _dna_stop_site_10_2_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0.5*width), (0), (0.5*width), (-height + width), )
+
+def _dna_stop_site_10_2_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0.5*width)
+    v1 = float(0)
+    v2 = float(0.5*width)
+    v3 = float(-height + width)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _dna_stop_site_10_3_values(p):
+    width = p['width']
+    height = p['height']
+    return (((0.5*width)), (-height+(0.5*width)), ((0.5*width)+(0.58778525229*(0.2*width))), ((-height+(0.5*width))+(0.80901699437*(0.2*width))), )
+
+def _dna_stop_site_10_3_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float((0.5*width))
+    v1 = float(-height+(0.5*width))
+    v2 = float((0.5*width)+(0.58778525229*(0.2*width)))
+    v3 = float((-height+(0.5*width))+(0.80901699437*(0.2*width)))
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _dna_stop_site_10_4_values(p):
+    width = p['width']
+    height = p['height']
+    return (((0.5*width)), (-height+(0.5*width)), ((0.5*width)+(0.95105651629*(0.2*width))), ((-height+(0.5*width))+(-0.30901699437*(0.2*width))), )
+
+def _dna_stop_site_10_4_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float((0.5*width))
+    v1 = float(-height+(0.5*width))
+    v2 = float((0.5*width)+(0.95105651629*(0.2*width)))
+    v3 = float((-height+(0.5*width))+(-0.30901699437*(0.2*width)))
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _dna_stop_site_10_5_values(p):
+    width = p['width']
+    height = p['height']
+    return (((0.5*width)), (-height+(0.5*width)), ((0.5*width)+(0.0*(0.2*width))), ((-height+(0.5*width))+(-1.0*(0.2*width))), )
+
+def _dna_stop_site_10_5_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float((0.5*width))
+    v1 = float(-height+(0.5*width))
+    v2 = float((0.5*width)+(0.0*(0.2*width)))
+    v3 = float((-height+(0.5*width))+(-1.0*(0.2*width)))
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _dna_stop_site_10_6_values(p):
+    width = p['width']
+    height = p['height']
+    return (((0.5*width)), (-height+(0.5*width)), ((0.5*width)+(-0.95105651629*(0.2*width))), ((-height+(0.5*width))+(-0.30901699437*(0.2*width))), )
+
+def _dna_stop_site_10_6_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float((0.5*width))
+    v1 = float(-height+(0.5*width))
+    v2 = float((0.5*width)+(-0.95105651629*(0.2*width)))
+    v3 = float((-height+(0.5*width))+(-0.30901699437*(0.2*width)))
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _dna_stop_site_10_7_values(p):
+    width = p['width']
+    height = p['height']
+    return (((0.5*width)), (-height+(0.5*width)), ((0.5*width)+(-0.58778525229*(0.2*width))), ((-height+(0.5*width))+(0.80901699437*(0.2*width))), )
+
+def _dna_stop_site_10_7_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float((0.5*width))
+    v1 = float(-height+(0.5*width))
+    v2 = float((0.5*width)+(-0.58778525229*(0.2*width)))
+    v3 = float((-height+(0.5*width))+(0.80901699437*(0.2*width)))
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _dna_stop_site_10_box_x_values(p):
+    return ((0), )
+
+def _dna_stop_site_10_box_y_values(p):
+    height = p['height']
+    return ((-height), )
+
+def _dna_stop_site_10_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _dna_stop_site_10_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _double_stranded_nucleic_acid_11_0_values(p):
+    return ()
+
+def _double_stranded_nucleic_acid_11_0_path(p):
+    vertices = []
+    codes = []
+    vertices += [(0.0, 0.0), (0.0, 0.0)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _double_stranded_nucleic_acid_11_1_values(p):
+    width = p['width']
+    height = p['height']
+    return ((((width-width/10.0)/3.0)*0.15), (height/2.0), (((width-width/10.0)/3.0)*0.35), (height/2.0), (((width-width/10.0)/3.0)/2.0), (((width-width/10.0)/3.0)*0.85), (-height/2.0), (((width-width/10.0)/3.0)), (((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.15), (height/2.0), (((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.35), (height/2.0), (((width-width/10.0)/3.0)+((width-width/10.0)/3.0)/2.0), (((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.85), (-height/2.0), (((width-width/10.0)/3.0)+((width-width/10.0)/3.0)), (2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.15), (height/2.0), (2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.35), (height/2.0), (2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)/2.0), (2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.85), (-height/2.0), (2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)), )
+
+def _double_stranded_nucleic_acid_11_1_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(((width-width/10.0)/3.0)*0.15)
+    v1 = float(height/2.0)
+    v2 = float(((width-width/10.0)/3.0)*0.35)
+    v3 = float(height/2.0)
+    v4 = float(((width-width/10.0)/3.0)/2.0)
+    v5 = float(((width-width/10.0)/3.0)*0.85)
+    v6 = float(-height/2.0)
+    v7 = float(((width-width/10.0)/3.0))
+    v8 = float(((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.15)
+    v9 = float(height/2.0)
+    v10 = float(((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.35)
+    v11 = float(height/2.0)
+    v12 = float(((width-width/10.0)/3.0)+((width-width/10.0)/3.0)/2.0)
+    v13 = float(((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.85)
+    v14 = float(-height/2.0)
+    v15 = float(((width-width/10.0)/3.0)+((width-width/10.0)/3.0))
+    v16 = float(2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.15)
+    v17 = float(height/2.0)
+    v18 = float(2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.35)
+    v19 = float(height/2.0)
+    v20 = float(2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)/2.0)
+    v21 = float(2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.85)
+    v22 = float(-height/2.0)
+    v23 = float(2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0))
+    v24 = v4 + v4 - v2
+    v25 = 0.0 + 0.0 - v3
+    v26 = v12 + v12 - v10
+    v27 = 0.0 + 0.0 - v11
+    v28 = v20 + v20 - v18
+    v29 = 0.0 + 0.0 - v19
+    vertices += [(0.0, 0.0), (v0, v1), (v2, v3), (v4, 0.0), (v24, v25), (v5, v6), (v7, 0.0), (v8, v9), (v10, v11), (v12, 0.0), (v26, v27), (v13, v14), (v15, 0.0), (v16, v17), (v18, v19), (v20, 0.0), (v28, v29), (v21, v22), (v23, 0.0)]
+    codes += [1, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _double_stranded_nucleic_acid_11_2_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0+(width/10.0)), (((width-width/10.0)/3.0)*0.15+(width/10.0)), (height/2.0), (((width-width/10.0)/3.0)*0.35+(width/10.0)), (height/2.0), (((width-width/10.0)/3.0)/2.0+(width/10.0)), (((width-width/10.0)/3.0)*0.85+(width/10.0)), (-height/2.0), (((width-width/10.0)/3.0)+(width/10.0)), (((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.15+(width/10.0)), (height/2.0), (((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.35+(width/10.0)), (height/2.0), (((width-width/10.0)/3.0)+((width-width/10.0)/3.0)/2.0+(width/10.0)), (((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.85+(width/10.0)), (-height/2.0), (((width-width/10.0)/3.0)+((width-width/10.0)/3.0)+(width/10.0)), (2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.15+(width/10.0)), (height/2.0), (2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.35+(width/10.0)), (height/2.0), (2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)/2.0+(width/10.0)), (2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.85+(width/10.0)), (-height/2.0), (2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)+(width/10.0)), )
+
+def _double_stranded_nucleic_acid_11_2_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0+(width/10.0))
+    v1 = float(((width-width/10.0)/3.0)*0.15+(width/10.0))
+    v2 = float(height/2.0)
+    v3 = float(((width-width/10.0)/3.0)*0.35+(width/10.0))
+    v4 = float(height/2.0)
+    v5 = float(((width-width/10.0)/3.0)/2.0+(width/10.0))
+    v6 = float(((width-width/10.0)/3.0)*0.85+(width/10.0))
+    v7 = float(-height/2.0)
+    v8 = float(((width-width/10.0)/3.0)+(width/10.0))
+    v9 = float(((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.15+(width/10.0))
+    v10 = float(height/2.0)
+    v11 = float(((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.35+(width/10.0))
+    v12 = float(height/2.0)
+    v13 = float(((width-width/10.0)/3.0)+((width-width/10.0)/3.0)/2.0+(width/10.0))
+    v14 = float(((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.85+(width/10.0))
+    v15 = float(-height/2.0)
+    v16 = float(((width-width/10.0)/3.0)+((width-width/10.0)/3.0)+(width/10.0))
+    v17 = float(2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.15+(width/10.0))
+    v18 = float(height/2.0)
+    v19 = float(2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.35+(width/10.0))
+    v20 = float(height/2.0)
+    v21 = float(2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)/2.0+(width/10.0))
+    v22 = float(2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.85+(width/10.0))
+    v23 = float(-height/2.0)
+    v24 = float(2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)+(width/10.0))
+    v25 = v5 + v5 - v3
+    v26 = 0.0 + 0.0 - v4
+    v27 = v13 + v13 - v11
+    v28 = 0.0 + 0.0 - v12
+    v29 = v21 + v21 - v19
+    v30 = 0.0 + 0.0 - v20
+    vertices += [(v0, 0.0), (v1, v2), (v3, v4), (v5, 0.0), (v25, v26), (v6, v7), (v8, 0.0), (v9, v10), (v11, v12), (v13, 0.0), (v27, v28), (v14, v15), (v16, 0.0), (v17, v18), (v19, v20), (v21, 0.0), (v29, v30), (v22, v23), (v24, 0.0)]
+    codes += [1, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _double_stranded_nucleic_acid_11_box_x_values(p):
+    return ()
+
+def _double_stranded_nucleic_acid_11_box_y_values(p):
+    height = p['height']
+    return ((-height/2), )
+
+def _double_stranded_nucleic_acid_11_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _double_stranded_nucleic_acid_11_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _engineered_region_12_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _engineered_region_12_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _engineered_region_12_1_values(p):
+    height = p['height']
+    width = p['width']
+    return ((0), (-0.5*height), (width), (-0.5*height), (width), (0.5*height), (0), (0.5*height), )
+
+def _engineered_region_12_1_path(p):
+    height = p['height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-0.5*height)
+    v2 = float(width)
+    v3 = float(-0.5*height)
+    v4 = float(width)
+    v5 = float(0.5*height)
+    v6 = float(0)
+    v7 = float(0.5*height)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7)]
+    codes += [1, 2, 2, 2]
+    if v6 != v0 or v7 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _engineered_region_12_box_x_values(p):
+    return ((0), )
+
+def _engineered_region_12_box_y_values(p):
+    height = p['height']
+    return ((-0.5*height), )
+
+def _engineered_region_12_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _engineered_region_12_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _insulator_13_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _insulator_13_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _insulator_13_1_values(p):
+    width = p['width']
+    return ((0), (-0.5*width), (width), (-0.5*width), (width), (0.5*width), (0), (0.5*width), )
+
+def _insulator_13_1_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-0.5*width)
+    v2 = float(width)
+    v3 = float(-0.5*width)
+    v4 = float(width)
+    v5 = float(0.5*width)
+    v6 = float(0)
+    v7 = float(0.5*width)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7)]
+    codes += [1, 2, 2, 2]
+    if v6 != v0 or v7 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _insulator_13_2_values(p):
+    width = p['width']
+    return ((0), (-0.5*width), (width), (-0.5*width), (width), (0.5*width), (0), (0.5*width), )
+
+def _insulator_13_2_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-0.5*width)
+    v2 = float(width)
+    v3 = float(-0.5*width)
+    v4 = float(width)
+    v5 = float(0.5*width)
+    v6 = float(0)
+    v7 = float(0.5*width)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7)]
+    codes += [1, 2, 2, 2]
+    if v6 != v0 or v7 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _insulator_13_3_values(p):
+    width = p['width']
+    return ((0.2*width), (-0.3*width), (0.8*width), (-0.3*width), (0.8*width), (0.3*width), (0.2*width), (0.3*width), )
+
+def _insulator_13_3_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0.2*width)
+    v1 = float(-0.3*width)
+    v2 = float(0.8*width)
+    v3 = float(-0.3*width)
+    v4 = float(0.8*width)
+    v5 = float(0.3*width)
+    v6 = float(0.2*width)
+    v7 = float(0.3*width)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7)]
+    codes += [1, 2, 2, 2]
+    if v6 != v0 or v7 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _insulator_13_box_x_values(p):
+    return ((0), )
+
+def _insulator_13_box_y_values(p):
+    width = p['width']
+    return ((-0.5*width), )
+
+def _insulator_13_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _insulator_13_box_height_values(p):
+    width = p['width']
+    return ((width), )
+
+def _macromolecule_14_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _macromolecule_14_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _macromolecule_14_1_values(p):
+    height = p['height']
+    width = p['width']
+    return ((height/4.0), (height/2.0), (width*0.1), (height/2.0), (width*0.9), (height/2.0), (width), (height/2.0), (width), (height/4.0), (width), (-height/4.0), (width), (-height/2.0), (width*0.9), (-height/2.0), (width*0.1), (-height/2.0), (-height/2.0), (-height/4.0), (height/4.0), )
+
+def _macromolecule_14_1_path(p):
+    height = p['height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(height/4.0)
+    v1 = float(height/2.0)
+    v2 = float(width*0.1)
+    v3 = float(height/2.0)
+    v4 = float(width*0.9)
+    v5 = float(height/2.0)
+    v6 = float(width)
+    v7 = float(height/2.0)
+    v8 = float(width)
+    v9 = float(height/4.0)
+    v10 = float(width)
+    v11 = float(-height/4.0)
+    v12 = float(width)
+    v13 = float(-height/2.0)
+    v14 = float(width*0.9)
+    v15 = float(-height/2.0)
+    v16 = float(width*0.1)
+    v17 = float(-height/2.0)
+    v18 = float(-height/2.0)
+    v19 = float(-height/4.0)
+    v20 = float(height/4.0)
+    vertices += [(0.0, v0), (0.0, v1), (v2, v3), (v4, v5), (v6, v7), (v8, v9), (v10, v11), (v12, v13), (v14, v15), (v16, v17), (0.0, v18), (0.0, v19), (0.0, v20)]
+    codes += [1, 3, 3, 2, 3, 3, 2, 3, 3, 2, 3, 3, 2]
+    if 0.0 != 0.0 or v20 != v0:
+        vertices.append((0.0, v0))
+        codes.append(2)
+    vertices += [(0.0, v0)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _macromolecule_14_box_x_values(p):
+    return ()
+
+def _macromolecule_14_box_y_values(p):
+    height = p['height']
+    return ((-height/2), )
+
+def _macromolecule_14_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _macromolecule_14_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _no_glyph_15_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _no_glyph_15_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _no_glyph_15_1_values(p):
+    height = p['height']
+    width = p['width']
+    return ((0), (-0.5*height), (width), (-0.5*height), (width), (0.5*height), (0), (0.5*height), )
+
+def _no_glyph_15_1_path(p):
+    height = p['height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-0.5*height)
+    v2 = float(width)
+    v3 = float(-0.5*height)
+    v4 = float(width)
+    v5 = float(0.5*height)
+    v6 = float(0)
+    v7 = float(0.5*height)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7)]
+    codes += [1, 2, 2, 2]
+    if v6 != v0 or v7 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _no_glyph_15_2_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0.3*width), (-0.5*height), (0), (-0.5*height), (0), (0.5*height), (0.3*width), (0.5*height), )
+
+def _no_glyph_15_2_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0.3*width)
+    v1 = float(-0.5*height)
+    v2 = float(0)
+    v3 = float(-0.5*height)
+    v4 = float(0)
+    v5 = float(0.5*height)
+    v6 = float(0.3*width)
+    v7 = float(0.5*height)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7)]
+    codes += [1, 2, 2, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _no_glyph_15_3_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0.7*width), (-0.5*height), (width), (-0.5*height), (width), (0.5*height), (0.7*width), (0.5*height), )
+
+def _no_glyph_15_3_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0.7*width)
+    v1 = float(-0.5*height)
+    v2 = float(width)
+    v3 = float(-0.5*height)
+    v4 = float(width)
+    v5 = float(0.5*height)
+    v6 = float(0.7*width)
+    v7 = float(0.5*height)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7)]
+    codes += [1, 2, 2, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _no_glyph_15_box_x_values(p):
+    return ((0), )
+
+def _no_glyph_15_box_y_values(p):
+    height = p['height']
+    return ((-0.5*height), )
+
+def _no_glyph_15_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _no_glyph_15_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _omitted_detail_16_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _omitted_detail_16_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _omitted_detail_16_1_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), (width), (0), (0), (0), )
+
+def _omitted_detail_16_1_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    v4 = float(width)
+    v5 = float(0)
+    v6 = float(0)
+    v7 = float(0)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7)]
+    codes += [1, 2, 2, 2]
+    if v6 != v0 or v7 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _omitted_detail_16_2_values(p):
+    width = p['width']
+    return ((0.5*width), (0), (0.5*width), (0), )
+
+def _omitted_detail_16_2_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0.5*width)
+    v1 = float(0)
+    v2 = float(0.5*width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _omitted_detail_16_3_values(p):
+    width = p['width']
+    return ((0.25*width), (0), (0.25*width), (0), )
+
+def _omitted_detail_16_3_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0.25*width)
+    v1 = float(0)
+    v2 = float(0.25*width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _omitted_detail_16_4_values(p):
+    width = p['width']
+    return ((0.75*width), (0), (0.75*width), (0), )
+
+def _omitted_detail_16_4_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0.75*width)
+    v1 = float(0)
+    v2 = float(0.75*width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _omitted_detail_16_box_x_values(p):
+    return ((0), )
+
+def _omitted_detail_16_box_y_values(p):
+    return ((0), )
+
+def _omitted_detail_16_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _omitted_detail_16_box_height_values(p):
+    return ((0), )
+
+def _operator_17_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _operator_17_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _operator_17_1_values(p):
+    height = p['height']
+    width = p['width']
+    return ((0), (-0.5*height), (width), (-0.5*height), (width), (0.5*height), (0), (0.5*height), )
+
+def _operator_17_1_path(p):
+    height = p['height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-0.5*height)
+    v2 = float(width)
+    v3 = float(-0.5*height)
+    v4 = float(width)
+    v5 = float(0.5*height)
+    v6 = float(0)
+    v7 = float(0.5*height)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7)]
+    codes += [1, 2, 2, 2]
+    if v6 != v0 or v7 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _operator_17_2_values(p):
+    height = p['height']
+    width = p['width']
+    return ((0), (-0.5*height), (0), (0.5*height), (width), (0.5*height), (width), (-0.5*height), )
+
+def _operator_17_2_path(p):
+    height = p['height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-0.5*height)
+    v2 = float(0)
+    v3 = float(0.5*height)
+    v4 = float(width)
+    v5 = float(0.5*height)
+    v6 = float(width)
+    v7 = float(-0.5*height)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7)]
+    codes += [1, 2, 2, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _operator_17_box_x_values(p):
+    return ((0), )
+
+def _operator_17_box_y_values(p):
+    height = p['height']
+    return ((-0.5*height), )
+
+def _operator_17_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _operator_17_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _originofreplication_18_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _originofreplication_18_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _originofreplication_18_1_values(p):
+    width = p['width']
+    return ((0), (0), (0), (-0.666666666666667*width), (width), (-0.666666666666667*width), (width), (0), (width), (0.666666666666667*width), (0), (0.666666666666667*width), (0), (0), )
+
+def _originofreplication_18_1_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(0)
+    v3 = float(-0.666666666666667*width)
+    v4 = float(width)
+    v5 = float(-0.666666666666667*width)
+    v6 = float(width)
+    v7 = float(0)
+    v8 = float(width)
+    v9 = float(0.666666666666667*width)
+    v10 = float(0)
+    v11 = float(0.666666666666667*width)
+    v12 = float(0)
+    v13 = float(0)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7), (v8, v9), (v10, v11), (v12, v13)]
+    codes += [1, 4, 4, 4, 4, 4, 4]
+    if v12 != v0 or v13 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _originofreplication_18_box_x_values(p):
+    return ((0), )
+
+def _originofreplication_18_box_y_values(p):
+    width = p['width']
+    return ((-0.5*width), )
+
+def _originofreplication_18_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _originofreplication_18_box_height_values(p):
+    width = p['width']
+    return ((width), )
+
+def _originoftransfer_19_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _originoftransfer_19_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _originoftransfer_19_1_values(p):
+    width = p['width']
+    return ((0), (0), (0), (-0.666666666666667*width), (width), (-0.666666666666667*width), (width), (0), (width), (0.666666666666667*width), (0), (0.666666666666667*width), (0), (0), )
+
+def _originoftransfer_19_1_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(0)
+    v3 = float(-0.666666666666667*width)
+    v4 = float(width)
+    v5 = float(-0.666666666666667*width)
+    v6 = float(width)
+    v7 = float(0)
+    v8 = float(width)
+    v9 = float(0.666666666666667*width)
+    v10 = float(0)
+    v11 = float(0.666666666666667*width)
+    v12 = float(0)
+    v13 = float(0)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7), (v8, v9), (v10, v11), (v12, v13)]
+    codes += [1, 4, 4, 4, 4, 4, 4]
+    if v12 != v0 or v13 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _originoftransfer_19_2_values(p):
+    width = p['width']
+    return ((0.5*width), (0), (width), (-0.5*width), )
+
+def _originoftransfer_19_2_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0.5*width)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(-0.5*width)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _originoftransfer_19_3_values(p):
+    width = p['width']
+    return ((0.85*width), (-0.5*width), (width), (-0.5*width), (width), (-0.35*width), )
+
+def _originoftransfer_19_3_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0.85*width)
+    v1 = float(-0.5*width)
+    v2 = float(width)
+    v3 = float(-0.5*width)
+    v4 = float(width)
+    v5 = float(-0.35*width)
+    vertices += [(v0, v1), (v2, v3), (v4, v5)]
+    codes += [1, 2, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _originoftransfer_19_box_x_values(p):
+    return ((0), )
+
+def _originoftransfer_19_box_y_values(p):
+    width = p['width']
+    return ((-0.5*width), )
+
+def _originoftransfer_19_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _originoftransfer_19_box_height_values(p):
+    width = p['width']
+    return ((width), )
+
+def _3_overhang_site_20_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _3_overhang_site_20_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _3_overhang_site_20_1_values(p):
+    height = p['height']
+    width = p['width']
+    return ((0), (-0.5*height), (width), (-0.5*height), (width), (0.5*height), (0), (0.5*height), )
+
+def _3_overhang_site_20_1_path(p):
+    height = p['height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-0.5*height)
+    v2 = float(width)
+    v3 = float(-0.5*height)
+    v4 = float(width)
+    v5 = float(0.5*height)
+    v6 = float(0)
+    v7 = float(0.5*height)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7)]
+    codes += [1, 2, 2, 2]
+    if v6 != v0 or v7 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _3_overhang_site_20_2_values(p):
+    height = p['height']
+    width = p['width']
+    return ((0), (-0.5*height), (width), (-0.5*height), )
+
+def _3_overhang_site_20_2_path(p):
+    height = p['height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-0.5*height)
+    v2 = float(width)
+    v3 = float(-0.5*height)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _3_overhang_site_20_3_values(p):
+    height = p['height']
+    width = p['width']
+    return ((0), (0.5*height), (0.6*width), (0.5*height), )
+
+def _3_overhang_site_20_3_path(p):
+    height = p['height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0.5*height)
+    v2 = float(0.6*width)
+    v3 = float(0.5*height)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _3_overhang_site_20_box_x_values(p):
+    return ((0), )
+
+def _3_overhang_site_20_box_y_values(p):
+    height = p['height']
+    return ((-0.5*height), )
+
+def _3_overhang_site_20_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _3_overhang_site_20_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _5_overhang_site_21_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _5_overhang_site_21_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _5_overhang_site_21_1_values(p):
+    height = p['height']
+    width = p['width']
+    return ((0), (-0.5*height), (width), (-0.5*height), (width), (0.5*height), (0), (0.5*height), )
+
+def _5_overhang_site_21_1_path(p):
+    height = p['height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-0.5*height)
+    v2 = float(width)
+    v3 = float(-0.5*height)
+    v4 = float(width)
+    v5 = float(0.5*height)
+    v6 = float(0)
+    v7 = float(0.5*height)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7)]
+    codes += [1, 2, 2, 2]
+    if v6 != v0 or v7 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _5_overhang_site_21_2_values(p):
+    height = p['height']
+    width = p['width']
+    return ((0), (-0.5*height), (width), (-0.5*height), )
+
+def _5_overhang_site_21_2_path(p):
+    height = p['height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-0.5*height)
+    v2 = float(width)
+    v3 = float(-0.5*height)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _5_overhang_site_21_3_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0.4*width), (0.5*height), (width), (0.5*height), )
+
+def _5_overhang_site_21_3_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0.4*width)
+    v1 = float(0.5*height)
+    v2 = float(width)
+    v3 = float(0.5*height)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _5_overhang_site_21_box_x_values(p):
+    return ((0), )
+
+def _5_overhang_site_21_box_y_values(p):
+    height = p['height']
+    return ((-0.5*height), )
+
+def _5_overhang_site_21_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _5_overhang_site_21_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _polya_site_22_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _polya_site_22_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _polya_site_22_1_values(p):
+    width = p['width']
+    return ((0), (-0.3*width), (width), (-0.3*width), (width), (0.3*width), (0), (0.3*width), )
+
+def _polya_site_22_1_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-0.3*width)
+    v2 = float(width)
+    v3 = float(-0.3*width)
+    v4 = float(width)
+    v5 = float(0.3*width)
+    v6 = float(0)
+    v7 = float(0.3*width)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7)]
+    codes += [1, 2, 2, 2]
+    if v6 != v0 or v7 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _polya_site_22_2_values(p):
+    width = p['width']
+    return ((0), (0), (0.166666666666667*width), (-0.3*width), (0.333333*width), (0), (0.5*width), (-0.3*width), (0.66666*width), (0), (0.833333333333333*width), (-0.3*width), (1.0*width), (0), )
+
+def _polya_site_22_2_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(0.166666666666667*width)
+    v3 = float(-0.3*width)
+    v4 = float(0.333333*width)
+    v5 = float(0)
+    v6 = float(0.5*width)
+    v7 = float(-0.3*width)
+    v8 = float(0.66666*width)
+    v9 = float(0)
+    v10 = float(0.833333333333333*width)
+    v11 = float(-0.3*width)
+    v12 = float(1.0*width)
+    v13 = float(0)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7), (v8, v9), (v10, v11), (v12, v13)]
+    codes += [1, 2, 2, 2, 2, 2, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _polya_site_22_3_values(p):
+    width = p['width']
+    return ((0.0583333333333333*width), (-0.09*width), (0.275*width), (-0.09*width), )
+
+def _polya_site_22_3_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0.0583333333333333*width)
+    v1 = float(-0.09*width)
+    v2 = float(0.275*width)
+    v3 = float(-0.09*width)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _polya_site_22_4_values(p):
+    width = p['width']
+    return ((0.391666666666667*width), (-0.09*width), (0.608333333333333*width), (-0.09*width), )
+
+def _polya_site_22_4_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0.391666666666667*width)
+    v1 = float(-0.09*width)
+    v2 = float(0.608333333333333*width)
+    v3 = float(-0.09*width)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _polya_site_22_5_values(p):
+    width = p['width']
+    return ((0.725*width), (-0.09*width), (0.941666666666667*width), (-0.09*width), )
+
+def _polya_site_22_5_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0.725*width)
+    v1 = float(-0.09*width)
+    v2 = float(0.941666666666667*width)
+    v3 = float(-0.09*width)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _polya_site_22_box_x_values(p):
+    return ((0), )
+
+def _polya_site_22_box_y_values(p):
+    width = p['width']
+    return ((-0.3*width), )
+
+def _polya_site_22_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _polya_site_22_box_height_values(p):
+    width = p['width']
+    return ((0.3*width), )
+
+def _polypeptide_region_23_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _polypeptide_region_23_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _polypeptide_region_23_1_values(p):
+    arrowbody_height = p['arrowbody_height']
+    width = p['width']
+    arrowhead_width = p['arrowhead_width']
+    height = p['height']
+    return ((0), (0), (0), (-arrowbody_height/2), (width - arrowhead_width), (-arrowbody_height/2), (width - arrowhead_width), (-height/2), (width), (0), (width - arrowhead_width), (height/2), (width - arrowhead_width), (arrowbody_height/2), (0), (arrowbody_height/2), )
+
+def _polypeptide_region_23_1_path(p):
+    arrowbody_height = p['arrowbody_height']
+    width = p['width']
+    arrowhead_width = p['arrowhead_width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(0)
+    v3 = float(-arrowbody_height/2)
+    v4 = float(width - arrowhead_width)
+    v5 = float(-arrowbody_height/2)
+    v6 = float(width - arrowhead_width)
+    v7 = float(-height/2)
+    v8 = float(width)
+    v9 = float(0)
+    v10 = float(width - arrowhead_width)
+    v11 = float(height/2)
+    v12 = float(width - arrowhead_width)
+    v13 = float(arrowbody_height/2)
+    v14 = float(0)
+    v15 = float(arrowbody_height/2)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7), (v8, v9), (v10, v11), (v12, v13), (v14, v15)]
+    codes += [1, 2, 2, 2, 2, 2, 2, 2]
+    if v14 != v0 or v15 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _polypeptide_region_23_2_values(p):
+    arrowhead_width = p['arrowhead_width']
+    width = p['width']
+    arrowbody_height = p['arrowbody_height']
+    return ((0+0.25*(width - arrowhead_width)+arrowhead_width), (0), (0+0.25*(width - arrowhead_width)), (-arrowbody_height/2), (0.6*(width - arrowhead_width)), (-arrowbody_height/2), (0.6*(width - arrowhead_width)+arrowhead_width), (0), (0.6*(width - arrowhead_width)), (arrowbody_height/2), (0+0.25*(width - arrowhead_width)), (arrowbody_height/2), )
+
+def _polypeptide_region_23_2_path(p):
+    arrowhead_width = p['arrowhead_width']
+    width = p['width']
+    arrowbody_height = p['arrowbody_height']
+    vertices = []
+    codes = []
+    v0 = float(0+0.25*(width - arrowhead_width)+arrowhead_width)
+    v1 = float(0)
+    v2 = float(0+0.25*(width - arrowhead_width))
+    v3 = float(-arrowbody_height/2)
+    v4 = float(0.6*(width - arrowhead_width))
+    v5 = float(-arrowbody_height/2)
+    v6 = float(0.6*(width - arrowhead_width)+arrowhead_width)
+    v7 = float(0)
+    v8 = float(0.6*(width - arrowhead_width))
+    v9 = float(arrowbody_height/2)
+    v10 = float(0+0.25*(width - arrowhead_width))
+    v11 = float(arrowbody_height/2)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7), (v8, v9), (v10, v11)]
+    codes += [1, 2, 2, 2, 2, 2]
+    if v10 != v0 or v11 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _polypeptide_region_23_box_x_values(p):
+    return ((0), )
+
+def _polypeptide_region_23_box_y_values(p):
+    height = p['height']
+    return ((-height/2), )
+
+def _polypeptide_region_23_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _polypeptide_region_23_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _primerbindingsite_24_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _primerbindingsite_24_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _primerbindingsite_24_1_values(p):
+    width = p['width']
+    arrowhead_width = p['arrowhead_width']
+    height = p['height']
+    return ((0), (0), (width), (0), (width - arrowhead_width), (-height), )
+
+def _primerbindingsite_24_1_path(p):
+    width = p['width']
+    arrowhead_width = p['arrowhead_width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    v4 = float(width - arrowhead_width)
+    v5 = float(-height)
+    vertices += [(v0, v1), (v2, v3), (v4, v5)]
+    codes += [1, 2, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _primerbindingsite_24_box_x_values(p):
+    return ((0), )
+
+def _primerbindingsite_24_box_y_values(p):
+    height = p['height']
+    return ((-height), )
+
+def _primerbindingsite_24_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _primerbindingsite_24_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _promoter_25_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _promoter_25_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _promoter_25_1_values(p):
+    height = p['height']
+    arrowbody_height = p['arrowbody_height']
+    width = p['width']
+    return ((0), (0), (0), (-height +arrowbody_height/2), (width), (-height +arrowbody_height/2), )
+
+def _promoter_25_1_path(p):
+    height = p['height']
+    arrowbody_height = p['arrowbody_height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(0)
+    v3 = float(-height +arrowbody_height/2)
+    v4 = float(width)
+    v5 = float(-height +arrowbody_height/2)
+    vertices += [(v0, v1), (v2, v3), (v4, v5)]
+    codes += [1, 2, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _promoter_25_2_values(p):
+    arrowhead_width = p['arrowhead_width']
+    height = p['height']
+    width = p['width']
+    arrowbody_height = p['arrowbody_height']
+    return ((arrowhead_width), (-height), (width), (-height + arrowbody_height/2), (arrowhead_width), (-height + arrowbody_height), )
+
+def _promoter_25_2_path(p):
+    arrowhead_width = p['arrowhead_width']
+    height = p['height']
+    width = p['width']
+    arrowbody_height = p['arrowbody_height']
+    vertices = []
+    codes = []
+    v0 = float(arrowhead_width)
+    v1 = float(-height)
+    v2 = float(width)
+    v3 = float(-height + arrowbody_height/2)
+    v4 = float(arrowhead_width)
+    v5 = float(-height + arrowbody_height)
+    vertices += [(v0, v1), (v2, v3), (v4, v5)]
+    codes += [1, 2, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _promoter_25_box_x_values(p):
+    return ((0), )
+
+def _promoter_25_box_y_values(p):
+    height = p['height']
+    arrowbody_height = p['arrowbody_height']
+    return ((-arrowbody_height - height), )
+
+def _promoter_25_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _promoter_25_box_height_values(p):
+    arrowbody_height = p['arrowbody_height']
+    height = p['height']
+    return ((arrowbody_height + height), )
+
+def _polypeptide_chain_26_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _polypeptide_chain_26_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _polypeptide_chain_26_1_values(p):
+    height = p['height']
+    width = p['width']
+    return ((height/2.0), (width*0.3), (height/2.0), (width*0.7), (height/2.0), (width), (height/2.0), (width), (width), (-height/2.0), (width*0.7), (-height/2.0), (width*0.3), (-height/2.0), (-height/2.0), )
+
+def _polypeptide_chain_26_1_path(p):
+    height = p['height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(height/2.0)
+    v1 = float(width*0.3)
+    v2 = float(height/2.0)
+    v3 = float(width*0.7)
+    v4 = float(height/2.0)
+    v5 = float(width)
+    v6 = float(height/2.0)
+    v7 = float(width)
+    v8 = float(width)
+    v9 = float(-height/2.0)
+    v10 = float(width*0.7)
+    v11 = float(-height/2.0)
+    v12 = float(width*0.3)
+    v13 = float(-height/2.0)
+    v14 = float(-height/2.0)
+    vertices += [(0.0, 0.0), (0.0, v0), (v1, v2), (v3, v4), (v5, v6), (v7, 0.0), (v8, v9), (v10, v11), (v12, v13), (0.0, v14), (0.0, 0.0), (0.0, 0.0)]
+    codes += [1, 3, 3, 2, 3, 3, 3, 3, 2, 3, 3, 79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _polypeptide_chain_26_box_x_values(p):
+    return ()
+
+def _polypeptide_chain_26_box_y_values(p):
+    height = p['height']
+    return ((-height/2), )
+
+def _polypeptide_chain_26_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _polypeptide_chain_26_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _protein_cleavage_site_27_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _protein_cleavage_site_27_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _protein_cleavage_site_27_1_values(p):
+    width = p['width']
+    height = p['height']
+    return ((width/2), (-height + width/2), (width/2), (width/2), (2 + (height - width/2)/3), ((height - width/2)/3), (width/2), (width/2), (2 + (height - width/2)/3), ((height - width/2)/3), (width/2), (width/2), (2 + (height - width/2)/3), ((height - width/2)/3), )
+
+def _protein_cleavage_site_27_1_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(width/2)
+    v1 = float(-height + width/2)
+    v2 = float(width/2)
+    v3 = float(width/2)
+    v4 = float(2 + (height - width/2)/3)
+    v5 = float((height - width/2)/3)
+    v6 = float(width/2)
+    v7 = float(width/2)
+    v8 = float(2 + (height - width/2)/3)
+    v9 = float((height - width/2)/3)
+    v10 = float(width/2)
+    v11 = float(width/2)
+    v12 = float(2 + (height - width/2)/3)
+    v13 = float((height - width/2)/3)
+    v14 = 0.0 + v0
+    v15 = 0.0 + v1
+    v16 = v2 + v14
+    v17 = -2.0 + v15
+    v18 = v3 + v14
+    v19 = v4 + v15
+    v20 = -0.0 + v14
+    v21 = v5 + v15
+    v22 = v6 + v20
+    v23 = -2.0 + v21
+    v24 = v7 + v20
+    v25 = v8 + v21
+    v26 = 0.0 + v20
+    v27 = v9 + v21
+    v28 = v10 + v26
+    v29 = -2.0 + v27
+    v30 = v11 + v26
+    v31 = v12 + v27
+    v32 = -0.0 + v26
+    v33 = v13 + v27
+    vertices += [(v14, v15), (v16, v17), (v18, v19), (v20, v21), (v22, v23), (v24, v25), (v26, v27), (v28, v29), (v30, v31), (v32, v33)]
+    codes += [1, 4, 4, 4, 4, 4, 4, 4, 4, 4]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _protein_cleavage_site_27_2_values(p):
+    height = p['height']
+    width = p['width']
+    return ((0), (-height), (width), (-height+width), )
+
+def _protein_cleavage_site_27_2_path(p):
+    height = p['height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-height)
+    v2 = float(width)
+    v3 = float(-height+width)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _protein_cleavage_site_27_3_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0), (-height+width), (width), (-height), )
+
+def _protein_cleavage_site_27_3_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-height+width)
+    v2 = float(width)
+    v3 = float(-height)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _protein_cleavage_site_27_box_x_values(p):
+    return ((0), )
+
+def _protein_cleavage_site_27_box_y_values(p):
+    height = p['height']
+    return ((-height), )
+
+def _protein_cleavage_site_27_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _protein_cleavage_site_27_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _protein_location_28_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _protein_location_28_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _protein_location_28_1_values(p):
+    width = p['width']
+    height = p['height']
+    return ((width/2), (-height + width/2), (width/2), (width/2), (2 + (height - width/2)/3), ((height - width/2)/3), (width/2), (width/2), (2 + (height - width/2)/3), ((height - width/2)/3), (width/2), (width/2), (2 + (height - width/2)/3), ((height - width/2)/3), )
+
+def _protein_location_28_1_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(width/2)
+    v1 = float(-height + width/2)
+    v2 = float(width/2)
+    v3 = float(width/2)
+    v4 = float(2 + (height - width/2)/3)
+    v5 = float((height - width/2)/3)
+    v6 = float(width/2)
+    v7 = float(width/2)
+    v8 = float(2 + (height - width/2)/3)
+    v9 = float((height - width/2)/3)
+    v10 = float(width/2)
+    v11 = float(width/2)
+    v12 = float(2 + (height - width/2)/3)
+    v13 = float((height - width/2)/3)
+    v14 = 0.0 + v0
+    v15 = 0.0 + v1
+    v16 = v2 + v14
+    v17 = -2.0 + v15
+    v18 = v3 + v14
+    v19 = v4 + v15
+    v20 = -0.0 + v14
+    v21 = v5 + v15
+    v22 = v6 + v20
+    v23 = -2.0 + v21
+    v24 = v7 + v20
+    v25 = v8 + v21
+    v26 = 0.0 + v20
+    v27 = v9 + v21
+    v28 = v10 + v26
+    v29 = -2.0 + v27
+    v30 = v11 + v26
+    v31 = v12 + v27
+    v32 = -0.0 + v26
+    v33 = v13 + v27
+    vertices += [(v14, v15), (v16, v17), (v18, v19), (v20, v21), (v22, v23), (v24, v25), (v26, v27), (v28, v29), (v30, v31), (v32, v33)]
+    codes += [1, 4, 4, 4, 4, 4, 4, 4, 4, 4]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _protein_location_28_2_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0), (-height + width - 0.5*width), (0), (-height + width - 1.16666666666667*width), (width), (-height + width - 1.16666666666667*width), (width), (-height + width - 0.5*width), (width), (-height + width + 0.166666666666667*width), (0), (-height + width + 0.166666666666667*width), (0), (-height + width - 0.5*width), )
+
+def _protein_location_28_2_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-height + width - 0.5*width)
+    v2 = float(0)
+    v3 = float(-height + width - 1.16666666666667*width)
+    v4 = float(width)
+    v5 = float(-height + width - 1.16666666666667*width)
+    v6 = float(width)
+    v7 = float(-height + width - 0.5*width)
+    v8 = float(width)
+    v9 = float(-height + width + 0.166666666666667*width)
+    v10 = float(0)
+    v11 = float(-height + width + 0.166666666666667*width)
+    v12 = float(0)
+    v13 = float(-height + width - 0.5*width)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7), (v8, v9), (v10, v11), (v12, v13)]
+    codes += [1, 4, 4, 4, 4, 4, 4]
+    if v12 != v0 or v13 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _protein_location_28_box_x_values(p):
+    return ((0), )
+
+def _protein_location_28_box_y_values(p):
+    height = p['height']
+    return ((-height), )
+
+def _protein_location_28_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _protein_location_28_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _protein_stability_element_29_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _protein_stability_element_29_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _protein_stability_element_29_1_values(p):
+    width = p['width']
+    height = p['height']
+    return ((width/2), (-height + width/2), (width/2), (width/2), (2 + (height - width/2)/3), ((height - width/2)/3), (width/2), (width/2), (2 + (height - width/2)/3), ((height - width/2)/3), (width/2), (width/2), (2 + (height - width/2)/3), ((height - width/2)/3), )
+
+def _protein_stability_element_29_1_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(width/2)
+    v1 = float(-height + width/2)
+    v2 = float(width/2)
+    v3 = float(width/2)
+    v4 = float(2 + (height - width/2)/3)
+    v5 = float((height - width/2)/3)
+    v6 = float(width/2)
+    v7 = float(width/2)
+    v8 = float(2 + (height - width/2)/3)
+    v9 = float((height - width/2)/3)
+    v10 = float(width/2)
+    v11 = float(width/2)
+    v12 = float(2 + (height - width/2)/3)
+    v13 = float((height - width/2)/3)
+    v14 = 0.0 + v0
+    v15 = 0.0 + v1
+    v16 = v2 + v14
+    v17 = -2.0 + v15
+    v18 = v3 + v14
+    v19 = v4 + v15
+    v20 = -0.0 + v14
+    v21 = v5 + v15
+    v22 = v6 + v20
+    v23 = -2.0 + v21
+    v24 = v7 + v20
+    v25 = v8 + v21
+    v26 = 0.0 + v20
+    v27 = v9 + v21
+    v28 = v10 + v26
+    v29 = -2.0 + v27
+    v30 = v11 + v26
+    v31 = v12 + v27
+    v32 = -0.0 + v26
+    v33 = v13 + v27
+    vertices += [(v14, v15), (v16, v17), (v18, v19), (v20, v21), (v22, v23), (v24, v25), (v26, v27), (v28, v29), (v30, v31), (v32, v33)]
+    codes += [1, 4, 4, 4, 4, 4, 4, 4, 4, 4]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _protein_stability_element_29_2_values(p):
+    height = p['height']
+    width = p['width']
+    return ((0), (-height), (width), (-height), (width), (-height + width - 0.3*width), (0.5*width), (-height + width), (0), (-height + width - 0.3*width), )
+
+def _protein_stability_element_29_2_path(p):
+    height = p['height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-height)
+    v2 = float(width)
+    v3 = float(-height)
+    v4 = float(width)
+    v5 = float(-height + width - 0.3*width)
+    v6 = float(0.5*width)
+    v7 = float(-height + width)
+    v8 = float(0)
+    v9 = float(-height + width - 0.3*width)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7), (v8, v9)]
+    codes += [1, 2, 2, 2, 2]
+    if v8 != v0 or v9 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _protein_stability_element_29_box_x_values(p):
+    return ((0), )
+
+def _protein_stability_element_29_box_y_values(p):
+    height = p['height']
+    return ((-height), )
+
+def _protein_stability_element_29_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _protein_stability_element_29_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _rna_cleavage_site_30_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _rna_cleavage_site_30_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _rna_cleavage_site_30_1_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0.5*width), (-2*(height-width/2)/3), ((height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/3), )
+
+def _rna_cleavage_site_30_1_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0.5*width)
+    v1 = float(-2*(height-width/2)/3)
+    v2 = float((height-width/2)/6)
+    v3 = float(-(height-width/2)/6)
+    v4 = float(-(height-width/2)/6)
+    v5 = float(-(height-width/2)/6)
+    v6 = float(-(height-width/2)/3)
+    v7 = 0.0 + v0
+    v8 = 0.0 + v1
+    v9 = v2 + v7
+    v10 = v3 + v8
+    v11 = v4 + v7
+    v12 = v5 + v8
+    v13 = 0.0 + v7
+    v14 = v6 + v8
+    vertices += [(v7, v8), (v9, v10), (v11, v12), (v13, v14)]
+    codes += [1, 4, 4, 4]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _rna_cleavage_site_30_2_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0.5*width), (-(height-width/2)/3), ((height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/3), )
+
+def _rna_cleavage_site_30_2_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0.5*width)
+    v1 = float(-(height-width/2)/3)
+    v2 = float((height-width/2)/6)
+    v3 = float(-(height-width/2)/6)
+    v4 = float(-(height-width/2)/6)
+    v5 = float(-(height-width/2)/6)
+    v6 = float(-(height-width/2)/3)
+    v7 = 0.0 + v0
+    v8 = 0.0 + v1
+    v9 = v2 + v7
+    v10 = v3 + v8
+    v11 = v4 + v7
+    v12 = v5 + v8
+    v13 = 0.0 + v7
+    v14 = v6 + v8
+    vertices += [(v7, v8), (v9, v10), (v11, v12), (v13, v14)]
+    codes += [1, 4, 4, 4]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _rna_cleavage_site_30_3_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0.5*width), (0), ((height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/3), )
+
+def _rna_cleavage_site_30_3_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0.5*width)
+    v1 = float(0)
+    v2 = float((height-width/2)/6)
+    v3 = float(-(height-width/2)/6)
+    v4 = float(-(height-width/2)/6)
+    v5 = float(-(height-width/2)/6)
+    v6 = float(-(height-width/2)/3)
+    v7 = 0.0 + v0
+    v8 = 0.0 + v1
+    v9 = v2 + v7
+    v10 = v3 + v8
+    v11 = v4 + v7
+    v12 = v5 + v8
+    v13 = 0.0 + v7
+    v14 = v6 + v8
+    vertices += [(v7, v8), (v9, v10), (v11, v12), (v13, v14)]
+    codes += [1, 4, 4, 4]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _rna_cleavage_site_30_4_values(p):
+    height = p['height']
+    width = p['width']
+    return ((0), (-height), (width), (-height+width), )
+
+def _rna_cleavage_site_30_4_path(p):
+    height = p['height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-height)
+    v2 = float(width)
+    v3 = float(-height+width)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _rna_cleavage_site_30_5_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0), (-height+width), (width), (-height), )
+
+def _rna_cleavage_site_30_5_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-height+width)
+    v2 = float(width)
+    v3 = float(-height)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _rna_cleavage_site_30_box_x_values(p):
+    return ((0), )
+
+def _rna_cleavage_site_30_box_y_values(p):
+    height = p['height']
+    return ((-height), )
+
+def _rna_cleavage_site_30_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _rna_cleavage_site_30_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _rna_location_31_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _rna_location_31_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _rna_location_31_1_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0.5*width), (-2*(height-width/2)/3), ((height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/3), )
+
+def _rna_location_31_1_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0.5*width)
+    v1 = float(-2*(height-width/2)/3)
+    v2 = float((height-width/2)/6)
+    v3 = float(-(height-width/2)/6)
+    v4 = float(-(height-width/2)/6)
+    v5 = float(-(height-width/2)/6)
+    v6 = float(-(height-width/2)/3)
+    v7 = 0.0 + v0
+    v8 = 0.0 + v1
+    v9 = v2 + v7
+    v10 = v3 + v8
+    v11 = v4 + v7
+    v12 = v5 + v8
+    v13 = 0.0 + v7
+    v14 = v6 + v8
+    vertices += [(v7, v8), (v9, v10), (v11, v12), (v13, v14)]
+    codes += [1, 4, 4, 4]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _rna_location_31_2_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0.5*width), (-(height-width/2)/3), ((height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/3), )
+
+def _rna_location_31_2_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0.5*width)
+    v1 = float(-(height-width/2)/3)
+    v2 = float((height-width/2)/6)
+    v3 = float(-(height-width/2)/6)
+    v4 = float(-(height-width/2)/6)
+    v5 = float(-(height-width/2)/6)
+    v6 = float(-(height-width/2)/3)
+    v7 = 0.0 + v0
+    v8 = 0.0 + v1
+    v9 = v2 + v7
+    v10 = v3 + v8
+    v11 = v4 + v7
+    v12 = v5 + v8
+    v13 = 0.0 + v7
+    v14 = v6 + v8
+    vertices += [(v7, v8), (v9, v10), (v11, v12), (v13, v14)]
+    codes += [1, 4, 4, 4]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _rna_location_31_3_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0.5*width), (0), ((height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/3), )
+
+def _rna_location_31_3_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0.5*width)
+    v1 = float(0)
+    v2 = float((height-width/2)/6)
+    v3 = float(-(height-width/2)/6)
+    v4 = float(-(height-width/2)/6)
+    v5 = float(-(height-width/2)/6)
+    v6 = float(-(height-width/2)/3)
+    v7 = 0.0 + v0
+    v8 = 0.0 + v1
+    v9 = v2 + v7
+    v10 = v3 + v8
+    v11 = v4 + v7
+    v12 = v5 + v8
+    v13 = 0.0 + v7
+    v14 = v6 + v8
+    vertices += [(v7, v8), (v9, v10), (v11, v12), (v13, v14)]
+    codes += [1, 4, 4, 4]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _rna_location_31_4_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0), (-height + width - 0.5*width), (0), (-height + width - 1.16666666666667*width), (width), (-height + width - 1.16666666666667*width), (width), (-height + width - 0.5*width), (width), (-height + width + 0.166666666666667*width), (0), (-height + width + 0.166666666666667*width), (0), (-height + width - 0.5*width), )
+
+def _rna_location_31_4_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-height + width - 0.5*width)
+    v2 = float(0)
+    v3 = float(-height + width - 1.16666666666667*width)
+    v4 = float(width)
+    v5 = float(-height + width - 1.16666666666667*width)
+    v6 = float(width)
+    v7 = float(-height + width - 0.5*width)
+    v8 = float(width)
+    v9 = float(-height + width + 0.166666666666667*width)
+    v10 = float(0)
+    v11 = float(-height + width + 0.166666666666667*width)
+    v12 = float(0)
+    v13 = float(-height + width - 0.5*width)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7), (v8, v9), (v10, v11), (v12, v13)]
+    codes += [1, 4, 4, 4, 4, 4, 4]
+    if v12 != v0 or v13 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _rna_location_31_box_x_values(p):
+    return ((0), )
+
+def _rna_location_31_box_y_values(p):
+    height = p['height']
+    return ((-height), )
+
+def _rna_location_31_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _rna_location_31_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _rna_stability_element_32_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _rna_stability_element_32_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _rna_stability_element_32_1_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0.5*width), (-2*(height-width/2)/3), ((height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/3), )
+
+def _rna_stability_element_32_1_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0.5*width)
+    v1 = float(-2*(height-width/2)/3)
+    v2 = float((height-width/2)/6)
+    v3 = float(-(height-width/2)/6)
+    v4 = float(-(height-width/2)/6)
+    v5 = float(-(height-width/2)/6)
+    v6 = float(-(height-width/2)/3)
+    v7 = 0.0 + v0
+    v8 = 0.0 + v1
+    v9 = v2 + v7
+    v10 = v3 + v8
+    v11 = v4 + v7
+    v12 = v5 + v8
+    v13 = 0.0 + v7
+    v14 = v6 + v8
+    vertices += [(v7, v8), (v9, v10), (v11, v12), (v13, v14)]
+    codes += [1, 4, 4, 4]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _rna_stability_element_32_2_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0.5*width), (-(height-width/2)/3), ((height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/3), )
+
+def _rna_stability_element_32_2_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0.5*width)
+    v1 = float(-(height-width/2)/3)
+    v2 = float((height-width/2)/6)
+    v3 = float(-(height-width/2)/6)
+    v4 = float(-(height-width/2)/6)
+    v5 = float(-(height-width/2)/6)
+    v6 = float(-(height-width/2)/3)
+    v7 = 0.0 + v0
+    v8 = 0.0 + v1
+    v9 = v2 + v7
+    v10 = v3 + v8
+    v11 = v4 + v7
+    v12 = v5 + v8
+    v13 = 0.0 + v7
+    v14 = v6 + v8
+    vertices += [(v7, v8), (v9, v10), (v11, v12), (v13, v14)]
+    codes += [1, 4, 4, 4]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _rna_stability_element_32_3_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0.5*width), (0), ((height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/3), )
+
+def _rna_stability_element_32_3_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0.5*width)
+    v1 = float(0)
+    v2 = float((height-width/2)/6)
+    v3 = float(-(height-width/2)/6)
+    v4 = float(-(height-width/2)/6)
+    v5 = float(-(height-width/2)/6)
+    v6 = float(-(height-width/2)/3)
+    v7 = 0.0 + v0
+    v8 = 0.0 + v1
+    v9 = v2 + v7
+    v10 = v3 + v8
+    v11 = v4 + v7
+    v12 = v5 + v8
+    v13 = 0.0 + v7
+    v14 = v6 + v8
+    vertices += [(v7, v8), (v9, v10), (v11, v12), (v13, v14)]
+    codes += [1, 4, 4, 4]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _rna_stability_element_32_4_values(p):
+    height = p['height']
+    width = p['width']
+    return ((0), (-height), (width), (-height), (width), (-height + width - 0.3*width), (0.5*width), (-height + width), (0), (-height + width - 0.3*width), )
+
+def _rna_stability_element_32_4_path(p):
+    height = p['height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-height)
+    v2 = float(width)
+    v3 = float(-height)
+    v4 = float(width)
+    v5 = float(-height + width - 0.3*width)
+    v6 = float(0.5*width)
+    v7 = float(-height + width)
+    v8 = float(0)
+    v9 = float(-height + width - 0.3*width)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7), (v8, v9)]
+    codes += [1, 2, 2, 2, 2]
+    if v8 != v0 or v9 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _rna_stability_element_32_box_x_values(p):
+    return ((0), )
+
+def _rna_stability_element_32_box_y_values(p):
+    height = p['height']
+    return ((-height), )
+
+def _rna_stability_element_32_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _rna_stability_element_32_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _rna_stop_site_33_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _rna_stop_site_33_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _rna_stop_site_33_1_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0.5*width), (- 2*(height-width/2)/3), ((height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/3), )
+
+def _rna_stop_site_33_1_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0.5*width)
+    v1 = float(- 2*(height-width/2)/3)
+    v2 = float((height-width/2)/6)
+    v3 = float(-(height-width/2)/6)
+    v4 = float(-(height-width/2)/6)
+    v5 = float(-(height-width/2)/6)
+    v6 = float(-(height-width/2)/3)
+    v7 = 0.0 + v0
+    v8 = 0.0 + v1
+    v9 = v2 + v7
+    v10 = v3 + v8
+    v11 = v4 + v7
+    v12 = v5 + v8
+    v13 = 0.0 + v7
+    v14 = v6 + v8
+    vertices += [(v7, v8), (v9, v10), (v11, v12), (v13, v14)]
+    codes += [1, 4, 4, 4]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _rna_stop_site_33_2_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0.5*width), (- (height-width/2)/3), ((height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/3), )
+
+def _rna_stop_site_33_2_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0.5*width)
+    v1 = float(- (height-width/2)/3)
+    v2 = float((height-width/2)/6)
+    v3 = float(-(height-width/2)/6)
+    v4 = float(-(height-width/2)/6)
+    v5 = float(-(height-width/2)/6)
+    v6 = float(-(height-width/2)/3)
+    v7 = 0.0 + v0
+    v8 = 0.0 + v1
+    v9 = v2 + v7
+    v10 = v3 + v8
+    v11 = v4 + v7
+    v12 = v5 + v8
+    v13 = 0.0 + v7
+    v14 = v6 + v8
+    vertices += [(v7, v8), (v9, v10), (v11, v12), (v13, v14)]
+    codes += [1, 4, 4, 4]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _rna_stop_site_33_3_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0.5*width), (0), ((height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/6), (-(height-width/2)/3), )
+
+def _rna_stop_site_33_3_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0.5*width)
+    v1 = float(0)
+    v2 = float((height-width/2)/6)
+    v3 = float(-(height-width/2)/6)
+    v4 = float(-(height-width/2)/6)
+    v5 = float(-(height-width/2)/6)
+    v6 = float(-(height-width/2)/3)
+    v7 = 0.0 + v0
+    v8 = 0.0 + v1
+    v9 = v2 + v7
+    v10 = v3 + v8
+    v11 = v4 + v7
+    v12 = v5 + v8
+    v13 = 0.0 + v7
+    v14 = v6 + v8
+    vertices += [(v7, v8), (v9, v10), (v11, v12), (v13, v14)]
+    codes += [1, 4, 4, 4]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _rna_stop_site_33_4_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0), (-height + width - 0.5*width), (0), (-height + width - 1.16666666666667*width), (width), (-height + width - 1.16666666666667*width), (width), (-height + width - 0.5*width), (width), (-height + width + 0.166666666666667*width), (0), (-height + width + 0.166666666666667*width), (0), (-height + width - 0.5*width), )
+
+def _rna_stop_site_33_4_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-height + width - 0.5*width)
+    v2 = float(0)
+    v3 = float(-height + width - 1.16666666666667*width)
+    v4 = float(width)
+    v5 = float(-height + width - 1.16666666666667*width)
+    v6 = float(width)
+    v7 = float(-height + width - 0.5*width)
+    v8 = float(width)
+    v9 = float(-height + width + 0.166666666666667*width)
+    v10 = float(0)
+    v11 = float(-height + width + 0.166666666666667*width)
+    v12 = float(0)
+    v13 = float(-height + width - 0.5*width)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7), (v8, v9), (v10, v11), (v12, v13)]
+    codes += [1, 4, 4, 4, 4, 4, 4]
+    if v12 != v0 or v13 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _rna_stop_site_33_5_values(p):
+    width = p['width']
+    height = p['height']
+    return (((0.5*width)), (-height+(0.5*width)), ((0.5*width)+(0.58778525229*(0.2*width))), ((-height+(0.5*width))+(0.80901699437*(0.2*width))), )
+
+def _rna_stop_site_33_5_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float((0.5*width))
+    v1 = float(-height+(0.5*width))
+    v2 = float((0.5*width)+(0.58778525229*(0.2*width)))
+    v3 = float((-height+(0.5*width))+(0.80901699437*(0.2*width)))
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _rna_stop_site_33_6_values(p):
+    width = p['width']
+    height = p['height']
+    return (((0.5*width)), (-height+(0.5*width)), ((0.5*width)+(0.95105651629*(0.2*width))), ((-height+(0.5*width))+(-0.30901699437*(0.2*width))), )
+
+def _rna_stop_site_33_6_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float((0.5*width))
+    v1 = float(-height+(0.5*width))
+    v2 = float((0.5*width)+(0.95105651629*(0.2*width)))
+    v3 = float((-height+(0.5*width))+(-0.30901699437*(0.2*width)))
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _rna_stop_site_33_7_values(p):
+    width = p['width']
+    height = p['height']
+    return (((0.5*width)), (-height+(0.5*width)), ((0.5*width)+(0.0*(0.2*width))), ((-height+(0.5*width))+(-1.0*(0.2*width))), )
+
+def _rna_stop_site_33_7_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float((0.5*width))
+    v1 = float(-height+(0.5*width))
+    v2 = float((0.5*width)+(0.0*(0.2*width)))
+    v3 = float((-height+(0.5*width))+(-1.0*(0.2*width)))
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _rna_stop_site_33_8_values(p):
+    width = p['width']
+    height = p['height']
+    return (((0.5*width)), (-height+(0.5*width)), ((0.5*width)+(-0.95105651629*(0.2*width))), ((-height+(0.5*width))+(-0.30901699437*(0.2*width))), )
+
+def _rna_stop_site_33_8_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float((0.5*width))
+    v1 = float(-height+(0.5*width))
+    v2 = float((0.5*width)+(-0.95105651629*(0.2*width)))
+    v3 = float((-height+(0.5*width))+(-0.30901699437*(0.2*width)))
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _rna_stop_site_33_9_values(p):
+    width = p['width']
+    height = p['height']
+    return (((0.5*width)), (-height+(0.5*width)), ((0.5*width)+(-0.58778525229*(0.2*width))), ((-height+(0.5*width))+(0.80901699437*(0.2*width))), )
+
+def _rna_stop_site_33_9_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float((0.5*width))
+    v1 = float(-height+(0.5*width))
+    v2 = float((0.5*width)+(-0.58778525229*(0.2*width)))
+    v3 = float((-height+(0.5*width))+(0.80901699437*(0.2*width)))
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _rna_stop_site_33_box_x_values(p):
+    return ((0), )
+
+def _rna_stop_site_33_box_y_values(p):
+    height = p['height']
+    return ((-height), )
+
+def _rna_stop_site_33_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _rna_stop_site_33_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _recombination_site_34_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _recombination_site_34_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _recombination_site_34_1_values(p):
+    height = p['height']
+    width = p['width']
+    return ((0), (-0.5*height), (width), (0), (0), (0.5*height), )
+
+def _recombination_site_34_1_path(p):
+    height = p['height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-0.5*height)
+    v2 = float(width)
+    v3 = float(0)
+    v4 = float(0)
+    v5 = float(0.5*height)
+    vertices += [(v0, v1), (v2, v3), (v4, v5)]
+    codes += [1, 2, 2]
+    if v4 != v0 or v5 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _recombination_site_34_box_x_values(p):
+    return ((0), )
+
+def _recombination_site_34_box_y_values(p):
+    height = p['height']
+    return ((-0.5*height), )
+
+def _recombination_site_34_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _recombination_site_34_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _ribosomeentrysite_35_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _ribosomeentrysite_35_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _ribosomeentrysite_35_1_values(p):
+    width = p['width']
+    return ((0), (0), (0), (-0.666666666666667*width), (width), (-0.666666666666667*width), (width), (0), (0), (0), )
+
+def _ribosomeentrysite_35_1_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(0)
+    v3 = float(-0.666666666666667*width)
+    v4 = float(width)
+    v5 = float(-0.666666666666667*width)
+    v6 = float(width)
+    v7 = float(0)
+    v8 = float(0)
+    v9 = float(0)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7), (v8, v9)]
+    codes += [1, 4, 4, 4, 2]
+    if v8 != v0 or v9 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _ribosomeentrysite_35_box_x_values(p):
+    return ((0), )
+
+def _ribosomeentrysite_35_box_y_values(p):
+    width = p['width']
+    return ((-0.5*width), )
+
+def _ribosomeentrysite_35_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _ribosomeentrysite_35_box_height_values(p):
+    width = p['width']
+    return ((0.5*width), )
+
+def _signature_36_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _signature_36_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _signature_36_1_values(p):
+    height = p['height']
+    width = p['width']
+    return ((0), (-height), (width), (-height), (width), (0), (0), (0), )
+
+def _signature_36_1_path(p):
+    height = p['height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-height)
+    v2 = float(width)
+    v3 = float(-height)
+    v4 = float(width)
+    v5 = float(0)
+    v6 = float(0)
+    v7 = float(0)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7)]
+    codes += [1, 2, 2, 2]
+    if v6 != v0 or v7 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _signature_36_2_values(p):
+    height = p['height']
+    return ((0.3*height), (-0.7*height), (0.7*height), (-0.3*height), )
+
+def _signature_36_2_path(p):
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0.3*height)
+    v1 = float(-0.7*height)
+    v2 = float(0.7*height)
+    v3 = float(-0.3*height)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _signature_36_3_values(p):
+    height = p['height']
+    return ((0.3*height), (-0.3*height), (0.7*height), (-0.7*height), )
+
+def _signature_36_3_path(p):
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0.3*height)
+    v1 = float(-0.3*height)
+    v2 = float(0.7*height)
+    v3 = float(-0.7*height)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _signature_36_4_values(p):
+    height = p['height']
+    width = p['width']
+    return ((height), (-0.3*height), (-0.3*height + width), (-0.3*height), )
+
+def _signature_36_4_path(p):
+    height = p['height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(height)
+    v1 = float(-0.3*height)
+    v2 = float(-0.3*height + width)
+    v3 = float(-0.3*height)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _signature_36_box_x_values(p):
+    return ((0), )
+
+def _signature_36_box_y_values(p):
+    height = p['height']
+    return ((-height), )
+
+def _signature_36_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _signature_36_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _simple_chemical_circle_37_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _simple_chemical_circle_37_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _simple_chemical_circle_37_1_values(p):
+    width = p['width']
+    return ((width/2.0), (width/2.0), (width/2.0), (width), (width/2.0), (width), (width), (-width/2.0), (width/2.0), (-width/2.0), (-width/2.0), )
+
+def _simple_chemical_circle_37_1_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(width/2.0)
+    v1 = float(width/2.0)
+    v2 = float(width/2.0)
+    v3 = float(width)
+    v4 = float(width/2.0)
+    v5 = float(width)
+    v6 = float(width)
+    v7 = float(-width/2.0)
+    v8 = float(width/2.0)
+    v9 = float(-width/2.0)
+    v10 = float(-width/2.0)
+    vertices += [(0.0, 0.0), (0.0, v0), (v1, v2), (v3, v4), (v5, 0.0), (v6, v7), (v8, v9), (0.0, v10), (0.0, 0.0), (0.0, 0.0)]
+    codes += [1, 3, 3, 3, 3, 3, 3, 3, 3, 79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _simple_chemical_circle_37_box_x_values(p):
+    return ()
+
+def _simple_chemical_circle_37_box_y_values(p):
+    width = p['width']
+    return ((-width/2), )
+
+def _simple_chemical_circle_37_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _simple_chemical_circle_37_box_height_values(p):
+    width = p['width']
+    return ((width), )
+
+def _single_stranded_nucleic_acid_38_0_values(p):
+    return ((0), (0), (0), (0), )
+
+def _single_stranded_nucleic_acid_38_0_path(p):
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(0)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _single_stranded_nucleic_acid_38_1_values(p):
+    width = p['width']
+    height = p['height']
+    return (((width/3.0)*0.15), (height/2.0), ((width/3.0)*0.35), (height/2.0), ((width/3.0)/2.0), ((width/3.0)*0.85), (-height/2.0), ((width/3.0)), ((width/3.0)+(width/3.0)*0.15), (height/2.0), ((width/3.0)+(width/3.0)*0.35), (height/2.0), ((width/3.0)+(width/3.0)/2.0), ((width/3.0)+(width/3.0)*0.85), (-height/2.0), ((width/3.0)+(width/3.0)), (2*(width/3.0)+(width/3.0)*0.15), (height/2.0), (2*(width/3.0)+(width/3.0)*0.35), (height/2.0), (2*(width/3.0)+(width/3.0)/2.0), (2*(width/3.0)+(width/3.0)*0.85), (-height/2.0), (2*(width/3.0)+(width/3.0)), )
+
+def _single_stranded_nucleic_acid_38_1_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float((width/3.0)*0.15)
+    v1 = float(height/2.0)
+    v2 = float((width/3.0)*0.35)
+    v3 = float(height/2.0)
+    v4 = float((width/3.0)/2.0)
+    v5 = float((width/3.0)*0.85)
+    v6 = float(-height/2.0)
+    v7 = float((width/3.0))
+    v8 = float((width/3.0)+(width/3.0)*0.15)
+    v9 = float(height/2.0)
+    v10 = float((width/3.0)+(width/3.0)*0.35)
+    v11 = float(height/2.0)
+    v12 = float((width/3.0)+(width/3.0)/2.0)
+    v13 = float((width/3.0)+(width/3.0)*0.85)
+    v14 = float(-height/2.0)
+    v15 = float((width/3.0)+(width/3.0))
+    v16 = float(2*(width/3.0)+(width/3.0)*0.15)
+    v17 = float(height/2.0)
+    v18 = float(2*(width/3.0)+(width/3.0)*0.35)
+    v19 = float(height/2.0)
+    v20 = float(2*(width/3.0)+(width/3.0)/2.0)
+    v21 = float(2*(width/3.0)+(width/3.0)*0.85)
+    v22 = float(-height/2.0)
+    v23 = float(2*(width/3.0)+(width/3.0))
+    v24 = v4 + v4 - v2
+    v25 = 0.0 + 0.0 - v3
+    v26 = v12 + v12 - v10
+    v27 = 0.0 + 0.0 - v11
+    v28 = v20 + v20 - v18
+    v29 = 0.0 + 0.0 - v19
+    vertices += [(0.0, 0.0), (v0, v1), (v2, v3), (v4, 0.0), (v24, v25), (v5, v6), (v7, 0.0), (v8, v9), (v10, v11), (v12, 0.0), (v26, v27), (v13, v14), (v15, 0.0), (v16, v17), (v18, v19), (v20, 0.0), (v28, v29), (v21, v22), (v23, 0.0)]
+    codes += [1, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _single_stranded_nucleic_acid_38_box_x_values(p):
+    return ()
+
+def _single_stranded_nucleic_acid_38_box_y_values(p):
+    height = p['height']
+    return ((-height/2), )
+
+def _single_stranded_nucleic_acid_38_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _single_stranded_nucleic_acid_38_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _inertdnaspacer_39_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _inertdnaspacer_39_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _inertdnaspacer_39_1_values(p):
+    width = p['width']
+    return ((-(width/1.5)), (width), (-(width/1.5)), (width), (width), ((width/1.5)), ((width/1.5)), )
+
+def _inertdnaspacer_39_1_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(-(width/1.5))
+    v1 = float(width)
+    v2 = float(-(width/1.5))
+    v3 = float(width)
+    v4 = float(width)
+    v5 = float((width/1.5))
+    v6 = float((width/1.5))
+    vertices += [(0.0, 0.0), (0.0, v0), (v1, v2), (v3, 0.0), (v4, v5), (0.0, v6), (0.0, 0.0), (0.0, 0.0)]
+    codes += [1, 4, 4, 4, 4, 4, 4, 79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _inertdnaspacer_39_2_values(p):
+    width = p['width']
+    return ((((width*0.5)-((width*0.5)*-0.6669380616522619))), (-((width*0.5)*0.7451131604793488)), ((width*0.5)+((width*0.5)*-0.6669380616522619)), (((width*0.5)*0.7451131604793488)), )
+
+def _inertdnaspacer_39_2_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(((width*0.5)-((width*0.5)*-0.6669380616522619)))
+    v1 = float(-((width*0.5)*0.7451131604793488))
+    v2 = float((width*0.5)+((width*0.5)*-0.6669380616522619))
+    v3 = float(((width*0.5)*0.7451131604793488))
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _inertdnaspacer_39_3_values(p):
+    width = p['width']
+    return ((((width*0.5)-((width*0.5)*-0.6669380616522619))), (((width*0.5)*0.7451131604793488)), ((width*0.5)+((width*0.5)*-0.6669380616522619)), (-((width*0.5)*0.7451131604793488)), )
+
+def _inertdnaspacer_39_3_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(((width*0.5)-((width*0.5)*-0.6669380616522619)))
+    v1 = float(((width*0.5)*0.7451131604793488))
+    v2 = float((width*0.5)+((width*0.5)*-0.6669380616522619))
+    v3 = float(-((width*0.5)*0.7451131604793488))
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _inertdnaspacer_39_box_x_values(p):
+    return ((0), )
+
+def _inertdnaspacer_39_box_y_values(p):
+    width = p['width']
+    return ((-width/2), )
+
+def _inertdnaspacer_39_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _inertdnaspacer_39_box_height_values(p):
+    width = p['width']
+    return ((width), )
+
+def _3_sticky_restriction_site_40_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _3_sticky_restriction_site_40_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _3_sticky_restriction_site_40_1_values(p):
+    height = p['height']
+    width = p['width']
+    return ((0), (-0.5*height), (width), (-0.5*height), (width), (0.5*height), (0), (0.5*height), )
+
+def _3_sticky_restriction_site_40_1_path(p):
+    height = p['height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-0.5*height)
+    v2 = float(width)
+    v3 = float(-0.5*height)
+    v4 = float(width)
+    v5 = float(0.5*height)
+    v6 = float(0)
+    v7 = float(0.5*height)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7)]
+    codes += [1, 2, 2, 2]
+    if v6 != v0 or v7 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _3_sticky_restriction_site_40_2_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0.15*width), (0.5*height), (0.15*width), (0), (0.85*width), (0), (0.85*width), (-0.5*height), )
+
+def _3_sticky_restriction_site_40_2_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0.15*width)
+    v1 = float(0.5*height)
+    v2 = float(0.15*width)
+    v3 = float(0)
+    v4 = float(0.85*width)
+    v5 = float(0)
+    v6 = float(0.85*width)
+    v7 = float(-0.5*height)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7)]
+    codes += [1, 2, 2, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _3_sticky_restriction_site_40_box_x_values(p):
+    return ((0), )
+
+def _3_sticky_restriction_site_40_box_y_values(p):
+    height = p['height']
+    return ((-0.5*height), )
+
+def _3_sticky_restriction_site_40_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _3_sticky_restriction_site_40_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _5_sticky_restriction_site_41_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _5_sticky_restriction_site_41_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _5_sticky_restriction_site_41_1_values(p):
+    height = p['height']
+    width = p['width']
+    return ((0), (-0.5*height), (width), (-0.5*height), (width), (0.5*height), (0), (0.5*height), )
+
+def _5_sticky_restriction_site_41_1_path(p):
+    height = p['height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-0.5*height)
+    v2 = float(width)
+    v3 = float(-0.5*height)
+    v4 = float(width)
+    v5 = float(0.5*height)
+    v6 = float(0)
+    v7 = float(0.5*height)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7)]
+    codes += [1, 2, 2, 2]
+    if v6 != v0 or v7 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _5_sticky_restriction_site_41_2_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0.15*width), (-0.5*height), (0.15*width), (0), (0.85*width), (0), (0.85*width), (0.5*height), )
+
+def _5_sticky_restriction_site_41_2_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0.15*width)
+    v1 = float(-0.5*height)
+    v2 = float(0.15*width)
+    v3 = float(0)
+    v4 = float(0.85*width)
+    v5 = float(0)
+    v6 = float(0.85*width)
+    v7 = float(0.5*height)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7)]
+    codes += [1, 2, 2, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _5_sticky_restriction_site_41_box_x_values(p):
+    return ((0), )
+
+def _5_sticky_restriction_site_41_box_y_values(p):
+    height = p['height']
+    return ((-0.5*height), )
+
+def _5_sticky_restriction_site_41_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _5_sticky_restriction_site_41_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _terminator_42_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _terminator_42_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _terminator_42_1_values(p):
+    width = p['width']
+    height = p['height']
+    return ((0.5*width), (0), (0.5*width), (-height), )
+
+def _terminator_42_1_path(p):
+    width = p['width']
+    height = p['height']
+    vertices = []
+    codes = []
+    v0 = float(0.5*width)
+    v1 = float(0)
+    v2 = float(0.5*width)
+    v3 = float(-height)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _terminator_42_2_values(p):
+    height = p['height']
+    width = p['width']
+    return ((0), (-height), (width), (-height), )
+
+def _terminator_42_2_path(p):
+    height = p['height']
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(-height)
+    v2 = float(width)
+    v3 = float(-height)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _terminator_42_box_x_values(p):
+    return ((0), )
+
+def _terminator_42_box_y_values(p):
+    height = p['height']
+    return ((-height), )
+
+def _terminator_42_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _terminator_42_box_height_values(p):
+    height = p['height']
+    return ((height), )
+
+def _unspecified_43_0_values(p):
+    width = p['width']
+    return ((0), (0), (width), (0), )
+
+def _unspecified_43_0_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(width)
+    v3 = float(0)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _unspecified_43_1_values(p):
+    width = p['width']
+    return ((0), (0), (0.5*width), (-0.5*width), (width), (0), (0.5*width), (0.5*width), )
+
+def _unspecified_43_1_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0)
+    v1 = float(0)
+    v2 = float(0.5*width)
+    v3 = float(-0.5*width)
+    v4 = float(width)
+    v5 = float(0)
+    v6 = float(0.5*width)
+    v7 = float(0.5*width)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7)]
+    codes += [1, 2, 2, 2]
+    if v6 != v0 or v7 != v1:
+        vertices.append((v0, v1))
+        codes.append(2)
+    vertices += [(v0, v1)]
+    codes += [79]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _unspecified_43_2_values(p):
+    width = p['width']
+    return ((0.35*width), (-0.06*width), (0.35*width), (-0.23*width), (0.75*width), (-0.23*width), (0.65*width), (0.01*width), (0.65*width), (0.05*width), (0.5*width), (0.01*width), (0.5*width), (0.15*width), )
+
+def _unspecified_43_2_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0.35*width)
+    v1 = float(-0.06*width)
+    v2 = float(0.35*width)
+    v3 = float(-0.23*width)
+    v4 = float(0.75*width)
+    v5 = float(-0.23*width)
+    v6 = float(0.65*width)
+    v7 = float(0.01*width)
+    v8 = float(0.65*width)
+    v9 = float(0.05*width)
+    v10 = float(0.5*width)
+    v11 = float(0.01*width)
+    v12 = float(0.5*width)
+    v13 = float(0.15*width)
+    vertices += [(v0, v1), (v2, v3), (v4, v5), (v6, v7), (v8, v9), (v10, v11), (v12, v13)]
+    codes += [1, 4, 4, 4, 4, 4, 4]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _unspecified_43_3_values(p):
+    width = p['width']
+    return ((0.5*width), (0.27*width), (0.5*width), (0.27*width), )
+
+def _unspecified_43_3_path(p):
+    width = p['width']
+    vertices = []
+    codes = []
+    v0 = float(0.5*width)
+    v1 = float(0.27*width)
+    v2 = float(0.5*width)
+    v3 = float(0.27*width)
+    vertices += [(v0, v1), (v2, v3)]
+    codes += [1, 2]
+    return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)
+
+def _unspecified_43_box_x_values(p):
+    return ((0), )
+
+def _unspecified_43_box_y_values(p):
+    width = p['width']
+    return ((-0.5*width), )
+
+def _unspecified_43_box_width_values(p):
+    width = p['width']
+    return ((width), )
+
+def _unspecified_43_box_height_values(p):
+    width = p['width']
+    return ((width), )
+
+
+GLYPHS = {
+    'Spacer': {
+        'defaults': {'width': 18.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _spacer_0_0_values, _spacer_0_0_path)},
+            {'class': 'filled-path', 'id': 'aptamer-path', 'style': {'facecolor': (0.9019607843137255, 0.9019607843137255, 0.9019607843137255), 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0.35*width},{0} L{0.35*width},{-0.3*width} C{0},{-0.4*width} {0.3*width},{-0.9*width} {0.55*width},{-0.65*width} L{0.75*width},{-0.8*width} C{0.72*width},{-0.95*width} {0.9*width},{-1.0*width} {0.97*width},{-0.92*width} C{1.05*width},{-0.72*width} {0.9*width},{-0.7*width} {0.82*width},{-0.68*width} L{0.6*width},{-0.5*width} C{0.63*width},{-0.37*width} {0.5*width},{-0.35*width} {0.5*width},{-0.3*width} L{0.5*width},{0} Z',
+             'parametric_path': ('M{0.35*width},{0} L{0.35*width},{-0.3*width} C{0},{-0.4*width} {0.3*width},{-0.9*width} {0.55*width},{-0.65*width} L{0.75*width},{-0.8*width} C{0.72*width},{-0.95*width} {0.9*width},{-1.0*width} {0.97*width},{-0.92*width} C{1.05*width},{-0.72*width} {0.9*width},{-0.7*width} {0.82*width},{-0.68*width} L{0.6*width},{-0.5*width} C{0.63*width},{-0.37*width} {0.5*width},{-0.35*width} {0.5*width},{-0.3*width} L{0.5*width},{0} Z', ['M', ',', ' L', ',', ' C', ',', ' ', ',', ' ', ',', ' L', ',', ' C', ',', ' ', ',', ' ', ',', ' C', ',', ' ', ',', ' ', ',', ' L', ',', ' C', ',', ' ', ',', ' ', ',', ' L', ',', ' Z'], ['0.35*width', '0', '0.35*width', '-0.3*width', '0', '-0.4*width', '0.3*width', '-0.9*width', '0.55*width', '-0.65*width', '0.75*width', '-0.8*width', '0.72*width', '-0.95*width', '0.9*width', '-1.0*width', '0.97*width', '-0.92*width', '1.05*width', '-0.72*width', '0.9*width', '-0.7*width', '0.82*width', '-0.68*width', '0.6*width', '-0.5*width', '0.63*width', '-0.37*width', '0.5*width', '-0.35*width', '0.5*width', '-0.3*width', '0.5*width', '0'], ['M', None, None, 'L', None, None, 'C', None, None, None, None, None, None, 'L', None, None, 'C', None, None, None, None, None, None, 'C', None, None, None, None, None, None, 'L', None, None, 'C', None, None, None, None, None, None, 'L', None, None, 'Z'], [1, 2, 4, 5, 7, 8, 9, 10, 11, 12, 14, 15, 17, 18, 19, 20, 21, 22, 24, 25, 26, 27, 28, 29, 31, 32, 34, 35, 36, 37, 38, 39, 41, 42], ('width',), _spacer_0_1_values, _spacer_0_1_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _spacer_0_box_x_values, None), 'y': ('{-width}', ['', ''], ['-width'], [None], [0], ('width',), _spacer_0_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _spacer_0_box_width_values, None), 'height': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _spacer_0_box_height_values, None)},
+    },
+    'Assembly Scar': {
+        'defaults': {'height': 5.0, 'width': 15.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _assembly_scar_1_0_values, _assembly_scar_1_0_path)},
+            {'class': 'filled-background-path', 'id': 'assembly-scar-background', 'style': {'facecolor': (1.0, 1.0, 1.0), 'edgecolor': 'none'}, 'd': 'M{0},{-0.5*height} L{width},{-0.5*height} L{width},{0.5*height} L{0},{0.5*height} Z',
+             'parametric_path': ('M{0},{-0.5*height} L{width},{-0.5*height} L{width},{0.5*height} L{0},{0.5*height} Z', ['M', ',', ' L', ',', ' L', ',', ' L', ',', ' Z'], ['0', '-0.5*height', 'width', '-0.5*height', 'width', '0.5*height', '0', '0.5*height'], ['M', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'Z'], [1, 2, 4, 5, 7, 8, 10, 11], ('height', 'width'), _assembly_scar_1_1_values, _assembly_scar_1_1_path)},
+            {'class': 'unfilled-path', 'id': 'assembly-scar-path1', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{-0.5*height} L{width},{-0.5*height}',
+             'parametric_path': ('M{0},{-0.5*height} L{width},{-0.5*height}', ['M', ',', ' L', ',', ''], ['0', '-0.5*height', 'width', '-0.5*height'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('height', 'width'), _assembly_scar_1_2_values, _assembly_scar_1_2_path)},
+            {'class': 'unfilled-path', 'id': 'assembly-scar-path1', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0.5*height} L{width},{0.5*height}',
+             'parametric_path': ('M{0},{0.5*height} L{width},{0.5*height}', ['M', ',', ' L', ',', ''], ['0', '0.5*height', 'width', '0.5*height'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('height', 'width'), _assembly_scar_1_3_values, _assembly_scar_1_3_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _assembly_scar_1_box_x_values, None), 'y': ('{-0.5*height}', ['', ''], ['-0.5*height'], [None], [0], ('height',), _assembly_scar_1_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _assembly_scar_1_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _assembly_scar_1_box_height_values, None)},
+    },
+    'Blunt Restriction Site': {
+        'defaults': {'height': 15.0, 'width': 8.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _blunt_restriction_site_2_0_values, _blunt_restriction_site_2_0_path)},
+            {'class': 'filled-background-path', 'id': 'blunt-restriction-site-background', 'style': {'facecolor': (1.0, 1.0, 1.0), 'edgecolor': 'none'}, 'd': 'M{0.3*width},{-0.5*height} L{0.7*width},{-0.5*height} L{0.7*width},{0.5*height} L{0.3*width},{0.5*height} Z',
+             'parametric_path': ('M{0.3*width},{-0.5*height} L{0.7*width},{-0.5*height} L{0.7*width},{0.5*height} L{0.3*width},{0.5*height} Z', ['M', ',', ' L', ',', ' L', ',', ' L', ',', ' Z'], ['0.3*width', '-0.5*height', '0.7*width', '-0.5*height', '0.7*width', '0.5*height', '0.3*width', '0.5*height'], ['M', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'Z'], [1, 2, 4, 5, 7, 8, 10, 11], ('width', 'height'), _blunt_restriction_site_2_1_values, _blunt_restriction_site_2_1_path)},
+            {'class': 'unfilled-path', 'id': 'blunt-restriction-site-path1', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{-0.5*height} L{0.3*width},{-0.5*height} L{0.3*width},{0.5*height} L{0},{0.5*height}',
+             'parametric_path': ('M{0},{-0.5*height} L{0.3*width},{-0.5*height} L{0.3*width},{0.5*height} L{0},{0.5*height}', ['M', ',', ' L', ',', ' L', ',', ' L', ',', ''], ['0', '-0.5*height', '0.3*width', '-0.5*height', '0.3*width', '0.5*height', '0', '0.5*height'], ['M', None, None, 'L', None, None, 'L', None, None, 'L', None, None], [1, 2, 4, 5, 7, 8, 10, 11], ('height', 'width'), _blunt_restriction_site_2_2_values, _blunt_restriction_site_2_2_path)},
+            {'class': 'unfilled-path', 'id': 'blunt-restriction-site-path1', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{width},{-0.5*height} L{0.7*width},{-0.5*height} L{0.7*width},{0.5*height} L{width},{0.5*height}',
+             'parametric_path': ('M{width},{-0.5*height} L{0.7*width},{-0.5*height} L{0.7*width},{0.5*height} L{width},{0.5*height}', ['M', ',', ' L', ',', ' L', ',', ' L', ',', ''], ['width', '-0.5*height', '0.7*width', '-0.5*height', '0.7*width', '0.5*height', 'width', '0.5*height'], ['M', None, None, 'L', None, None, 'L', None, None, 'L', None, None], [1, 2, 4, 5, 7, 8, 10, 11], ('width', 'height'), _blunt_restriction_site_2_3_values, _blunt_restriction_site_2_3_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _blunt_restriction_site_2_box_x_values, None), 'y': ('{-0.5*height}', ['', ''], ['-0.5*height'], [None], [0], ('height',), _blunt_restriction_site_2_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _blunt_restriction_site_2_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _blunt_restriction_site_2_box_height_values, None)},
+    },
+    'CDS': {
+        'defaults': {'arrowbody_height': 15.0, 'arrowhead_width': 7.0, 'width': 30.0, 'height': 15.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _cds_3_0_values, _cds_3_0_path)},
+            {'class': 'filled-path', 'id': 'cds', 'style': {'facecolor': (0.9019607843137255, 0.9019607843137255, 0.9019607843137255), 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0}  L{0},{-arrowbody_height/2}  L{width - arrowhead_width},{-arrowbody_height/2}  L{width - arrowhead_width},{-height/2}  L{width},{0}   L{width - arrowhead_width},{height/2}    L{width - arrowhead_width},{arrowbody_height/2}    L{0},{arrowbody_height/2} Z',
+             'parametric_path': ('M{0},{0}  L{0},{-arrowbody_height/2}  L{width - arrowhead_width},{-arrowbody_height/2}  L{width - arrowhead_width},{-height/2}  L{width},{0}   L{width - arrowhead_width},{height/2}    L{width - arrowhead_width},{arrowbody_height/2}    L{0},{arrowbody_height/2} Z', ['M', ',', '  L', ',', '  L', ',', '  L', ',', '  L', ',', '   L', ',', '    L', ',', '    L', ',', ' Z'], ['0', '0', '0', '-arrowbody_height/2', 'width - arrowhead_width', '-arrowbody_height/2', 'width - arrowhead_width', '-height/2', 'width', '0', 'width - arrowhead_width', 'height/2', 'width - arrowhead_width', 'arrowbody_height/2', '0', 'arrowbody_height/2'], ['M', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'Z'], [1, 2, 4, 5, 7, 8, 10, 11, 13, 14, 16, 17, 19, 20, 22, 23], ('arrowbody_height', 'width', 'arrowhead_width', 'height'), _cds_3_1_values, _cds_3_1_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _cds_3_box_x_values, None), 'y': ('{-height/2}', ['', ''], ['-height/2'], [None], [0], ('height',), _cds_3_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _cds_3_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _cds_3_box_height_values, None)},
+    },
+    "Chromosome Part 3' End": {
+        'defaults': {'height': 10.0, 'width': 20.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{0},{0}',
+             'parametric_path': ('M{0},{0} L{0},{0}', ['M', ',', ' L', ',', ''], ['0', '0', '0', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], (), _chromosome_part_3_end_4_0_values, _chromosome_part_3_end_4_0_path)},
+            {'class': 'filled-path', 'id': 'chromosome-part-end', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M0,0 C{width},0 {width},{height/2.0} {width*0.5},{height/2.0} C0,{height/2.0} 0,{height} {width},{height}',
+             'parametric_path': ('M0,0 C{width},0 {width},{height/2.0} {width*0.5},{height/2.0} C0,{height/2.0} 0,{height} {width},{height}', ['M0,0 C', ',0 ', ',', ' ', ',', ' C0,', ' 0,', ' ', ',', ''], ['width', 'width', 'height/2.0', 'width*0.5', 'height/2.0', 'height/2.0', 'height', 'width', 'height'], ['M', 0.0, 0.0, 'C', None, 0.0, None, None, None, None, 'C', 0.0, None, 0.0, None, None, None], [4, 6, 7, 8, 9, 12, 14, 15, 16], ('width', 'height'), _chromosome_part_3_end_4_1_values, _chromosome_part_3_end_4_1_path)},
+        ],
+        'bounding_box': {'x': ('0', ['0'], [], [0.0], [], (), _chromosome_part_3_end_4_box_x_values, None), 'y': ('0', ['0'], [], [0.0], [], (), _chromosome_part_3_end_4_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _chromosome_part_3_end_4_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _chromosome_part_3_end_4_box_height_values, None)},
+    },
+    "Circular Plasmid 3' end": {
+        'defaults': {'height': 10.0, 'width': 20.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{0},{0}',
+             'parametric_path': ('M{0},{0} L{0},{0}', ['M', ',', ' L', ',', ''], ['0', '0', '0', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], (), _circular_plasmid_3_end_5_0_values, _circular_plasmid_3_end_5_0_path)},
+            {'class': 'filled-path', 'id': 'plasmid-end', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M0,0 C{width},0 {width},{height} {width*0.2},{height}',
+             'parametric_path': ('M0,0 C{width},0 {width},{height} {width*0.2},{height}', ['M0,0 C', ',0 ', ',', ' ', ',', ''], ['width', 'width', 'height', 'width*0.2', 'height'], ['M', 0.0, 0.0, 'C', None, 0.0, None, None, None, None], [4, 6, 7, 8, 9], ('width', 'height'), _circular_plasmid_3_end_5_1_values, _circular_plasmid_3_end_5_1_path)},
+        ],
+        'bounding_box': {'x': ('0', ['0'], [], [0.0], [], (), _circular_plasmid_3_end_5_box_x_values, None), 'y': ('0', ['0'], [], [0.0], [], (), _circular_plasmid_3_end_5_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _circular_plasmid_3_end_5_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _circular_plasmid_3_end_5_box_height_values, None)},
+    },
+    "Circular Plasmid 5' end": {
+        'defaults': {'height': 10.0, 'width': 20.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{0},{0}',
+             'parametric_path': ('M{0},{0} L{0},{0}', ['M', ',', ' L', ',', ''], ['0', '0', '0', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], (), _circular_plasmid_5_end_6_0_values, _circular_plasmid_5_end_6_0_path)},
+            {'class': 'filled-path', 'id': 'plasmid-end', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M0,0 C{-width},0 {-width},{height} {-width*0.2},{height}',
+             'parametric_path': ('M0,0 C{-width},0 {-width},{height} {-width*0.2},{height}', ['M0,0 C', ',0 ', ',', ' ', ',', ''], ['-width', '-width', 'height', '-width*0.2', 'height'], ['M', 0.0, 0.0, 'C', None, 0.0, None, None, None, None], [4, 6, 7, 8, 9], ('width', 'height'), _circular_plasmid_5_end_6_1_values, _circular_plasmid_5_end_6_1_path)},
+        ],
+        'bounding_box': {'x': ('0', ['0'], [], [0.0], [], (), _circular_plasmid_5_end_6_box_x_values, None), 'y': ('0', ['0'], [], [0.0], [], (), _circular_plasmid_5_end_6_box_y_values, None), 'width': ('{-width}', ['', ''], ['-width'], [None], [0], ('width',), _circular_plasmid_5_end_6_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _circular_plasmid_5_end_6_box_height_values, None)},
+    },
+    'DNA Cleavage Site': {
+        'defaults': {'height': 16.0, 'width': 6.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _dna_cleavage_site_7_0_values, _dna_cleavage_site_7_0_path)},
+            {'class': 'unfilled-path', 'id': 'location-top-path', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{-height} L{width},{-height+width}',
+             'parametric_path': ('M{0},{-height} L{width},{-height+width}', ['M', ',', ' L', ',', ''], ['0', '-height', 'width', '-height+width'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('height', 'width'), _dna_cleavage_site_7_1_values, _dna_cleavage_site_7_1_path)},
+            {'class': 'unfilled-path', 'id': 'location-top-path', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{-height+width} L{width},{-height}',
+             'parametric_path': ('M{0},{-height+width} L{width},{-height}', ['M', ',', ' L', ',', ''], ['0', '-height+width', 'width', '-height'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width', 'height'), _dna_cleavage_site_7_2_values, _dna_cleavage_site_7_2_path)},
+            {'class': 'unfilled-path', 'id': 'location-stem-path', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0.5*width},{0} L{0.5*width},{-height + 0.5*width}',
+             'parametric_path': ('M{0.5*width},{0} L{0.5*width},{-height + 0.5*width}', ['M', ',', ' L', ',', ''], ['0.5*width', '0', '0.5*width', '-height + 0.5*width'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width', 'height'), _dna_cleavage_site_7_3_values, _dna_cleavage_site_7_3_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _dna_cleavage_site_7_box_x_values, None), 'y': ('{-height}', ['', ''], ['-height'], [None], [0], ('height',), _dna_cleavage_site_7_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _dna_cleavage_site_7_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _dna_cleavage_site_7_box_height_values, None)},
+    },
+    'DNA Location': {
+        'defaults': {'height': 16.0, 'width': 6.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _dna_location_8_0_values, _dna_location_8_0_path)},
+            {'class': 'filled-path', 'id': 'location-top-path', 'style': {'facecolor': (0.9019607843137255, 0.9019607843137255, 0.9019607843137255), 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{-height + 0.5*width} C{0},{-height - 0.16666666666667*width} {width},{-height - 0.16666666666667*width} {width},{-height + 0.5*width} C{width},{-height + 1.166666666666667*width} {0},{-height + 1.166666666666667*width} {0},{-height + 0.5*width} Z',
+             'parametric_path': ('M{0},{-height + 0.5*width} C{0},{-height - 0.16666666666667*width} {width},{-height - 0.16666666666667*width} {width},{-height + 0.5*width} C{width},{-height + 1.166666666666667*width} {0},{-height + 1.166666666666667*width} {0},{-height + 0.5*width} Z', ['M', ',', ' C', ',', ' ', ',', ' ', ',', ' C', ',', ' ', ',', ' ', ',', ' Z'], ['0', '-height + 0.5*width', '0', '-height - 0.16666666666667*width', 'width', '-height - 0.16666666666667*width', 'width', '-height + 0.5*width', 'width', '-height + 1.166666666666667*width', '0', '-height + 1.166666666666667*width', '0', '-height + 0.5*width'], ['M', None, None, 'C', None, None, None, None, None, None, 'C', None, None, None, None, None, None, 'Z'], [1, 2, 4, 5, 6, 7, 8, 9, 11, 12, 13, 14, 15, 16], ('height', 'width'), _dna_location_8_1_values, _dna_location_8_1_path)},
+            {'class': 'unfilled-path', 'id': 'location-stem-path', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0.5*width},{0} L{0.5*width},{-height + width}',
+             'parametric_path': ('M{0.5*width},{0} L{0.5*width},{-height + width}', ['M', ',', ' L', ',', ''], ['0.5*width', '0', '0.5*width', '-height + width'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width', 'height'), _dna_location_8_2_values, _dna_location_8_2_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _dna_location_8_box_x_values, None), 'y': ('{-height}', ['', ''], ['-height'], [None], [0], ('height',), _dna_location_8_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _dna_location_8_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _dna_location_8_box_height_values, None)},
+    },
+    'DNA Stability Element': {
+        'defaults': {'height': 16.0, 'width': 6.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _dna_stability_element_9_0_values, _dna_stability_element_9_0_path)},
+            {'class': 'filled-path', 'id': 'location-top-path', 'style': {'facecolor': (0.9019607843137255, 0.9019607843137255, 0.9019607843137255), 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{-height} L{width},{-height} L{width},{-height + 0.7*width} L{0.5*width},{-height + width} L{0},{-height + 0.7*width} Z',
+             'parametric_path': ('M{0},{-height} L{width},{-height} L{width},{-height + 0.7*width} L{0.5*width},{-height + width} L{0},{-height + 0.7*width} Z', ['M', ',', ' L', ',', ' L', ',', ' L', ',', ' L', ',', ' Z'], ['0', '-height', 'width', '-height', 'width', '-height + 0.7*width', '0.5*width', '-height + width', '0', '-height + 0.7*width'], ['M', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'Z'], [1, 2, 4, 5, 7, 8, 10, 11, 13, 14], ('height', 'width'), _dna_stability_element_9_1_values, _dna_stability_element_9_1_path)},
+            {'class': 'unfilled-path', 'id': 'location-stem-path', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0.5*width},{0} L{0.5*width},{-height + width}',
+             'parametric_path': ('M{0.5*width},{0} L{0.5*width},{-height + width}', ['M', ',', ' L', ',', ''], ['0.5*width', '0', '0.5*width', '-height + width'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width', 'height'), _dna_stability_element_9_2_values, _dna_stability_element_9_2_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _dna_stability_element_9_box_x_values, None), 'y': ('{-height}', ['', ''], ['-height'], [None], [0], ('height',), _dna_stability_element_9_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _dna_stability_element_9_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _dna_stability_element_9_box_height_values, None)},
+    },
+    'DNA Stop Site': {
+        'defaults': {'height': 16.0, 'width': 6.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _dna_stop_site_10_0_values, _dna_stop_site_10_0_path)},
+            {'class': 'filled-path', 'id': 'location-top-path', 'style': {'facecolor': (0.9019607843137255, 0.9019607843137255, 0.9019607843137255), 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{-height + width - 0.5*width} C{0},{-height + width - 1.16666666666667*width} {width},{-height + width - 1.16666666666667*width} {width},{-height + width - 0.5*width} C{width},{-height + width + 0.166666666666667*width} {0},{-height + width + 0.166666666666667*width} {0},{-height + width - 0.5*width} Z',
+             'parametric_path': ('M{0},{-height + width - 0.5*width} C{0},{-height + width - 1.16666666666667*width} {width},{-height + width - 1.16666666666667*width} {width},{-height + width - 0.5*width} C{width},{-height + width + 0.166666666666667*width} {0},{-height + width + 0.166666666666667*width} {0},{-height + width - 0.5*width} Z', ['M', ',', ' C', ',', ' ', ',', ' ', ',', ' C', ',', ' ', ',', ' ', ',', ' Z'], ['0', '-height + width - 0.5*width', '0', '-height + width - 1.16666666666667*width', 'width', '-height + width - 1.16666666666667*width', 'width', '-height + width - 0.5*width', 'width', '-height + width + 0.166666666666667*width', '0', '-height + width + 0.166666666666667*width', '0', '-height + width - 0.5*width'], ['M', None, None, 'C', None, None, None, None, None, None, 'C', None, None, None, None, None, None, 'Z'], [1, 2, 4, 5, 6, 7, 8, 9, 11, 12, 13, 14, 15, 16], ('width', 'height'), _dna_stop_site_10_1_values, _dna_stop_site_10_1_path)},
+            {'class': 'unfilled-path', 'id': 'location-stem-path', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0.5*width},{0} L{0.5*width},{-height + width}',
+             'parametric_path': ('M{0.5*width},{0} L{0.5*width},{-height + width}', ['M', ',', ' L', ',', ''], ['0.5*width', '0', '0.5*width', '-height + width'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width', 'height'), _dna_stop_site_10_2_values, _dna_stop_site_10_2_path)},
+            {'class': 'unfilled-path', 'id': 'star-1', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{(0.5*width)},{-height+(0.5*width)} L{(0.5*width)+(0.58778525229*(0.2*width))},{(-height+(0.5*width))+(0.80901699437*(0.2*width))}',
+             'parametric_path': ('M{(0.5*width)},{-height+(0.5*width)} L{(0.5*width)+(0.58778525229*(0.2*width))},{(-height+(0.5*width))+(0.80901699437*(0.2*width))}', ['M', ',', ' L', ',', ''], ['(0.5*width)', '-height+(0.5*width)', '(0.5*width)+(0.58778525229*(0.2*width))', '(-height+(0.5*width))+(0.80901699437*(0.2*width))'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width', 'height'), _dna_stop_site_10_3_values, _dna_stop_site_10_3_path)},
+            {'class': 'unfilled-path', 'id': 'star-2', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{(0.5*width)},{-height+(0.5*width)} L{(0.5*width)+(0.95105651629*(0.2*width))},{(-height+(0.5*width))+(-0.30901699437*(0.2*width))}',
+             'parametric_path': ('M{(0.5*width)},{-height+(0.5*width)} L{(0.5*width)+(0.95105651629*(0.2*width))},{(-height+(0.5*width))+(-0.30901699437*(0.2*width))}', ['M', ',', ' L', ',', ''], ['(0.5*width)', '-height+(0.5*width)', '(0.5*width)+(0.95105651629*(0.2*width))', '(-height+(0.5*width))+(-0.30901699437*(0.2*width))'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width', 'height'), _dna_stop_site_10_4_values, _dna_stop_site_10_4_path)},
+            {'class': 'unfilled-path', 'id': 'star-3', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{(0.5*width)},{-height+(0.5*width)} L{(0.5*width)+(0.0*(0.2*width))},{(-height+(0.5*width))+(-1.0*(0.2*width))}',
+             'parametric_path': ('M{(0.5*width)},{-height+(0.5*width)} L{(0.5*width)+(0.0*(0.2*width))},{(-height+(0.5*width))+(-1.0*(0.2*width))}', ['M', ',', ' L', ',', ''], ['(0.5*width)', '-height+(0.5*width)', '(0.5*width)+(0.0*(0.2*width))', '(-height+(0.5*width))+(-1.0*(0.2*width))'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width', 'height'), _dna_stop_site_10_5_values, _dna_stop_site_10_5_path)},
+            {'class': 'unfilled-path', 'id': 'star-4', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{(0.5*width)},{-height+(0.5*width)} L{(0.5*width)+(-0.95105651629*(0.2*width))},{(-height+(0.5*width))+(-0.30901699437*(0.2*width))}',
+             'parametric_path': ('M{(0.5*width)},{-height+(0.5*width)} L{(0.5*width)+(-0.95105651629*(0.2*width))},{(-height+(0.5*width))+(-0.30901699437*(0.2*width))}', ['M', ',', ' L', ',', ''], ['(0.5*width)', '-height+(0.5*width)', '(0.5*width)+(-0.95105651629*(0.2*width))', '(-height+(0.5*width))+(-0.30901699437*(0.2*width))'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width', 'height'), _dna_stop_site_10_6_values, _dna_stop_site_10_6_path)},
+            {'class': 'unfilled-path', 'id': 'star-5', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{(0.5*width)},{-height+(0.5*width)} L{(0.5*width)+(-0.58778525229*(0.2*width))},{(-height+(0.5*width))+(0.80901699437*(0.2*width))}',
+             'parametric_path': ('M{(0.5*width)},{-height+(0.5*width)} L{(0.5*width)+(-0.58778525229*(0.2*width))},{(-height+(0.5*width))+(0.80901699437*(0.2*width))}', ['M', ',', ' L', ',', ''], ['(0.5*width)', '-height+(0.5*width)', '(0.5*width)+(-0.58778525229*(0.2*width))', '(-height+(0.5*width))+(0.80901699437*(0.2*width))'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width', 'height'), _dna_stop_site_10_7_values, _dna_stop_site_10_7_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _dna_stop_site_10_box_x_values, None), 'y': ('{-height}', ['', ''], ['-height'], [None], [0], ('height',), _dna_stop_site_10_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _dna_stop_site_10_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _dna_stop_site_10_box_height_values, None)},
+    },
+    'Double-Stranded Nucleic Acid': {
+        'defaults': {'width': 22.5, 'height': 5.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M0,0 L0,0',
+             'parametric_path': ('M0,0 L0,0', ['M0,0 L0,0'], [], ['M', 0.0, 0.0, 'L', 0.0, 0.0], [], (), _double_stranded_nucleic_acid_11_0_values, _double_stranded_nucleic_acid_11_0_path)},
+            {'class': 'unfilled-path', 'id': 'dsNA-line1', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M0,0 C{((width-width/10.0)/3.0)*0.15},{height/2.0} {((width-width/10.0)/3.0)*0.35},{height/2.0} {((width-width/10.0)/3.0)/2.0},0 S{((width-width/10.0)/3.0)*0.85},{-height/2.0} {((width-width/10.0)/3.0)},0            C{((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.15},{height/2.0} {((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.35},{height/2.0} {((width-width/10.0)/3.0)+((width-width/10.0)/3.0)/2.0},0 S{((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.85},{-height/2.0} {((width-width/10.0)/3.0)+((width-width/10.0)/3.0)},0            C{2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.15},{height/2.0} {2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.35},{height/2.0} {2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)/2.0},0 S{2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.85},{-height/2.0} {2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)},0',
+             'parametric_path': ('M0,0 C{((width-width/10.0)/3.0)*0.15},{height/2.0} {((width-width/10.0)/3.0)*0.35},{height/2.0} {((width-width/10.0)/3.0)/2.0},0 S{((width-width/10.0)/3.0)*0.85},{-height/2.0} {((width-width/10.0)/3.0)},0            C{((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.15},{height/2.0} {((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.35},{height/2.0} {((width-width/10.0)/3.0)+((width-width/10.0)/3.0)/2.0},0 S{((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.85},{-height/2.0} {((width-width/10.0)/3.0)+((width-width/10.0)/3.0)},0            C{2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.15},{height/2.0} {2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.35},{height/2.0} {2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)/2.0},0 S{2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.85},{-height/2.0} {2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)},0', ['M0,0 C', ',', ' ', ',', ' ', ',0 S', ',', ' ', ',0            C', ',', ' ', ',', ' ', ',0 S', ',', ' ', ',0            C', ',', ' ', ',', ' ', ',0 S', ',', ' ', ',0'], ['((width-width/10.0)/3.0)*0.15', 'height/2.0', '((width-width/10.0)/3.0)*0.35', 'height/2.0', '((width-width/10.0)/3.0)/2.0', '((width-width/10.0)/3.0)*0.85', '-height/2.0', '((width-width/10.0)/3.0)', '((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.15', 'height/2.0', '((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.35', 'height/2.0', '((width-width/10.0)/3.0)+((width-width/10.0)/3.0)/2.0', '((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.85', '-height/2.0', '((width-width/10.0)/3.0)+((width-width/10.0)/3.0)', '2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.15', 'height/2.0', '2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.35', 'height/2.0', '2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)/2.0', '2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.85', '-height/2.0', '2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)'], ['M', 0.0, 0.0, 'C', None, None, None, None, None, 0.0, 'S', None, None, None, 0.0, 'C', None, None, None, None, None, 0.0, 'S', None, None, None, 0.0, 'C', None, None, None, None, None, 0.0, 'S', None, None, None, 0.0], [4, 5, 6, 7, 8, 11, 12, 13, 16, 17, 18, 19, 20, 23, 24, 25, 28, 29, 30, 31, 32, 35, 36, 37], ('width', 'height'), _double_stranded_nucleic_acid_11_1_values, _double_stranded_nucleic_acid_11_1_path)},
+            {'class': 'unfilled-path', 'id': 'dsNA-line2', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0+(width/10.0)},0 C{((width-width/10.0)/3.0)*0.15+(width/10.0)},{height/2.0} {((width-width/10.0)/3.0)*0.35+(width/10.0)},{height/2.0} {((width-width/10.0)/3.0)/2.0+(width/10.0)},0 S{((width-width/10.0)/3.0)*0.85+(width/10.0)},{-height/2.0} {((width-width/10.0)/3.0)+(width/10.0)},0            C{((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.15+(width/10.0)},{height/2.0} {((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.35+(width/10.0)},{height/2.0} {((width-width/10.0)/3.0)+((width-width/10.0)/3.0)/2.0+(width/10.0)},0 S{((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.85+(width/10.0)},{-height/2.0} {((width-width/10.0)/3.0)+((width-width/10.0)/3.0)+(width/10.0)},0            C{2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.15+(width/10.0)},{height/2.0} {2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.35+(width/10.0)},{height/2.0} {2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)/2.0+(width/10.0)},0 S{2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.85+(width/10.0)},{-height/2.0} {2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)+(width/10.0)},0',
+             'parametric_path': ('M{0+(width/10.0)},0 C{((width-width/10.0)/3.0)*0.15+(width/10.0)},{height/2.0} {((width-width/10.0)/3.0)*0.35+(width/10.0)},{height/2.0} {((width-width/10.0)/3.0)/2.0+(width/10.0)},0 S{((width-width/10.0)/3.0)*0.85+(width/10.0)},{-height/2.0} {((width-width/10.0)/3.0)+(width/10.0)},0            C{((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.15+(width/10.0)},{height/2.0} {((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.35+(width/10.0)},{height/2.0} {((width-width/10.0)/3.0)+((width-width/10.0)/3.0)/2.0+(width/10.0)},0 S{((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.85+(width/10.0)},{-height/2.0} {((width-width/10.0)/3.0)+((width-width/10.0)/3.0)+(width/10.0)},0            C{2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.15+(width/10.0)},{height/2.0} {2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.35+(width/10.0)},{height/2.0} {2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)/2.0+(width/10.0)},0 S{2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.85+(width/10.0)},{-height/2.0} {2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)+(width/10.0)},0', ['M', ',0 C', ',', ' ', ',', ' ', ',0 S', ',', ' ', ',0            C', ',', ' ', ',', ' ', ',0 S', ',', ' ', ',0            C', ',', ' ', ',', ' ', ',0 S', ',', ' ', ',0'], ['0+(width/10.0)', '((width-width/10.0)/3.0)*0.15+(width/10.0)', 'height/2.0', '((width-width/10.0)/3.0)*0.35+(width/10.0)', 'height/2.0', '((width-width/10.0)/3.0)/2.0+(width/10.0)', '((width-width/10.0)/3.0)*0.85+(width/10.0)', '-height/2.0', '((width-width/10.0)/3.0)+(width/10.0)', '((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.15+(width/10.0)', 'height/2.0', '((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.35+(width/10.0)', 'height/2.0', '((width-width/10.0)/3.0)+((width-width/10.0)/3.0)/2.0+(width/10.0)', '((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.85+(width/10.0)', '-height/2.0', '((width-width/10.0)/3.0)+((width-width/10.0)/3.0)+(width/10.0)', '2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.15+(width/10.0)', 'height/2.0', '2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.35+(width/10.0)', 'height/2.0', '2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)/2.0+(width/10.0)', '2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)*0.85+(width/10.0)', '-height/2.0', '2*((width-width/10.0)/3.0)+((width-width/10.0)/3.0)+(width/10.0)'], ['M', None, 0.0, 'C', None, None, None, None, None, 0.0, 'S', None, None, None, 0.0, 'C', None, None, None, None, None, 0.0, 'S', None, None, None, 0.0, 'C', None, None, None, None, None, 0.0, 'S', None, None, None, 0.0], [1, 4, 5, 6, 7, 8, 11, 12, 13, 16, 17, 18, 19, 20, 23, 24, 25, 28, 29, 30, 31, 32, 35, 36, 37], ('width', 'height'), _double_stranded_nucleic_acid_11_2_values, _double_stranded_nucleic_acid_11_2_path)},
+        ],
+        'bounding_box': {'x': ('0', ['0'], [], [0.0], [], (), _double_stranded_nucleic_acid_11_box_x_values, None), 'y': ('{-height/2},0', ['', ',0'], ['-height/2'], [None, 0.0], [0], ('height',), _double_stranded_nucleic_acid_11_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _double_stranded_nucleic_acid_11_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _double_stranded_nucleic_acid_11_box_height_values, None)},
+    },
+    'Engineered Region': {
+        'defaults': {'height': 15.0, 'width': 30.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _engineered_region_12_0_values, _engineered_region_12_0_path)},
+            {'class': 'filled-path', 'id': 'engineered-region-path', 'style': {'facecolor': (0.9019607843137255, 0.9019607843137255, 0.9019607843137255), 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{-0.5*height} L{width},{-0.5*height} L{width},{0.5*height} {0},{0.5*height} Z',
+             'parametric_path': ('M{0},{-0.5*height} L{width},{-0.5*height} L{width},{0.5*height} {0},{0.5*height} Z', ['M', ',', ' L', ',', ' L', ',', ' ', ',', ' Z'], ['0', '-0.5*height', 'width', '-0.5*height', 'width', '0.5*height', '0', '0.5*height'], ['M', None, None, 'L', None, None, 'L', None, None, None, None, 'Z'], [1, 2, 4, 5, 7, 8, 9, 10], ('height', 'width'), _engineered_region_12_1_values, _engineered_region_12_1_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _engineered_region_12_box_x_values, None), 'y': ('{-0.5*height}', ['', ''], ['-0.5*height'], [None], [0], ('height',), _engineered_region_12_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _engineered_region_12_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _engineered_region_12_box_height_values, None)},
+    },
+    'Insulator': {
+        'defaults': {'width': 15.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _insulator_13_0_values, _insulator_13_0_path)},
+            {'class': 'filled-background-path', 'id': 'insulator-background', 'style': {'facecolor': (1.0, 1.0, 1.0), 'edgecolor': 'none'}, 'd': 'M{0},{-0.5*width} L{width},{-0.5*width} L{width},{0.5*width} L{0},{0.5*width} Z',
+             'parametric_path': ('M{0},{-0.5*width} L{width},{-0.5*width} L{width},{0.5*width} L{0},{0.5*width} Z', ['M', ',', ' L', ',', ' L', ',', ' L', ',', ' Z'], ['0', '-0.5*width', 'width', '-0.5*width', 'width', '0.5*width', '0', '0.5*width'], ['M', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'Z'], [1, 2, 4, 5, 7, 8, 10, 11], ('width',), _insulator_13_1_values, _insulator_13_1_path)},
+            {'class': 'unfilled-path', 'id': 'insulator-outer-path', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{-0.5*width} L{width},{-0.5*width} L{width},{0.5*width} L{0},{0.5*width} Z',
+             'parametric_path': ('M{0},{-0.5*width} L{width},{-0.5*width} L{width},{0.5*width} L{0},{0.5*width} Z', ['M', ',', ' L', ',', ' L', ',', ' L', ',', ' Z'], ['0', '-0.5*width', 'width', '-0.5*width', 'width', '0.5*width', '0', '0.5*width'], ['M', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'Z'], [1, 2, 4, 5, 7, 8, 10, 11], ('width',), _insulator_13_2_values, _insulator_13_2_path)},
+            {'class': 'filled-path', 'id': 'insulator-inner-path', 'style': {'facecolor': (0.9019607843137255, 0.9019607843137255, 0.9019607843137255), 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0.2*width},{-0.3*width} L{0.8*width},{-0.3*width} L{0.8*width},{0.3*width} L{0.2*width},{0.3*width} Z',
+             'parametric_path': ('M{0.2*width},{-0.3*width} L{0.8*width},{-0.3*width} L{0.8*width},{0.3*width} L{0.2*width},{0.3*width} Z', ['M', ',', ' L', ',', ' L', ',', ' L', ',', ' Z'], ['0.2*width', '-0.3*width', '0.8*width', '-0.3*width', '0.8*width', '0.3*width', '0.2*width', '0.3*width'], ['M', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'Z'], [1, 2, 4, 5, 7, 8, 10, 11], ('width',), _insulator_13_3_values, _insulator_13_3_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _insulator_13_box_x_values, None), 'y': ('{-0.5*width}', ['', ''], ['-0.5*width'], [None], [0], ('width',), _insulator_13_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _insulator_13_box_width_values, None), 'height': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _insulator_13_box_height_values, None)},
+    },
+    'Macromolecule': {
+        'defaults': {'height': 8.0, 'width': 18.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _macromolecule_14_0_values, _macromolecule_14_0_path)},
+            {'class': 'filled-path', 'id': 'protein', 'style': {'facecolor': (0.9019607843137255, 0.9019607843137255, 0.9019607843137255), 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M0,{height/4.0} Q0,{height/2.0} {width*0.1},{height/2.0} L{width*0.9},{height/2.0} Q{width},{height/2.0} {width},{height/4.0} L{width},{-height/4.0}  Q{width},{-height/2.0} {width*0.9},{-height/2.0} L{width*0.1},{-height/2.0} Q0,{-height/2.0} 0,{-height/4.0} L0,{height/4.0} Z',
+             'parametric_path': ('M0,{height/4.0} Q0,{height/2.0} {width*0.1},{height/2.0} L{width*0.9},{height/2.0} Q{width},{height/2.0} {width},{height/4.0} L{width},{-height/4.0}  Q{width},{-height/2.0} {width*0.9},{-height/2.0} L{width*0.1},{-height/2.0} Q0,{-height/2.0} 0,{-height/4.0} L0,{height/4.0} Z', ['M0,', ' Q0,', ' ', ',', ' L', ',', ' Q', ',', ' ', ',', ' L', ',', '  Q', ',', ' ', ',', ' L', ',', ' Q0,', ' 0,', ' L0,', ' Z'], ['height/4.0', 'height/2.0', 'width*0.1', 'height/2.0', 'width*0.9', 'height/2.0', 'width', 'height/2.0', 'width', 'height/4.0', 'width', '-height/4.0', 'width', '-height/2.0', 'width*0.9', '-height/2.0', 'width*0.1', '-height/2.0', '-height/2.0', '-height/4.0', 'height/4.0'], ['M', 0.0, None, 'Q', 0.0, None, None, None, 'L', None, None, 'Q', None, None, None, None, 'L', None, None, 'Q', None, None, None, None, 'L', None, None, 'Q', 0.0, None, 0.0, None, 'L', 0.0, None, 'Z'], [2, 5, 6, 7, 9, 10, 12, 13, 14, 15, 17, 18, 20, 21, 22, 23, 25, 26, 29, 31, 34], ('height', 'width'), _macromolecule_14_1_values, _macromolecule_14_1_path)},
+        ],
+        'bounding_box': {'x': ('0', ['0'], [], [0.0], [], (), _macromolecule_14_box_x_values, None), 'y': ('{-height/2},0', ['', ',0'], ['-height/2'], [None, 0.0], [0], ('height',), _macromolecule_14_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _macromolecule_14_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _macromolecule_14_box_height_values, None)},
+    },
+    'No Glyph': {
+        'defaults': {'height': 15.0, 'width': 8.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _no_glyph_15_0_values, _no_glyph_15_0_path)},
+            {'class': 'filled-background-path', 'id': 'operator-background', 'style': {'facecolor': (1.0, 1.0, 1.0), 'edgecolor': 'none'}, 'd': 'M{0},{-0.5*height} L{width},{-0.5*height} L{width},{0.5*height} L{0},{0.5*height} Z',
+             'parametric_path': ('M{0},{-0.5*height} L{width},{-0.5*height} L{width},{0.5*height} L{0},{0.5*height} Z', ['M', ',', ' L', ',', ' L', ',', ' L', ',', ' Z'], ['0', '-0.5*height', 'width', '-0.5*height', 'width', '0.5*height', '0', '0.5*height'], ['M', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'Z'], [1, 2, 4, 5, 7, 8, 10, 11], ('height', 'width'), _no_glyph_15_1_values, _no_glyph_15_1_path)},
+            {'class': 'unfilled-path', 'id': 'no-glyph-path1', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0.3*width},{-0.5*height} L{0},{-0.5*height} L{0},{0.5*height} L{0.3*width},{0.5*height}',
+             'parametric_path': ('M{0.3*width},{-0.5*height} L{0},{-0.5*height} L{0},{0.5*height} L{0.3*width},{0.5*height}', ['M', ',', ' L', ',', ' L', ',', ' L', ',', ''], ['0.3*width', '-0.5*height', '0', '-0.5*height', '0', '0.5*height', '0.3*width', '0.5*height'], ['M', None, None, 'L', None, None, 'L', None, None, 'L', None, None], [1, 2, 4, 5, 7, 8, 10, 11], ('width', 'height'), _no_glyph_15_2_values, _no_glyph_15_2_path)},
+            {'class': 'unfilled-path', 'id': 'no-glyph-path1', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0.7*width},{-0.5*height} L{width},{-0.5*height} L{width},{0.5*height} L{0.7*width},{0.5*height}',
+             'parametric_path': ('M{0.7*width},{-0.5*height} L{width},{-0.5*height} L{width},{0.5*height} L{0.7*width},{0.5*height}', ['M', ',', ' L', ',', ' L', ',', ' L', ',', ''], ['0.7*width', '-0.5*height', 'width', '-0.5*height', 'width', '0.5*height', '0.7*width', '0.5*height'], ['M', None, None, 'L', None, None, 'L', None, None, 'L', None, None], [1, 2, 4, 5, 7, 8, 10, 11], ('width', 'height'), _no_glyph_15_3_values, _no_glyph_15_3_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _no_glyph_15_box_x_values, None), 'y': ('{-0.5*height}', ['', ''], ['-0.5*height'], [None], [0], ('height',), _no_glyph_15_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _no_glyph_15_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _no_glyph_15_box_height_values, None)},
+    },
+    'Omitted Detail': {
+        'defaults': {'width': 15.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _omitted_detail_16_0_values, _omitted_detail_16_0_path)},
+            {'class': 'filled-background-path', 'id': 'omitted-detail-background', 'style': {'facecolor': (1.0, 1.0, 1.0), 'edgecolor': 'none'}, 'd': 'M{0},{0} L{width},{0} L{width},{0} L{0},{0} Z',
+             'parametric_path': ('M{0},{0} L{width},{0} L{width},{0} L{0},{0} Z', ['M', ',', ' L', ',', ' L', ',', ' L', ',', ' Z'], ['0', '0', 'width', '0', 'width', '0', '0', '0'], ['M', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'Z'], [1, 2, 4, 5, 7, 8, 10, 11], ('width',), _omitted_detail_16_1_values, _omitted_detail_16_1_path)},
+            {'class': 'unfilled-path', 'id': 'omitted-detail-point1', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0.5*width},{0} L{0.5*width},{0}',
+             'parametric_path': ('M{0.5*width},{0} L{0.5*width},{0}', ['M', ',', ' L', ',', ''], ['0.5*width', '0', '0.5*width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _omitted_detail_16_2_values, _omitted_detail_16_2_path)},
+            {'class': 'unfilled-path', 'id': 'omitted-detail-point1', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0.25*width},{0} L{0.25*width},{0}',
+             'parametric_path': ('M{0.25*width},{0} L{0.25*width},{0}', ['M', ',', ' L', ',', ''], ['0.25*width', '0', '0.25*width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _omitted_detail_16_3_values, _omitted_detail_16_3_path)},
+            {'class': 'unfilled-path', 'id': 'omitted-detail-point1', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0.75*width},{0} L{0.75*width},{0}',
+             'parametric_path': ('M{0.75*width},{0} L{0.75*width},{0}', ['M', ',', ' L', ',', ''], ['0.75*width', '0', '0.75*width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _omitted_detail_16_4_values, _omitted_detail_16_4_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _omitted_detail_16_box_x_values, None), 'y': ('{0}', ['', ''], ['0'], [None], [0], (), _omitted_detail_16_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _omitted_detail_16_box_width_values, None), 'height': ('{0}', ['', ''], ['0'], [None], [0], (), _omitted_detail_16_box_height_values, None)},
+    },
+    'Operator': {
+        'defaults': {'height': 7.0, 'width': 7.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _operator_17_0_values, _operator_17_0_path)},
+            {'class': 'filled-background-path', 'id': 'operator-background', 'style': {'facecolor': (1.0, 1.0, 1.0), 'edgecolor': 'none'}, 'd': 'M{0},{-0.5*height} L{width},{-0.5*height} L{width},{0.5*height} L{0},{0.5*height} Z',
+             'parametric_path': ('M{0},{-0.5*height} L{width},{-0.5*height} L{width},{0.5*height} L{0},{0.5*height} Z', ['M', ',', ' L', ',', ' L', ',', ' L', ',', ' Z'], ['0', '-0.5*height', 'width', '-0.5*height', 'width', '0.5*height', '0', '0.5*height'], ['M', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'Z'], [1, 2, 4, 5, 7, 8, 10, 11], ('height', 'width'), _operator_17_1_values, _operator_17_1_path)},
+            {'class': 'unfilled-path', 'id': 'operator-path', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{-0.5*height} L{0},{0.5*height} L{width},{0.5*height} L{width},{-0.5*height}',
+             'parametric_path': ('M{0},{-0.5*height} L{0},{0.5*height} L{width},{0.5*height} L{width},{-0.5*height}', ['M', ',', ' L', ',', ' L', ',', ' L', ',', ''], ['0', '-0.5*height', '0', '0.5*height', 'width', '0.5*height', 'width', '-0.5*height'], ['M', None, None, 'L', None, None, 'L', None, None, 'L', None, None], [1, 2, 4, 5, 7, 8, 10, 11], ('height', 'width'), _operator_17_2_values, _operator_17_2_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _operator_17_box_x_values, None), 'y': ('{-0.5*height}', ['', ''], ['-0.5*height'], [None], [0], ('height',), _operator_17_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _operator_17_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _operator_17_box_height_values, None)},
+    },
+    'OriginOfReplication': {
+        'defaults': {'width': 20.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _originofreplication_18_0_values, _originofreplication_18_0_path)},
+            {'class': 'filled-path', 'id': 'origin-of-replication', 'style': {'facecolor': (0.9019607843137255, 0.9019607843137255, 0.9019607843137255), 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} C{0},{-0.666666666666667*width} {width},{-0.666666666666667*width} {width},{0} C{width},{0.666666666666667*width} {0},{0.666666666666667*width} {0},{0} Z',
+             'parametric_path': ('M{0},{0} C{0},{-0.666666666666667*width} {width},{-0.666666666666667*width} {width},{0} C{width},{0.666666666666667*width} {0},{0.666666666666667*width} {0},{0} Z', ['M', ',', ' C', ',', ' ', ',', ' ', ',', ' C', ',', ' ', ',', ' ', ',', ' Z'], ['0', '0', '0', '-0.666666666666667*width', 'width', '-0.666666666666667*width', 'width', '0', 'width', '0.666666666666667*width', '0', '0.666666666666667*width', '0', '0'], ['M', None, None, 'C', None, None, None, None, None, None, 'C', None, None, None, None, None, None, 'Z'], [1, 2, 4, 5, 6, 7, 8, 9, 11, 12, 13, 14, 15, 16], ('width',), _originofreplication_18_1_values, _originofreplication_18_1_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _originofreplication_18_box_x_values, None), 'y': ('{-0.5*width}', ['', ''], ['-0.5*width'], [None], [0], ('width',), _originofreplication_18_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _originofreplication_18_box_width_values, None), 'height': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _originofreplication_18_box_height_values, None)},
+    },
+    'OriginOfTransfer': {
+        'defaults': {'width': 20.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _originoftransfer_19_0_values, _originoftransfer_19_0_path)},
+            {'class': 'filled-path', 'id': 'origin-of-transfer', 'style': {'facecolor': (0.9019607843137255, 0.9019607843137255, 0.9019607843137255), 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} C{0},{-0.666666666666667*width} {width},{-0.666666666666667*width} {width},{0} C{width},{0.666666666666667*width} {0},{0.666666666666667*width} {0},{0} Z',
+             'parametric_path': ('M{0},{0} C{0},{-0.666666666666667*width} {width},{-0.666666666666667*width} {width},{0} C{width},{0.666666666666667*width} {0},{0.666666666666667*width} {0},{0} Z', ['M', ',', ' C', ',', ' ', ',', ' ', ',', ' C', ',', ' ', ',', ' ', ',', ' Z'], ['0', '0', '0', '-0.666666666666667*width', 'width', '-0.666666666666667*width', 'width', '0', 'width', '0.666666666666667*width', '0', '0.666666666666667*width', '0', '0'], ['M', None, None, 'C', None, None, None, None, None, None, 'C', None, None, None, None, None, None, 'Z'], [1, 2, 4, 5, 6, 7, 8, 9, 11, 12, 13, 14, 15, 16], ('width',), _originoftransfer_19_1_values, _originoftransfer_19_1_path)},
+            {'class': 'unfilled-path', 'id': 'origin-of-transfer-arrowbody', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0.5*width},{0} L{width},{-0.5*width}',
+             'parametric_path': ('M{0.5*width},{0} L{width},{-0.5*width}', ['M', ',', ' L', ',', ''], ['0.5*width', '0', 'width', '-0.5*width'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _originoftransfer_19_2_values, _originoftransfer_19_2_path)},
+            {'class': 'unfilled-path', 'id': 'origin-of-transfer-arrowhead', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0.85*width},{-0.5*width} L{width},{-0.5*width} L{width},{-0.35*width}',
+             'parametric_path': ('M{0.85*width},{-0.5*width} L{width},{-0.5*width} L{width},{-0.35*width}', ['M', ',', ' L', ',', ' L', ',', ''], ['0.85*width', '-0.5*width', 'width', '-0.5*width', 'width', '-0.35*width'], ['M', None, None, 'L', None, None, 'L', None, None], [1, 2, 4, 5, 7, 8], ('width',), _originoftransfer_19_3_values, _originoftransfer_19_3_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _originoftransfer_19_box_x_values, None), 'y': ('{-0.5*width}', ['', ''], ['-0.5*width'], [None], [0], ('width',), _originoftransfer_19_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _originoftransfer_19_box_width_values, None), 'height': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _originoftransfer_19_box_height_values, None)},
+    },
+    "3' Overhang Site": {
+        'defaults': {'height': 5.0, 'width': 15.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _3_overhang_site_20_0_values, _3_overhang_site_20_0_path)},
+            {'class': 'filled-background-path', 'id': 'overhang_site-background', 'style': {'facecolor': (1.0, 1.0, 1.0), 'edgecolor': 'none'}, 'd': 'M{0},{-0.5*height} L{width},{-0.5*height} L{width},{0.5*height} L{0},{0.5*height} Z',
+             'parametric_path': ('M{0},{-0.5*height} L{width},{-0.5*height} L{width},{0.5*height} L{0},{0.5*height} Z', ['M', ',', ' L', ',', ' L', ',', ' L', ',', ' Z'], ['0', '-0.5*height', 'width', '-0.5*height', 'width', '0.5*height', '0', '0.5*height'], ['M', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'Z'], [1, 2, 4, 5, 7, 8, 10, 11], ('height', 'width'), _3_overhang_site_20_1_values, _3_overhang_site_20_1_path)},
+            {'class': 'unfilled-path', 'id': 'overhang_site-path1', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{-0.5*height} L{width},{-0.5*height}',
+             'parametric_path': ('M{0},{-0.5*height} L{width},{-0.5*height}', ['M', ',', ' L', ',', ''], ['0', '-0.5*height', 'width', '-0.5*height'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('height', 'width'), _3_overhang_site_20_2_values, _3_overhang_site_20_2_path)},
+            {'class': 'unfilled-path', 'id': 'overhang_site-path1', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0.5*height} L{0.6*width},{0.5*height}',
+             'parametric_path': ('M{0},{0.5*height} L{0.6*width},{0.5*height}', ['M', ',', ' L', ',', ''], ['0', '0.5*height', '0.6*width', '0.5*height'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('height', 'width'), _3_overhang_site_20_3_values, _3_overhang_site_20_3_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _3_overhang_site_20_box_x_values, None), 'y': ('{-0.5*height}', ['', ''], ['-0.5*height'], [None], [0], ('height',), _3_overhang_site_20_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _3_overhang_site_20_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _3_overhang_site_20_box_height_values, None)},
+    },
+    "5' Overhang Site": {
+        'defaults': {'height': 5.0, 'width': 15.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _5_overhang_site_21_0_values, _5_overhang_site_21_0_path)},
+            {'class': 'filled-background-path', 'id': 'overhang_site-background', 'style': {'facecolor': (1.0, 1.0, 1.0), 'edgecolor': 'none'}, 'd': 'M{0},{-0.5*height} L{width},{-0.5*height} L{width},{0.5*height} L{0},{0.5*height} Z',
+             'parametric_path': ('M{0},{-0.5*height} L{width},{-0.5*height} L{width},{0.5*height} L{0},{0.5*height} Z', ['M', ',', ' L', ',', ' L', ',', ' L', ',', ' Z'], ['0', '-0.5*height', 'width', '-0.5*height', 'width', '0.5*height', '0', '0.5*height'], ['M', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'Z'], [1, 2, 4, 5, 7, 8, 10, 11], ('height', 'width'), _5_overhang_site_21_1_values, _5_overhang_site_21_1_path)},
+            {'class': 'unfilled-path', 'id': 'overhang_site-path1', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{-0.5*height} L{width},{-0.5*height}',
+             'parametric_path': ('M{0},{-0.5*height} L{width},{-0.5*height}', ['M', ',', ' L', ',', ''], ['0', '-0.5*height', 'width', '-0.5*height'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('height', 'width'), _5_overhang_site_21_2_values, _5_overhang_site_21_2_path)},
+            {'class': 'unfilled-path', 'id': 'overhang_site-path1', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0.4*width},{0.5*height} L{width},{0.5*height}',
+             'parametric_path': ('M{0.4*width},{0.5*height} L{width},{0.5*height}', ['M', ',', ' L', ',', ''], ['0.4*width', '0.5*height', 'width', '0.5*height'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width', 'height'), _5_overhang_site_21_3_values, _5_overhang_site_21_3_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _5_overhang_site_21_box_x_values, None), 'y': ('{-0.5*height}', ['', ''], ['-0.5*height'], [None], [0], ('height',), _5_overhang_site_21_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _5_overhang_site_21_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _5_overhang_site_21_box_height_values, None)},
+    },
+    'PolyA Site': {
+        'defaults': {'width': 20.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _polya_site_22_0_values, _polya_site_22_0_path)},
+            {'class': 'filled-background-path', 'id': 'poly-a-site-background', 'style': {'facecolor': (1.0, 1.0, 1.0), 'edgecolor': 'none'}, 'd': 'M{0},{-0.3*width} L{width},{-0.3*width} L{width},{0.3*width} L{0},{0.3*width} Z',
+             'parametric_path': ('M{0},{-0.3*width} L{width},{-0.3*width} L{width},{0.3*width} L{0},{0.3*width} Z', ['M', ',', ' L', ',', ' L', ',', ' L', ',', ' Z'], ['0', '-0.3*width', 'width', '-0.3*width', 'width', '0.3*width', '0', '0.3*width'], ['M', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'Z'], [1, 2, 4, 5, 7, 8, 10, 11], ('width',), _polya_site_22_1_values, _polya_site_22_1_path)},
+            {'class': 'unfilled-path', 'id': 'poly-a-site-path1', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{0.166666666666667*width},{-0.3*width} L{0.333333*width},{0} L{0.5*width},{-0.3*width} L{0.66666*width},{0} L{0.833333333333333*width},{-0.3*width} L{1.0*width},{0}',
+             'parametric_path': ('M{0},{0} L{0.166666666666667*width},{-0.3*width} L{0.333333*width},{0} L{0.5*width},{-0.3*width} L{0.66666*width},{0} L{0.833333333333333*width},{-0.3*width} L{1.0*width},{0}', ['M', ',', ' L', ',', ' L', ',', ' L', ',', ' L', ',', ' L', ',', ' L', ',', ''], ['0', '0', '0.166666666666667*width', '-0.3*width', '0.333333*width', '0', '0.5*width', '-0.3*width', '0.66666*width', '0', '0.833333333333333*width', '-0.3*width', '1.0*width', '0'], ['M', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'L', None, None], [1, 2, 4, 5, 7, 8, 10, 11, 13, 14, 16, 17, 19, 20], ('width',), _polya_site_22_2_values, _polya_site_22_2_path)},
+            {'class': 'unfilled-path', 'id': 'poly-a-site-path2', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0.0583333333333333*width},{-0.09*width} L{0.275*width},{-0.09*width}',
+             'parametric_path': ('M{0.0583333333333333*width},{-0.09*width} L{0.275*width},{-0.09*width}', ['M', ',', ' L', ',', ''], ['0.0583333333333333*width', '-0.09*width', '0.275*width', '-0.09*width'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _polya_site_22_3_values, _polya_site_22_3_path)},
+            {'class': 'unfilled-path', 'id': 'poly-a-site-path3', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0.391666666666667*width},{-0.09*width} L{0.608333333333333*width},{-0.09*width}',
+             'parametric_path': ('M{0.391666666666667*width},{-0.09*width} L{0.608333333333333*width},{-0.09*width}', ['M', ',', ' L', ',', ''], ['0.391666666666667*width', '-0.09*width', '0.608333333333333*width', '-0.09*width'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _polya_site_22_4_values, _polya_site_22_4_path)},
+            {'class': 'unfilled-path', 'id': 'poly-a-site-path3', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0.725*width},{-0.09*width} L{0.941666666666667*width},{-0.09*width}',
+             'parametric_path': ('M{0.725*width},{-0.09*width} L{0.941666666666667*width},{-0.09*width}', ['M', ',', ' L', ',', ''], ['0.725*width', '-0.09*width', '0.941666666666667*width', '-0.09*width'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _polya_site_22_5_values, _polya_site_22_5_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _polya_site_22_box_x_values, None), 'y': ('{-0.3*width}', ['', ''], ['-0.3*width'], [None], [0], ('width',), _polya_site_22_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _polya_site_22_box_width_values, None), 'height': ('{0.3*width}', ['', ''], ['0.3*width'], [None], [0], ('width',), _polya_site_22_box_height_values, None)},
+    },
+    'Polypeptide Region': {
+        'defaults': {'arrowbody_height': 15.0, 'arrowhead_width': 7.0, 'width': 30.0, 'height': 15.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _polypeptide_region_23_0_values, _polypeptide_region_23_0_path)},
+            {'class': 'filled-path', 'id': 'cds', 'style': {'facecolor': (0.9019607843137255, 0.9019607843137255, 0.9019607843137255), 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0}  L{0},{-arrowbody_height/2}  L{width - arrowhead_width},{-arrowbody_height/2}  L{width - arrowhead_width},{-height/2}  L{width},{0}  L{width - arrowhead_width},{height/2}  L{width - arrowhead_width},{arrowbody_height/2}  L{0},{arrowbody_height/2} Z',
+             'parametric_path': ('M{0},{0}  L{0},{-arrowbody_height/2}  L{width - arrowhead_width},{-arrowbody_height/2}  L{width - arrowhead_width},{-height/2}  L{width},{0}  L{width - arrowhead_width},{height/2}  L{width - arrowhead_width},{arrowbody_height/2}  L{0},{arrowbody_height/2} Z', ['M', ',', '  L', ',', '  L', ',', '  L', ',', '  L', ',', '  L', ',', '  L', ',', '  L', ',', ' Z'], ['0', '0', '0', '-arrowbody_height/2', 'width - arrowhead_width', '-arrowbody_height/2', 'width - arrowhead_width', '-height/2', 'width', '0', 'width - arrowhead_width', 'height/2', 'width - arrowhead_width', 'arrowbody_height/2', '0', 'arrowbody_height/2'], ['M', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'Z'], [1, 2, 4, 5, 7, 8, 10, 11, 13, 14, 16, 17, 19, 20, 22, 23], ('arrowbody_height', 'width', 'arrowhead_width', 'height'), _polypeptide_region_23_1_values, _polypeptide_region_23_1_path)},
+            {'class': 'filled-path', 'id': 'internal', 'style': {'facecolor': (0.7058823529411765, 0.7058823529411765, 0.7058823529411765), 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0+0.25*(width - arrowhead_width)+arrowhead_width},{0}  L{0+0.25*(width - arrowhead_width)},{-arrowbody_height/2}  L{0.6*(width - arrowhead_width)},{-arrowbody_height/2}  L{0.6*(width - arrowhead_width)+arrowhead_width},{0}  L{0.6*(width - arrowhead_width)},{arrowbody_height/2}  L{0+0.25*(width - arrowhead_width)},{arrowbody_height/2} Z',
+             'parametric_path': ('M{0+0.25*(width - arrowhead_width)+arrowhead_width},{0}  L{0+0.25*(width - arrowhead_width)},{-arrowbody_height/2}  L{0.6*(width - arrowhead_width)},{-arrowbody_height/2}  L{0.6*(width - arrowhead_width)+arrowhead_width},{0}  L{0.6*(width - arrowhead_width)},{arrowbody_height/2}  L{0+0.25*(width - arrowhead_width)},{arrowbody_height/2} Z', ['M', ',', '  L', ',', '  L', ',', '  L', ',', '  L', ',', '  L', ',', ' Z'], ['0+0.25*(width - arrowhead_width)+arrowhead_width', '0', '0+0.25*(width - arrowhead_width)', '-arrowbody_height/2', '0.6*(width - arrowhead_width)', '-arrowbody_height/2', '0.6*(width - arrowhead_width)+arrowhead_width', '0', '0.6*(width - arrowhead_width)', 'arrowbody_height/2', '0+0.25*(width - arrowhead_width)', 'arrowbody_height/2'], ['M', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'Z'], [1, 2, 4, 5, 7, 8, 10, 11, 13, 14, 16, 17], ('arrowhead_width', 'width', 'arrowbody_height'), _polypeptide_region_23_2_values, _polypeptide_region_23_2_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _polypeptide_region_23_box_x_values, None), 'y': ('{-height/2}', ['', ''], ['-height/2'], [None], [0], ('height',), _polypeptide_region_23_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _polypeptide_region_23_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _polypeptide_region_23_box_height_values, None)},
+    },
+    'PrimerBindingSite': {
+        'defaults': {'arrowhead_width': 10.0, 'width': 30.0, 'height': 10.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _primerbindingsite_24_0_values, _primerbindingsite_24_0_path)},
+            {'class': 'unfilled-path', 'id': 'primer-binding-site', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0} L{width - arrowhead_width},{-height}',
+             'parametric_path': ('M{0},{0} L{width},{0} L{width - arrowhead_width},{-height}', ['M', ',', ' L', ',', ' L', ',', ''], ['0', '0', 'width', '0', 'width - arrowhead_width', '-height'], ['M', None, None, 'L', None, None, 'L', None, None], [1, 2, 4, 5, 7, 8], ('width', 'arrowhead_width', 'height'), _primerbindingsite_24_1_values, _primerbindingsite_24_1_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _primerbindingsite_24_box_x_values, None), 'y': ('{-height}', ['', ''], ['-height'], [None], [0], ('height',), _primerbindingsite_24_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _primerbindingsite_24_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _primerbindingsite_24_box_height_values, None)},
+    },
+    'Promoter': {
+        'defaults': {'arrowbody_height': 5.0, 'arrowhead_width': 10.0, 'width': 13.0, 'height': 15.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _promoter_25_0_values, _promoter_25_0_path)},
+            {'class': 'unfilled-path', 'id': 'promoter-body', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{0},{-height +arrowbody_height/2} L{width},{-height +arrowbody_height/2}',
+             'parametric_path': ('M{0},{0} L{0},{-height +arrowbody_height/2} L{width},{-height +arrowbody_height/2}', ['M', ',', ' L', ',', ' L', ',', ''], ['0', '0', '0', '-height +arrowbody_height/2', 'width', '-height +arrowbody_height/2'], ['M', None, None, 'L', None, None, 'L', None, None], [1, 2, 4, 5, 7, 8], ('height', 'arrowbody_height', 'width'), _promoter_25_1_values, _promoter_25_1_path)},
+            {'class': 'unfilled-path', 'id': 'promoter-head', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{arrowhead_width},{-height} L{width},{-height + arrowbody_height/2} L{arrowhead_width},{-height + arrowbody_height}',
+             'parametric_path': ('M{arrowhead_width},{-height} L{width},{-height + arrowbody_height/2} L{arrowhead_width},{-height + arrowbody_height}', ['M', ',', ' L', ',', ' L', ',', ''], ['arrowhead_width', '-height', 'width', '-height + arrowbody_height/2', 'arrowhead_width', '-height + arrowbody_height'], ['M', None, None, 'L', None, None, 'L', None, None], [1, 2, 4, 5, 7, 8], ('arrowhead_width', 'height', 'width', 'arrowbody_height'), _promoter_25_2_values, _promoter_25_2_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _promoter_25_box_x_values, None), 'y': ('{-arrowbody_height - height}', ['', ''], ['-arrowbody_height - height'], [None], [0], ('height', 'arrowbody_height'), _promoter_25_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _promoter_25_box_width_values, None), 'height': ('{arrowbody_height + height}', ['', ''], ['arrowbody_height + height'], [None], [0], ('arrowbody_height', 'height'), _promoter_25_box_height_values, None)},
+    },
+    'Polypeptide Chain': {
+        'defaults': {'height': 8.0, 'width': 18.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _polypeptide_chain_26_0_values, _polypeptide_chain_26_0_path)},
+            {'class': 'filled-path', 'id': 'protein', 'style': {'facecolor': (0.9019607843137255, 0.9019607843137255, 0.9019607843137255), 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M0,0 Q0,{height/2.0} {width*0.3},{height/2.0} L{width*0.7},{height/2.0} Q{width},{height/2.0} {width},0 Q{width},{-height/2.0} {width*0.7},{-height/2.0} L{width*0.3},{-height/2.0} Q0,{-height/2.0} 0,0 Z',
+             'parametric_path': ('M0,0 Q0,{height/2.0} {width*0.3},{height/2.0} L{width*0.7},{height/2.0} Q{width},{height/2.0} {width},0 Q{width},{-height/2.0} {width*0.7},{-height/2.0} L{width*0.3},{-height/2.0} Q0,{-height/2.0} 0,0 Z', ['M0,0 Q0,', ' ', ',', ' L', ',', ' Q', ',', ' ', ',0 Q', ',', ' ', ',', ' L', ',', ' Q0,', ' 0,0 Z'], ['height/2.0', 'width*0.3', 'height/2.0', 'width*0.7', 'height/2.0', 'width', 'height/2.0', 'width', 'width', '-height/2.0', 'width*0.7', '-height/2.0', 'width*0.3', '-height/2.0', '-height/2.0'], ['M', 0.0, 0.0, 'Q', 0.0, None, None, None, 'L', None, None, 'Q', None, None, None, 0.0, 'Q', None, None, None, None, 'L', None, None, 'Q', 0.0, None, 0.0, 0.0, 'Z'], [5, 6, 7, 9, 10, 12, 13, 14, 17, 18, 19, 20, 22, 23, 26], ('height', 'width'), _polypeptide_chain_26_1_values, _polypeptide_chain_26_1_path)},
+        ],
+        'bounding_box': {'x': ('0', ['0'], [], [0.0], [], (), _polypeptide_chain_26_box_x_values, None), 'y': ('{-height/2},0', ['', ',0'], ['-height/2'], [None, 0.0], [0], ('height',), _polypeptide_chain_26_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _polypeptide_chain_26_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _polypeptide_chain_26_box_height_values, None)},
+    },
+    'Protein Cleavage Site': {
+        'defaults': {'height': 16.0, 'width': 6.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _protein_cleavage_site_27_0_values, _protein_cleavage_site_27_0_path)},
+            {'class': 'unfilled-path', 'id': 'location-stem-path', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'm {width/2},{-height + width/2} c {width/2},-2 {width/2},{2 + (height - width/2)/3} -0,{ (height - width/2)/3} {width/2},-2 {width/2},{2 + (height - width/2)/3} 0,{(height - width/2)/3} {width/2},-2 {width/2},{2 + (height - width/2)/3} -0,{ (height - width/2)/3}',
+             'parametric_path': ('m {width/2},{-height + width/2} c {width/2},-2 {width/2},{2 + (height - width/2)/3} -0,{ (height - width/2)/3} {width/2},-2 {width/2},{2 + (height - width/2)/3} 0,{(height - width/2)/3} {width/2},-2 {width/2},{2 + (height - width/2)/3} -0,{ (height - width/2)/3}', ['m ', ',', ' c ', ',-2 ', ',', ' -0,', ' ', ',-2 ', ',', ' 0,', ' ', ',-2 ', ',', ' -0,', ''], ['width/2', '-height + width/2', 'width/2', 'width/2', '2 + (height - width/2)/3', ' (height - width/2)/3', 'width/2', 'width/2', '2 + (height - width/2)/3', '(height - width/2)/3', 'width/2', 'width/2', '2 + (height - width/2)/3', ' (height - width/2)/3'], ['m', None, None, 'c', None, -2.0, None, None, -0.0, None, None, -2.0, None, None, 0.0, None, None, -2.0, None, None, -0.0, None], [1, 2, 4, 6, 7, 9, 10, 12, 13, 15, 16, 18, 19, 21], ('width', 'height'), _protein_cleavage_site_27_1_values, _protein_cleavage_site_27_1_path)},
+            {'class': 'unfilled-path', 'id': 'location-top-path', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{-height} L{width},{-height+width}',
+             'parametric_path': ('M{0},{-height} L{width},{-height+width}', ['M', ',', ' L', ',', ''], ['0', '-height', 'width', '-height+width'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('height', 'width'), _protein_cleavage_site_27_2_values, _protein_cleavage_site_27_2_path)},
+            {'class': 'unfilled-path', 'id': 'location-top-path', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{-height+width} L{width},{-height}',
+             'parametric_path': ('M{0},{-height+width} L{width},{-height}', ['M', ',', ' L', ',', ''], ['0', '-height+width', 'width', '-height'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width', 'height'), _protein_cleavage_site_27_3_values, _protein_cleavage_site_27_3_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _protein_cleavage_site_27_box_x_values, None), 'y': ('{-height}', ['', ''], ['-height'], [None], [0], ('height',), _protein_cleavage_site_27_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _protein_cleavage_site_27_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _protein_cleavage_site_27_box_height_values, None)},
+    },
+    'Protein Location': {
+        'defaults': {'height': 16.0, 'width': 6.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _protein_location_28_0_values, _protein_location_28_0_path)},
+            {'class': 'unfilled-path', 'id': 'location-stem-path', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'm {width/2},{-height + width/2} c {width/2},-2 {width/2},{2 + (height - width/2)/3} -0,{ (height - width/2)/3} {width/2},-2 {width/2},{2 + (height - width/2)/3} 0,{(height - width/2)/3} {width/2},-2 {width/2},{2 + (height - width/2)/3} -0,{ (height - width/2)/3}',
+             'parametric_path': ('m {width/2},{-height + width/2} c {width/2},-2 {width/2},{2 + (height - width/2)/3} -0,{ (height - width/2)/3} {width/2},-2 {width/2},{2 + (height - width/2)/3} 0,{(height - width/2)/3} {width/2},-2 {width/2},{2 + (height - width/2)/3} -0,{ (height - width/2)/3}', ['m ', ',', ' c ', ',-2 ', ',', ' -0,', ' ', ',-2 ', ',', ' 0,', ' ', ',-2 ', ',', ' -0,', ''], ['width/2', '-height + width/2', 'width/2', 'width/2', '2 + (height - width/2)/3', ' (height - width/2)/3', 'width/2', 'width/2', '2 + (height - width/2)/3', '(height - width/2)/3', 'width/2', 'width/2', '2 + (height - width/2)/3', ' (height - width/2)/3'], ['m', None, None, 'c', None, -2.0, None, None, -0.0, None, None, -2.0, None, None, 0.0, None, None, -2.0, None, None, -0.0, None], [1, 2, 4, 6, 7, 9, 10, 12, 13, 15, 16, 18, 19, 21], ('width', 'height'), _protein_location_28_1_values, _protein_location_28_1_path)},
+            {'class': 'filled-path', 'id': 'location-top-path', 'style': {'facecolor': (0.9019607843137255, 0.9019607843137255, 0.9019607843137255), 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{-height + width - 0.5*width} C{0},{-height + width - 1.16666666666667*width} {width},{-height + width - 1.16666666666667*width} {width},{-height + width - 0.5*width} C{width},{-height + width + 0.166666666666667*width} {0},{-height + width + 0.166666666666667*width} {0},{-height + width - 0.5*width} Z',
+             'parametric_path': ('M{0},{-height + width - 0.5*width} C{0},{-height + width - 1.16666666666667*width} {width},{-height + width - 1.16666666666667*width} {width},{-height + width - 0.5*width} C{width},{-height + width + 0.166666666666667*width} {0},{-height + width + 0.166666666666667*width} {0},{-height + width - 0.5*width} Z', ['M', ',', ' C', ',', ' ', ',', ' ', ',', ' C', ',', ' ', ',', ' ', ',', ' Z'], ['0', '-height + width - 0.5*width', '0', '-height + width - 1.16666666666667*width', 'width', '-height + width - 1.16666666666667*width', 'width', '-height + width - 0.5*width', 'width', '-height + width + 0.166666666666667*width', '0', '-height + width + 0.166666666666667*width', '0', '-height + width - 0.5*width'], ['M', None, None, 'C', None, None, None, None, None, None, 'C', None, None, None, None, None, None, 'Z'], [1, 2, 4, 5, 6, 7, 8, 9, 11, 12, 13, 14, 15, 16], ('width', 'height'), _protein_location_28_2_values, _protein_location_28_2_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _protein_location_28_box_x_values, None), 'y': ('{-height}', ['', ''], ['-height'], [None], [0], ('height',), _protein_location_28_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _protein_location_28_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _protein_location_28_box_height_values, None)},
+    },
+    'Protein Stability Element': {
+        'defaults': {'height': 16.0, 'width': 6.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _protein_stability_element_29_0_values, _protein_stability_element_29_0_path)},
+            {'class': 'unfilled-path', 'id': 'location-stem-path', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'm {width/2},{-height + width/2} c {width/2},-2 {width/2},{2 + (height - width/2)/3} -0,{ (height - width/2)/3} {width/2},-2 {width/2},{2 + (height - width/2)/3} 0,{(height - width/2)/3} {width/2},-2 {width/2},{2 + (height - width/2)/3} -0,{ (height - width/2)/3}',
+             'parametric_path': ('m {width/2},{-height + width/2} c {width/2},-2 {width/2},{2 + (height - width/2)/3} -0,{ (height - width/2)/3} {width/2},-2 {width/2},{2 + (height - width/2)/3} 0,{(height - width/2)/3} {width/2},-2 {width/2},{2 + (height - width/2)/3} -0,{ (height - width/2)/3}', ['m ', ',', ' c ', ',-2 ', ',', ' -0,', ' ', ',-2 ', ',', ' 0,', ' ', ',-2 ', ',', ' -0,', ''], ['width/2', '-height + width/2', 'width/2', 'width/2', '2 + (height - width/2)/3', ' (height - width/2)/3', 'width/2', 'width/2', '2 + (height - width/2)/3', '(height - width/2)/3', 'width/2', 'width/2', '2 + (height - width/2)/3', ' (height - width/2)/3'], ['m', None, None, 'c', None, -2.0, None, None, -0.0, None, None, -2.0, None, None, 0.0, None, None, -2.0, None, None, -0.0, None], [1, 2, 4, 6, 7, 9, 10, 12, 13, 15, 16, 18, 19, 21], ('width', 'height'), _protein_stability_element_29_1_values, _protein_stability_element_29_1_path)},
+            {'class': 'filled-path', 'id': 'location-top-path', 'style': {'facecolor': (0.9019607843137255, 0.9019607843137255, 0.9019607843137255), 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{-height} L{width},{-height} L{width},{-height + width - 0.3*width} L{0.5*width},{-height + width} L{0},{-height + width - 0.3*width} Z',
+             'parametric_path': ('M{0},{-height} L{width},{-height} L{width},{-height + width - 0.3*width} L{0.5*width},{-height + width} L{0},{-height + width - 0.3*width} Z', ['M', ',', ' L', ',', ' L', ',', ' L', ',', ' L', ',', ' Z'], ['0', '-height', 'width', '-height', 'width', '-height + width - 0.3*width', '0.5*width', '-height + width', '0', '-height + width - 0.3*width'], ['M', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'Z'], [1, 2, 4, 5, 7, 8, 10, 11, 13, 14], ('height', 'width'), _protein_stability_element_29_2_values, _protein_stability_element_29_2_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _protein_stability_element_29_box_x_values, None), 'y': ('{-height}', ['', ''], ['-height'], [None], [0], ('height',), _protein_stability_element_29_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _protein_stability_element_29_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _protein_stability_element_29_box_height_values, None)},
+    },
+    'RNA Cleavage Site': {
+        'defaults': {'height': 16.0, 'width': 6.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _rna_cleavage_site_30_0_values, _rna_cleavage_site_30_0_path)},
+            {'class': 'unfilled-path', 'id': 'location-stem-path-1', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'm {0.5*width}, {-2*(height-width/2)/3} c {(height-width/2)/6},{-(height-width/2)/6} {-(height-width/2)/6},{-(height-width/2)/6} 0,{-(height-width/2)/3}',
+             'parametric_path': ('m {0.5*width}, {-2*(height-width/2)/3} c {(height-width/2)/6},{-(height-width/2)/6} {-(height-width/2)/6},{-(height-width/2)/6} 0,{-(height-width/2)/3}', ['m ', ', ', ' c ', ',', ' ', ',', ' 0,', ''], ['0.5*width', '-2*(height-width/2)/3', '(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/3'], ['m', None, None, 'c', None, None, None, None, 0.0, None], [1, 2, 4, 5, 6, 7, 9], ('width', 'height'), _rna_cleavage_site_30_1_values, _rna_cleavage_site_30_1_path)},
+            {'class': 'unfilled-path', 'id': 'location-stem-path-2', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'm {0.5*width}, {-(height-width/2)/3} c {(height-width/2)/6},{-(height-width/2)/6} {-(height-width/2)/6},{-(height-width/2)/6} 0,{-(height-width/2)/3}',
+             'parametric_path': ('m {0.5*width}, {-(height-width/2)/3} c {(height-width/2)/6},{-(height-width/2)/6} {-(height-width/2)/6},{-(height-width/2)/6} 0,{-(height-width/2)/3}', ['m ', ', ', ' c ', ',', ' ', ',', ' 0,', ''], ['0.5*width', '-(height-width/2)/3', '(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/3'], ['m', None, None, 'c', None, None, None, None, 0.0, None], [1, 2, 4, 5, 6, 7, 9], ('width', 'height'), _rna_cleavage_site_30_2_values, _rna_cleavage_site_30_2_path)},
+            {'class': 'unfilled-path', 'id': 'location-stem-path-3', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'm {0.5*width}, {0} c {(height-width/2)/6},{-(height-width/2)/6} {-(height-width/2)/6},{-(height-width/2)/6} 0,{-(height-width/2)/3}',
+             'parametric_path': ('m {0.5*width}, {0} c {(height-width/2)/6},{-(height-width/2)/6} {-(height-width/2)/6},{-(height-width/2)/6} 0,{-(height-width/2)/3}', ['m ', ', ', ' c ', ',', ' ', ',', ' 0,', ''], ['0.5*width', '0', '(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/3'], ['m', None, None, 'c', None, None, None, None, 0.0, None], [1, 2, 4, 5, 6, 7, 9], ('width', 'height'), _rna_cleavage_site_30_3_values, _rna_cleavage_site_30_3_path)},
+            {'class': 'unfilled-path', 'id': 'location-top-path', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{-height} L{width},{-height+width}',
+             'parametric_path': ('M{0},{-height} L{width},{-height+width}', ['M', ',', ' L', ',', ''], ['0', '-height', 'width', '-height+width'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('height', 'width'), _rna_cleavage_site_30_4_values, _rna_cleavage_site_30_4_path)},
+            {'class': 'unfilled-path', 'id': 'location-top-path', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{-height+width} L{width},{-height}',
+             'parametric_path': ('M{0},{-height+width} L{width},{-height}', ['M', ',', ' L', ',', ''], ['0', '-height+width', 'width', '-height'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width', 'height'), _rna_cleavage_site_30_5_values, _rna_cleavage_site_30_5_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _rna_cleavage_site_30_box_x_values, None), 'y': ('{-height}', ['', ''], ['-height'], [None], [0], ('height',), _rna_cleavage_site_30_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _rna_cleavage_site_30_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _rna_cleavage_site_30_box_height_values, None)},
+    },
+    'RNA Location': {
+        'defaults': {'height': 16.0, 'width': 6.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _rna_location_31_0_values, _rna_location_31_0_path)},
+            {'class': 'unfilled-path', 'id': 'location-stem-path-1', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'm {0.5*width}, {-2*(height-width/2)/3} c {(height-width/2)/6},{-(height-width/2)/6} {-(height-width/2)/6},{-(height-width/2)/6} 0,{-(height-width/2)/3}',
+             'parametric_path': ('m {0.5*width}, {-2*(height-width/2)/3} c {(height-width/2)/6},{-(height-width/2)/6} {-(height-width/2)/6},{-(height-width/2)/6} 0,{-(height-width/2)/3}', ['m ', ', ', ' c ', ',', ' ', ',', ' 0,', ''], ['0.5*width', '-2*(height-width/2)/3', '(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/3'], ['m', None, None, 'c', None, None, None, None, 0.0, None], [1, 2, 4, 5, 6, 7, 9], ('width', 'height'), _rna_location_31_1_values, _rna_location_31_1_path)},
+            {'class': 'unfilled-path', 'id': 'location-stem-path-2', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'm {0.5*width}, {-(height-width/2)/3} c {(height-width/2)/6},{-(height-width/2)/6} {-(height-width/2)/6},{-(height-width/2)/6} 0,{-(height-width/2)/3}',
+             'parametric_path': ('m {0.5*width}, {-(height-width/2)/3} c {(height-width/2)/6},{-(height-width/2)/6} {-(height-width/2)/6},{-(height-width/2)/6} 0,{-(height-width/2)/3}', ['m ', ', ', ' c ', ',', ' ', ',', ' 0,', ''], ['0.5*width', '-(height-width/2)/3', '(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/3'], ['m', None, None, 'c', None, None, None, None, 0.0, None], [1, 2, 4, 5, 6, 7, 9], ('width', 'height'), _rna_location_31_2_values, _rna_location_31_2_path)},
+            {'class': 'unfilled-path', 'id': 'location-stem-path-3', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'm {0.5*width}, {0} c {(height-width/2)/6},{-(height-width/2)/6} {-(height-width/2)/6},{-(height-width/2)/6} 0,{-(height-width/2)/3}',
+             'parametric_path': ('m {0.5*width}, {0} c {(height-width/2)/6},{-(height-width/2)/6} {-(height-width/2)/6},{-(height-width/2)/6} 0,{-(height-width/2)/3}', ['m ', ', ', ' c ', ',', ' ', ',', ' 0,', ''], ['0.5*width', '0', '(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/3'], ['m', None, None, 'c', None, None, None, None, 0.0, None], [1, 2, 4, 5, 6, 7, 9], ('width', 'height'), _rna_location_31_3_values, _rna_location_31_3_path)},
+            {'class': 'filled-path', 'id': 'location-top-path', 'style': {'facecolor': (0.9019607843137255, 0.9019607843137255, 0.9019607843137255), 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{-height + width - 0.5*width} C{0},{-height + width - 1.16666666666667*width} {width},{-height + width - 1.16666666666667*width} {width},{-height + width - 0.5*width} C{width},{-height + width + 0.166666666666667*width} {0},{-height + width + 0.166666666666667*width} {0},{-height + width - 0.5*width} Z',
+             'parametric_path': ('M{0},{-height + width - 0.5*width} C{0},{-height + width - 1.16666666666667*width} {width},{-height + width - 1.16666666666667*width} {width},{-height + width - 0.5*width} C{width},{-height + width + 0.166666666666667*width} {0},{-height + width + 0.166666666666667*width} {0},{-height + width - 0.5*width} Z', ['M', ',', ' C', ',', ' ', ',', ' ', ',', ' C', ',', ' ', ',', ' ', ',', ' Z'], ['0', '-height + width - 0.5*width', '0', '-height + width - 1.16666666666667*width', 'width', '-height + width - 1.16666666666667*width', 'width', '-height + width - 0.5*width', 'width', '-height + width + 0.166666666666667*width', '0', '-height + width + 0.166666666666667*width', '0', '-height + width - 0.5*width'], ['M', None, None, 'C', None, None, None, None, None, None, 'C', None, None, None, None, None, None, 'Z'], [1, 2, 4, 5, 6, 7, 8, 9, 11, 12, 13, 14, 15, 16], ('width', 'height'), _rna_location_31_4_values, _rna_location_31_4_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _rna_location_31_box_x_values, None), 'y': ('{-height}', ['', ''], ['-height'], [None], [0], ('height',), _rna_location_31_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _rna_location_31_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _rna_location_31_box_height_values, None)},
+    },
+    'RNA Stability Element': {
+        'defaults': {'height': 16.0, 'width': 6.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _rna_stability_element_32_0_values, _rna_stability_element_32_0_path)},
+            {'class': 'unfilled-path', 'id': 'location-stem-path-1', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'm {0.5*width}, {-2*(height-width/2)/3} c {(height-width/2)/6},{-(height-width/2)/6} {-(height-width/2)/6},{-(height-width/2)/6} 0,{-(height-width/2)/3}',
+             'parametric_path': ('m {0.5*width}, {-2*(height-width/2)/3} c {(height-width/2)/6},{-(height-width/2)/6} {-(height-width/2)/6},{-(height-width/2)/6} 0,{-(height-width/2)/3}', ['m ', ', ', ' c ', ',', ' ', ',', ' 0,', ''], ['0.5*width', '-2*(height-width/2)/3', '(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/3'], ['m', None, None, 'c', None, None, None, None, 0.0, None], [1, 2, 4, 5, 6, 7, 9], ('width', 'height'), _rna_stability_element_32_1_values, _rna_stability_element_32_1_path)},
+            {'class': 'unfilled-path', 'id': 'location-stem-path-2', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'm {0.5*width}, {-(height-width/2)/3} c {(height-width/2)/6},{-(height-width/2)/6} {-(height-width/2)/6},{-(height-width/2)/6} 0,{-(height-width/2)/3}',
+             'parametric_path': ('m {0.5*width}, {-(height-width/2)/3} c {(height-width/2)/6},{-(height-width/2)/6} {-(height-width/2)/6},{-(height-width/2)/6} 0,{-(height-width/2)/3}', ['m ', ', ', ' c ', ',', ' ', ',', ' 0,', ''], ['0.5*width', '-(height-width/2)/3', '(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/3'], ['m', None, None, 'c', None, None, None, None, 0.0, None], [1, 2, 4, 5, 6, 7, 9], ('width', 'height'), _rna_stability_element_32_2_values, _rna_stability_element_32_2_path)},
+            {'class': 'unfilled-path', 'id': 'location-stem-path-3', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'm {0.5*width}, {0} c {(height-width/2)/6},{-(height-width/2)/6} {-(height-width/2)/6},{-(height-width/2)/6} 0,{-(height-width/2)/3}',
+             'parametric_path': ('m {0.5*width}, {0} c {(height-width/2)/6},{-(height-width/2)/6} {-(height-width/2)/6},{-(height-width/2)/6} 0,{-(height-width/2)/3}', ['m ', ', ', ' c ', ',', ' ', ',', ' 0,', ''], ['0.5*width', '0', '(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/3'], ['m', None, None, 'c', None, None, None, None, 0.0, None], [1, 2, 4, 5, 6, 7, 9], ('width', 'height'), _rna_stability_element_32_3_values, _rna_stability_element_32_3_path)},
+            {'class': 'filled-path', 'id': 'location-top-path', 'style': {'facecolor': (0.9019607843137255, 0.9019607843137255, 0.9019607843137255), 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{-height} L{width},{-height} L{width},{-height + width - 0.3*width} L{0.5*width},{-height + width} L{0},{-height + width - 0.3*width} Z',
+             'parametric_path': ('M{0},{-height} L{width},{-height} L{width},{-height + width - 0.3*width} L{0.5*width},{-height + width} L{0},{-height + width - 0.3*width} Z', ['M', ',', ' L', ',', ' L', ',', ' L', ',', ' L', ',', ' Z'], ['0', '-height', 'width', '-height', 'width', '-height + width - 0.3*width', '0.5*width', '-height + width', '0', '-height + width - 0.3*width'], ['M', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'Z'], [1, 2, 4, 5, 7, 8, 10, 11, 13, 14], ('height', 'width'), _rna_stability_element_32_4_values, _rna_stability_element_32_4_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _rna_stability_element_32_box_x_values, None), 'y': ('{-height}', ['', ''], ['-height'], [None], [0], ('height',), _rna_stability_element_32_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _rna_stability_element_32_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _rna_stability_element_32_box_height_values, None)},
+    },
+    'RNA Stop Site': {
+        'defaults': {'height': 16.0, 'width': 6.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _rna_stop_site_33_0_values, _rna_stop_site_33_0_path)},
+            {'class': 'unfilled-path', 'id': None, 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'm {0.5*width}, {- 2*(height-width/2)/3} c {(height-width/2)/6},{-(height-width/2)/6} {-(height-width/2)/6},{-(height-width/2)/6} 0,{-(height-width/2)/3}',
+             'parametric_path': ('m {0.5*width}, {- 2*(height-width/2)/3} c {(height-width/2)/6},{-(height-width/2)/6} {-(height-width/2)/6},{-(height-width/2)/6} 0,{-(height-width/2)/3}', ['m ', ', ', ' c ', ',', ' ', ',', ' 0,', ''], ['0.5*width', '- 2*(height-width/2)/3', '(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/3'], ['m', None, None, 'c', None, None, None, None, 0.0, None], [1, 2, 4, 5, 6, 7, 9], ('width', 'height'), _rna_stop_site_33_1_values, _rna_stop_site_33_1_path)},
+            {'class': 'unfilled-path', 'id': None, 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'm {0.5*width}, {- (height-width/2)/3} c {(height-width/2)/6},{-(height-width/2)/6} {-(height-width/2)/6},{-(height-width/2)/6} 0,{-(height-width/2)/3}',
+             'parametric_path': ('m {0.5*width}, {- (height-width/2)/3} c {(height-width/2)/6},{-(height-width/2)/6} {-(height-width/2)/6},{-(height-width/2)/6} 0,{-(height-width/2)/3}', ['m ', ', ', ' c ', ',', ' ', ',', ' 0,', ''], ['0.5*width', '- (height-width/2)/3', '(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/3'], ['m', None, None, 'c', None, None, None, None, 0.0, None], [1, 2, 4, 5, 6, 7, 9], ('width', 'height'), _rna_stop_site_33_2_values, _rna_stop_site_33_2_path)},
+            {'class': 'unfilled-path', 'id': None, 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'm {0.5*width}, {0} c {(height-width/2)/6},{-(height-width/2)/6} {-(height-width/2)/6},{-(height-width/2)/6} 0,{-(height-width/2)/3}',
+             'parametric_path': ('m {0.5*width}, {0} c {(height-width/2)/6},{-(height-width/2)/6} {-(height-width/2)/6},{-(height-width/2)/6} 0,{-(height-width/2)/3}', ['m ', ', ', ' c ', ',', ' ', ',', ' 0,', ''], ['0.5*width', '0', '(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/6', '-(height-width/2)/3'], ['m', None, None, 'c', None, None, None, None, 0.0, None], [1, 2, 4, 5, 6, 7, 9], ('width', 'height'), _rna_stop_site_33_3_values, _rna_stop_site_33_3_path)},
+            {'class': 'filled-path', 'id': 'location-top-path', 'style': {'facecolor': (0.9019607843137255, 0.9019607843137255, 0.9019607843137255), 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{-height + width - 0.5*width} C{0},{-height + width - 1.16666666666667*width} {width},{-height + width - 1.16666666666667*width} {width},{-height + width - 0.5*width} C{width},{-height + width + 0.166666666666667*width} {0},{-height + width + 0.166666666666667*width} {0},{-height + width - 0.5*width} Z',
+             'parametric_path': ('M{0},{-height + width - 0.5*width} C{0},{-height + width - 1.16666666666667*width} {width},{-height + width - 1.16666666666667*width} {width},{-height + width - 0.5*width} C{width},{-height + width + 0.166666666666667*width} {0},{-height + width + 0.166666666666667*width} {0},{-height + width - 0.5*width} Z', ['M', ',', ' C', ',', ' ', ',', ' ', ',', ' C', ',', ' ', ',', ' ', ',', ' Z'], ['0', '-height + width - 0.5*width', '0', '-height + width - 1.16666666666667*width', 'width', '-height + width - 1.16666666666667*width', 'width', '-height + width - 0.5*width', 'width', '-height + width + 0.166666666666667*width', '0', '-height + width + 0.166666666666667*width', '0', '-height + width - 0.5*width'], ['M', None, None, 'C', None, None, None, None, None, None, 'C', None, None, None, None, None, None, 'Z'], [1, 2, 4, 5, 6, 7, 8, 9, 11, 12, 13, 14, 15, 16], ('width', 'height'), _rna_stop_site_33_4_values, _rna_stop_site_33_4_path)},
+            {'class': 'unfilled-path', 'id': 'star-1', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{(0.5*width)},{-height+(0.5*width)} L{(0.5*width)+(0.58778525229*(0.2*width))},{(-height+(0.5*width))+(0.80901699437*(0.2*width))}',
+             'parametric_path': ('M{(0.5*width)},{-height+(0.5*width)} L{(0.5*width)+(0.58778525229*(0.2*width))},{(-height+(0.5*width))+(0.80901699437*(0.2*width))}', ['M', ',', ' L', ',', ''], ['(0.5*width)', '-height+(0.5*width)', '(0.5*width)+(0.58778525229*(0.2*width))', '(-height+(0.5*width))+(0.80901699437*(0.2*width))'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width', 'height'), _rna_stop_site_33_5_values, _rna_stop_site_33_5_path)},
+            {'class': 'unfilled-path', 'id': 'star-2', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{(0.5*width)},{-height+(0.5*width)} L{(0.5*width)+(0.95105651629*(0.2*width))},{(-height+(0.5*width))+(-0.30901699437*(0.2*width))}',
+             'parametric_path': ('M{(0.5*width)},{-height+(0.5*width)} L{(0.5*width)+(0.95105651629*(0.2*width))},{(-height+(0.5*width))+(-0.30901699437*(0.2*width))}', ['M', ',', ' L', ',', ''], ['(0.5*width)', '-height+(0.5*width)', '(0.5*width)+(0.95105651629*(0.2*width))', '(-height+(0.5*width))+(-0.30901699437*(0.2*width))'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width', 'height'), _rna_stop_site_33_6_values, _rna_stop_site_33_6_path)},
+            {'class': 'unfilled-path', 'id': 'star-3', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{(0.5*width)},{-height+(0.5*width)} L{(0.5*width)+(0.0*(0.2*width))},{(-height+(0.5*width))+(-1.0*(0.2*width))}',
+             'parametric_path': ('M{(0.5*width)},{-height+(0.5*width)} L{(0.5*width)+(0.0*(0.2*width))},{(-height+(0.5*width))+(-1.0*(0.2*width))}', ['M', ',', ' L', ',', ''], ['(0.5*width)', '-height+(0.5*width)', '(0.5*width)+(0.0*(0.2*width))', '(-height+(0.5*width))+(-1.0*(0.2*width))'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width', 'height'), _rna_stop_site_33_7_values, _rna_stop_site_33_7_path)},
+            {'class': 'unfilled-path', 'id': 'star-4', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{(0.5*width)},{-height+(0.5*width)} L{(0.5*width)+(-0.95105651629*(0.2*width))},{(-height+(0.5*width))+(-0.30901699437*(0.2*width))}',
+             'parametric_path': ('M{(0.5*width)},{-height+(0.5*width)} L{(0.5*width)+(-0.95105651629*(0.2*width))},{(-height+(0.5*width))+(-0.30901699437*(0.2*width))}', ['M', ',', ' L', ',', ''], ['(0.5*width)', '-height+(0.5*width)', '(0.5*width)+(-0.95105651629*(0.2*width))', '(-height+(0.5*width))+(-0.30901699437*(0.2*width))'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width', 'height'), _rna_stop_site_33_8_values, _rna_stop_site_33_8_path)},
+            {'class': 'unfilled-path', 'id': 'star-5', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{(0.5*width)},{-height+(0.5*width)} L{(0.5*width)+(-0.58778525229*(0.2*width))},{(-height+(0.5*width))+(0.80901699437*(0.2*width))}',
+             'parametric_path': ('M{(0.5*width)},{-height+(0.5*width)} L{(0.5*width)+(-0.58778525229*(0.2*width))},{(-height+(0.5*width))+(0.80901699437*(0.2*width))}', ['M', ',', ' L', ',', ''], ['(0.5*width)', '-height+(0.5*width)', '(0.5*width)+(-0.58778525229*(0.2*width))', '(-height+(0.5*width))+(0.80901699437*(0.2*width))'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width', 'height'), _rna_stop_site_33_9_values, _rna_stop_site_33_9_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _rna_stop_site_33_box_x_values, None), 'y': ('{-height}', ['', ''], ['-height'], [None], [0], ('height',), _rna_stop_site_33_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _rna_stop_site_33_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _rna_stop_site_33_box_height_values, None)},
+    },
+    'Recombination Site': {
+        'defaults': {'height': 15.0, 'width': 10.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _recombination_site_34_0_values, _recombination_site_34_0_path)},
+            {'class': 'filled-path', 'id': 'recombination-site', 'style': {'facecolor': (0.9019607843137255, 0.9019607843137255, 0.9019607843137255), 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{-0.5*height} L{width},{0} {0},{0.5*height} Z',
+             'parametric_path': ('M{0},{-0.5*height} L{width},{0} {0},{0.5*height} Z', ['M', ',', ' L', ',', ' ', ',', ' Z'], ['0', '-0.5*height', 'width', '0', '0', '0.5*height'], ['M', None, None, 'L', None, None, None, None, 'Z'], [1, 2, 4, 5, 6, 7], ('height', 'width'), _recombination_site_34_1_values, _recombination_site_34_1_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _recombination_site_34_box_x_values, None), 'y': ('{-0.5*height}', ['', ''], ['-0.5*height'], [None], [0], ('height',), _recombination_site_34_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _recombination_site_34_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _recombination_site_34_box_height_values, None)},
+    },
+    'RibosomeEntrySite': {
+        'defaults': {'width': 15.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _ribosomeentrysite_35_0_values, _ribosomeentrysite_35_0_path)},
+            {'class': 'filled-path', 'id': 'rbs', 'style': {'facecolor': (0.9019607843137255, 0.9019607843137255, 0.9019607843137255), 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} C{0},{-0.666666666666667*width} {width},{-0.666666666666667*width} {width},{0} L{0},{0}Z',
+             'parametric_path': ('M{0},{0} C{0},{-0.666666666666667*width} {width},{-0.666666666666667*width} {width},{0} L{0},{0}Z', ['M', ',', ' C', ',', ' ', ',', ' ', ',', ' L', ',', 'Z'], ['0', '0', '0', '-0.666666666666667*width', 'width', '-0.666666666666667*width', 'width', '0', '0', '0'], ['M', None, None, 'C', None, None, None, None, None, None, 'L', None, None, 'Z'], [1, 2, 4, 5, 6, 7, 8, 9, 11, 12], ('width',), _ribosomeentrysite_35_1_values, _ribosomeentrysite_35_1_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _ribosomeentrysite_35_box_x_values, None), 'y': ('{-0.5*width}', ['', ''], ['-0.5*width'], [None], [0], ('width',), _ribosomeentrysite_35_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _ribosomeentrysite_35_box_width_values, None), 'height': ('{0.5*width}', ['', ''], ['0.5*width'], [None], [0], ('width',), _ribosomeentrysite_35_box_height_values, None)},
+    },
+    'Signature': {
+        'defaults': {'height': 10.0, 'width': 20.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _signature_36_0_values, _signature_36_0_path)},
+            {'class': 'filled-path', 'id': 'signature-box-path', 'style': {'facecolor': (0.9019607843137255, 0.9019607843137255, 0.9019607843137255), 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{-height} L{width},{-height} L{width},{0} {0},{0} Z',
+             'parametric_path': ('M{0},{-height} L{width},{-height} L{width},{0} {0},{0} Z', ['M', ',', ' L', ',', ' L', ',', ' ', ',', ' Z'], ['0', '-height', 'width', '-height', 'width', '0', '0', '0'], ['M', None, None, 'L', None, None, 'L', None, None, None, None, 'Z'], [1, 2, 4, 5, 7, 8, 9, 10], ('height', 'width'), _signature_36_1_values, _signature_36_1_path)},
+            {'class': 'unfilled-path', 'id': 'signature-cross-path1', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0.3*height},{-0.7*height} L{0.7*height},{-0.3*height}',
+             'parametric_path': ('M{0.3*height},{-0.7*height} L{0.7*height},{-0.3*height}', ['M', ',', ' L', ',', ''], ['0.3*height', '-0.7*height', '0.7*height', '-0.3*height'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('height',), _signature_36_2_values, _signature_36_2_path)},
+            {'class': 'unfilled-path', 'id': 'signature-cross-path2', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0.3*height},{-0.3*height} L{0.7*height},{-0.7*height}',
+             'parametric_path': ('M{0.3*height},{-0.3*height} L{0.7*height},{-0.7*height}', ['M', ',', ' L', ',', ''], ['0.3*height', '-0.3*height', '0.7*height', '-0.7*height'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('height',), _signature_36_3_values, _signature_36_3_path)},
+            {'class': 'unfilled-path', 'id': 'signature-line-path', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{height},{-0.3*height} L{-0.3*height + width},{-0.3*height}',
+             'parametric_path': ('M{height},{-0.3*height} L{-0.3*height + width},{-0.3*height}', ['M', ',', ' L', ',', ''], ['height', '-0.3*height', '-0.3*height + width', '-0.3*height'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('height', 'width'), _signature_36_4_values, _signature_36_4_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _signature_36_box_x_values, None), 'y': ('{-height}', ['', ''], ['-height'], [None], [0], ('height',), _signature_36_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _signature_36_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _signature_36_box_height_values, None)},
+    },
+    'Simple Chemical (Circle)': {
+        'defaults': {'width': 5.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _simple_chemical_circle_37_0_values, _simple_chemical_circle_37_0_path)},
+            {'class': 'filled-path', 'id': 'chemical', 'style': {'facecolor': (0.9019607843137255, 0.9019607843137255, 0.9019607843137255), 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M0,0 Q0,{width/2.0} {width/2.0},{width/2.0} Q{width},{width/2.0} {width},0 Q{width},{-width/2.0} {width/2.0},{-width/2.0} Q0,{-width/2.0} 0,0 Z',
+             'parametric_path': ('M0,0 Q0,{width/2.0} {width/2.0},{width/2.0} Q{width},{width/2.0} {width},0 Q{width},{-width/2.0} {width/2.0},{-width/2.0} Q0,{-width/2.0} 0,0 Z', ['M0,0 Q0,', ' ', ',', ' Q', ',', ' ', ',0 Q', ',', ' ', ',', ' Q0,', ' 0,0 Z'], ['width/2.0', 'width/2.0', 'width/2.0', 'width', 'width/2.0', 'width', 'width', '-width/2.0', 'width/2.0', '-width/2.0', '-width/2.0'], ['M', 0.0, 0.0, 'Q', 0.0, None, None, None, 'Q', None, None, None, 0.0, 'Q', None, None, None, None, 'Q', 0.0, None, 0.0, 0.0, 'Z'], [5, 6, 7, 9, 10, 11, 14, 15, 16, 17, 20], ('width',), _simple_chemical_circle_37_1_values, _simple_chemical_circle_37_1_path)},
+        ],
+        'bounding_box': {'x': ('0', ['0'], [], [0.0], [], (), _simple_chemical_circle_37_box_x_values, None), 'y': ('{-width/2},0', ['', ',0'], ['-width/2'], [None, 0.0], [0], ('width',), _simple_chemical_circle_37_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _simple_chemical_circle_37_box_width_values, None), 'height': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _simple_chemical_circle_37_box_height_values, None)},
+    },
+    'Single-Stranded Nucleic Acid': {
+        'defaults': {'width': 18.0, 'height': 5.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{0},{0}',
+             'parametric_path': ('M{0},{0} L{0},{0}', ['M', ',', ' L', ',', ''], ['0', '0', '0', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], (), _single_stranded_nucleic_acid_38_0_values, _single_stranded_nucleic_acid_38_0_path)},
+            {'class': 'unfilled-path', 'id': 'ssNA', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M0,0 C{(width/3.0)*0.15},{height/2.0} {(width/3.0)*0.35},{height/2.0} {(width/3.0)/2.0},0 S{(width/3.0)*0.85},{-height/2.0} {(width/3.0)},0            C{(width/3.0)+(width/3.0)*0.15},{height/2.0} {(width/3.0)+(width/3.0)*0.35},{height/2.0} {(width/3.0)+(width/3.0)/2.0},0 S{(width/3.0)+(width/3.0)*0.85},{-height/2.0} {(width/3.0)+(width/3.0)},0            C{2*(width/3.0)+(width/3.0)*0.15},{height/2.0} {2*(width/3.0)+(width/3.0)*0.35},{height/2.0} {2*(width/3.0)+(width/3.0)/2.0},0 S{2*(width/3.0)+(width/3.0)*0.85},{-height/2.0} {2*(width/3.0)+(width/3.0)},0',
+             'parametric_path': ('M0,0 C{(width/3.0)*0.15},{height/2.0} {(width/3.0)*0.35},{height/2.0} {(width/3.0)/2.0},0 S{(width/3.0)*0.85},{-height/2.0} {(width/3.0)},0            C{(width/3.0)+(width/3.0)*0.15},{height/2.0} {(width/3.0)+(width/3.0)*0.35},{height/2.0} {(width/3.0)+(width/3.0)/2.0},0 S{(width/3.0)+(width/3.0)*0.85},{-height/2.0} {(width/3.0)+(width/3.0)},0            C{2*(width/3.0)+(width/3.0)*0.15},{height/2.0} {2*(width/3.0)+(width/3.0)*0.35},{height/2.0} {2*(width/3.0)+(width/3.0)/2.0},0 S{2*(width/3.0)+(width/3.0)*0.85},{-height/2.0} {2*(width/3.0)+(width/3.0)},0', ['M0,0 C', ',', ' ', ',', ' ', ',0 S', ',', ' ', ',0            C', ',', ' ', ',', ' ', ',0 S', ',', ' ', ',0            C', ',', ' ', ',', ' ', ',0 S', ',', ' ', ',0'], ['(width/3.0)*0.15', 'height/2.0', '(width/3.0)*0.35', 'height/2.0', '(width/3.0)/2.0', '(width/3.0)*0.85', '-height/2.0', '(width/3.0)', '(width/3.0)+(width/3.0)*0.15', 'height/2.0', '(width/3.0)+(width/3.0)*0.35', 'height/2.0', '(width/3.0)+(width/3.0)/2.0', '(width/3.0)+(width/3.0)*0.85', '-height/2.0', '(width/3.0)+(width/3.0)', '2*(width/3.0)+(width/3.0)*0.15', 'height/2.0', '2*(width/3.0)+(width/3.0)*0.35', 'height/2.0', '2*(width/3.0)+(width/3.0)/2.0', '2*(width/3.0)+(width/3.0)*0.85', '-height/2.0', '2*(width/3.0)+(width/3.0)'], ['M', 0.0, 0.0, 'C', None, None, None, None, None, 0.0, 'S', None, None, None, 0.0, 'C', None, None, None, None, None, 0.0, 'S', None, None, None, 0.0, 'C', None, None, None, None, None, 0.0, 'S', None, None, None, 0.0], [4, 5, 6, 7, 8, 11, 12, 13, 16, 17, 18, 19, 20, 23, 24, 25, 28, 29, 30, 31, 32, 35, 36, 37], ('width', 'height'), _single_stranded_nucleic_acid_38_1_values, _single_stranded_nucleic_acid_38_1_path)},
+        ],
+        'bounding_box': {'x': ('0', ['0'], [], [0.0], [], (), _single_stranded_nucleic_acid_38_box_x_values, None), 'y': ('{-height/2},0', ['', ',0'], ['-height/2'], [None, 0.0], [0], ('height',), _single_stranded_nucleic_acid_38_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _single_stranded_nucleic_acid_38_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _single_stranded_nucleic_acid_38_box_height_values, None)},
+    },
+    'InertDNASpacer': {
+        'defaults': {'width': 10.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _inertdnaspacer_39_0_values, _inertdnaspacer_39_0_path)},
+            {'class': 'filled-path', 'id': 'spacer-circle-path', 'style': {'facecolor': (0.9019607843137255, 0.9019607843137255, 0.9019607843137255), 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M0,0  C0,{-(width/1.5)} {width},{-(width/1.5)} {width},0  C{width},{(width/1.5)} 0,{(width/1.5)} 0,0 Z',
+             'parametric_path': ('M0,0  C0,{-(width/1.5)} {width},{-(width/1.5)} {width},0  C{width},{(width/1.5)} 0,{(width/1.5)} 0,0 Z', ['M0,0  C0,', ' ', ',', ' ', ',0  C', ',', ' 0,', ' 0,0 Z'], ['-(width/1.5)', 'width', '-(width/1.5)', 'width', 'width', '(width/1.5)', '(width/1.5)'], ['M', 0.0, 0.0, 'C', 0.0, None, None, None, None, 0.0, 'C', None, None, 0.0, None, 0.0, 0.0, 'Z'], [5, 6, 7, 8, 11, 12, 14], ('width',), _inertdnaspacer_39_1_values, _inertdnaspacer_39_1_path)},
+            {'class': 'unfilled-path', 'id': 'spacer-cross1-path', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{((width*0.5)-((width*0.5)*-0.6669380616522619))},{-((width*0.5)*0.7451131604793488)} L{(width*0.5)+((width*0.5)*-0.6669380616522619)},{((width*0.5)*0.7451131604793488)}',
+             'parametric_path': ('M{((width*0.5)-((width*0.5)*-0.6669380616522619))},{-((width*0.5)*0.7451131604793488)} L{(width*0.5)+((width*0.5)*-0.6669380616522619)},{((width*0.5)*0.7451131604793488)}', ['M', ',', ' L', ',', ''], ['((width*0.5)-((width*0.5)*-0.6669380616522619))', '-((width*0.5)*0.7451131604793488)', '(width*0.5)+((width*0.5)*-0.6669380616522619)', '((width*0.5)*0.7451131604793488)'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _inertdnaspacer_39_2_values, _inertdnaspacer_39_2_path)},
+            {'class': 'unfilled-path', 'id': 'spacer-cross2-path', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{((width*0.5)-((width*0.5)*-0.6669380616522619))},{((width*0.5)*0.7451131604793488)} L{(width*0.5)+((width*0.5)*-0.6669380616522619)},{-((width*0.5)*0.7451131604793488)}',
+             'parametric_path': ('M{((width*0.5)-((width*0.5)*-0.6669380616522619))},{((width*0.5)*0.7451131604793488)} L{(width*0.5)+((width*0.5)*-0.6669380616522619)},{-((width*0.5)*0.7451131604793488)}', ['M', ',', ' L', ',', ''], ['((width*0.5)-((width*0.5)*-0.6669380616522619))', '((width*0.5)*0.7451131604793488)', '(width*0.5)+((width*0.5)*-0.6669380616522619)', '-((width*0.5)*0.7451131604793488)'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _inertdnaspacer_39_3_values, _inertdnaspacer_39_3_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _inertdnaspacer_39_box_x_values, None), 'y': ('{-width/2}', ['', ''], ['-width/2'], [None], [0], ('width',), _inertdnaspacer_39_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _inertdnaspacer_39_box_width_values, None), 'height': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _inertdnaspacer_39_box_height_values, None)},
+    },
+    "3' Sticky Restriction Site": {
+        'defaults': {'height': 8.0, 'width': 15.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _3_sticky_restriction_site_40_0_values, _3_sticky_restriction_site_40_0_path)},
+            {'class': 'filled-background-path', 'id': 'sticky-restriction-site-background', 'style': {'facecolor': (1.0, 1.0, 1.0), 'edgecolor': 'none'}, 'd': 'M{0},{-0.5*height} L{width},{-0.5*height} L{width},{0.5*height} L{0},{0.5*height} Z',
+             'parametric_path': ('M{0},{-0.5*height} L{width},{-0.5*height} L{width},{0.5*height} L{0},{0.5*height} Z', ['M', ',', ' L', ',', ' L', ',', ' L', ',', ' Z'], ['0', '-0.5*height', 'width', '-0.5*height', 'width', '0.5*height', '0', '0.5*height'], ['M', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'Z'], [1, 2, 4, 5, 7, 8, 10, 11], ('height', 'width'), _3_sticky_restriction_site_40_1_values, _3_sticky_restriction_site_40_1_path)},
+            {'class': 'unfilled-path', 'id': 'sticky-restriction-site-path', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0.15*width},{0.5*height} L{0.15*width},{0} L{0.85*width},{0} L{0.85*width},{-0.5*height}',
+             'parametric_path': ('M{0.15*width},{0.5*height} L{0.15*width},{0} L{0.85*width},{0} L{0.85*width},{-0.5*height}', ['M', ',', ' L', ',', ' L', ',', ' L', ',', ''], ['0.15*width', '0.5*height', '0.15*width', '0', '0.85*width', '0', '0.85*width', '-0.5*height'], ['M', None, None, 'L', None, None, 'L', None, None, 'L', None, None], [1, 2, 4, 5, 7, 8, 10, 11], ('width', 'height'), _3_sticky_restriction_site_40_2_values, _3_sticky_restriction_site_40_2_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _3_sticky_restriction_site_40_box_x_values, None), 'y': ('{-0.5*height}', ['', ''], ['-0.5*height'], [None], [0], ('height',), _3_sticky_restriction_site_40_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _3_sticky_restriction_site_40_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _3_sticky_restriction_site_40_box_height_values, None)},
+    },
+    "5' Sticky Restriction Site": {
+        'defaults': {'height': 8.0, 'width': 15.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _5_sticky_restriction_site_41_0_values, _5_sticky_restriction_site_41_0_path)},
+            {'class': 'filled-background-path', 'id': 'sticky-restriction-site-background', 'style': {'facecolor': (1.0, 1.0, 1.0), 'edgecolor': 'none'}, 'd': 'M{0},{-0.5*height} L{width},{-0.5*height} L{width},{0.5*height} L{0},{0.5*height} Z',
+             'parametric_path': ('M{0},{-0.5*height} L{width},{-0.5*height} L{width},{0.5*height} L{0},{0.5*height} Z', ['M', ',', ' L', ',', ' L', ',', ' L', ',', ' Z'], ['0', '-0.5*height', 'width', '-0.5*height', 'width', '0.5*height', '0', '0.5*height'], ['M', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'Z'], [1, 2, 4, 5, 7, 8, 10, 11], ('height', 'width'), _5_sticky_restriction_site_41_1_values, _5_sticky_restriction_site_41_1_path)},
+            {'class': 'unfilled-path', 'id': 'sticky-restriction-site-path', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0.15*width},{-0.5*height} L{0.15*width},{0} L{0.85*width},{0} L{0.85*width},{0.5*height}',
+             'parametric_path': ('M{0.15*width},{-0.5*height} L{0.15*width},{0} L{0.85*width},{0} L{0.85*width},{0.5*height}', ['M', ',', ' L', ',', ' L', ',', ' L', ',', ''], ['0.15*width', '-0.5*height', '0.15*width', '0', '0.85*width', '0', '0.85*width', '0.5*height'], ['M', None, None, 'L', None, None, 'L', None, None, 'L', None, None], [1, 2, 4, 5, 7, 8, 10, 11], ('width', 'height'), _5_sticky_restriction_site_41_2_values, _5_sticky_restriction_site_41_2_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _5_sticky_restriction_site_41_box_x_values, None), 'y': ('{-0.5*height}', ['', ''], ['-0.5*height'], [None], [0], ('height',), _5_sticky_restriction_site_41_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _5_sticky_restriction_site_41_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _5_sticky_restriction_site_41_box_height_values, None)},
+    },
+    'Terminator': {
+        'defaults': {'height': 10.0, 'width': 8.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _terminator_42_0_values, _terminator_42_0_path)},
+            {'class': 'unfilled-path', 'id': 'terminator-body', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0.5*width},{0} L{0.5*width},{-height}',
+             'parametric_path': ('M{0.5*width},{0} L{0.5*width},{-height}', ['M', ',', ' L', ',', ''], ['0.5*width', '0', '0.5*width', '-height'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width', 'height'), _terminator_42_1_values, _terminator_42_1_path)},
+            {'class': 'unfilled-path', 'id': 'terminator-head', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{-height} L{width},{-height}',
+             'parametric_path': ('M{0},{-height} L{width},{-height}', ['M', ',', ' L', ',', ''], ['0', '-height', 'width', '-height'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('height', 'width'), _terminator_42_2_values, _terminator_42_2_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _terminator_42_box_x_values, None), 'y': ('{-height}', ['', ''], ['-height'], [None], [0], ('height',), _terminator_42_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _terminator_42_box_width_values, None), 'height': ('{height}', ['', ''], ['height'], [None], [0], ('height',), _terminator_42_box_height_values, None)},
+    },
+    'Unspecified': {
+        'defaults': {'width': 15.0, 'baseline_y': 0.0, 'baseline_x': 0.0},
+        'paths': [
+            {'class': 'baseline', 'id': 'baseline', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{width},{0}',
+             'parametric_path': ('M{0},{0} L{width},{0}', ['M', ',', ' L', ',', ''], ['0', '0', 'width', '0'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _unspecified_43_0_values, _unspecified_43_0_path)},
+            {'class': 'filled-path', 'id': 'unspecified-boundry', 'style': {'facecolor': (0.9019607843137255, 0.9019607843137255, 0.9019607843137255), 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0},{0} L{0.5*width},{-0.5*width} L{width},{0} L{0.5*width},{0.5*width} Z',
+             'parametric_path': ('M{0},{0} L{0.5*width},{-0.5*width} L{width},{0} L{0.5*width},{0.5*width} Z', ['M', ',', ' L', ',', ' L', ',', ' L', ',', ' Z'], ['0', '0', '0.5*width', '-0.5*width', 'width', '0', '0.5*width', '0.5*width'], ['M', None, None, 'L', None, None, 'L', None, None, 'L', None, None, 'Z'], [1, 2, 4, 5, 7, 8, 10, 11], ('width',), _unspecified_43_1_values, _unspecified_43_1_path)},
+            {'class': 'unfilled-path', 'id': 'unspecified-question-mark', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0.35*width},{-0.06*width} C{0.35*width},{-0.23*width} {0.75*width},{-0.23*width} {0.65*width},{0.01*width} C{0.65*width},{0.05*width} {0.5*width},{0.01*width} {0.5*width},{0.15*width}',
+             'parametric_path': ('M{0.35*width},{-0.06*width} C{0.35*width},{-0.23*width} {0.75*width},{-0.23*width} {0.65*width},{0.01*width} C{0.65*width},{0.05*width} {0.5*width},{0.01*width} {0.5*width},{0.15*width}', ['M', ',', ' C', ',', ' ', ',', ' ', ',', ' C', ',', ' ', ',', ' ', ',', ''], ['0.35*width', '-0.06*width', '0.35*width', '-0.23*width', '0.75*width', '-0.23*width', '0.65*width', '0.01*width', '0.65*width', '0.05*width', '0.5*width', '0.01*width', '0.5*width', '0.15*width'], ['M', None, None, 'C', None, None, None, None, None, None, 'C', None, None, None, None, None, None], [1, 2, 4, 5, 6, 7, 8, 9, 11, 12, 13, 14, 15, 16], ('width',), _unspecified_43_2_values, _unspecified_43_2_path)},
+            {'class': 'unfilled-path', 'id': 'unspecified-question-mark-point', 'style': {'facecolor': 'none', 'edgecolor': 'black', 'linewidth': 1.0}, 'd': 'M{0.5*width},{0.27*width} L{0.5*width},{0.27*width}',
+             'parametric_path': ('M{0.5*width},{0.27*width} L{0.5*width},{0.27*width}', ['M', ',', ' L', ',', ''], ['0.5*width', '0.27*width', '0.5*width', '0.27*width'], ['M', None, None, 'L', None, None], [1, 2, 4, 5], ('width',), _unspecified_43_3_values, _unspecified_43_3_path)},
+        ],
+        'bounding_box': {'x': ('{0}', ['', ''], ['0'], [None], [0], (), _unspecified_43_box_x_values, None), 'y': ('{-0.5*width}', ['', ''], ['-0.5*width'], [None], [0], ('width',), _unspecified_43_box_y_values, None), 'width': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _unspecified_43_box_width_values, None), 'height': ('{width}', ['', ''], ['width'], [None], [0], ('width',), _unspecified_43_box_height_values, None)},
+    },
+}
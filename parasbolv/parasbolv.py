@@ -10,19 +10,31 @@ and provides a number of helper functions to handle part lists and interactions.
 
 
 import warnings
+import ast
+import builtins
 import os
 import sys
 import glob
 import math
+import hashlib
+import marshal
+import pickle
+import tempfile
+import time
+import heapq
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import xml.etree.ElementTree as ET
 import re
+import numbers
+from collections import OrderedDict
+from functools import lru_cache
+from collections.abc import MutableMapping
 from math import cos, sin, pi, sqrt
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-import matplotlib.font_manager as font_manager
+# pyplot, patches, collections and font_manager are imported where they are
+# used, so that importing parasbolv and computing geometry stays cheap
 from matplotlib.path import Path
-from parasbolv.svgpath2mpl import parse_path
+from parasbolv.svgpath2mpl import parse_path, parse_tokens, parse_token_arrays, FLOAT_RE
 
 
 __author__  = 'Thomas E. Gorochowski <tom@chofski.co.uk>, \
@@ -30,13 +42,556 @@ __author__  = 'Thomas E. Gorochowski <tom@chofski.co.uk>, \
 __license__ = 'MIT'
 __version__ = '0.1'
 
+# Bump whenever the structure of the processed glyph library changes
+GLYPH_CACHE_VERSION = 8
+
+# Tokens of parametric path data: an expression, a command or a number
+TEMPLATE_TOKEN_RE = re.compile(r"{([^{}]+)}|([MmZzLlHhVvCcSsQqTtAa])|(" + FLOAT_RE.pattern + ")")
+
+# User parameters that are accepted by every glyph but do not affect its paths
+NON_GEOMETRY_PARAMETERS = ('label_parameters', 'orientation', 'vertical_offset',
+                           'trailing_gap_skew', 'path_zorders')
+
+# Common types of scalar parameter values that ParametricPath.to_path can
+# compare with its previous values without further checks
+MEMO_SCALAR_TYPES = frozenset((int, float, bool, str, np.float64, np.float32, np.int64, np.int32))
+
+# Data units per inch of the figures sized by render_part_list, used to
+# convert label extents measured in points into data units
+DATA_UNITS_PER_INCH = 60.0
+
+# Matplotlib settings that fonts and text extents depend on, including the
+# font lists that generic family names such as sans-serif resolve through
+FONT_RCPARAMS = ('font.family', 'font.style', 'font.variant', 'font.weight',
+                 'font.stretch', 'font.size', 'font.serif', 'font.sans-serif',
+                 'font.cursive', 'font.fantasy', 'font.monospace', 'text.usetex')
+
+# Number of distinct label fonts and of distinct label texts, fonts and
+# rotations whose FontProperties and measured extents are kept
+FONT_CACHE_SIZE = 64
+TEXT_EXTENT_CACHE_SIZE = 4096
+# Stat data of the packaged SVG files when the compiled glyphs were last
+# checked against them, and whether they matched
+_COMPILED_GLYPHS_CHECK = []
+
+# The dpi and font settings, figure and renderer text extents are measured with
+_TEXT_MEASUREMENT = []
+
+
+class ParametricPath:
+    """Parametric SVG path data with its {...} expressions compiled once
+       at load time, so drawing never re-parses or re-compiles them.
+
+       Attributes
+       ----------
+       text: str
+           Original parametric path data.
+       literals: list
+           Text found between the expressions.
+       expressions: list
+           Source of each expression.
+       template: list
+           Command letters and numbers of the path in order, with
+           None in each slot filled by an expression. None if the
+           path data cannot be tokenized ahead of evaluation.
+       slot_positions: list
+           Index in template of the slot for each expression.
+       parameters: tuple
+           Names the expressions depend on. This includes builtins
+           they use, such as max, which a glyph parameter of the
+           same name replaces.
+       last_evaluation: tuple
+           The values of `parameters` and the Path of the most recent
+           `to_path` call, reused until one of those values changes.
+           Only calls whose values are all scalars are remembered.
+           Equal parametric paths, which share their text, each keep
+           their own.
+       evaluator: function
+           Generated function returning the value of each expression
+           for a dictionary of parameters, used instead of `code`.
+           None unless loaded from compiled glyphs.
+       path_function: function
+           Generated function returning the vertex and code arrays
+           of the path for a dictionary of parameters. None unless
+           loaded from compiled glyphs.
+    """
+
+
+    def __init__(self, text):
+        """
+        Parameters
+        ----------
+        text: str
+            Parametric path data, e.g. 'M{0},{0} L{width},{0}'.
+        """
+        self.text = text
+        parts = re.split(r"{([^{}]+)}", text)
+        self.literals = parts[0::2]
+        self.expressions = parts[1::2]
+        self.code = self.__compile_expressions(self.expressions)
+        self.template, self.slot_positions = self.__build_template(text, len(self.expressions))
+        self.parameters = self.__find_parameters(self.expressions)
+        self.last_evaluation = None
+        self.evaluator = None
+        self.path_function = None
+
+
+    @classmethod
+    def from_compiled(cls, text, literals, expressions, template, slot_positions,
+                      parameters, evaluator, path_function):
+        """Creates a parametric path from the output of the glyph
+        compiler (scripts/compile_glyphs.py) without tokenizing or
+        compiling its expressions.
+
+        NOTE: See the class attributes for parameter descriptions.
+        """
+        parametric_path = cls.__new__(cls)
+        parametric_path.text = text
+        parametric_path.literals = literals
+        parametric_path.expressions = expressions
+        parametric_path.code = None
+        parametric_path.template = template
+        parametric_path.slot_positions = slot_positions
+        parametric_path.parameters = parameters
+        parametric_path.last_evaluation = None
+        parametric_path.evaluator = evaluator
+        parametric_path.path_function = path_function
+        return parametric_path
+
+
+    @staticmethod
+    def __find_parameters(expressions):
+        """Returns the names of the parameters referenced by the
+        expressions, in order of first use.
+
+        Parameters
+        ----------
+        expressions: list
+            Source of each expression.
+        """
+        parameters = []
+        for expression in expressions:
+            for node in ast.walk(ast.parse(expression.strip(), mode='eval')):
+                if isinstance(node, ast.Name) and node.id not in parameters:
+                    parameters.append(node.id)
+        return tuple(parameters)
+
+
+    @staticmethod
+    def __compile_expressions(expressions):
+        """Compiles all expressions into a single code object that
+        evaluates to a tuple holding the value of each expression.
+
+        Parameters
+        ----------
+        expressions: list
+            Source of each expression.
+        """
+        source = '(' + ''.join('(' + e + '),' for e in expressions) + ')'
+        return compile(source, '<parametric>', 'eval')
+
+
+    @staticmethod
+    def __build_template(text, expression_count):
+        """Tokenizes the path data once, leaving a slot for the value
+        of each expression.
+
+        Returns (None, None) if an expression directly touches a
+        number or another expression, as their text would then merge
+        after substitution.
+
+        Parameters
+        ----------
+        text: str
+            Parametric path data.
+        expression_count: int
+            Number of expressions in the path data.
+        """
+        template = []
+        slot_positions = []
+        last_end = None
+        last_kind = None
+        for match in TEMPLATE_TOKEN_RE.finditer(text):
+            expression, command, number = match.groups()
+            if expression is not None:
+                kind = 'expression'
+            elif command is not None:
+                kind = 'command'
+            else:
+                kind = 'number'
+            if (match.start() == last_end and
+                kind != 'command' and
+                last_kind != 'command' and
+                'expression' in (kind, last_kind)):
+                return None, None
+            if kind == 'expression':
+                slot_positions.append(len(template))
+                template.append(None)
+            elif kind == 'command':
+                template.append(command)
+            else:
+                template.append(float(number))
+            last_end = match.end()
+            last_kind = kind
+        if len(slot_positions) != expression_count:
+            return None, None
+        return template, slot_positions
+
+
+    def evaluate(self, parameters):
+        """Returns a tuple of the values of each expression.
+
+        Parameters
+        ----------
+        parameters: dict
+            Parameter values the expressions are evaluated with.
+        """
+        if self.evaluator is None:
+            return eval(self.code, parameters)
+        try:
+            return self.evaluator(parameters)
+        except KeyError as e:
+            # Match the error raised when evaluating the source
+            raise NameError(f"""name {e.args[0]!r} is not defined""") from None
+
+
+    def svg_text(self, parameters):
+        """Returns the SVG path data with every expression replaced
+        by its value.
+
+        Parameters
+        ----------
+        parameters: dict
+            Parameter values the expressions are evaluated with.
+        """
+        values = self.evaluate(parameters)
+        text = [self.literals[0]]
+        for value, literal in zip(values, self.literals[1:]):
+            text.append(str(value))
+            text.append(literal)
+        return ''.join(text)
+
+
+    def to_path(self, parameters):
+        """Returns the evaluated path as a Matplotlib Path object,
+        filling the template directly rather than formatting and
+        re-parsing SVG text.
+
+        The path is only re-evaluated if a parameter it depends on
+        has changed since the previous call. Calls given arrays of
+        values are always evaluated.
+
+        Parameters
+        ----------
+        parameters: dict
+            Parameter values the expressions are evaluated with.
+        """
+        try:
+            values = tuple([parameters[name] for name in self.parameters])
+        except KeyError:
+            values = self.__parameter_values(parameters)
+        if values is not None:
+            for value in values:
+                if (type(value) not in MEMO_SCALAR_TYPES and
+                    not isinstance(value, (numbers.Number, str)) and not callable(value)):
+                    # Arrays cannot be compared with the previous values
+                    values = None
+                    break
+        last_evaluation = self.last_evaluation
+        if (values is not None and
+            last_evaluation is not None and
+            last_evaluation[0] == values):
+            return last_evaluation[1]
+        if self.path_function is not None:
+            try:
+                vertices, codes = self.path_function(parameters)
+            except KeyError as e:
+                raise NameError(f"""name {e.args[0]!r} is not defined""") from None
+            path = Path(vertices, codes, readonly=True)
+        elif self.template is None:
+            path = parse_path(self.svg_text(parameters))
+        else:
+            tokens = self.template.copy()
+            for position, value in zip(self.slot_positions, self.evaluate(parameters)):
+                tokens[position] = value
+            path = parse_tokens(tokens)
+        if values is not None:
+            self.last_evaluation = (values, path)
+        return path
+
+
+    def __parameter_values(self, parameters):
+        """Returns the values of `parameters`, taking builtins that are
+        not given from the builtins module, or None if a name that is
+        not a builtin is missing.
+
+        Parameters
+        ----------
+        parameters: dict
+            Parameter values the expressions are evaluated with.
+        """
+        values = []
+        for name in self.parameters:
+            if name in parameters:
+                values.append(parameters[name])
+            elif hasattr(builtins, name):
+                values.append(getattr(builtins, name))
+            else:
+                # Let the evaluation report the missing parameter
+                return None
+        return tuple(values)
+
+
+    def to_vertex_arrays(self, parameters, count):
+        """Returns the path evaluated for many sets of parameters at
+        once as a (count, V, 2) array of vertices and the codes
+        shared by every set. Paths with arcs, or path data that cannot
+        be tokenized ahead, are evaluated for each set in turn.
+
+        Parameters
+        ----------
+        parameters: dict
+            Parameter values the expressions are evaluated with, each
+            either an array holding a value per set or a single value.
+        count: int
+            Number of parameter sets.
+        """
+        if self.template is not None and 'A' not in self.template and 'a' not in self.template:
+            tokens = self.template.copy()
+            for position, value in zip(self.slot_positions, self.evaluate(parameters)):
+                tokens[position] = value
+            return parse_token_arrays(tokens, count)
+        # Arcs and path data that cannot be tokenized ahead are evaluated per set
+        paths = []
+        for index in range(count):
+            set_parameters = {}
+            for name, value in parameters.items():
+                set_parameters[name] = value[index] if np.ndim(value) == 1 else value
+            paths.append(self.to_path(set_parameters))
+        codes = paths[0].codes
+        for path in paths[1:]:
+            if not np.array_equal(path.codes, codes):
+                raise ValueError(f"""Path '{self.text}' changes shape between parameter sets.""")
+        return np.stack([path.vertices for path in paths]), codes
+
+
+    def __eq__(self, other):
+        return isinstance(other, ParametricPath) and self.text == other.text
+
+
+    def __hash__(self):
+        return hash(self.text)
+
+
+    def __getstate__(self):
+        # Code objects cannot be pickled, so store them marshalled
+        state = self.__dict__.copy()
+        if self.code is None and self.evaluator is not None:
+            # Generated functions cannot be pickled by value, compile the source instead
+            state['code'] = self.__compile_expressions(self.expressions)
+            state['evaluator'] = state['path_function'] = None
+        state['code'] = marshal.dumps(state['code'])
+        state['last_evaluation'] = None
+        return state
+
+
+    def __setstate__(self, state):
+        state['code'] = marshal.loads(state['code'])
+        self.__dict__.update(state)
+
+
+class LazyGlyphLibrary(MutableMapping):
+    """Glyph library that defers parsing a glyph's SVG file until the
+       glyph is first accessed. Once parsed, the glyph is kept.
+
+       Attributes
+       ----------
+       glyph_files: dict
+           Maps each glyph type to the SVG file it is loaded from.
+    """
+
+
+    def __init__(self, glyph_files, loader):
+        """
+        Parameters
+        ----------
+        glyph_files: dict
+            Maps each glyph type to the SVG file defining it.
+        loader: function
+            Called with a filename, returns the tuple
+            (glyph_type, glyph_terms, glyph_data).
+        """
+        self.glyph_files = glyph_files
+        self.loader = loader
+        self.loaded_glyphs = {}
+
+
+    def is_loaded(self, glyph_type):
+        """Returns true if the glyph has already been parsed.
+
+        Parameters
+        ----------
+        glyph_type: str
+            Type of glyph.
+        """
+        return glyph_type in self.loaded_glyphs
+
+
+    def __getitem__(self, glyph_type):
+        if glyph_type not in self.loaded_glyphs:
+            filename = self.glyph_files[glyph_type]
+            self.loaded_glyphs[glyph_type] = self.loader(filename)[2]
+        return self.loaded_glyphs[glyph_type]
+
+
+    def __setitem__(self, glyph_type, glyph_data):
+        self.loaded_glyphs[glyph_type] = glyph_data
+        self.glyph_files.setdefault(glyph_type, None)
+
+
+    def __delitem__(self, glyph_type):
+        del self.glyph_files[glyph_type]
+        self.loaded_glyphs.pop(glyph_type, None)
+
+
+    def __iter__(self):
+        return iter(self.glyph_files)
+
+
+    def __len__(self):
+        return len(self.glyph_files)
+
+
+class GeometryCache:
+    """Size-bounded least recently used cache of evaluated, untransformed
+       glyph geometry, keyed on the glyph type and its merged parameters.
+
+       Attributes
+       ----------
+       maxsize: int
+           Maximum number of entries held before the least recently
+           used entry is evicted.
+       hits: int
+           Number of lookups that found an entry.
+       misses: int
+           Number of lookups that did not find an entry.
+       evictions: int
+           Number of entries evicted to respect maxsize.
+    """
+
+
+    def __init__(self, maxsize=1024):
+        """
+        Parameters
+        ----------
+        maxsize: int, optional
+            Maximum number of entries held.
+        """
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+    @staticmethod
+    def key(glyph_type, parameters):
+        """Returns the canonical cache key of a glyph's merged parameters,
+        or None if the parameters cannot be hashed.
+
+        Parameters
+        ----------
+        glyph_type: str
+            Type of glyph.
+        parameters: dict
+            Merged parameters of the glyph.
+        """
+        key = (glyph_type,
+               tuple(sorted((name, value) for name, value in parameters.items()
+                            if name not in NON_GEOMETRY_PARAMETERS)))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+
+    def get(self, key):
+        """Returns the entry for a key, or None if it is not cached.
+
+        Parameters
+        ----------
+        key: tuple
+            Key returned by `key`.
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+
+    def put(self, key, entry):
+        """Stores an entry, evicting the least recently used entries
+        if the cache is full.
+
+        Parameters
+        ----------
+        key: tuple
+            Key returned by `key`.
+        entry: tuple
+            Geometry to cache.
+        """
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+
+    def invalidate(self, glyph_type=None):
+        """Removes the entries of a glyph type, or all entries.
+
+        Parameters
+        ----------
+        glyph_type: str, optional
+            Type of glyph whose entries are removed. If None,
+            the cache is emptied.
+        """
+        if glyph_type is None:
+            self.entries.clear()
+            return
+        for key in [key for key in self.entries if key[0] == glyph_type]:
+            del self.entries[key]
+
+
+    def stats(self):
+        """Returns a dictionary of the hits, misses, evictions,
+        current size and maximum size of the cache.
+        """
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self.entries),
+                'maxsize': self.maxsize}
+
 
 class GlyphRenderer:
     """ Class to load and render using matplotlib parametric SVG glyphs.
     """
 
 
-    def __init__(self, glyph_path=None):
+    def __init__(self,
+                 glyph_path=None,
+                 use_cache=False,
+                 cache_dir=None,
+                 lazy=False,
+                 geometry_cache_size=0,
+                 use_compiled=True,
+                 workers=None,
+                 processes=False):
         """
         Parameters
         ----------
@@ -44,15 +599,66 @@ class GlyphRenderer:
             File path at which the glyph SVG files are stored,
             relative to the directory in which parasbolv.py is
             contained.
+        use_cache: bool, optional
+            If true, the processed glyph library is stored on disk
+            and reused by later renderers for as long as the glyph
+            files remain unchanged.
+        cache_dir: str, optional
+            Directory in which the glyph cache is stored. Defaults
+            to the PARASBOLV_CACHE_DIR environment variable, or
+            ~/.cache/parasbolv if that is unset.
+        lazy: bool, optional
+            If true, only the root attributes of each glyph file
+            are read on construction. The paths and styles of a
+            glyph are parsed the first time it is used. Ignored
+            when use_cache is true, as the cache already holds
+            every fully processed glyph.
+        geometry_cache_size: int, optional
+            If greater than zero, the evaluated paths of up to this
+            many (glyph type, parameters) combinations are kept in
+            the `geometry_cache` so that redrawing them only needs
+            the paths to be transformed into place.
+        use_compiled: bool, optional
+            If true, the packaged glyphs are loaded from the module
+            generated by scripts/compile_glyphs.py, without parsing
+            any XML, as long as it matches the SVG files. Only used
+            when no glyph_path is given and neither use_cache nor
+            lazy is set.
+        workers: int, optional
+            If greater than one, glyph files are parsed concurrently
+            by this many workers. Useful for large glyph directories.
+        processes: bool, optional
+            If true, the workers are processes rather than threads.
         """
+        self.geometry_cache = None
+        self.glyph_load_times = {}
+        self.glyph_file_records = {}
+        self.glyph_path = glyph_path
+        if glyph_path is None:
+            self.glyph_path = self.package_glyph_path()
+        self.lazy = lazy
+        self.workers = workers
+        self.processes = processes
+        if geometry_cache_size > 0:
+            self.geometry_cache = GeometryCache(geometry_cache_size)
         self.svg2mpl_style_map = {}
         self.svg2mpl_style_map['fill'] = 'facecolor'
         self.svg2mpl_style_map['stroke'] = 'edgecolor'
         self.svg2mpl_style_map['stroke-width'] = 'linewidth'
-        if glyph_path is None:
-            self.glyphs_library, self.glyph_term_map = self.load_package_glyphs()
+        compiled_glyphs = None
+        if use_compiled and glyph_path is None and not use_cache and not lazy:
+            compiled_glyphs = self.load_compiled_glyphs()
+        if compiled_glyphs is not None:
+            self.glyphs_library, self.glyph_term_map = compiled_glyphs
+        elif use_cache:
+            if glyph_path is None:
+                glyph_path = self.package_glyph_path()
+            self.glyphs_library, self.glyph_term_map = self.load_glyphs_from_cache(glyph_path,
+                                                                                   cache_dir=cache_dir)
+        elif glyph_path is None:
+            self.glyphs_library, self.glyph_term_map = self.load_package_glyphs(lazy=lazy)
         else:
-            self.glyphs_library, self.glyph_term_map = self.load_glyphs_from_path(glyph_path)
+            self.glyphs_library, self.glyph_term_map = self.load_glyphs_from_path(glyph_path, lazy=lazy)
 
 
     @staticmethod
@@ -95,7 +701,7 @@ class GlyphRenderer:
         return converted_val
 
 
-    def get_glyph_parameters(self, glyph_type=None, default_values=False):
+    def get_glyph_parameters(self, glyph_type=None, default_values=False, dependencies=False):
         """Returns the possible glyph parameters of a glyph.
         If no glyph is specified, returns the possible parameters
         for all glyphs.
@@ -109,8 +715,16 @@ class GlyphRenderer:
         default_values: bool
             If true, also returns default values for
             glyph parameters.
+        dependencies: bool
+            If true, instead returns a dictionary mapping
+            the ID of each path of the glyph to the
+            parameters its geometry depends on.
         """
         library = self.glyphs_library
+        if dependencies:
+            if glyph_type:
+                return self.__path_dependencies(self.__lookup_glyph(glyph_type))
+            return {key: self.__path_dependencies(library[key]) for key in library.keys()}
         if glyph_type:
             try:
                 default_dictionary = library[glyph_type]['defaults']
@@ -143,6 +757,29 @@ class GlyphRenderer:
                 return all_default_dictionaries
 
 
+    @staticmethod
+    def __path_dependencies(glyph):
+        """Maps the ID of each path of a glyph to the parameters its
+        geometry depends on. Builtins the paths use count only if the
+        glyph declares a parameter of the same name.
+
+        Parameters
+        ----------
+        glyph: dict
+            Glyph data from the glyphs library.
+        """
+        dependencies = {}
+        for path in glyph['paths']:
+            path_parameters = dependencies.setdefault(path['id'], [])
+            for name in path['parametric_path'].parameters:
+                if name in path_parameters:
+                    continue
+                if hasattr(builtins, name) and name not in glyph['defaults']:
+                    continue
+                path_parameters.append(name)
+        return dependencies
+
+
     def __process_style (self, style_text):
         """Converts style text into a dictionary.
 
@@ -180,6 +817,7 @@ class GlyphRenderer:
         tag_details['defaults'] = None
         tag_details['style'] = {}
         tag_details['d'] = None
+        tag_details['parametric_path'] = None
         # Pull out the relevant details
         for key in tag_attributes.keys():
             if key == 'glyphtype':
@@ -194,6 +832,7 @@ class GlyphRenderer:
                 tag_details['style'] = self.__process_style(tag_attributes[key])
             if 'parametric' in key and key.endswith('}d'):
                 tag_details['d'] = tag_attributes[key]
+                tag_details['parametric_path'] = ParametricPath(tag_attributes[key])
             if 'parametric' in key and key.endswith('}defaults'):
                 split_defaults_text = tag_attributes[key].split(';')
                 defaults = {}
@@ -207,57 +846,57 @@ class GlyphRenderer:
 
 
     @staticmethod
-    def __eval_svg_data(svg_text, parameters):
-        """Extracts and then replaces equation with evaluated version using regular expression.
-
-        See: https://stackoverflow.com/questions/38734335/python-regex-replace-bracketed-text-with-contents-of-brackets
+    def glyph_transform(baseline_y, position, orientation, rotation):
+        """Builds the 3x3 affine matrix that flips paths about the baseline
+        into matplotlib default orientation, rotates them and moves them
+        to their position.
 
         Parameters
         ----------
-        svg_text: str
-            SVG text containing unsubstituted values.
-        parameters: dict
-            Contains parameter values to be substituted
-            into `svg_text` for evaluation.
-        """
-        return re.sub(r"{([^{}]+)}", lambda m: str(eval(m.group()[1:-1], parameters)), svg_text)
-
-
-    @staticmethod
-    def __flip_position_rotate_glyph(path, baseline_y, position, orientation, rotation):
-        """Flips paths into matplotlib default orientation and position, and rotates paths.
-
-        Parameters
-        ----------
-        path: Matplotlib Path object - https://matplotlib.org/stable/api/path_api.html
-            Path to be transformed.
         baseline_y: float
             y value of the baseline.
         position: tuple
             Path position, format (x,y).
         orientation: 'forward' or 'reverse'
-            Orietnation of the part.
+            Orientation of the part.
         rotation: float
             Rotation value in radians.
         """
-        # Flip paths into matplotlib default orientation and position and rotate paths
         if orientation == 'reverse':
             rotation += math.radians(180)
-        new_verts = []
-        new_codes = []
-        for v_idx in range(np.size(path.vertices, 0)):
-            cur_vert = path.vertices[v_idx]
-            new_codes.append(path.codes[v_idx])
-            # Assign x and flipped y of origin in accordance with matplotlib default orientation
-            org_x = cur_vert[0]
-            org_flipped_y = baseline_y-(cur_vert[1]-baseline_y)
-            # Rotate using trig functions
-            rot_x = org_x * np.cos(rotation) - org_flipped_y * np.sin(rotation)
-            rot_y = org_x * np.sin(rotation) + org_flipped_y * np.cos(rotation)
-            final_x = rot_x+position[0]
-            final_y = rot_y+position[1]
-            new_verts.append([final_x, final_y])
-        return Path(new_verts, new_codes)
+        cos_r = cos(rotation)
+        sin_r = sin(rotation)
+        # Flip y about baseline_y, then rotate, then translate
+        return np.array([[cos_r,  sin_r, position[0] - 2*baseline_y*sin_r],
+                         [sin_r, -cos_r, position[1] + 2*baseline_y*cos_r],
+                         [0.0,    0.0,   1.0]])
+
+
+    @staticmethod
+    def transform_paths(paths, transform):
+        """Applies an affine transform to the vertices of all paths at once.
+
+        Parameters
+        ----------
+        paths: list
+            Matplotlib Path objects to be transformed.
+        transform: numpy.ndarray
+            3x3 affine matrix, see `glyph_transform`.
+        """
+        linear = transform[:2, :2].T
+        offset = transform[:2, 2]
+        if len(paths) == 1:
+            return [Path(paths[0].vertices @ linear + offset, paths[0].codes)]
+        if len(paths) == 0:
+            return []
+        vertices = np.concatenate([p.vertices for p in paths]) @ linear + offset
+        transformed_paths = []
+        start = 0
+        for p in paths:
+            end = start + len(p.vertices)
+            transformed_paths.append(Path(vertices[start:end], p.codes))
+            start = end
+        return transformed_paths
 
 
     @staticmethod
@@ -314,36 +953,382 @@ class GlyphRenderer:
         glyph_data = {}
         glyph_data['paths'] = []
         glyph_data['defaults'] = root_attributes['defaults']
+        glyph_data['bounding_box'] = None
         for child in root:
             # Cycle through and find all paths
             if child.tag.endswith('path'):
                 glyph_data['paths'].append(self.__extract_tag_details(child.attrib))
+            elif child.tag.endswith('rect') and child.attrib.get('class') == 'bounding-box':
+                glyph_data['bounding_box'] = self.__extract_bounding_box(child.attrib)
         return glyph_type, glyph_terms, glyph_data
 
 
-    def load_package_glyphs(self):
-        """Finds the directory with packaged glyphs and loads them.
+    @staticmethod
+    def __extract_bounding_box(tag_attributes):
+        """Extracts the parametric x, y, width and height of a bounding-box rect.
+
+        Parameters
+        ----------
+        tag_attributes: dict
+            Dictionary derived from XML structure
+            containing SVG parameters.
+        """
+        bounding_box = {}
+        for key in tag_attributes.keys():
+            if 'parametric' in key:
+                attribute = key.split('}')[-1]
+                if attribute in ['x', 'y', 'width', 'height']:
+                    bounding_box[attribute] = ParametricPath(tag_attributes[key])
+        if len(bounding_box) != 4:
+            return None
+        return bounding_box
+
+
+    @staticmethod
+    def package_glyph_path():
+        """Returns the directory holding the packaged glyphs.
         """
         d = os.path.dirname(sys.modules[__name__].__file__)
-        path = os.path.join(d, 'glyphs')
-        return self.load_glyphs_from_path(path)
+        return os.path.join(d, 'glyphs')
+
+
+    def load_glyph_header(self, filename):
+        """Loads only the glyph type and terms from an SVG file, without
+        parsing any of the paths it contains.
+
+        Parameters
+        ----------
+        filename: str
+            Absolute file path of SVG file.
+        """
+        parser = ET.XMLPullParser(events=('start',))
+        with open(filename, 'rb') as f:
+            chunk = f.read(512)
+            while chunk:
+                # Stop reading as soon as the root <svg> element is complete
+                parser.feed(chunk)
+                for _, root in parser.read_events():
+                    root_attributes = self.__extract_tag_details(root.attrib)
+                    return root_attributes['glyphtype'], root_attributes['terms']
+                chunk = f.read(512)
+        return None, []
+
+
+    def load_package_glyphs(self, lazy=False):
+        """Finds the directory with packaged glyphs and loads them.
+
+        Parameters
+        ----------
+        lazy: bool, optional
+            If true, return a LazyGlyphLibrary.
+        """
+        return self.load_glyphs_from_path(self.package_glyph_path(), lazy=lazy)
+
+
+    @staticmethod
+    def glyph_sources(path):
+        """Returns the SHA-1 digest of each SVG file in a directory,
+        keyed by file name.
+
+        Parameters
+        ----------
+        path: str
+            Absolute file path of directory containing glyphs.
+        """
+        sources = {}
+        for infile in sorted(glob.glob(os.path.join(path, '*.svg'))):
+            with open(infile, 'rb') as f:
+                sources[os.path.basename(infile)] = hashlib.sha1(f.read()).hexdigest()
+        return sources
+
+
+    @classmethod
+    def __compiled_glyphs_current(cls, compiled_glyphs):
+        """Returns whether the compiled glyphs match the packaged SVG
+        files. The files are only hashed, and a warning raised if they
+        do not match, when their modification times or sizes differ
+        from the previous check in this process.
+
+        Parameters
+        ----------
+        compiled_glyphs: module
+            The parasbolv.compiled_glyphs module.
+        """
+        glyph_path = cls.package_glyph_path()
+        signature = []
+        for infile in sorted(glob.glob(os.path.join(glyph_path, '*.svg'))):
+            stat = os.stat(infile)
+            signature.append((os.path.basename(infile), stat.st_mtime_ns, stat.st_size))
+        if _COMPILED_GLYPHS_CHECK and _COMPILED_GLYPHS_CHECK[0] == signature:
+            return _COMPILED_GLYPHS_CHECK[1]
+        current = compiled_glyphs.SOURCES == cls.glyph_sources(glyph_path)
+        if not current:
+            warnings.warn("""Compiled glyphs are out of date, loading the SVG files instead. """
+                          """Run scripts/compile_glyphs.py to update them.""")
+        _COMPILED_GLYPHS_CHECK[:] = [signature, current]
+        return current
+
+
+    def load_compiled_glyphs(self):
+        """Loads the packaged glyphs from the parasbolv.compiled_glyphs
+        module generated by scripts/compile_glyphs.py. Returns None if
+        the module is missing or was compiled from other SVG files.
+        """
+        try:
+            from parasbolv import compiled_glyphs
+        except ImportError:
+            return None
+        if not self.__compiled_glyphs_current(compiled_glyphs):
+            return None
+        glyphs_library = {}
+        for glyph_type, compiled_glyph in compiled_glyphs.GLYPHS.items():
+            glyph_data = {}
+            glyph_data['paths'] = []
+            glyph_data['defaults'] = compiled_glyph['defaults'].copy()
+            glyph_data['bounding_box'] = None
+            for compiled_path in compiled_glyph['paths']:
+                path = {'glyphtype': None, 'terms': [], 'defaults': None}
+                path['class'] = compiled_path['class']
+                path['id'] = compiled_path['id']
+                path['style'] = compiled_path['style'].copy()
+                path['d'] = compiled_path['d']
+                path['parametric_path'] = None
+                if compiled_path['parametric_path'] is not None:
+                    path['parametric_path'] = ParametricPath.from_compiled(*compiled_path['parametric_path'])
+                glyph_data['paths'].append(path)
+            if compiled_glyph['bounding_box'] is not None:
+                glyph_data['bounding_box'] = {key: ParametricPath.from_compiled(*value)
+                                              for key, value in compiled_glyph['bounding_box'].items()}
+            glyphs_library[glyph_type] = glyph_data
+        self.glyph_file_records = {}
+        for name, (glyph_type, glyph_terms) in compiled_glyphs.FILES.items():
+            # Modification times are unknown, so the first refresh compares digests
+            self.glyph_file_records[os.path.join(self.package_glyph_path(), name)] = {
+                'mtime': None, 'size': None, 'digest': compiled_glyphs.SOURCES[name],
+                'glyph_type': glyph_type, 'terms': list(glyph_terms)}
+        return glyphs_library, compiled_glyphs.GLYPH_TERM_MAP.copy()
 
 
-    def load_glyphs_from_path(self, path):
+    def load_glyphs_from_path(self, path, lazy=False):
         """Loads glyph information from SVG files in a directory.
 
+        Files are processed in order of file name, so when several
+        glyphs share a type or term the first file wins, however
+        many workers are used. This keeps the main packaged drawings,
+        such as RNALocation.svg, ahead of their *Alternate.svg files. The time taken to load each file is
+        stored in `glyph_load_times`.
+
         Parameters
         ----------
         path: str
             Absolute file path of directory containing glyphs.
+        lazy: bool, optional
+            If true, return a LazyGlyphLibrary that parses each
+            glyph on first access.
         """
         glyphs_library = {}
+        glyph_files = {}
         glyph_term_map = {}
-        for infile in glob.glob( os.path.join(path, '*.svg') ):
-            glyph_type, glyph_terms, glyph_data = self.load_glyph(infile)
-            glyphs_library[glyph_type] = glyph_data
+        infiles = sorted(glob.glob( os.path.join(path, '*.svg') ))
+        self.glyph_load_times = {}
+        self.glyph_file_records = {}
+        results = self.__load_files(infiles, lazy)
+        for infile, result in zip(infiles, results):
+            glyph_type, glyph_terms = result[0], result[1]
             for term in glyph_terms:
-                glyph_term_map[term] = glyph_type
+                glyph_term_map.setdefault(term, glyph_type)
+            if glyph_type in glyph_files:
+                continue
+            glyph_files[glyph_type] = infile
+            if not lazy:
+                glyphs_library[glyph_type] = result[2]
+        if lazy:
+            glyphs_library = LazyGlyphLibrary(glyph_files, self.load_glyph)
+        return glyphs_library, glyph_term_map
+
+
+    def __load_files(self, infiles, lazy):
+        """Loads glyph files, using the configured workers, recording
+        the load time and file record of each. Returns the results of
+        load_glyph (or load_glyph_header if lazy) in the same order.
+
+        Parameters
+        ----------
+        infiles: list
+            Absolute file paths of SVG files.
+        lazy: bool
+            If true, only the glyph type and terms are loaded.
+        """
+        loader = self.load_glyph_header if lazy else self.load_glyph
+        if self.workers is not None and self.workers > 1 and len(infiles) > 1:
+            pool = ProcessPoolExecutor if self.processes else ThreadPoolExecutor
+            with pool(max_workers=self.workers) as executor:
+                results = list(executor.map(_timed_load, [loader] * len(infiles), infiles))
+        else:
+            results = [_timed_load(loader, infile) for infile in infiles]
+        for infile, (result, load_time) in zip(infiles, results):
+            self.glyph_load_times[infile] = load_time
+            file_stat = os.stat(infile)
+            digest = None
+            if not lazy:
+                with open(infile, 'rb') as f:
+                    digest = hashlib.sha1(f.read()).hexdigest()
+            self.glyph_file_records[infile] = {'mtime': file_stat.st_mtime_ns,
+                                               'size': file_stat.st_size,
+                                               'digest': digest,
+                                               'glyph_type': result[0],
+                                               'terms': list(result[1])}
+        return [result for result, _ in results]
+
+
+    def refresh(self):
+        """Reloads the glyphs whose SVG files have been added, edited
+        or deleted since they were loaded, leaving the others as they
+        are. A file is only re-parsed if its modification time or size
+        changed and its contents no longer match the digest recorded
+        when it was loaded. Geometry cached for the affected glyph
+        types is invalidated.
+
+        Returns a dict listing the glyph types that were 'updated'
+        and those that were 'removed'.
+        """
+        infiles = sorted(glob.glob( os.path.join(self.glyph_path, '*.svg') ))
+        records = self.glyph_file_records
+        affected = set()
+        for infile in set(records) - set(infiles):
+            affected.add(records.pop(infile)['glyph_type'])
+        changed = []
+        for infile in infiles:
+            record = records.get(infile)
+            if record is None:
+                changed.append(infile)
+                continue
+            file_stat = os.stat(infile)
+            if record['mtime'] == file_stat.st_mtime_ns and record['size'] == file_stat.st_size:
+                continue
+            digest = None
+            if record['digest'] is not None:
+                with open(infile, 'rb') as f:
+                    digest = hashlib.sha1(f.read()).hexdigest()
+            if digest is not None and digest == record['digest']:
+                # Touched but unchanged
+                record['mtime'] = file_stat.st_mtime_ns
+                record['size'] = file_stat.st_size
+                continue
+            affected.add(record['glyph_type'])
+            changed.append(infile)
+        results = dict(zip(changed, self.__load_files(changed, self.lazy)))
+        affected.update(records[infile]['glyph_type'] for infile in changed)
+        library = self.glyphs_library
+        updated = []
+        removed = []
+        for glyph_type in sorted(affected, key=str):
+            glyph_infiles = [infile for infile in infiles if records[infile]['glyph_type'] == glyph_type]
+            if self.geometry_cache is not None:
+                self.geometry_cache.invalidate(glyph_type)
+            if not glyph_infiles:
+                if glyph_type in library:
+                    del library[glyph_type]
+                    removed.append(glyph_type)
+                continue
+            # As when loading, the first file by name wins
+            infile = glyph_infiles[0]
+            if isinstance(library, LazyGlyphLibrary):
+                library.glyph_files[glyph_type] = infile
+                library.loaded_glyphs.pop(glyph_type, None)
+            elif infile in results:
+                library[glyph_type] = results[infile][2]
+            else:
+                library[glyph_type] = self.__load_files([infile], False)[0][2]
+            updated.append(glyph_type)
+        # Rebuild the term map in place so references to it stay valid
+        self.glyph_term_map.clear()
+        for infile in infiles:
+            for term in records[infile]['terms']:
+                self.glyph_term_map.setdefault(term, records[infile]['glyph_type'])
+        return {'updated': updated, 'removed': removed}
+
+
+    @staticmethod
+    def glyph_cache_key(path):
+        """Builds the key identifying a directory of glyphs in the cache.
+
+        The key changes whenever a glyph file is added, removed,
+        touched or edited, so a stale cache is never reused.
+
+        Parameters
+        ----------
+        path: str
+            Absolute file path of directory containing glyphs.
+        """
+        file_keys = []
+        for infile in sorted(glob.glob( os.path.join(path, '*.svg') )):
+            with open(infile, 'rb') as f:
+                digest = hashlib.sha1(f.read()).hexdigest()
+            file_keys.append((os.path.basename(infile),
+                              os.stat(infile).st_mtime_ns,
+                              digest))
+        return (GLYPH_CACHE_VERSION,
+                __version__,
+                sys.version_info[:2],
+                os.path.abspath(path),
+                tuple(file_keys))
+
+
+    @staticmethod
+    def glyph_cache_file(path, cache_dir=None):
+        """Returns the cache file used for a directory of glyphs.
+
+        Parameters
+        ----------
+        path: str
+            Absolute file path of directory containing glyphs.
+        cache_dir: str, optional
+            Directory in which cache files are stored.
+        """
+        if cache_dir is None:
+            cache_dir = os.environ.get('PARASBOLV_CACHE_DIR',
+                                       os.path.join(os.path.expanduser('~'), '.cache', 'parasbolv'))
+        path_digest = hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()
+        return os.path.join(cache_dir, 'glyphs-' + path_digest + '.pickle')
+
+
+    def load_glyphs_from_cache(self, path, cache_dir=None):
+        """Loads glyph information from the on-disk cache, falling back
+        to parsing the SVG files (and refreshing the cache) when the
+        cache is missing or out of date.
+
+        Parameters
+        ----------
+        path: str
+            Absolute file path of directory containing glyphs.
+        cache_dir: str, optional
+            Directory in which cache files are stored.
+        """
+        key = self.glyph_cache_key(path)
+        cache_file = self.glyph_cache_file(path, cache_dir=cache_dir)
+        try:
+            with open(cache_file, 'rb') as f:
+                cached_key, glyphs_library, glyph_term_map, glyph_file_records = pickle.load(f)
+            if cached_key == key:
+                self.glyph_file_records = glyph_file_records
+                return glyphs_library, glyph_term_map
+        except (OSError, EOFError, ValueError, TypeError, AttributeError, ImportError,
+                pickle.UnpicklingError):
+            # Missing or unreadable cache, or one naming classes that have
+            # since been moved or removed, rebuild it below
+            pass
+        glyphs_library, glyph_term_map = self.load_glyphs_from_path(path)
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            # Write to a temporary file first so readers never see a partial cache
+            fd, tmp_file = tempfile.mkstemp(dir=os.path.dirname(cache_file), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((key, glyphs_library, glyph_term_map, self.glyph_file_records), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            warnings.warn(f"""Unable to write glyph cache '{cache_file}': {e}""")
         return glyphs_library, glyph_term_map
 
 
@@ -354,7 +1339,8 @@ class GlyphRenderer:
                    orientation='forward',
                    rotation=0.0,
                    user_parameters=None,
-                   user_style=None):
+                   user_style=None,
+                   batch=None):
         """Draws a glyph to Matploblib Axes.
 
         Parameters
@@ -371,18 +1357,184 @@ class GlyphRenderer:
             Dictionary containing sizing/label parameters of glyph.
         user_style: dict, optional
             Dictionary containing style parameters of glyph.
+        batch: GlyphBatch, optional
+            If given, the glyph's paths are added to the batch
+            instead of being drawn as individual patches.
         """
-        try:
-        # Check glyph type exists
-            glyph = self.glyphs_library[glyph_type]
-        except:
-            class Invalid_glyph_type(Exception):
-                pass
-            raise Invalid_glyph_type(f"""'{glyph_type}' is not a valid glyph.""")
+        glyph = self.__lookup_glyph(glyph_type)
         # Collate parameters
         merged_parameters, label_parameters = collate_user_params(self,
                                                                   glyph_type,
                                                                   user_parameters)
+        styles = self.__glyph_styles(glyph, glyph_type, user_style)
+        zorders = self.__glyph_zorders(glyph, user_parameters)
+        paths, baseline_path = self.__glyph_geometry(glyph_type, glyph, merged_parameters)
+        return self.__place_glyph(ax, glyph, paths, baseline_path, styles, zorders,
+                                  position, orientation, rotation,
+                                  merged_parameters['width'], label_parameters, batch)
+
+
+    def draw_glyph_instances(self,
+                             ax,
+                             glyph_type,
+                             positions,
+                             orientations='forward',
+                             rotations=0.0,
+                             params_array=None,
+                             user_style=None,
+                             batch=None):
+        """Draws many glyphs of the same type to Matplotlib Axes. The
+        geometry of each distinct set of parameters is evaluated once
+        and then placed at every position it is used, giving the same
+        result as calling `draw_glyph` for each glyph.
+
+        Parameters
+        ----------
+        ax: Axes object
+            https://matplotlib.org/stable/api/axes_api.html
+        glyph_type: str
+            Name of the glyphs being drawn.
+        positions: list
+            Positions to draw to, each of format (x,y).
+        orientations: str or list, optional
+            Orientation of all glyphs, or a list with the
+            orientation of each glyph.
+        rotations: float or list, optional
+            Rotation of all glyphs in radians, or a list with
+            the rotation of each glyph.
+        params_array: dict or list, optional
+            Sizing/label parameters of all glyphs, or a list with
+            the parameters (or None) of each glyph.
+        user_style: dict, optional
+            Dictionary containing style parameters of all glyphs.
+        batch: GlyphBatch, optional
+            If given, the glyphs' paths are added to the batch
+            instead of being drawn as individual patches.
+
+        Returns
+        -------
+        list
+            The (bounds, baseline end) of each glyph, as returned
+            by `draw_glyph`.
+        """
+        glyph = self.__lookup_glyph(glyph_type)
+        count = len(positions)
+        if isinstance(orientations, str):
+            orientations = [orientations] * count
+        if np.ndim(rotations) == 0:
+            rotations = [rotations] * count
+        if params_array is None or isinstance(params_array, dict):
+            params_array = [params_array] * count
+        if not len(orientations) == len(rotations) == len(params_array) == count:
+            raise ValueError('Each glyph instance requires a position, orientation, rotation and parameters.')
+        styles = self.__glyph_styles(glyph, glyph_type, user_style)
+        prototypes = {}
+        instances = []
+        for position, orientation, rotation, user_parameters in zip(positions,
+                                                                    orientations,
+                                                                    rotations,
+                                                                    params_array):
+            # Merge every instance's parameters, so that invalid ones are
+            # warned about once per glyph as with draw_glyph
+            merged_parameters = collate_user_params(self, glyph_type, user_parameters)[0]
+            key = self.__prototype_key(user_parameters)
+            prototype = prototypes.get(key) if key is not None else None
+            if prototype is None:
+                prototype = ((merged_parameters['width'],)
+                             + self.__glyph_geometry(glyph_type, glyph, merged_parameters))
+                if key is not None:
+                    prototypes[key] = prototype
+            width, paths, baseline_path = prototype
+            label_parameters = None
+            if user_parameters is not None:
+                label_parameters = user_parameters.get('label_parameters')
+            instances.append(self.__place_glyph(ax, glyph, paths, baseline_path, styles,
+                                                self.__glyph_zorders(glyph, user_parameters),
+                                                position, orientation, rotation,
+                                                width, label_parameters, batch))
+        return instances
+
+
+    def evaluate_glyph_paths(self, glyph_type, parameter_arrays):
+        """Evaluates the untransformed paths of a glyph for many sets of
+        parameters at once, evaluating each parametric expression over
+        whole arrays of parameter values.
+
+        Parameters
+        ----------
+        glyph_type: str
+            Name of the glyph.
+        parameter_arrays: dict
+            Maps parameter names to an array holding the value of the
+            parameter in each set, or to a single value shared by every
+            set. Parameters not given take their default values.
+
+        Returns
+        -------
+        list
+            A dictionary for each path of the glyph, holding its 'id'
+            and 'class', its 'vertices' as an array of shape (N, V, 2)
+            for N parameter sets and the 'codes' shared by every set.
+        """
+        glyph = self.__lookup_glyph(glyph_type)
+        parameters = glyph['defaults'].copy()
+        lengths = set()
+        for name, values in parameter_arrays.items():
+            if name not in glyph['defaults']:
+                warnings.warn(f"""Parameter '{name}' is not valid for '{glyph_type}'.""")
+            values = np.asarray(values, dtype=float)
+            if values.ndim > 1:
+                raise ValueError(f"""Values of parameter '{name}' must be a single value or a 1D array.""")
+            if values.ndim == 1:
+                lengths.add(len(values))
+            parameters[name] = values
+        if len(lengths) > 1:
+            raise ValueError('Parameter arrays must all have the same length.')
+        count = lengths.pop() if lengths else 1
+        evaluated_paths = []
+        for path in glyph['paths']:
+            vertices, codes = path['parametric_path'].to_vertex_arrays(dict(parameters), count)
+            evaluated_paths.append({'id': path['id'],
+                                    'class': path['class'],
+                                    'vertices': vertices,
+                                    'codes': codes})
+        return evaluated_paths
+
+
+    @staticmethod
+    def __prototype_key(user_parameters):
+        """Returns a hashable key of the parameters that affect a
+        glyph's geometry, or None if they cannot be hashed.
+
+        Parameters
+        ----------
+        user_parameters: dict
+            Dictionary containing sizing/label parameters of glyph.
+        """
+        if user_parameters is None:
+            return ()
+        key = tuple(sorted((name, value) for name, value in user_parameters.items()
+                           if name not in NON_GEOMETRY_PARAMETERS))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+
+    def __glyph_styles(self, glyph, glyph_type, user_style):
+        """Returns the merged style of each drawn path of a glyph,
+        warning about invalid path IDs and style parameters.
+
+        Parameters
+        ----------
+        glyph: dict
+            Glyph data from the glyphs library.
+        glyph_type: str
+            Name of the glyph.
+        user_style: dict
+            Dictionary containing style parameters of glyph.
+        """
         # Find invalid path ids
         if user_style is not None:
             path_ids = []
@@ -391,12 +1543,7 @@ class GlyphRenderer:
             for key in user_style.keys():
                 if key not in path_ids:
                     warnings.warn(f"""'{key}' is not a valid path ID for the '{glyph_type}' glyph.""")
-        paths_to_draw = []
-        path_zorders = None
-        if user_parameters is not None:
-            if 'path_zorders' in user_parameters:
-                path_zorders = user_parameters['path_zorders']
-        zorders_to_use = []
+        styles = []
         for path in glyph['paths']:
             if path['class'] not in ['baseline', 'bounding-box']:
                 merged_style = path['style']
@@ -413,52 +1560,181 @@ class GlyphRenderer:
                         if style_el not in path['style'].keys():
                             merged_style.pop(style_el)
                             warnings.warn(f"""Style parameter '{style_el}' is not valid for '{path["id"]}'.""")
-                svg_text = self.__eval_svg_data(path['d'], merged_parameters)
+                styles.append(merged_style)
+        return styles
+
+
+    @staticmethod
+    def __glyph_zorders(glyph, user_parameters):
+        """Returns the zorder (or None) of each drawn path of a glyph.
+
+        Parameters
+        ----------
+        glyph: dict
+            Glyph data from the glyphs library.
+        user_parameters: dict
+            Dictionary containing sizing/label parameters of glyph.
+        """
+        path_zorders = None
+        if user_parameters is not None:
+            if 'path_zorders' in user_parameters:
+                path_zorders = user_parameters['path_zorders']
+        zorders = []
+        for path in glyph['paths']:
+            if path['class'] not in ['baseline', 'bounding-box']:
                 # Handle user-inputted path zorders
-                if path_zorders is not None:
-                    if path['id'] in path_zorders:
-                        zorder = path_zorders[path['id']]
-                        zorders_to_use.append(zorder)
-                    else:
-                        zorders_to_use.append(None)
+                if path_zorders is not None and path['id'] in path_zorders:
+                    zorders.append(path_zorders[path['id']])
                 else:
-                    zorders_to_use.append(None)
-                # Call to svgpath2mpl
-                paths_to_draw.append([parse_path(svg_text), merged_style])
+                    zorders.append(None)
+        return zorders
+
+
+    def __glyph_geometry(self, glyph_type, glyph, parameters):
+        """Evaluates the untransformed drawn paths and baseline path
+        of a glyph, using the geometry cache if it is enabled.
+
+        Parameters
+        ----------
+        glyph_type: str
+            Type of glyph.
+        glyph: dict
+            Glyph data from the glyphs library.
+        parameters: dict
+            Merged parameters of the glyph.
+        """
+        key = None
+        if self.geometry_cache is not None:
+            key = self.geometry_cache.key(glyph_type, parameters)
+            if key is not None:
+                geometry = self.geometry_cache.get(key)
+                if geometry is not None:
+                    return geometry
+        geometry = self.__evaluate_glyph_geometry(glyph, parameters)
+        if key is not None:
+            self.geometry_cache.put(key, geometry)
+        return geometry
+
+
+    @staticmethod
+    def __evaluate_glyph_geometry(glyph, parameters):
+        """Evaluates the untransformed drawn paths and baseline path
+        of a glyph.
+
+        Parameters
+        ----------
+        glyph: dict
+            Glyph data from the glyphs library.
+        parameters: dict
+            Merged parameters of the glyph.
+        """
+        paths = []
+        baseline_path = None
+        for path in glyph['paths']:
+            if path['class'] not in ['baseline', 'bounding-box']:
+                paths.append(path['parametric_path'].to_path(parameters))
+            elif path['class'] == 'baseline' and baseline_path is None:
+                baseline_path = path['parametric_path'].to_path(parameters)
+        return paths, baseline_path
+
+
+    def __place_glyph(self,
+                      ax,
+                      glyph,
+                      paths,
+                      baseline_path,
+                      styles,
+                      zorders,
+                      position,
+                      orientation,
+                      rotation,
+                      width,
+                      label_parameters,
+                      batch):
+        """Transforms evaluated glyph paths into place and draws them,
+        returning the glyph's bounds and baseline end.
+
+        NOTE: See parameters of `draw_glyph` and the
+        returns of `__glyph_styles`, `__glyph_zorders`
+        and `__glyph_geometry`.
+        """
+        import matplotlib.patches as patches
         # Draw glyph to the axis with correct styling parameters
         baseline_y = glyph['defaults']['baseline_y']
+        position = adjust_position_for_orientation(position, orientation, width, rotation)
+        transform = self.glyph_transform(baseline_y, position, orientation, rotation)
+        y_flipped_paths = self.transform_paths(paths, transform)
         all_y_flipped_paths = []
-        position = adjust_position_for_orientation(position, orientation, merged_parameters['width'], rotation)
-        for path in paths_to_draw:
-            path_index = paths_to_draw.index(path)
-            y_flipped_path = self.__flip_position_rotate_glyph(path[0],
-                                                               baseline_y,
-                                                               position,
-                                                               orientation,
-                                                               rotation)
+        for path_index, y_flipped_path in enumerate(y_flipped_paths):
             all_y_flipped_paths.append([y_flipped_path])
-            patch = patches.PathPatch(y_flipped_path, **path[1], zorder=zorders_to_use[path_index])
+            if batch is not None:
+                batch.add(y_flipped_path,
+                          styles[path_index],
+                          zorder=zorders[path_index])
+                continue
+            patch = patches.PathPatch(y_flipped_path,
+                                      **styles[path_index],
+                                      zorder=zorders[path_index])
             if ax is not None:
                 ax.add_patch(patch)
-        if user_parameters is not None:
-            if label_parameters is not None:
-                # Draw label
-                processed_label_params = self.process_label_params(label_parameters,
-                                                                   all_y_flipped_paths)
-                ax.text(**processed_label_params,
-                        ha='center',
-                        va='center')
+        if label_parameters is not None:
+            # Draw label
+            processed_label_params = self.process_label_params(label_parameters,
+                                                               all_y_flipped_paths)
+            ax.text(**processed_label_params,
+                    ha='center',
+                    va='center')
+            leader_line = self.process_leader_line_params(label_parameters, processed_label_params)
+            if leader_line is not None:
+                from matplotlib.lines import Line2D
+                ax.add_line(Line2D(leader_line['xs'],
+                                   leader_line['ys'],
+                                   color=leader_line['color'],
+                                   linewidth=leader_line['linewidth']))
         glyph_bounds = self.__bounds_from_paths_to_draw(all_y_flipped_paths)
-        position = adjust_position_for_orientation(position, orientation, merged_parameters['width'], rotation)
+        position = adjust_position_for_orientation(position, orientation, width, rotation)
+        baseline_transform = self.glyph_transform(baseline_y, position, orientation, rotation)
         return (glyph_bounds,
-                self.get_baseline_end(glyph_type,
-                                      position,
-                                      orientation,
-                                      rotation=rotation,
-                                      user_parameters=user_parameters))
+                self.__baseline_end(baseline_path, baseline_transform))
+
+
+    @staticmethod
+    def __baseline_path(glyph, parameters):
+        """Returns the untransformed baseline path of a glyph, or None
+        if the glyph has no baseline.
+
+        Parameters
+        ----------
+        glyph: dict
+            Glyph data from the glyphs library.
+        parameters: dict
+            Merged parameters of the glyph.
+        """
+        for path in glyph['paths']:
+            if path['class'] == 'baseline':
+                return path['parametric_path'].to_path(parameters)
+        return None
 
 
-    def process_label_params(self, label_parameters, paths):
+    @staticmethod
+    def __baseline_end(baseline_path, transform):
+        """Returns the transformed end point of a glyph's baseline, or
+        None if the glyph has no baseline.
+
+        Parameters
+        ----------
+        baseline_path: Path
+            Untransformed baseline path, or None.
+        transform: numpy.ndarray
+            3x3 affine matrix, see `glyph_transform`.
+        """
+        if baseline_path is None:
+            return None
+        end = transform[:2, :2] @ baseline_path.vertices[1] + transform[:2, 2]
+        return (end[0], end[1])
+
+
+    def process_label_params(self, label_parameters, paths, centroid=None):
         """Formats and completes label parameters.
 
         Parameters
@@ -479,14 +1755,24 @@ class GlyphRenderer:
                     Dictionary containing Matplotlib
                     font properties key-value pairs:
                     https://matplotlib.org/stable/_modules/matplotlib/font_manager.html#FontProperties.
+                leader_line: dict
+                    Draws a line to the label, see
+                    `process_leader_line_params`.
         paths: list
             List of paths composing the
             to-be-labelled glyph.
+        centroid: tuple, optional
+            Centroid of the paths, format (x,y),
+            if already found by `label_centroids`.
+
+        NOTE: The returned fontproperties are shared
+        by every label with the same userfont and
+        should be copied before being modified.
         """
         color = (0,0,0)
         xy_skew = (0,0)
         rotation = 0.0
-        finalfont = font_manager.FontProperties()
+        userfont = None
         # Collate parameters (user parameters take priority)
         if 'color' in label_parameters:
             color = label_parameters['color']
@@ -496,13 +1782,13 @@ class GlyphRenderer:
             # Convert to degrees
             rotation = (180/pi) * label_parameters['rotation']
         if 'userfont' in label_parameters:
-            finalfont = font_manager.FontProperties(**label_parameters['userfont'])
-        all_path_vertices = []
-        for path in paths:
-            # Find vertices of each path
-            path_vertices = path[0].vertices.copy()
-            all_path_vertices.append(path_vertices)
-        textpos_x, textpos_y = self.calculate_centroid_of_paths(all_path_vertices, xy_skew=xy_skew)
+            userfont = label_parameters['userfont']
+        finalfont = _font_properties(userfont)
+        if centroid is None:
+            all_path_vertices = [path[0].vertices for path in paths]
+            textpos_x, textpos_y = self.calculate_centroid_of_paths(all_path_vertices, xy_skew=xy_skew)
+        else:
+            textpos_x, textpos_y = xy_skew[0] + centroid[0], xy_skew[1] + centroid[1]
         return {'x':textpos_x,
                 'y':textpos_y,
                 's':label_parameters['text'],
@@ -511,6 +1797,69 @@ class GlyphRenderer:
                 'rotation':rotation}
 
 
+    @staticmethod
+    def process_leader_line_params(label_parameters, text_parameters, bounds=None):
+        """Finds the line drawn to a label that has been moved away
+        from where it belongs, such as by `place_labels`.
+
+        Parameters
+        ----------
+        label_parameters: dict
+            Label parameters holding a leader_line
+            dict, which may contain:
+                xy_skew: tuple
+                    Skew of the start of the line from
+                    the centroid of the glyph, format
+                    (x,y). Defaults to (0,0).
+                color: tuple
+                    Line colour, format (r,g,b).
+                    Defaults to the label colour.
+                linewidth: float
+                    Width of the line. Defaults to 0.5.
+        text_parameters: dict
+            Result of `process_label_params`
+            for the label.
+        bounds: tuple, optional
+            Bounds of the label text, the line
+            ending at their edge. Measured if
+            not given.
+
+        Returns
+        -------
+        dict
+            The xs and ys of the line, its color and
+            linewidth, or None if there is no leader line
+            or it starts within the label.
+        """
+        leader_line = label_parameters.get('leader_line')
+        if leader_line is None:
+            return None
+        x, y = text_parameters['x'], text_parameters['y']
+        if bounds is None:
+            width, height = _text_extent(text_parameters['s'],
+                                         label_parameters.get('userfont'),
+                                         text_parameters['rotation'])
+            scale = DATA_UNITS_PER_INCH / (72 * 0.98)
+            half_width, half_height = width*scale/2, height*scale/2
+        else:
+            half_width, half_height = (bounds[1][0] - bounds[0][0])/2, (bounds[1][1] - bounds[0][1])/2
+        # Start of the line relative to the glyph centroid
+        xy_skew = label_parameters.get('xy_skew', (0,0))
+        leader_skew = leader_line.get('xy_skew', (0,0))
+        start_x = x - xy_skew[0] + leader_skew[0]
+        start_y = y - xy_skew[1] + leader_skew[1]
+        # End the line where it meets the edge of the label
+        dx, dy = start_x - x, start_y - y
+        if abs(dx) <= half_width and abs(dy) <= half_height:
+            return None
+        edge = min(half_width/abs(dx) if dx != 0 else float('inf'),
+                   half_height/abs(dy) if dy != 0 else float('inf'))
+        return {'xs': [start_x, x + dx*edge],
+                'ys': [start_y, y + dy*edge],
+                'color': leader_line.get('color', text_parameters['color']),
+                'linewidth': leader_line.get('linewidth', 0.5)}
+
+
     @staticmethod
     def calculate_centroid_of_paths(all_path_vertices, xy_skew=(0,0)):
         """Calculates central point of paths provided.
@@ -545,8 +1894,129 @@ class GlyphRenderer:
         return x, y
 
 
-    def get_glyph_bounds(self, glyph_type, position, rotation=0.0, user_parameters=None):
-        """Returns bounds of glyph.
+    def layout_labels(self, part_list, part_positions, rotation=0.0):
+        """Computes the text parameters and bounds of the labels of
+        all parts in one pass, without drawing anything. Centroids
+        are found for every labelled glyph at once and each distinct
+        text is measured once, in the data units of figures sized by
+        `render_part_list` (see DATA_UNITS_PER_INCH).
+
+        Parameters
+        ----------
+        part_list: list
+            Parts as given to `render_part_list`.
+        part_positions: list
+            Position each part is drawn at, see
+            `layout_part_list`.
+        rotation: float, optional
+            Rotation of the construct in radians.
+
+        Returns
+        -------
+        list
+            A dict for each labelled part holding its 'index'
+            in the part list, its 'label_parameters', the
+            'text_parameters' returned by `process_label_params`
+            and the 'bounds' of the text.
+        """
+        labelled = []
+        glyph_vertices = []
+        for index, (part, position) in enumerate(zip(part_list, part_positions)):
+            user_parameters = part[2]
+            if user_parameters is None or user_parameters.get('label_parameters') is None:
+                continue
+            glyph = self.__lookup_glyph(part[0])
+            merged_parameters = self.__merge_parameters(glyph, user_parameters)
+            paths = self.__glyph_geometry(part[0], glyph, merged_parameters)[0]
+            if len(paths) == 0:
+                # Nothing to centre the label on
+                continue
+            position = adjust_position_for_orientation(position, part[1], merged_parameters['width'], rotation)
+            transform = self.glyph_transform(glyph['defaults']['baseline_y'], position, part[1], rotation)
+            glyph_vertices.append([path.vertices @ transform[:2, :2].T + transform[:2, 2] for path in paths])
+            labelled.append((index, user_parameters['label_parameters']))
+        centroids = label_centroids(glyph_vertices)
+        # Data units per point, where the axes of render_part_list fill 98% of the figure
+        scale = DATA_UNITS_PER_INCH / (72 * 0.98)
+        labels = []
+        for (index, label_parameters), centroid in zip(labelled, centroids.tolist()):
+            text_parameters = self.process_label_params(label_parameters, None, centroid=centroid)
+            width, height = _text_extent(text_parameters['s'],
+                                         label_parameters.get('userfont'),
+                                         text_parameters['rotation'])
+            x, y = text_parameters['x'], text_parameters['y']
+            labels.append({'index': index,
+                           'label_parameters': label_parameters,
+                           'text_parameters': text_parameters,
+                           'bounds': ((x - width*scale/2, y - height*scale/2),
+                                      (x + width*scale/2, y + height*scale/2))})
+        return labels
+
+
+    def __lookup_glyph(self, glyph_type):
+        """Returns a glyph from the glyphs library, raising an exception
+        if the glyph type does not exist.
+
+        Parameters
+        ----------
+        glyph_type: str
+            Type of glyph.
+        """
+        try:
+        # Check glyph type exists
+            return self.glyphs_library[glyph_type]
+        except:
+            class Invalid_glyph_type(Exception):
+                pass
+            raise Invalid_glyph_type(f"""'{glyph_type}' is not a valid glyph.""")
+
+
+    @staticmethod
+    def __merge_parameters(glyph, user_parameters):
+        """Combines default and user parameters without validating them.
+
+        Parameters
+        ----------
+        glyph: dict
+            Glyph data from the glyphs library.
+        user_parameters: dict
+            Dictionary containing sizing/label parameters of glyph.
+        """
+        merged_parameters = glyph['defaults'].copy()
+        if user_parameters is not None:
+            # Collate parameters (user parameters take priority)
+            for key in user_parameters.keys():
+                merged_parameters[key] = user_parameters[key]
+        return merged_parameters
+
+
+    @staticmethod
+    def __eval_parametric_value(parametric_value, parameters):
+        """Evaluates a single parametric attribute, such as '{width}' or '0'.
+
+        Parameters
+        ----------
+        parametric_value: ParametricPath
+            Parametric attribute value.
+        parameters: dict
+            Parameter values the expressions are evaluated with.
+        """
+        if (len(parametric_value.expressions) == 1 and
+            not ''.join(parametric_value.literals).strip()):
+            return float(parametric_value.evaluate(parameters)[0])
+        return float(parametric_value.svg_text(parameters))
+
+
+    def get_glyph_bounds(self,
+                         glyph_type,
+                         position,
+                         rotation=0.0,
+                         user_parameters=None,
+                         orientation='forward',
+                         use_bounding_box=False):
+        """Returns bounds of glyph and the end point of its baseline,
+        computed from the glyph geometry alone. No styles are merged,
+        no warnings are raised and no matplotlib artists are created.
 
         Parameters
         ----------
@@ -558,8 +2028,47 @@ class GlyphRenderer:
             Rotation of glyph in radians.
         user_parameters: dict, optional
             Dictionary containing sizing/label parameters of glyph.
+        orientation: 'forward' or 'reverse', optional
+            Orientation of the glyph.
+        use_bounding_box: bool, optional
+            If true, use the glyph's parametric bounding-box rect
+            rather than the vertices of its paths. Glyphs without a
+            usable rect fall back to their path vertices.
         """
-        return self.draw_glyph(None, glyph_type, position, rotation=rotation, user_parameters=user_parameters)
+        glyph = self.__lookup_glyph(glyph_type)
+        merged_parameters = self.__merge_parameters(glyph, user_parameters)
+        baseline_y = glyph['defaults']['baseline_y']
+        position = adjust_position_for_orientation(position, orientation, merged_parameters['width'], rotation)
+        transform = self.glyph_transform(baseline_y, position, orientation, rotation)
+        vertices = None
+        if use_bounding_box and glyph.get('bounding_box') is not None:
+            bounding_box = glyph['bounding_box']
+            try:
+                x = self.__eval_parametric_value(bounding_box['x'], merged_parameters)
+                y = self.__eval_parametric_value(bounding_box['y'], merged_parameters)
+                width = self.__eval_parametric_value(bounding_box['width'], merged_parameters)
+                height = self.__eval_parametric_value(bounding_box['height'], merged_parameters)
+                vertices = np.array([[x, y], [x+width, y], [x, y+height], [x+width, y+height]])
+            except NameError:
+                # Rect refers to parameters the glyph does not define
+                vertices = None
+        if vertices is None:
+            paths, baseline_path = self.__glyph_geometry(glyph_type, glyph, merged_parameters)
+            if len(paths) > 0:
+                vertices = np.concatenate([path.vertices for path in paths])
+        else:
+            baseline_path = self.__baseline_path(glyph, merged_parameters)
+        if vertices is None:
+            glyph_bounds = ((None, None), (None, None))
+        else:
+            vertices = vertices @ transform[:2, :2].T + transform[:2, 2]
+            x_min, y_min = np.min(vertices, axis=0)
+            x_max, y_max = np.max(vertices, axis=0)
+            glyph_bounds = ((x_min, y_min), (x_max, y_max))
+        position = adjust_position_for_orientation(position, orientation, merged_parameters['width'], rotation)
+        baseline_transform = self.glyph_transform(baseline_y, position, orientation, rotation)
+        return (glyph_bounds,
+                self.__baseline_end(baseline_path, baseline_transform))
 
 
     def get_baseline_end(self, glyph_type, position, orientation, rotation=0.0, user_parameters=None):
@@ -577,29 +2086,317 @@ class GlyphRenderer:
             Dictionary containing sizing/label parameters of glyph.
         """
         glyph = self.glyphs_library[glyph_type]
-        merged_parameters = glyph['defaults'].copy()
-        if user_parameters is not None:
-            # Collate parameters (user parameters take priority)
-            for key in user_parameters.keys():
-                merged_parameters[key] = user_parameters[key]
-        baseline_path = None
-        for path in glyph['paths']:
-            if path['class'] == 'baseline':
-                svg_text = self.__eval_svg_data(path['d'], merged_parameters)
-                # Call to svgpath2mpl
-                baseline_path = parse_path(svg_text)
-                break
-        if baseline_path is not None:
-            # Draw glyph to the axis with correct styling parameters
-            baseline_y = glyph['defaults']['baseline_y']
-            y_flipped_path = self.__flip_position_rotate_glyph(baseline_path,
-                                                               baseline_y,
-                                                               position,
-                                                               orientation,
-                                                               rotation)
-            return (y_flipped_path.vertices[1,0], y_flipped_path.vertices[1,1])
+        merged_parameters = self.__merge_parameters(glyph, user_parameters)
+        baseline_y = glyph['defaults']['baseline_y']
+        transform = self.glyph_transform(baseline_y, position, orientation, rotation)
+        if self.geometry_cache is not None:
+            baseline_path = self.__glyph_geometry(glyph_type, glyph, merged_parameters)[1]
+        else:
+            baseline_path = self.__baseline_path(glyph, merged_parameters)
+        return self.__baseline_end(baseline_path, transform)
 
-        return None
+
+class GlyphBatch:
+    """Collects the transformed paths of many glyphs so that they can
+       be drawn with a few PathCollection artists, one per zorder,
+       rather than one PathPatch per path.
+
+       Attributes
+       ----------
+       groups: dict
+           Maps each zorder to the paths and their face colours,
+           edge colours and line widths.
+    """
+
+
+    def __init__(self):
+        self.groups = {}
+        self.resolved_styles = {}
+
+
+    def __resolve_style(self, style):
+        """Returns the face colour, edge colour and line width a
+        PathPatch would be drawn with for a style dictionary.
+
+        Parameters
+        ----------
+        style: dict
+            Matplotlib patch style parameters.
+        """
+        import matplotlib.patches as patches
+        try:
+            key = tuple(sorted(style.items()))
+            hash(key)
+        except TypeError:
+            key = None
+        if key is not None and key in self.resolved_styles:
+            return self.resolved_styles[key]
+        # Let matplotlib fill in defaults exactly as for a patch
+        patch = patches.PathPatch(Path([[0, 0]]), **style)
+        resolved = (patch.get_facecolor(), patch.get_edgecolor(), patch.get_linewidth())
+        if key is not None:
+            self.resolved_styles[key] = resolved
+        return resolved
+
+
+    def add(self, path, style, zorder=None):
+        """Adds a path to the batch.
+
+        Parameters
+        ----------
+        path: Matplotlib Path object
+            Transformed path to draw.
+        style: dict
+            Matplotlib patch style parameters.
+        zorder: float, optional
+            Matplotlib zorder, defaults to that of a patch.
+        """
+        import matplotlib.patches as patches
+        if zorder is None:
+            zorder = patches.Patch.zorder
+        if zorder not in self.groups:
+            self.groups[zorder] = {'paths': [],
+                                   'facecolors': [],
+                                   'edgecolors': [],
+                                   'linewidths': []}
+        group = self.groups[zorder]
+        facecolor, edgecolor, linewidth = self.__resolve_style(style)
+        group['paths'].append(path)
+        group['facecolors'].append(facecolor)
+        group['edgecolors'].append(edgecolor)
+        group['linewidths'].append(linewidth)
+
+
+    def draw(self, ax):
+        """Draws every path in the batch and returns the artists added.
+
+        Parameters
+        ----------
+        ax: Axes object
+            https://matplotlib.org/stable/api/axes_api.html
+        """
+        import matplotlib.patches as patches
+        from matplotlib.collections import PathCollection
+        collections = []
+        for zorder in sorted(self.groups.keys()):
+            group = self.groups[zorder]
+            if len(group['paths']) == 1:
+                # Matplotlib draws single path collections as markers, which
+                # snaps them to whole pixels, so use a normal patch instead
+                patch = patches.PathPatch(group['paths'][0],
+                                          facecolor=group['facecolors'][0],
+                                          edgecolor=group['edgecolors'][0],
+                                          linewidth=group['linewidths'][0],
+                                          zorder=zorder)
+                ax.add_patch(patch)
+                collections.append(patch)
+                continue
+            collection = PathCollection(group['paths'],
+                                        facecolors=group['facecolors'],
+                                        edgecolors=group['edgecolors'],
+                                        linewidths=group['linewidths'],
+                                        joinstyle='miter',
+                                        capstyle='butt',
+                                        zorder=zorder)
+            ax.add_collection(collection)
+            collections.append(collection)
+        return collections
+
+
+class InteractionBatch:
+    """Collects the stems and heads of many interactions so that they
+       can be drawn on an axes with one LineCollection per zorder for
+       the stems and one PathCollection per interaction type and zorder
+       for the heads, rather than an artist per line.
+
+       Attributes
+       ----------
+       stems: dict
+           Maps each zorder to the stem polylines and their
+           colours and line widths.
+       heads: dict
+           Maps each (interaction type, zorder, filled) key to
+           the head paths and their face colours, edge colours
+           and line widths.
+    """
+
+
+    # Parts of each head as built by `interaction_head_paths`: their name
+    # in the heads of `interaction_geometry_arrays`, path codes, fill
+    # ('color', 'white' or None for lines) and zorder offset
+    HEAD_PARTS = {'control': [('head', None, None, 0)],
+                  'degradation': [('head', [1,2,2,2], 'color', 0),
+                                  ('circle', Path.circle().codes, 'white', 0),
+                                  ('slash', None, None, 500)],
+                  'inhibition': [('head', None, None, 0)],
+                  'process': [('head', [1,2,2,2], 'color', 0)],
+                  'stimulation': [('head', [1,2,2,2,2], 'white', 0)]}
+
+
+    def __init__(self):
+        self.stems = {}
+        self.heads = {}
+
+
+    def add(self, geometry, interaction_type):
+        """Adds the stem and head of an interaction to the batch.
+
+        Parameters
+        ----------
+        geometry: dict
+            Result of `interaction_geometry`.
+        interaction_type: string
+            Type of interaction.
+        """
+        parameters = geometry['parameters']
+        self.__add_stem(np.column_stack((geometry['xs'], geometry['ys'])), parameters)
+        self.add_head(interaction_type,
+                      geometry['end'][0],
+                      geometry['end'][1],
+                      parameters,
+                      rotation = geometry['head_rotation'])
+
+
+    def add_arrays(self, geometry, parameters):
+        """Adds many interactions to the batch at once.
+
+        Parameters
+        ----------
+        geometry: dict
+            Result of `interaction_geometry_arrays`.
+        parameters: list
+            Processed parameters of each interaction (see
+            `process_interaction_params`), giving their
+            colours, line widths and zorders.
+        """
+        for index, stem in enumerate(geometry['stems']):
+            self.__add_stem(stem, parameters[index])
+        # Add the heads in the order of the interactions, as `add` would
+        head_order = []
+        for interaction_type, heads in geometry['heads'].items():
+            for position, index in enumerate(heads['indices']):
+                head_order.append((index, interaction_type, position))
+        for index, interaction_type, position in sorted(head_order):
+            heads = geometry['heads'][interaction_type]
+            interaction_parameters = parameters[index]
+            color = interaction_parameters['color']
+            for name, codes, fill, zorder_offset in self.HEAD_PARTS.get(interaction_type, []):
+                facecolor = {'color': color, 'white': 'white', None: None}[fill]
+                self.__add_head_path(interaction_type,
+                                     Path(heads[name][position], codes),
+                                     facecolor,
+                                     color,
+                                     interaction_parameters['zorder'] + zorder_offset,
+                                     interaction_parameters['linewidth'])
+
+
+    def add_head(self, interaction_type, int_end_x, int_end_y, parameters, rotation = 0.0):
+        """Adds the head of an interaction to the batch.
+
+        NOTE: See parameters of `interaction_head_paths`.
+        """
+        for head in interaction_head_paths(interaction_type, int_end_x, int_end_y, parameters, rotation):
+            self.__add_head_path(interaction_type,
+                                 head['path'],
+                                 head['facecolor'],
+                                 head['edgecolor'],
+                                 head['zorder'],
+                                 parameters['linewidth'])
+
+
+    def __add_stem(self, vertices, parameters):
+        """Adds the line of an interaction, of shape (4, 2)."""
+        from matplotlib.colors import to_rgba
+        # Slightly lower zorder than head to prevent overlap
+        zorder = parameters['zorder'] - 5
+        if zorder not in self.stems:
+            self.stems[zorder] = {'segments': [], 'colors': [], 'linewidths': []}
+        stems = self.stems[zorder]
+        stems['segments'].append(vertices)
+        stems['colors'].append(to_rgba(parameters['color']))
+        stems['linewidths'].append(parameters['linewidth'])
+
+
+    def __add_head_path(self, interaction_type, path, facecolor, edgecolor, zorder, linewidth):
+        """Adds a path of an interaction head, drawn as a line if facecolor is None."""
+        from matplotlib.colors import to_rgba
+        filled = facecolor is not None
+        key = (interaction_type, zorder, filled)
+        if key not in self.heads:
+            self.heads[key] = {'paths': [], 'facecolors': [], 'edgecolors': [], 'linewidths': []}
+        group = self.heads[key]
+        group['paths'].append(path)
+        group['facecolors'].append(to_rgba(facecolor) if filled else 'none')
+        group['edgecolors'].append(to_rgba(edgecolor))
+        group['linewidths'].append(linewidth)
+
+
+    def draw(self, ax):
+        """Draws every interaction in the batch and returns the artists added.
+
+        Parameters
+        ----------
+        ax: Axes object
+            https://matplotlib.org/stable/api/axes_api.html
+        """
+        import matplotlib.patches as patches
+        from matplotlib.collections import LineCollection, PathCollection
+        from matplotlib.lines import Line2D
+        artists = []
+        for zorder, stems in self.stems.items():
+            if len(stems['segments']) == 1:
+                # Matplotlib draws single path collections as markers, which
+                # snaps them to whole pixels, so use a normal line instead
+                segment = stems['segments'][0]
+                artist = ax.add_line(Line2D(segment[:, 0], segment[:, 1],
+                                            color=stems['colors'][0],
+                                            linewidth=stems['linewidths'][0],
+                                            zorder=zorder))
+            else:
+                artist = ax.add_collection(LineCollection(stems['segments'],
+                                                          colors=stems['colors'],
+                                                          linewidths=stems['linewidths'],
+                                                          capstyle='projecting',
+                                                          joinstyle='round',
+                                                          zorder=zorder))
+            artists.append(artist)
+        for (interaction_type, zorder, filled), group in self.heads.items():
+            if len(group['paths']) == 1:
+                if filled:
+                    artist = ax.add_patch(patches.PathPatch(group['paths'][0],
+                                                            facecolor=group['facecolors'][0],
+                                                            edgecolor=group['edgecolors'][0],
+                                                            linewidth=group['linewidths'][0],
+                                                            zorder=zorder))
+                else:
+                    vertices = group['paths'][0].vertices
+                    artist = ax.add_line(Line2D(vertices[:, 0], vertices[:, 1],
+                                                color=group['edgecolors'][0],
+                                                linewidth=group['linewidths'][0],
+                                                zorder=zorder))
+            else:
+                # Filled heads are drawn like patches, the others like lines
+                artist = ax.add_collection(PathCollection(group['paths'],
+                                                          facecolors=group['facecolors'],
+                                                          edgecolors=group['edgecolors'],
+                                                          linewidths=group['linewidths'],
+                                                          capstyle='butt' if filled else 'projecting',
+                                                          joinstyle='miter' if filled else 'round',
+                                                          zorder=zorder))
+            artists.append(artist)
+        return artists
+
+
+def _timed_load(loader, filename):
+    """Calls loader on a glyph file, returning its result and the
+    time taken in seconds. Errors are re-raised naming the file.
+    """
+    start = time.perf_counter()
+    try:
+        result = loader(filename)
+    except Exception as e:
+        raise ValueError(f"""Unable to load glyph file '{filename}': {e}""") from e
+    return result, time.perf_counter() - start
 
 
 def find_bound_of_bounds(bounds_list):
@@ -649,12 +2446,22 @@ class Construct:
        interaction_list: list
        rotation: float
        modify_axis: bool
+       batch: bool
+       route_interactions: bool
+       lane_spacing: float
+       include_labels: bool
+       avoid_label_collisions: bool
+       label_leader_lines: bool or dict
        bounds: tuple
            Represents the bounds of the
            construct, formatted as ((x1,y1), (x2,y2))
            where (x1,y1) are the coordinates of the
            lower left vertex and (x2, y2) are the
            coordinates of the top right vertex.
+       layout: dict
+           Geometry of the construct computed by
+           `layout_part_list` when it was created,
+           last drawn or its bounds last updated.
     """
 
 
@@ -669,7 +2476,13 @@ class Construct:
                   additional_bounds_list = None,
                   interaction_list = None,
                   rotation = 0.0,
-                  modify_axis = True):
+                  modify_axis = True,
+                  batch = False,
+                  route_interactions = False,
+                  lane_spacing = 8.0,
+                  include_labels = False,
+                  avoid_label_collisions = False,
+                  label_leader_lines = False):
         """
         Parameters
         ----------
@@ -705,8 +2518,9 @@ class Construct:
             is represented by a list containing
             four elements: [0] The origin glyph
             of the interaction, represented by
-            the glyph's index, [1] the receiving
-            glyph of the interaction, represented
+            the glyph's index in part_list or the
+            part itself, [1] the receiving glyph
+            of the interaction, represented
             similarly, [2] the interaction type
             string, and [3] the interaction_parameters
             dictionary.
@@ -717,6 +2531,30 @@ class Construct:
             Enable/disable the automatic resizing and
             modification of the Matplotlib Axes object - useful
             when wanting to modify it manually
+        batch: bool, optional
+            Draw glyphs as a few PathCollection artists
+            rather than one patch per path, which is much
+            faster for constructs with many parts.
+        route_interactions: bool, optional
+            Raise interactions that overlap or are
+            nested inside others on the same side of
+            the baseline into separate lanes, so that
+            their lines do not cross or coincide.
+        lane_spacing: float, optional
+            Height added to an interaction's line
+            for each lane it is raised by.
+        include_labels: bool, optional
+            Lay out the labels of the parts with the
+            construct, so that their text is part of
+            its bounds, and draw them after the glyphs.
+        avoid_label_collisions: bool, optional
+            Lay out the labels as for include_labels,
+            moving those that would overlap others
+            away from their glyphs (see `place_labels`).
+        label_leader_lines: bool or dict, optional
+            Draw lines to the labels that are moved,
+            with the given leader_line parameters if
+            a dict.
         """
         self.renderer = renderer
         self.padding = padding
@@ -724,10 +2562,17 @@ class Construct:
         self.fig = fig
         self.ax = ax
         if self.fig is None or self.ax is  None:
+            import matplotlib.pyplot as plt
             self.fig, self.ax = plt.subplots()
         self.start_position = start_position
         self.additional_bounds_list = additional_bounds_list
         self.modify_axis = modify_axis
+        self.batch = batch
+        self.route_interactions = route_interactions
+        self.lane_spacing = lane_spacing
+        self.include_labels = include_labels
+        self.avoid_label_collisions = avoid_label_collisions
+        self.label_leader_lines = label_leader_lines
 
         # Data structure
         self.part_list = part_list
@@ -735,6 +2580,7 @@ class Construct:
         self.rotation = 0.0
         self.rotation = rotation # Radians
         self.bounds = None
+        self.layout = None
         self.update_bounds()
 
 
@@ -752,60 +2598,392 @@ class Construct:
                         interaction[3]['direction'] = 'forward'
                 if 'direction' not in interaction[3]:
                     interaction[3]['direction'] = 'reverse'
+        self.update_bounds()
+
+
+    def update_bounds (self):
+        """Updates the layout and bounds of the constuct.
+        """
+        self.layout = layout_part_list(self.part_list,
+                                       self.renderer,
+                                       gapsize = self.gapsize,
+                                       start_position = self.start_position,
+                                       additional_bounds_list = self.additional_bounds_list,
+                                       interaction_list = self.interaction_list,
+                                       rotation = self.rotation,
+                                       route_interactions = self.route_interactions,
+                                       lane_spacing = self.lane_spacing,
+                                       include_labels = self.include_labels,
+                                       avoid_label_collisions = self.avoid_label_collisions,
+                                       label_leader_lines = self.label_leader_lines)
+        self.bounds = self.layout['bounds']
+        self.bounds = ((self.bounds[0], self.bounds[1]))
+
+
+    def draw (self, draw_for_bounds = False):
+        """Draws the construct using Matplotlib.
+
+        Parameters
+        ----------
+        draw_for_bounds: bool, optional
+            Indicates if the construct is being
+            drawn to update the self.bounds
+            attribute. If true, only the layout
+            is computed and nothing is drawn on
+            the returned fig and ax.
+        """
+        # Lay out the current parts and interactions, which may have been modified in place
+        self.update_bounds()
+        if draw_for_bounds is True:
+            return (self.fig,
+                    self.ax,
+                    self.layout['baseline_start'],
+                    self.layout['baseline_end'],
+                    self.layout['bounds'])
+        # Draw the construct
+        fig, ax, baseline_start, baseline_end, bounds = render_part_list(self.part_list,
+                                                                         self.renderer,
+                                                                         padding = self.padding,
+                                                                         gapsize = self.gapsize,
+                                                                         fig = self.fig,
+                                                                         ax = self.ax,
+                                                                         start_position = self.start_position,
+                                                                         additional_bounds_list = self.additional_bounds_list,
+                                                                         interaction_list = self.interaction_list,
+                                                                         rotation = self.rotation,
+                                                                         modify_axis = self.modify_axis,
+                                                                         layout = self.layout,
+                                                                         batch = self.batch)
+        return fig, ax, baseline_start, baseline_end, bounds
+
+
+def assign_interaction_lanes (intervals):
+    """Assigns each interval of part indices to a lane, so that no two
+       overlapping intervals share a lane and nested intervals are
+       placed in lower lanes than the intervals containing them.
+
+       Intervals are visited in order of their end. Each takes the
+       lowest lane above every interval it contains that is not used
+       by an earlier interval ending at or after its start. A Fenwick
+       tree finds the highest lane among contained intervals and a
+       segment tree over the last end of each lane finds the first
+       free lane, so this takes O(n log n) time for n intervals.
+
+    Parameters
+    ----------
+    intervals: list
+        Pairs of part indices (start, end), in either order.
+        Intervals sharing an end point are treated as
+        overlapping.
+
+    Returns
+    -------
+    list
+        Lane of each interval, starting from 0.
+    """
+    count = len(intervals)
+    if count == 0:
+        return []
+    intervals = [(min(interval), max(interval)) for interval in intervals]
+    positions = max(end for _, end in intervals) + 1
+    # Fenwick tree of the highest lane of the intervals starting at
+    # each position, indexed from the right so that prefixes are suffixes
+    highest_lane = [-1] * (positions + 1)
+    # Segment tree of the minimum, over a range of lanes, of the
+    # last end of the intervals placed in each lane (-1 when empty)
+    size = 1
+    while size < count:
+        size *= 2
+    last_end = [-1] * (2 * size)
+    lanes = [0] * count
+    # Visit intervals by end, shorter intervals first when ends are equal
+    for index in sorted(range(count), key=lambda i: (intervals[i][1], -intervals[i][0])):
+        start, end = intervals[index]
+        # Highest lane of the intervals already placed that start at or after
+        # start, which are those contained in this one
+        lowest_lane = 0
+        position = positions - start
+        while position > 0:
+            lowest_lane = max(lowest_lane, highest_lane[position] + 1)
+            position -= position & -position
+        # First lane from lowest_lane whose intervals all end before start
+        node, node_low, node_high = 1, 0, size - 1
+        stack = []
+        lane = None
+        while lane is None:
+            if node_high >= lowest_lane and last_end[node] < start:
+                if node_low == node_high:
+                    lane = node_low
+                    continue
+                middle = (node_low + node_high) // 2
+                stack.append((2 * node + 1, middle + 1, node_high))
+                node, node_high = 2 * node, middle
+            else:
+                node, node_low, node_high = stack.pop()
+        lanes[index] = lane
+        node = size + lane
+        last_end[node] = end
+        node //= 2
+        while node:
+            last_end[node] = min(last_end[2 * node], last_end[2 * node + 1])
+            node //= 2
+        position = positions - start
+        while position <= positions:
+            highest_lane[position] = max(highest_lane[position], lane)
+            position += position & -position
+    return lanes
+
+
+def layout_part_list (part_list,
+                      renderer,
+                      gapsize = 3.0,
+                      start_position = (0, 0),
+                      additional_bounds_list = None,
+                      interaction_list = None,
+                      rotation = 0.0,
+                      route_interactions = False,
+                      lane_spacing = 8.0,
+                      include_labels = False,
+                      avoid_label_collisions = False,
+                      label_leader_lines = False):
+    """Computes the positions and bounds of multiple glyphs in
+       sequence and of their interactions, without drawing anything.
+
+    NOTE: See parameters of the __init__
+    method within the Construct class
+    for parameter descriptions.
+
+    Parameters
+    ----------
+    part_list: list
+    renderer: object
+    gapsize: float, optional
+    start_position: tuple, optional
+    additional_bounds_list: list, optional
+    interaction_list: list, optional
+    rotation: float, optional
+    route_interactions: bool, optional
+    lane_spacing: float, optional
+    include_labels: bool, optional
+    avoid_label_collisions: bool, optional
+    label_leader_lines: bool or dict, optional
+
+    Returns
+    -------
+    dict with keys:
+        part_positions: list
+            Position each part is drawn at.
+        part_bounds: list
+            Bounds of each part.
+        interactions: list
+            One dict per valid interaction holding
+            the interaction and its sending_index,
+            receiving_index, sending_bounds,
+            receiving_bounds, processed parameters,
+            bounds and, if routed, lane.
+        interaction_arrays: dict
+            Result of `interaction_geometry_arrays` for
+            the valid interactions, or None if there
+            are none.
+        labels: list
+            Result of `GlyphRenderer.layout_labels`,
+            passed through `place_labels` if
+            avoid_label_collisions is true, or None
+            if neither option is set.
+        baseline_start: tuple
+        baseline_end: tuple
+        bounds: list
+            Bounds of the whole construct.
+    """
+    part_position = start_position
+    part_positions = []
+    bounds_list = []
+    # Advances that only depend on the rotation, computed once
+    bearing = 2*3.142 - rotation
+    offset_x, offset_y = sin(bearing), cos(bearing)
+    skew_x, skew_y = cos(rotation), sin(rotation)
+    gap_x, gap_y = gapsize*cos(rotation), gapsize*sin(rotation)
+    last_index = len(part_list) - 1
+    for index, part in enumerate(part_list):
+        orientation = part[1]
+        user_parameters = part[2]
+        # Pre-draw part_position adjustments (vertical_offset and orientation).
+        if user_parameters is not None:
+            if 'vertical_offset' in user_parameters:
+                part_position = (part_position[0] + (user_parameters['vertical_offset'])*offset_x,
+                                 part_position[1] + (user_parameters['vertical_offset'])*offset_y)
+        part_positions.append(part_position)
+        # Find the geometry of the part
+        bounds, part_position = renderer.get_glyph_bounds(part[0],
+                                                          part_position,
+                                                          rotation=rotation,
+                                                          user_parameters=user_parameters,
+                                                          orientation=orientation)
+        # Post-draw part_position adjustments (vertical_offset, orientation, and gapsize)
+        if user_parameters is not None:
+            if 'vertical_offset' in user_parameters:
+                part_position = (part_position[0] - (user_parameters['vertical_offset'])*offset_x,
+                                 part_position[1] - (user_parameters['vertical_offset'])*offset_y)
+            if 'trailing_gap_skew' in user_parameters:
+                trailing_gap_skew = user_parameters['trailing_gap_skew']
+                part_position = (part_position[0] + trailing_gap_skew*skew_x,
+                                (part_position[1] + trailing_gap_skew*skew_y))
+        if index != last_index:
+            part_position = (part_position[0] + gap_x,
+                            (part_position[1] + gap_y))
+        bounds_list.append(bounds)
+    part_bounds = list(bounds_list)
+    interactions = []
+    if interaction_list is not None:
+        interaction_types = ['control','degradation','inhibition','process','stimulation']
+        part_indices = None
+        for interaction in interaction_list:
+            if interaction[2] in interaction_types:
+                # Find bounds of glyphs
+                if part_indices is None and not (isinstance(interaction[0], (int, np.integer))
+                                                 and isinstance(interaction[1], (int, np.integer))):
+                    part_indices = _part_index_map(part_list)
+                sending_index = _find_part_index(part_list, interaction[0], part_indices)
+                receiving_index = _find_part_index(part_list, interaction[1], part_indices)
+                if sending_index is None or receiving_index is None:
+                    warnings.warn(f"""Interaction '{interaction[2]}' refers to a part that is not in the part list.""")
+                    continue
+                sending_bounds = part_bounds[sending_index]
+                receiving_bounds = part_bounds[receiving_index]
+                receiving_part_orientation = part_list[receiving_index][1]
+                # If unspecified by the user, interactions with reverse orientation receiving parts are drawn in reverse direction
+                if receiving_part_orientation == 'reverse':
+                    if interaction[3] is None:
+                        interaction[3] = {'direction':'reverse'}
+                    else:
+                        if 'direction' not in interaction[3]:
+                            interaction[3]['direction'] = 'reverse'
+                interactions.append({'interaction': interaction,
+                                     'sending_index': sending_index,
+                                     'receiving_index': receiving_index,
+                                     'sending_bounds': sending_bounds,
+                                     'receiving_bounds': receiving_bounds,
+                                     'parameters': process_interaction_params(interaction[3], warn = False)})
+            else:
+                warnings.warn(f"""'{interaction[2]}' is not a valid interaction type.""")
+    # Compute the geometry of every interaction in one pass
+    interaction_arrays = None
+    if interactions:
+        interaction_arrays = _interaction_layout_arrays(interactions, rotation)
+        if route_interactions:
+            _route_interactions(interactions, interaction_arrays, start_position, rotation, lane_spacing)
+            interaction_arrays = _interaction_layout_arrays(interactions, rotation)
+        for interaction, bounds in zip(interactions, interaction_arrays['bounds'].tolist()):
+            interaction['bounds'] = (tuple(bounds[0]), tuple(bounds[1]))
+    labels = None
+    if include_labels or avoid_label_collisions:
+        labels = renderer.layout_labels(part_list, part_positions, rotation = rotation)
+        if avoid_label_collisions:
+            labels = place_labels(labels, leader_lines = label_leader_lines)
+    # Unify interaction, label and additional bounds with glyph bounds
+    for interaction in interactions:
+        bounds_list.append(interaction['bounds'])
+    if labels is not None:
+        for label in labels:
+            bounds_list.append(label['bounds'])
+    if additional_bounds_list is not None:
+        for additional_bounds in additional_bounds_list:
+            bounds_list.append(additional_bounds)
+    return {'part_positions': part_positions,
+            'part_bounds': part_bounds,
+            'interactions': interactions,
+            'interaction_arrays': interaction_arrays,
+            'labels': labels,
+            'baseline_start': start_position,
+            'baseline_end': part_position,
+            'bounds': find_bound_of_bounds(bounds_list)}
+
+
+def _interaction_layout_arrays (interactions, rotation):
+    """Returns the result of `interaction_geometry_arrays` for
+       the interactions found by `layout_part_list`.
 
+    Parameters
+    ----------
+    interactions: list
+    rotation: float
+    """
+    parameter_columns = {}
+    for key in INTERACTION_GEOMETRY_PARAMETERS + ('direction',):
+        parameter_columns[key] = [interaction['parameters'][key] for interaction in interactions]
+    return interaction_geometry_arrays([interaction['sending_bounds'] for interaction in interactions],
+                                       [interaction['receiving_bounds'] for interaction in interactions],
+                                       [interaction['interaction'][2] for interaction in interactions],
+                                       parameter_columns,
+                                       rotation = rotation)
+
+
+def _route_interactions (interactions, interaction_arrays, start_position, rotation, lane_spacing):
+    """Assigns the interactions on each side of the baseline to lanes
+       with `assign_interaction_lanes` and adjusts their heightskew so
+       that the line of each lies lane_spacing above the lane below,
+       starting from the highest unrouted line on that side.
 
-    def update_bounds (self):
-        """Updates the bounds of the constuct.
-        """
-        self.bounds = self.draw(draw_for_bounds = True)[4]
-        self.bounds = ((self.bounds[0], self.bounds[1]))
+    Parameters
+    ----------
+    interactions: list
+    interaction_arrays: dict
+        Unrouted geometry of the interactions.
+    start_position: tuple
+    rotation: float
+    lane_spacing: float
+    """
+    # Height of each line above the baseline, on its own side
+    normal = np.array([-sin(rotation), cos(rotation)])
+    heights = (interaction_arrays['stems'][:, 1] - np.asarray(start_position, dtype=float)) @ normal
+    reverse = np.array([interaction['parameters']['direction'] == 'reverse' for interaction in interactions])
+    heights = np.where(reverse, -heights, heights)
+    for side in (np.flatnonzero(~reverse), np.flatnonzero(reverse)):
+        if len(side) == 0:
+            continue
+        lanes = assign_interaction_lanes([(interactions[index]['sending_index'],
+                                           interactions[index]['receiving_index']) for index in side])
+        base_height = heights[side].max()
+        for index, lane in zip(side.tolist(), lanes):
+            interaction = interactions[index]
+            interaction['lane'] = lane
+            # The line is raised by twice the heightskew
+            interaction['parameters'] = dict(interaction['parameters'])
+            interaction['parameters']['heightskew'] += (base_height + lane*lane_spacing - heights[index]) / 2
+
+
+def _part_index_map (part_list):
+    """Maps the identity of each part to its index in the part list,
+       keeping the first index of a part that appears more than once.
 
+    Parameters
+    ----------
+    part_list: list
+    """
+    part_indices = {}
+    for index, part in enumerate(part_list):
+        part_indices.setdefault(id(part), index)
+    return part_indices
 
-    def draw (self, draw_for_bounds = False):
-        """Draws the construct using Matplotlib.
 
-        Parameters
-        ----------
-        draw_for_bounds: bool, optional
-            Indicates if the construct is being
-            drawn to update the self.bounds
-            attribute.
-        """
-        # Draw the construct
-        bounds_to_add = []
-        if self.additional_bounds_list is not None:
-            # Include additional bounds
-            for additional_bounds in self.additional_bounds_list:
-                bounds_to_add.append(additional_bounds)
-        if draw_for_bounds is False:
-            fig, ax, baseline_start, baseline_end, bounds = render_part_list(self.part_list,
-                                                                             self.renderer,
-                                                                             padding = self.padding,
-                                                                             gapsize = self.gapsize,
-                                                                             fig = self.fig,
-                                                                             ax = self.ax,
-                                                                             start_position = self.start_position,
-                                                                             additional_bounds_list = bounds_to_add,
-                                                                             interaction_list = self.interaction_list,
-                                                                             rotation = self.rotation,
-                                                                             modify_axis = self.modify_axis)
-            return fig, ax, baseline_start, baseline_end, bounds
-        elif draw_for_bounds is True:
-            # Temporary rendering pathway to generate bounds
-            temp_fig, temp_ax = plt.subplots()
-            fig, ax, baseline_start, baseline_end, bounds = render_part_list(self.part_list,
-                                                                             self.renderer,
-                                                                             padding = self.padding,
-                                                                             gapsize = self.gapsize,
-                                                                             fig = temp_fig,
-                                                                             ax = temp_ax,
-                                                                             start_position = self.start_position,
-                                                                             additional_bounds_list = bounds_to_add,
-                                                                             interaction_list = self.interaction_list,
-                                                                             rotation = self.rotation,
-                                                                             modify_axis = self.modify_axis)
-            plt.close()
-            return fig, ax, baseline_start, baseline_end, bounds
+def _find_part_index (part_list, part, part_indices):
+    """Returns the index in the part list of an interaction's sending
+       or receiving part, or None if it is not in the list.
+
+    Parameters
+    ----------
+    part_list: list
+    part: int or list
+        Index of the part, or the part itself.
+    part_indices: dict
+        Result of `_part_index_map` for the part list.
+        Only used if part is not an index.
+    """
+    if isinstance(part, (int, np.integer)):
+        if 0 <= part < len(part_list):
+            return part
+        return None
+    return part_indices.get(id(part))
 
 
 def render_part_list (part_list,
@@ -818,7 +2996,14 @@ def render_part_list (part_list,
                       additional_bounds_list = None,
                       interaction_list = None,
                       rotation = 0.0,
-                      modify_axis = 1):
+                      modify_axis = 1,
+                      layout = None,
+                      batch = False,
+                      route_interactions = False,
+                      lane_spacing = 8.0,
+                      include_labels = False,
+                      avoid_label_collisions = False,
+                      label_leader_lines = False):
     """Renders multiple glyphs in sequence.
 
     NOTE: See parameters of the __init__
@@ -837,7 +3022,20 @@ def render_part_list (part_list,
     additional_bounds_list: list, optional
     interaction_list: list, optional
     rotation: float, optional
+    layout: dict, optional
+        Result of `layout_part_list` for the same
+        arguments. Computed if not given.
+    batch: bool, optional
+        If true, draw the glyphs as a few
+        PathCollection artists (see GlyphBatch)
+        rather than one patch per path.
+    route_interactions: bool, optional
+    lane_spacing: float, optional
+    include_labels: bool, optional
+    avoid_label_collisions: bool, optional
+    label_leader_lines: bool or dict, optional
     """
+    import matplotlib.pyplot as plt
     if fig is None or ax is None:
         fig, ax = plt.subplots()
     if modify_axis:
@@ -846,84 +3044,66 @@ def render_part_list (part_list,
         ax.set_yticks([])
         ax.axis('off')
         plt.subplots_adjust(left=0.01, right=0.99, top=0.99, bottom=0.01)
-    part_position = start_position
-    bounds_list = []
-    for part in part_list:
-        orientation = part[1]
+    if layout is None:
+        layout = layout_part_list(part_list,
+                                  renderer,
+                                  gapsize = gapsize,
+                                  start_position = start_position,
+                                  additional_bounds_list = additional_bounds_list,
+                                  interaction_list = interaction_list,
+                                  rotation = rotation,
+                                  route_interactions = route_interactions,
+                                  lane_spacing = lane_spacing,
+                                  include_labels = include_labels,
+                                  avoid_label_collisions = avoid_label_collisions,
+                                  label_leader_lines = label_leader_lines)
+    glyph_batch = GlyphBatch() if batch else None
+    for part, part_position in zip(part_list, layout['part_positions']):
         user_parameters = part[2]
-        # Pre-draw part_position adjustments (vertical_offset and orientation).
-        if user_parameters is not None:
-            if 'vertical_offset' in user_parameters:
-                bearing = 2*3.142 - rotation
-                part_position = (part_position[0] + (user_parameters['vertical_offset'])*sin(bearing),
-                                 part_position[1] + (user_parameters['vertical_offset'])*cos(bearing))
+        if layout['labels'] is not None and user_parameters is not None and 'label_parameters' in user_parameters:
+            # Labels laid out with the construct are drawn below
+            user_parameters = {key: value for key, value in user_parameters.items() if key != 'label_parameters'}
         # Draw the part
-        bounds, part_position = renderer.draw_glyph(ax,
-                                                    part[0],
-                                                    part_position,
-                                                    orientation=orientation,
-                                                    rotation=rotation,
-                                                    user_parameters=user_parameters,
-                                                    user_style=part[3])
-        # Post-draw part_position adjustments (vertical_offset, orientation, and gapsize)
-        if user_parameters is not None:
-            if 'vertical_offset' in user_parameters:
-                bearing = 2*3.142 - rotation
-                part_position = (part_position[0] - (user_parameters['vertical_offset'])*sin(bearing),
-                                 part_position[1] - (user_parameters['vertical_offset'])*cos(bearing))
-            if 'trailing_gap_skew' in user_parameters:
-                trailing_gap_skew = user_parameters['trailing_gap_skew']
-                part_position = (part_position[0] + trailing_gap_skew*cos(rotation),
-                                (part_position[1] + trailing_gap_skew*sin(rotation)))
-        if part is not part_list[-1]:
-            part_position = (part_position[0] + gapsize*cos(rotation),
-                            (part_position[1] + gapsize*sin(rotation)))
-        bounds_list.append(bounds)
-    interaction_bounds_list = []
-    if interaction_list is not None:
-        interaction_types = ['control','degradation','inhibition','process','stimulation']
-        for interaction in interaction_list:
-            if interaction[2] in interaction_types:
-                # Find bounds of glyphs
-                n = 0
-                for part in part_list:
-                    if part is interaction[0]:
-                        sending_bounds = bounds_list[n]
-                        break
-                    n += 1
-                n = 0
-                for part in part_list:
-                    if part is interaction[1]:
-                        receiving_bounds = bounds_list[n]
-                        receiving_part_orientation = part[1]
-                        break
-                    n += 1
-                # If unspecified by the user, interactions with reverse orientation receiving parts are drawn in reverse direction
-                if receiving_part_orientation == 'reverse':
-                    if interaction[3] is None:
-                        interaction[3] = {'direction':'reverse'}
-                    else:
-                        if 'direction' not in interaction[3]:
-                            interaction[3]['direction'] = 'reverse'
-                # Draw interactions
-                bounds = draw_interaction(ax,
-                                          sending_bounds,
-                                          receiving_bounds,
-                                          interaction[2],
-                                          interaction[3],
-                                          rotation = rotation)
-                interaction_bounds_list.append(bounds)
-            else:
-                warnings.warn(f"""'{interaction[2]}' is not a valid interaction type.""")
-    # Unify interaction bounds and additional bounds with glyph bounds
-    for interaction_bounds in interaction_bounds_list:
-        bounds_list.append(interaction_bounds)
-    for additional_bounds in additional_bounds_list:
-        bounds_list.append(additional_bounds)
+        renderer.draw_glyph(ax,
+                            part[0],
+                            part_position,
+                            orientation=part[1],
+                            rotation=rotation,
+                            user_parameters=user_parameters,
+                            user_style=part[3],
+                            batch=glyph_batch)
+    if glyph_batch is not None:
+        glyph_batch.draw(ax)
+    if layout['labels'] is not None:
+        leader_lines = []
+        for label in layout['labels']:
+            ax.text(**label['text_parameters'],
+                    ha='center',
+                    va='center')
+            leader_line = renderer.process_leader_line_params(label['label_parameters'],
+                                                              label['text_parameters'],
+                                                              bounds = label['bounds'])
+            if leader_line is not None:
+                leader_lines.append(leader_line)
+        if leader_lines:
+            from matplotlib.collections import LineCollection
+            ax.add_collection(LineCollection([np.column_stack((line['xs'], line['ys'])) for line in leader_lines],
+                                             colors=[line['color'] for line in leader_lines],
+                                             linewidths=[line['linewidth'] for line in leader_lines]),
+                              autolim=False)
+    if layout['interaction_arrays'] is not None:
+        for interaction_layout in layout['interactions']:
+            # Warn about invalid parameters, which the layout ignores
+            process_interaction_params(interaction_layout['interaction'][3])
+        # Draw all the interactions at once
+        interaction_batch = InteractionBatch()
+        interaction_batch.add_arrays(layout['interaction_arrays'],
+                                     [interaction_layout['parameters'] for interaction_layout in layout['interactions']])
+        interaction_batch.draw(ax)
     # Automatically find bounds for plot and resize axes
-    final_bounds = find_bound_of_bounds(bounds_list)
-    width = (final_bounds[1][0] - final_bounds[0][0])/60.0
-    height = (final_bounds[1][1] - final_bounds[0][1])/60.0
+    final_bounds = layout['bounds']
+    width = (final_bounds[1][0] - final_bounds[0][0])/DATA_UNITS_PER_INCH
+    height = (final_bounds[1][1] - final_bounds[0][1])/DATA_UNITS_PER_INCH
     fig_pad = (final_bounds[1][1] - final_bounds[0][1])*padding
     pad = height*padding
     width = width + (pad*2.0)
@@ -932,7 +3112,7 @@ def render_part_list (part_list,
         ax.set_xlim([final_bounds[0][0]-fig_pad, final_bounds[1][0]+fig_pad])
         ax.set_ylim([final_bounds[0][1]-fig_pad, final_bounds[1][1]+fig_pad])
         fig.set_size_inches( (width, height) )
-    return fig, ax, start_position, part_position, final_bounds
+    return fig, ax, layout['baseline_start'], layout['baseline_end'], final_bounds
 
 
 def adjust_position_for_orientation (position, orientation, glyph_width, rotation):
@@ -983,49 +3163,273 @@ def collate_user_params (renderer, glyph_type, user_parameters):
             label_parameters = user_parameters['label_parameters']
         for key in user_parameters.keys():
             if (key not in glyph['defaults'] and
-                key != 'label_parameters' and
-                key != 'orientation' and
-                key != 'vertical_offset' and
-                key != 'trailing_gap_skew' and
-                key != 'path_zorders'):
+                key not in NON_GEOMETRY_PARAMETERS):
                 warnings.warn(f"""Parameter '{key}' is not valid for '{glyph_type}'.""")
             merged_parameters[key] = user_parameters[key]
     return merged_parameters, label_parameters
 
 
-def draw_interaction (ax,
-                      sending_bounds,
-                      receiving_bounds,
-                      interaction_type,
-                      parameters,
-                      rotation = 0.0):
-    """Draws an interaction.
+def label_centroids (glyph_vertices):
+    """Finds the centroids that `calculate_centroid_of_paths` gives
+       for many glyphs at once: the mean of the vertices of a glyph with
+       one path, otherwise the mean of the means of its paths.
+
+    Parameters
+    ----------
+    glyph_vertices: list
+        For each glyph, a list of the vertex arrays of
+        its paths. Every glyph needs at least one path.
+
+    Returns
+    -------
+    numpy.ndarray
+        Centroid of each glyph, shape (N, 2).
+    """
+    if len(glyph_vertices) == 0:
+        return np.zeros((0, 2))
+    path_vertices = [vertices for paths in glyph_vertices for vertices in paths]
+    path_lengths = np.array([len(vertices) for vertices in path_vertices])
+    path_counts = np.array([len(paths) for paths in glyph_vertices])
+    path_starts = np.concatenate(([0], np.cumsum(path_lengths)[:-1]))
+    glyph_starts = np.concatenate(([0], np.cumsum(path_counts)[:-1]))
+    path_means = np.add.reduceat(np.concatenate(path_vertices), path_starts, axis=0) / path_lengths[:, None]
+    return np.add.reduceat(path_means, glyph_starts, axis=0) / path_counts[:, None]
+
+
+def place_labels (labels, padding = 2.0, max_tiers = 3, leader_lines = False):
+    """Moves labels that would overlap others into tiers further from
+       their glyphs, above the glyph for labels at or above its centroid
+       and below it otherwise.
+
+       Labels are swept in order of their left edge, keeping a heap of
+       those placed so far that can still overlap the next label, and
+       each label takes the lowest tier in which it overlaps none of
+       them. Sorting dominates, so n labels are placed in O(n log n)
+       time unless very many labels overlap the same place.
+
+    Parameters
+    ----------
+    labels: list
+        Result of `GlyphRenderer.layout_labels`.
+    padding: float, optional
+        Space kept between labels, in data units.
+    max_tiers: int, optional
+        Most tiers a label is moved by. Labels that
+        overlap others in every tier take the tier in
+        which they overlap the fewest.
+    leader_lines: bool or dict, optional
+        If true, labels that are moved get a
+        leader_line to where they were, drawn with the
+        given leader_line parameters if a dict (see
+        `GlyphRenderer.process_leader_line_params`).
+
+    Returns
+    -------
+    list
+        A copy of each label with its 'tier', and its
+        'bounds', 'text_parameters' and xy_skew in its
+        'label_parameters' moved by that tier.
+    """
+    order = sorted(range(len(labels)), key=lambda index: labels[index]['bounds'][0][0])
+    placed_labels = [None] * len(labels)
+    # Bounds of the placed labels that may overlap later ones, with a heap of their right edges
+    active = {}
+    right_edges = []
+    for index in order:
+        label = labels[index]
+        (x_min, y_min), (x_max, y_max) = label['bounds']
+        while right_edges and right_edges[0][0] + padding <= x_min:
+            del active[heapq.heappop(right_edges)[1]]
+        label_parameters = label['label_parameters']
+        xy_skew = label_parameters.get('xy_skew', (0,0))
+        step = (y_max - y_min + padding) * (1 if xy_skew[1] >= 0 else -1)
+        best_tier, best_overlaps = 0, None
+        for tier in range(max_tiers + 1):
+            offset = tier * step
+            overlaps = 0
+            for (other_min, other_max) in active.values():
+                if (x_min < other_max[0] + padding and other_min[0] < x_max + padding and
+                        y_min + offset < other_max[1] + padding and other_min[1] < y_max + offset + padding):
+                    overlaps += 1
+            if best_overlaps is None or overlaps < best_overlaps:
+                best_tier, best_overlaps = tier, overlaps
+            if overlaps == 0:
+                break
+        offset = best_tier * step
+        bounds = ((x_min, y_min + offset), (x_max, y_max + offset))
+        active[index] = bounds
+        heapq.heappush(right_edges, (x_max, index))
+        placed_label = dict(label)
+        placed_label['tier'] = best_tier
+        if best_tier > 0:
+            label_parameters = dict(label_parameters)
+            label_parameters['xy_skew'] = (xy_skew[0], xy_skew[1] + offset)
+            if leader_lines:
+                leader_line = dict(leader_lines) if isinstance(leader_lines, dict) else {}
+                leader_line['xy_skew'] = xy_skew
+                label_parameters['leader_line'] = leader_line
+            text_parameters = dict(label['text_parameters'])
+            text_parameters['y'] += offset
+            placed_label['label_parameters'] = label_parameters
+            placed_label['text_parameters'] = text_parameters
+            placed_label['bounds'] = bounds
+        placed_labels[index] = placed_label
+    return placed_labels
+
+
+def _font_key (userfont):
+    """Returns a hashable key of a label's userfont dict and the
+       matplotlib settings it is completed with, or None if its
+       values cannot be hashed.
+
+    Parameters
+    ----------
+    userfont: dict
+        Font properties of the label, or None.
+    """
+    import matplotlib
+    settings = tuple(tuple(value) if isinstance(value, list) else value
+                     for value in (matplotlib.rcParams[name] for name in FONT_RCPARAMS))
+    if userfont is None:
+        return (settings,)
+    try:
+        key = (settings,) + tuple(sorted((name, tuple(value) if isinstance(value, list) else value)
+                                         for name, value in userfont.items()))
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _font_properties (userfont):
+    """Returns the FontProperties of a label's userfont dict,
+       shared by every label with the same font.
+
+    Parameters
+    ----------
+    userfont: dict
+        Font properties of the label, or None.
+    """
+    key = _font_key(userfont)
+    if key is None:
+        import matplotlib.font_manager as font_manager
+        return font_manager.FontProperties(**userfont)
+    return _cached_font_properties(key)
+
+
+@lru_cache(maxsize=FONT_CACHE_SIZE)
+def _cached_font_properties (key):
+    """Creates the FontProperties of a key returned by `_font_key`,
+       keeping those of the most recently used fonts.
+
+    Parameters
+    ----------
+    key: tuple
+    """
+    import matplotlib.font_manager as font_manager
+    return font_manager.FontProperties(**dict(key[1:]))
+
+
+def _text_extent (text, userfont, rotation):
+    """Returns the width and height, in points, of the bounds of a
+       label drawn centred with matplotlib in a figure of the default
+       dpi, keeping the extents of the most recently measured texts.
+
+    Parameters
+    ----------
+    text: str
+    userfont: dict
+        Font properties of the label, or None.
+    rotation: float
+        Rotation of the text in degrees.
+    """
+    import matplotlib
+    # Font hinting makes extents depend on the dpi text is drawn at
+    dpi = matplotlib.rcParams['figure.dpi']
+    font_key = _font_key(userfont)
+    if font_key is None:
+        return _measure_text(text, _font_properties(userfont), rotation, dpi)
+    return _cached_text_extent(text, font_key, rotation, dpi)
+
+
+@lru_cache(maxsize=TEXT_EXTENT_CACHE_SIZE)
+def _cached_text_extent (text, font_key, rotation, dpi):
+    """Measures a text with the font of a key returned by `_font_key`.
+
+    NOTE: See parameters of `_measure_text`.
+    """
+    return _measure_text(text, _cached_font_properties(font_key), rotation, dpi)
+
+
+def _measure_text (text, font_properties, rotation, dpi):
+    """Returns the width and height, in points, of the bounds of a
+       text drawn centred with matplotlib.
+
+    Parameters
+    ----------
+    text: str
+    font_properties: FontProperties
+    rotation: float
+        Rotation of the text in degrees.
+    dpi: float
+        Resolution the text is drawn at.
+    """
+    from matplotlib.text import Text
+    # Matplotlib caches text metrics per renderer regardless of
+    # the font settings, so measure with a new one when they change
+    measurement_key = (dpi, _font_key(None))
+    if not _TEXT_MEASUREMENT or _TEXT_MEASUREMENT[0] != measurement_key:
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        figure = Figure(dpi=dpi)
+        _TEXT_MEASUREMENT[:] = [measurement_key, figure, FigureCanvasAgg(figure).get_renderer()]
+    measurement_key, figure, renderer = _TEXT_MEASUREMENT
+    text_artist = Text(0, 0, text,
+                       fontproperties=font_properties,
+                       rotation=rotation,
+                       ha='center',
+                       va='center')
+    text_artist.set_figure(figure)
+    text_bounds = text_artist.get_window_extent(renderer=renderer)
+    return (text_bounds.width * 72/dpi, text_bounds.height * 72/dpi)
+
+
+def interaction_geometry (sending_bounds,
+                          receiving_bounds,
+                          interaction_type,
+                          parameters,
+                          rotation = 0.0,
+                          warn = True):
+    """Computes the geometry of an interaction without drawing it.
+
+    NOTE: See parameters of `draw_interaction`
+    for parameter descriptions.
 
     Parameters
     ----------
-    ax: object
-        Matplotlib Axes object.
     sending_bounds: tuple
-        Bounds of the sending glyph of the
-        interaction, format ((x1,y1), (x2,y2)),
-        where (x1,y1) is the bottom left vertex
-        and (x2,y2) the top right.
     receiving_bounds: tuple
-        Bounds of the receiving glyph of the
-        interaction, formatted identically.
     interaction_type: string
-        Type of interaction being drawn, from
-        'control', 'degradation', 'inhibition',
-        'process', 'stimulation'.
     parameters: dict
-        Contains parameters for the interaction.
-        See docstring for the function
-        `process_interaction_params` for details.
     rotation: float, optional
-        Rotation, in radians, of construct that
-        interactions are to be drawn to.
+    warn: bool, optional
+        Warn about invalid interaction parameters.
+
+    Returns
+    -------
+    dict with keys:
+        parameters: dict
+            Processed interaction parameters.
+        xs, ys: list
+            Coordinates of the interaction line.
+        end: tuple
+            Point the head is drawn at.
+        head_rotation: float
+            Rotation, in degrees, the head is drawn with.
+        bounds: tuple
+            Bounds of the interaction line.
     """
-    parameters = process_interaction_params(parameters)
+    parameters = process_interaction_params(parameters, warn = warn)
     # Convert to degrees
     rotation = (180/pi) * rotation
     if parameters['direction'] == 'reverse':
@@ -1069,53 +3473,6 @@ def draw_interaction (ax,
         p = int_origin_x, int_origin_y, int_origin_max
         int_origin_x, int_origin_y, int_origin_max = int_end_x, int_end_y, int_end_max
         int_end_x, int_end_y, int_end_max = p
-    # Draw headless interaction
-    plt.plot([int_origin_x,
-              int_origin_max[0],
-              int_end_max[0],
-              int_end_x],
-             [int_origin_y,
-              int_origin_max[1],
-              int_end_max[1],
-              int_end_y],
-            color = parameters['color'],
-            lw = parameters['linewidth'],
-            zorder = parameters['zorder'] - 5) # Slightly lower zorder than head to prevent overlap
-    # Control
-    if interaction_type == 'control':
-        draw_control(ax,
-                     int_end_x,
-                     int_end_y,
-                     parameters,
-                     rotation = rotation)
-    # Degradation
-    elif interaction_type == 'degradation':
-        draw_degradation(ax,
-                         int_end_x,
-                         int_end_y,
-                         parameters,
-                         rotation = rotation)
-    # Inhibition
-    elif interaction_type == 'inhibition':
-        draw_inhibition(ax,
-                        int_end_x,
-                        int_end_y,
-                        parameters,
-                        rotation = rotation)
-    # Process
-    elif interaction_type == 'process':
-        draw_process(ax,
-                     int_end_x,
-                     int_end_y,
-                     parameters,
-                     rotation = rotation)
-    # Stimulation
-    elif interaction_type == 'stimulation':
-        draw_stimulation(ax,
-                         int_end_x,
-                         int_end_y,
-                         parameters,
-                         rotation = rotation)
     # Find bounds of interaction
     xcoords = [int_origin_max[0], int_end_max[0],
                int_origin_x, int_end_x]
@@ -1123,67 +3480,227 @@ def draw_interaction (ax,
                int_origin_y, int_end_y]
     minbounds = (min(xcoords),min(ycoords))
     maxbounds = (max(xcoords),max(ycoords))
-    return (minbounds, maxbounds)
+    return {'parameters': parameters,
+            'xs': [int_origin_x, int_origin_max[0], int_end_max[0], int_end_x],
+            'ys': [int_origin_y, int_origin_max[1], int_end_max[1], int_end_y],
+            'end': (int_end_x, int_end_y),
+            'head_rotation': rotation,
+            'bounds': (minbounds, maxbounds)}
+
+
+# Geometry parameters of an interaction and their defaults (see
+# `process_interaction_params`), used by `interaction_geometry_arrays`
+INTERACTION_GEOMETRY_PARAMETERS = ('headheight',
+                                   'headwidth',
+                                   'heightskew',
+                                   'sending_length_skew',
+                                   'receiving_length_skew',
+                                   'distance_from_baseline')
+
+
+def interaction_geometry_arrays (sending_bounds,
+                                 receiving_bounds,
+                                 interaction_types,
+                                 parameters = None,
+                                 rotation = 0.0):
+    """Computes the geometry of many interactions at once without
+       drawing them, matching `interaction_geometry` and
+       `interaction_head_paths` for each interaction.
+
+    Parameters
+    ----------
+    sending_bounds: array_like
+        Bounds of the sending glyph of each
+        interaction, shape (N, 2, 2).
+    receiving_bounds: array_like
+        Bounds of the receiving glyph of each
+        interaction, shape (N, 2, 2).
+    interaction_types: sequence
+        Type of each interaction.
+    parameters: dict, optional
+        Maps interaction parameters to a single
+        value or an array of N values. Only the
+        'direction' and the geometry parameters in
+        INTERACTION_GEOMETRY_PARAMETERS are used,
+        others default as in `process_interaction_params`.
+    rotation: float, optional
+        Rotation, in radians, of the construct.
+
+    Returns
+    -------
+    dict with keys:
+        stems: numpy.ndarray
+            Vertices of each interaction line,
+            shape (N, 4, 2).
+        ends: numpy.ndarray
+            Point each head is drawn at, shape (N, 2).
+        head_rotations: numpy.ndarray
+            Rotation, in degrees, of each head.
+        bounds: numpy.ndarray
+            Bounds of each interaction line,
+            shape (N, 2, 2).
+        heads: dict
+            Maps each interaction type present to a dict
+            holding the 'indices' of its interactions and
+            the vertices of each part of their heads,
+            shape (n, V, 2): 'head' for every type, and
+            'circle' and 'slash' for degradation.
+    """
+    sending = np.asarray(sending_bounds, dtype=float).reshape(-1, 2, 2)
+    receiving = np.asarray(receiving_bounds, dtype=float).reshape(-1, 2, 2)
+    count = len(sending)
+    interaction_types = np.asarray(interaction_types, dtype=object).reshape(count)
+    defaults = process_interaction_params(None)
+    if parameters is None:
+        parameters = {}
+    columns = {}
+    for key in INTERACTION_GEOMETRY_PARAMETERS:
+        columns[key] = np.broadcast_to(np.asarray(parameters.get(key, defaults[key]), dtype=float), (count,))
+    reverse = np.broadcast_to(np.asarray(parameters.get('direction', defaults['direction'])) == 'reverse',
+                              (count,))
+    # Convert to degrees and flip the side reverse interactions are drawn on
+    rotation = np.where(reverse, (180/pi) * rotation + 180, (180/pi) * rotation)
+    sending, receiving = (np.where(reverse[:, None, None], receiving, sending),
+                          np.where(reverse[:, None, None], sending, receiving))
+    distance = columns['distance_from_baseline']
+    # Degradation is bigger than the other interactions
+    initial_distance = np.where(interaction_types == 'degradation', distance * 2, distance)
+    y_pad = columns['heightskew'] * 2
+    # Find centroids of glyph bounds and the distance between them
+    origin_cent = sending[:, 0] + (sending[:, 1] - sending[:, 0])/2
+    end_cent = receiving[:, 0] + (receiving[:, 1] - receiving[:, 0])/2
+    centroid_distance = np.sqrt(np.sum(np.abs(origin_cent - end_cent)**2, axis=1))
+    rotation = rotation % 360
+    bearing = 360 - rotation
+    # Unit vectors (sin, cos) of the bearings used below
+    outward = np.column_stack((np.sin(bearing * pi/180), np.cos(bearing * pi/180)))
+    along = np.column_stack((np.sin((90 - rotation) * pi/180), np.cos((90 - rotation) * pi/180)))
+    inward = np.column_stack((np.sin((180 - rotation) * pi/180), np.cos((180 - rotation) * pi/180)))
+    int_origin = origin_cent + (initial_distance + distance)[:, None] * outward
+    int_origin_max = int_origin + (y_pad + columns['sending_length_skew'])[:, None] * outward
+    int_end_max = int_origin_max + centroid_distance[:, None] * along
+    int_end = int_end_max + (y_pad + columns['receiving_length_skew'])[:, None] * inward
+    # Reverse origin and end points
+    int_origin, int_end = (np.where(reverse[:, None], int_end, int_origin),
+                           np.where(reverse[:, None], int_origin, int_end))
+    int_origin_max, int_end_max = (np.where(reverse[:, None], int_end_max, int_origin_max),
+                                   np.where(reverse[:, None], int_origin_max, int_end_max))
+    stems = np.stack((int_origin, int_origin_max, int_end_max, int_end), axis=1)
+    heads = {}
+    for interaction_type in dict.fromkeys(interaction_types):
+        indices = np.flatnonzero(interaction_types == interaction_type)
+        heads[interaction_type] = _interaction_head_arrays(interaction_type,
+                                                           int_end[indices],
+                                                           rotation[indices],
+                                                           columns['headwidth'][indices],
+                                                           columns['headheight'][indices])
+        heads[interaction_type]['indices'] = indices
+    return {'stems': stems,
+            'ends': int_end,
+            'head_rotations': rotation,
+            'bounds': np.stack((stems.min(axis=1), stems.max(axis=1)), axis=1),
+            'heads': heads}
+
+
+def _interaction_head_arrays (interaction_type, ends, rotation, headwidth, headheight):
+    """Vectorized form of `interaction_head_paths` for interactions of
+       one type, returning the vertices of each part of their heads.
+    """
+    def offset(points, length, bearing):
+        return points + length[:, None] * np.column_stack((np.sin(bearing*pi/180), np.cos(bearing*pi/180)))
+    heads = {}
+    if interaction_type == 'control':
+        bearing1 = ((360 - (2 * rotation)) / 2) - 45
+        bearing2 = ((360 - (2 * rotation)) / 2) + 45
+        point1 = offset(ends, headwidth / 2, bearing1)
+        point2 = offset(point1, headwidth / 2, bearing2)
+        point3 = offset(ends, headwidth / 2, bearing2)
+        heads['head'] = np.stack((ends, point1, point2, point3, ends), axis=1)
+    elif interaction_type == 'inhibition':
+        bearing1 = 90 - rotation
+        bearing2 = ((360 - (2 * bearing1)) / 2) + (bearing1 * 2)
+        heads['head'] = np.stack((offset(ends, headwidth / 2, bearing1),
+                                  offset(ends, headwidth / 2, bearing2)), axis=1)
+    elif interaction_type in ('degradation', 'process', 'stimulation'):
+        bearing1 = 90 - rotation
+        bearing2 = ((360 - (2 * bearing1)) / 2) + (bearing1 * 2)
+        bearing3 = ((360 - (2 * rotation)) / 2)
+        arrow = [ends,
+                 offset(ends, headwidth / 2, bearing1),
+                 offset(ends, headheight, bearing3),
+                 offset(ends, headwidth / 2, bearing2)]
+        if interaction_type == 'stimulation':
+            arrow.append(ends)
+        heads['head'] = np.stack(arrow, axis=1)
+        if interaction_type == 'degradation':
+            origin = offset(ends, headheight*2 + headwidth/2, bearing3)
+            radius = headwidth / 2
+            heads['circle'] = Path.circle().vertices * radius[:, None, None] + origin[:, None, :]
+            heads['slash'] = np.stack((offset(origin, headwidth / 2, (360 - rotation) + 45),
+                                       offset(origin, headwidth / 2, (360 - rotation) + 225)), axis=1)
+    return heads
 
 
-def draw_control(ax,
-                 int_end_x,
-                 int_end_y,
-                 parameters,
-                 rotation = 0.0):
-    """Draws the head of a control interaction.
+def draw_interaction (ax,
+                      sending_bounds,
+                      receiving_bounds,
+                      interaction_type,
+                      parameters,
+                      rotation = 0.0,
+                      batch = None):
+    """Draws an interaction.
 
     Parameters
     ----------
     ax: object
         Matplotlib Axes object.
-    int_end_x: float
-        x value for the point at the end of
-        the interaction.
-    int_end_y: float
-        y value for the point at the end of
-        the interaction.
+    sending_bounds: tuple
+        Bounds of the sending glyph of the
+        interaction, format ((x1,y1), (x2,y2)),
+        where (x1,y1) is the bottom left vertex
+        and (x2,y2) the top right.
+    receiving_bounds: tuple
+        Bounds of the receiving glyph of the
+        interaction, formatted identically.
+    interaction_type: string
+        Type of interaction being drawn, from
+        'control', 'degradation', 'inhibition',
+        'process', 'stimulation'.
     parameters: dict
         Contains parameters for the interaction.
         See docstring for the function
         `process_interaction_params` for details.
     rotation: float, optional
-        Rotation of the construct the interaction
-        is being drawn to.
+        Rotation, in radians, of construct that
+        interactions are to be drawn to.
+    batch: InteractionBatch, optional
+        If given, the interaction is added to the
+        batch instead of being drawn, so that many
+        interactions can be drawn at once.
     """
-    if parameters['headheight'] > parameters['headheight']:
-        parameters['headwidth'] = parameters['headheight']
-    bearing1 = ((360 - (2 * rotation)) / 2) - 45
-    bearing2 = ((360 - (2 * rotation)) / 2) + 45
-    point1 = (int_end_x + (parameters['headwidth'] / 2) * sin(bearing1*pi/180),
-              int_end_y + (parameters['headwidth'] / 2) * cos(bearing1*pi/180))
-    point2 = (point1[0] + (parameters['headwidth'] / 2) * sin(bearing2*pi/180),
-              point1[1] + (parameters['headwidth'] / 2) * cos(bearing2*pi/180))
-    point3 = (int_end_x + (parameters['headwidth'] / 2) * sin(bearing2*pi/180),
-              int_end_y + (parameters['headwidth'] / 2) * cos(bearing2*pi/180))
-    # Draw
-    plt.plot([int_end_x,
-              point1[0],
-              point2[0],
-              point3[0],
-              int_end_x],
-             [int_end_y,
-              point1[1],
-              point2[1],
-              point3[1],
-              int_end_y],
-              color = parameters['color'],
-              lw = parameters['linewidth'],
-              zorder = parameters['zorder'])
-
-
-def draw_degradation(ax, int_end_x, int_end_y, parameters, rotation = 0.0):
-    """Draws the head of a degradation interaction.
+    geometry = interaction_geometry(sending_bounds,
+                                    receiving_bounds,
+                                    interaction_type,
+                                    parameters,
+                                    rotation = rotation)
+    if batch is not None:
+        batch.add(geometry, interaction_type)
+    else:
+        interaction_batch = InteractionBatch()
+        interaction_batch.add(geometry, interaction_type)
+        interaction_batch.draw(ax)
+    return geometry['bounds']
+
+
+def interaction_head_paths(interaction_type, int_end_x, int_end_y, parameters, rotation = 0.0):
+    """Computes the paths making up the head of an interaction.
 
     Parameters
     ----------
-    ax: object
-        Matplotlib Axes object.
+    interaction_type: string
+        Type of interaction, from 'control',
+        'degradation', 'inhibition', 'process',
+        'stimulation'.
     int_end_x: float
         x value for the point at the end of
         the interaction.
@@ -1197,183 +3714,159 @@ def draw_degradation(ax, int_end_x, int_end_y, parameters, rotation = 0.0):
     rotation: float, optional
         Rotation of the construct the interaction
         is being drawn to.
-    """
-    bearing1 = 90 - rotation
-    bearing2 = ((360 - (2 * bearing1)) / 2) + (bearing1 * 2)
-    bearing3 = ((360 - (2 * rotation)) / 2)
-    base1 = (int_end_x + (parameters['headwidth'] / 2) * sin(bearing1*pi/180),
-             int_end_y + (parameters['headwidth'] / 2) * cos(bearing1*pi/180))
-    base2 = (int_end_x + (parameters['headwidth'] / 2) * sin(bearing2*pi/180),
-             int_end_y + (parameters['headwidth'] / 2) * cos(bearing2*pi/180))
-    point = (int_end_x + (parameters['headheight']) * sin(bearing3*pi/180),
-             int_end_y + (parameters['headheight']) * cos(bearing3*pi/180))
-    # Arrow
-    path = Path([[int_end_x, int_end_y],
-                [base1[0], base1[1]],
-                [point[0], point[1]],
-                [base2[0], base2[1]]],
-                [1,2,2,2])
-    patch = patches.PathPatch(path,
-                              facecolor=parameters['color'],
-                              edgecolor = parameters['color'],
-                              lw = parameters['linewidth'],
-                              zorder = parameters['zorder'])
-    ax.add_patch(patch)
-    # Circle
-    origin = (int_end_x + (parameters['headheight']*2 + parameters['headwidth']/2) * sin(bearing3*pi/180),
-              int_end_y + (parameters['headheight']*2 + parameters['headwidth']/2) * cos(bearing3*pi/180))
-    r = parameters['headwidth'] / 2
-    patch = patches.Circle((origin[0], origin[1]),
-                            radius = r,
-                            facecolor='white',
-                            edgecolor = parameters['color'],
-                            lw = parameters['linewidth'],
-                            zorder = parameters['zorder'])
-    ax.add_patch(patch)
-    # Line within circle
-    bearing1 = (360 - rotation) + 45
-    bearing2 = (360 - rotation) + 225
-    end1 = (origin[0] + (parameters['headwidth'] / 2) * sin(bearing1*pi/180),
-            origin[1] + (parameters['headwidth'] / 2) * cos(bearing1*pi/180))
-    end2 = (origin[0] + (parameters['headwidth'] / 2) * sin(bearing2*pi/180),
-            origin[1] + (parameters['headwidth'] / 2) * cos(bearing2*pi/180))
-    plt.plot([end1[0], end2[0]],
-             [end1[1], end2[1]],
-             color = parameters['color'],
-             lw = parameters['linewidth'],
-             zorder = parameters['zorder'] + 500)
 
-
-def draw_inhibition(ax, int_end_x, int_end_y, parameters, rotation = 0.0):
-    """Draws the head of an inhibition interaction.
+    Returns
+    -------
+    list of dicts with keys:
+        path: Matplotlib Path object
+        facecolor: tuple or str
+            Fill colour, or None for paths drawn
+            as lines.
+        edgecolor: tuple or str
+        zorder: float
+    """
+    color = parameters['color']
+    zorder = parameters['zorder']
+    heads = []
+    if interaction_type == 'control':
+        if parameters['headheight'] > parameters['headheight']:
+            parameters['headwidth'] = parameters['headheight']
+        bearing1 = ((360 - (2 * rotation)) / 2) - 45
+        bearing2 = ((360 - (2 * rotation)) / 2) + 45
+        point1 = (int_end_x + (parameters['headwidth'] / 2) * sin(bearing1*pi/180),
+                  int_end_y + (parameters['headwidth'] / 2) * cos(bearing1*pi/180))
+        point2 = (point1[0] + (parameters['headwidth'] / 2) * sin(bearing2*pi/180),
+                  point1[1] + (parameters['headwidth'] / 2) * cos(bearing2*pi/180))
+        point3 = (int_end_x + (parameters['headwidth'] / 2) * sin(bearing2*pi/180),
+                  int_end_y + (parameters['headwidth'] / 2) * cos(bearing2*pi/180))
+        path = Path([[int_end_x, int_end_y],
+                     [point1[0], point1[1]],
+                     [point2[0], point2[1]],
+                     [point3[0], point3[1]],
+                     [int_end_x, int_end_y]])
+        heads.append({'path': path, 'facecolor': None, 'edgecolor': color, 'zorder': zorder})
+    elif interaction_type == 'inhibition':
+        bearing1 = 90 - rotation
+        bearing2 = ((360 - (2 * bearing1)) / 2) + (bearing1 * 2)
+        base1 = (int_end_x + (parameters['headwidth'] / 2) * sin(bearing1*pi/180),
+                 int_end_y + (parameters['headwidth'] / 2) * cos(bearing1*pi/180))
+        base2 = (int_end_x + (parameters['headwidth'] / 2) * sin(bearing2*pi/180),
+                 int_end_y + (parameters['headwidth'] / 2) * cos(bearing2*pi/180))
+        path = Path([[base1[0], base1[1]],
+                     [base2[0], base2[1]]])
+        heads.append({'path': path, 'facecolor': None, 'edgecolor': color, 'zorder': zorder})
+    elif interaction_type in ('degradation', 'process', 'stimulation'):
+        bearing1 = 90 - rotation
+        bearing2 = ((360 - (2 * bearing1)) / 2) + (bearing1 * 2)
+        bearing3 = ((360 - (2 * rotation)) / 2)
+        base1 = (int_end_x + (parameters['headwidth'] / 2) * sin(bearing1*pi/180),
+                 int_end_y + (parameters['headwidth'] / 2) * cos(bearing1*pi/180))
+        base2 = (int_end_x + (parameters['headwidth'] / 2) * sin(bearing2*pi/180),
+                 int_end_y + (parameters['headwidth'] / 2) * cos(bearing2*pi/180))
+        point = (int_end_x + (parameters['headheight']) * sin(bearing3*pi/180),
+                 int_end_y + (parameters['headheight']) * cos(bearing3*pi/180))
+        if interaction_type == 'stimulation':
+            # Closed, unfilled arrow
+            path = Path([[int_end_x, int_end_y],
+                         [base1[0], base1[1]],
+                         [point[0], point[1]],
+                         [base2[0], base2[1]],
+                         [int_end_x, int_end_y]],
+                        [1,2,2,2,2])
+            heads.append({'path': path, 'facecolor': 'white', 'edgecolor': color, 'zorder': zorder})
+        else:
+            # Filled arrow
+            path = Path([[int_end_x, int_end_y],
+                         [base1[0], base1[1]],
+                         [point[0], point[1]],
+                         [base2[0], base2[1]]],
+                        [1,2,2,2])
+            heads.append({'path': path, 'facecolor': color, 'edgecolor': color, 'zorder': zorder})
+        if interaction_type == 'degradation':
+            # Circle
+            origin = (int_end_x + (parameters['headheight']*2 + parameters['headwidth']/2) * sin(bearing3*pi/180),
+                      int_end_y + (parameters['headheight']*2 + parameters['headwidth']/2) * cos(bearing3*pi/180))
+            r = parameters['headwidth'] / 2
+            heads.append({'path': Path.circle(origin, r), 'facecolor': 'white', 'edgecolor': color, 'zorder': zorder})
+            # Line within circle
+            bearing1 = (360 - rotation) + 45
+            bearing2 = (360 - rotation) + 225
+            end1 = (origin[0] + (parameters['headwidth'] / 2) * sin(bearing1*pi/180),
+                    origin[1] + (parameters['headwidth'] / 2) * cos(bearing1*pi/180))
+            end2 = (origin[0] + (parameters['headwidth'] / 2) * sin(bearing2*pi/180),
+                    origin[1] + (parameters['headwidth'] / 2) * cos(bearing2*pi/180))
+            path = Path([[end1[0], end1[1]],
+                         [end2[0], end2[1]]])
+            heads.append({'path': path, 'facecolor': None, 'edgecolor': color, 'zorder': zorder + 500})
+    return heads
+
+
+def draw_interaction_head(ax, interaction_type, int_end_x, int_end_y, parameters, rotation = 0.0):
+    """Draws the head of an interaction and returns the artists added.
+
+    NOTE: See parameters of `interaction_head_paths`
+    for parameter descriptions.
 
     Parameters
     ----------
     ax: object
         Matplotlib Axes object.
+    interaction_type: string
     int_end_x: float
-        x value for the point at the end of
-        the interaction.
     int_end_y: float
-        y value for the point at the end of
-        the interaction.
     parameters: dict
-        Contains parameters for the interaction.
-        See docstring for the function
-        `process_interaction_params` for details.
     rotation: float, optional
-        Rotation of the construct the interaction
-        is being drawn to.
     """
-    bearing1 = 90 - rotation
-    bearing2 = ((360 - (2 * bearing1)) / 2) + (bearing1 * 2)
-    base1 = (int_end_x + (parameters['headwidth'] / 2) * sin(bearing1*pi/180),
-             int_end_y + (parameters['headwidth'] / 2) * cos(bearing1*pi/180))
-    base2 = (int_end_x + (parameters['headwidth'] / 2) * sin(bearing2*pi/180),
-             int_end_y + (parameters['headwidth'] / 2) * cos(bearing2*pi/180))
-    # Draw
-    plt.plot([base1[0],
-              base2[0]],
-             [base1[1],
-              base2[1]],
-             color = parameters['color'],
-             lw = parameters['linewidth'],
-             zorder = parameters['zorder'])
+    batch = InteractionBatch()
+    batch.add_head(interaction_type, int_end_x, int_end_y, parameters, rotation = rotation)
+    return batch.draw(ax)
+
+
+def draw_control(ax, int_end_x, int_end_y, parameters, rotation = 0.0):
+    """Draws the head of a control interaction.
+
+    NOTE: See `draw_interaction_head`.
+    """
+    return draw_interaction_head(ax, 'control', int_end_x, int_end_y, parameters, rotation = rotation)
+
+
+def draw_degradation(ax, int_end_x, int_end_y, parameters, rotation = 0.0):
+    """Draws the head of a degradation interaction.
+
+    NOTE: See `draw_interaction_head`.
+    """
+    return draw_interaction_head(ax, 'degradation', int_end_x, int_end_y, parameters, rotation = rotation)
+
+
+def draw_inhibition(ax, int_end_x, int_end_y, parameters, rotation = 0.0):
+    """Draws the head of an inhibition interaction.
+
+    NOTE: See `draw_interaction_head`.
+    """
+    return draw_interaction_head(ax, 'inhibition', int_end_x, int_end_y, parameters, rotation = rotation)
 
 
 def draw_process(ax, int_end_x, int_end_y, parameters, rotation = 0.0):
     """Draws the head of a process interaction.
 
-    Parameters
-    ----------
-    ax: object
-        Matplotlib Axes object.
-    int_end_x: float
-        x value for the point at the end of
-        the interaction.
-    int_end_y: float
-        y value for the point at the end of
-        the interaction.
-    parameters: dict
-        Contains parameters for the interaction.
-        See docstring for the function
-        `process_interaction_params` for details.
-    rotation: float, optional
-        Rotation of the construct the interaction
-        is being drawn to.
+    NOTE: See `draw_interaction_head`.
     """
-    bearing1 = 90 - rotation
-    bearing2 = ((360 - (2 * bearing1)) / 2) + (bearing1 * 2)
-    bearing3 = ((360 - (2 * rotation)) / 2)
-    base1 = (int_end_x + (parameters['headwidth'] / 2) * sin(bearing1*pi/180),
-             int_end_y + (parameters['headwidth'] / 2) * cos(bearing1*pi/180))
-    base2 = (int_end_x + (parameters['headwidth'] / 2) * sin(bearing2*pi/180),
-             int_end_y + (parameters['headwidth'] / 2) * cos(bearing2*pi/180))
-    point = (int_end_x + (parameters['headheight']) * sin(bearing3*pi/180),
-             int_end_y + (parameters['headheight']) * cos(bearing3*pi/180))
-    # Draw
-    path = Path([[int_end_x, int_end_y],
-                [base1[0], base1[1]],
-                [point[0], point[1]],
-                [base2[0], base2[1]]],
-                [1,2,2,2])
-    patch = patches.PathPatch(path,
-                              facecolor=parameters['color'],
-                              edgecolor = parameters['color'],
-                              lw = parameters['linewidth'],
-                              zorder = parameters['zorder'])
-    ax.add_patch(patch)
+    return draw_interaction_head(ax, 'process', int_end_x, int_end_y, parameters, rotation = rotation)
 
 
 def draw_stimulation(ax, int_end_x, int_end_y, parameters, rotation = 0.0):
     """Draws the head of a stimulation interaction.
 
-    Parameters
-    ----------
-    ax: object
-        Matplotlib Axes object.
-    int_end_x: float
-        x value for the point at the end of
-        the interaction.
-    int_end_y: float
-        y value for the point at the end of
-        the interaction.
-    parameters: dict
-        Contains parameters for the interaction.
-        See docstring for the function
-        `process_interaction_params` for details.
-    rotation: float, optional
-        Rotation of the construct the interaction
-        is being drawn to.
+    NOTE: See `draw_interaction_head`.
     """
-    bearing1 = 90 - rotation
-    bearing2 = ((360 - (2 * bearing1)) / 2) + (bearing1 * 2)
-    bearing3 = ((360 - (2 * rotation)) / 2)
-    base1 = (int_end_x + (parameters['headwidth'] / 2) * sin(bearing1*pi/180),
-             int_end_y + (parameters['headwidth'] / 2) * cos(bearing1*pi/180))
-    base2 = (int_end_x + (parameters['headwidth'] / 2) * sin(bearing2*pi/180),
-             int_end_y + (parameters['headwidth'] / 2) * cos(bearing2*pi/180))
-    point = (int_end_x + (parameters['headheight']) * sin(bearing3*pi/180),
-             int_end_y + (parameters['headheight']) * cos(bearing3*pi/180))
-    # Draw
-    path = Path([[int_end_x, int_end_y],
-                [base1[0], base1[1]],
-                [point[0], point[1]],
-                [base2[0], base2[1]],
-                [int_end_x, int_end_y]],
-                [1,2,2,2,2])
-    patch = patches.PathPatch(path,
-                              facecolor='white',
-                              edgecolor = parameters['color'],
-                              lw = parameters['linewidth'],
-                              zorder = parameters['zorder'])
-    ax.add_patch(patch)
-
-
-def process_interaction_params(parameters):
+    return draw_interaction_head(ax, 'stimulation', int_end_x, int_end_y, parameters, rotation = rotation)
+
+
+def process_interaction_params(parameters, warn = True):
     """Formats and completes interaction parameters.
 
     Interaction parameters are combined into a dictionary passed as a single argumnet.
+    Unknown parameters are ignored, with a warning unless `warn` is false.
 
     Parameters
     ----------
@@ -1424,7 +3917,7 @@ def process_interaction_params(parameters):
     for key in parameters:
         if key in final_parameters:
             final_parameters[key] = parameters[key]
-        else:
+        elif warn:
             warnings.warn(f"""'{key}' is not a valid interaction parameter.""")
     # Amplify zorder to ensure all drawings composing the interaction can be grouped on Z axis
     final_parameters['zorder'] *= 100
@@ -40,22 +40,36 @@ Path specification at <https://www.w3.org/TR/SVG/paths.html>.
 :license: BSD.
 """
 #from __future__ import division, print_function
-from math import sin, cos, sqrt, degrees, radians, acos
+from functools import lru_cache
+from math import sin, cos, sqrt, degrees, radians, acos, ceil, pi
 import re
 
 from matplotlib.path import Path
-import matplotlib.transforms as transforms
 import numpy as np
 
 __version__ = '0.2.1'
-__all__ = ['parse_path']
+__all__ = ['parse_path', 'parse_tokens', 'arc_to_beziers', 'parse_token_arrays', 'cache_info', 'cache_clear']
 
 
 COMMANDS = set('MmZzLlHhVvCcSsQqTtAa')
 UPPERCASE = set('MZLHVCSQTA')
 
 COMMAND_RE = re.compile("([MmZzLlHhVvCcSsQqTtAa])")
-FLOAT_RE = re.compile("[-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?")
+FLOAT_RE = re.compile(r"[-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?")
+TOKEN_RE = re.compile("[MmZzLlHhVvCcSsQqTtAa]|" + FLOAT_RE.pattern)
+
+MOVETO = Path.MOVETO
+LINETO = Path.LINETO
+CURVE3 = Path.CURVE3
+CURVE4 = Path.CURVE4
+CLOSEPOLY = Path.CLOSEPOLY
+
+# Number of parsed paths kept by parse_path and parse_tokens
+PATH_CACHE_SIZE = 4096
+
+# Most vertices a single arc command can add: Path.arc splits a full
+# turn into 16 cubic Bezier segments.
+ARC_MAX_VERTICES = 16 * 3 + 1
 
 COMMAND_CODES = {
     'M' : (Path.MOVETO,),    # moveto
@@ -183,7 +197,7 @@ def endpoint_to_center(start, radius, rotation, large, sweep, end):
     n = sqrt((ux * ux + uy * uy) * (vx * vx + vy * vy))
     # In certain cases the above calculation can through inaccuracies
     # become just slightly out of range, f ex -1.0000000000000002.
-    d = np.clip(p / n, -1, 1)
+    d = min(max(p / n, -1.0), 1.0)
     delta = degrees(acos(d))
     delta %= 360
     if (ux * vy - uy * vx) < 0:
@@ -199,67 +213,168 @@ def endpoint_to_center(start, radius, rotation, large, sweep, end):
     return center, theta, theta + delta
 
 
-def _tokenize_path(pathdef):
-    for x in COMMAND_RE.split(pathdef):
-        if x in COMMANDS:
-            yield x
-        for token in FLOAT_RE.findall(x):
-            yield token
+@lru_cache(maxsize=256)
+def _unit_arc(theta1, theta2):
+    """
+    Vertices of the cubic Bezier approximation of the arc on the unit circle
+    from `theta1` to `theta2` degrees (0 <= theta2 - theta1 < 360), equal to
+    ``Path.arc(theta1, theta2).vertices``. The first vertex is the start of
+    the arc, followed by two control points and an end point per segment.
+    Results are cached and read-only, as glyphs redraw the same arcs.
+    """
+    eta1 = radians(theta1)
+    eta2 = radians(theta2)
+    # number of curve segments to make
+    n = int(2 ** ceil((eta2 - eta1) / (pi * 0.5)))
+    deta = (eta2 - eta1) / n
+    t = np.tan(0.5 * deta)
+    alpha = np.sin(deta) * (np.sqrt(4.0 + 3.0 * t * t) - 1) / 3.0
+
+    steps = np.linspace(eta1, eta2, n + 1, True)
+    cos_eta = np.cos(steps)
+    sin_eta = np.sin(steps)
+
+    vertices = np.empty((3 * n + 1, 2))
+    vertices[0] = cos_eta[0], sin_eta[0]
+    vertices[1::3, 0] = cos_eta[:-1] - alpha * sin_eta[:-1]
+    vertices[1::3, 1] = sin_eta[:-1] + alpha * cos_eta[:-1]
+    vertices[2::3, 0] = cos_eta[1:] + alpha * sin_eta[1:]
+    vertices[2::3, 1] = sin_eta[1:] - alpha * cos_eta[1:]
+    vertices[3::3, 0] = cos_eta[1:]
+    vertices[3::3, 1] = sin_eta[1:]
+    vertices.flags.writeable = False
+    return vertices
+
+
+def arc_to_beziers(x, y, rx, ry, rotation, large, sweep, end_x, end_y):
+    """
+    Vertices of the cubic Bezier segments approximating an SVG elliptical arc
+    from (x, y) to (end_x, end_y). Unless `sweep` is set, the first vertex is
+    a moveto to the start of the arc. See `endpoint_to_center` for the other
+    parameters.
+
+    Returns
+    -------
+    numpy.ndarray
+        Vertices of shape (V, 2).
+    """
+    center, theta1, theta2 = endpoint_to_center(
+        complex(x, y),
+        complex(rx, ry),
+        rotation,
+        large,
+        sweep,
+        complex(end_x, end_y)
+    )
+
+    # Bezier vertices of the arc on the unit circle
+    if theta2 > theta1:
+        arc_vertices = _unit_arc(theta1, theta2)
+    else:
+        arc_vertices = _unit_arc(theta2, theta1)
+    if sweep:
+        # mysterious hack needed to render properly when sweeping the
+        # arc angle in the "positive" angular direction
+        arc_vertices = arc_vertices[1:]
+
+    # Transform it into an elliptical arc in one step: scale the minor and
+    # major axes, rotate the x-axis of the ellipse from the x-axis of the
+    # current coordinate system and translate it to the center
+    cosr = cos(radians(rotation))
+    sinr = sin(radians(rotation))
+    matrix = np.array([[rx * cosr, rx * sinr],
+                       [-ry * sinr, ry * cosr]])
+    return arc_vertices @ matrix + (center.real, center.imag)
 
 
-def _next_pos(elements):
-    return float(elements.pop()) + float(elements.pop()) * 1j
+def _tokenize_path(pathdef):
+    # Commands and numbers in a single pass, skipping separators
+    return TOKEN_RE.findall(pathdef)
 
 
 def _parse_path(pathdef, current_pos):
+    return _parse_tokens(_tokenize_path(pathdef), current_pos, pathdef)
+
+
+def _parse_tokens(elements, current_pos, pathdef=None):
     # In the SVG specs, initial movetos are absolute, even if
     # specified as 'm'. This is the default behavior here as well.
     # But if you pass in a current_pos variable, the initial moveto
     # will be relative to that current_pos. This is useful.
-    elements = list(_tokenize_path(pathdef))
-    # Reverse for easy use of .pop()
-    elements.reverse()
-
-    start_pos = None
+    # Tokens are command letters and numbers, the latter either as
+    # strings or already converted to floats. Returns the vertex and
+    # code arrays of the path.
+    count = len(elements)
+
+    # Every command adds at most two vertices and every number at most
+    # one, except for arcs which are bounded by ARC_MAX_VERTICES.
+    capacity = 2 * count + 1
+    if 'A' in elements or 'a' in elements:
+        capacity += ARC_MAX_VERTICES * (count // 7 + 1)
+    flat_vertices = np.empty(2 * capacity)
+    codes = np.empty(capacity, dtype=Path.code_type)
+    # Item assignment through memoryviews is much faster than indexing
+    # the NumPy arrays themselves.
+    v = memoryview(flat_vertices)
+    c = memoryview(codes)
+
+    x = current_pos.real
+    y = current_pos.imag
+    start_x = start_y = None
+    # Last control points, reflected by S and T
+    control2_x = control2_y = control_x = control_y = 0.0
     command = None
+    last_command = None
+    i = 0
+    n = 0
 
-    while elements:
+    while i < count:
 
         # 1. Determine the current command
 
-        if elements[-1] in COMMANDS:
+        token = elements[i]
+        if token in COMMANDS:
             # New command.
             last_command = command  # Used by S and T
-            command = elements.pop()
-            absolute = command in UPPERCASE
-            command = command.upper()
+            absolute = token in UPPERCASE
+            command = token.upper()
+            i += 1
         else:
             # Implicit command.
             # If this element starts with numbers, it is an implicit command
             # and we don't change the command. Check that it's allowed:
             if command is None:
+                if isinstance(pathdef, str):
+                    position = len(pathdef.split()) - (count - i)
+                else:
+                    position = i
                 raise ValueError(
                     "Unallowed implicit command in {}, position {}".format(
-                    pathdef, len(pathdef.split()) - len(elements)))
+                    pathdef, position))
             last_command = command  # Used by S and T
 
-
         # 2. Parse the current command
 
         # MOVETO
         if command == 'M':
-            pos = _next_pos(elements)
             if absolute:
-                current_pos = pos
+                x = float(elements[i])
+                y = float(elements[i + 1])
             else:
-                current_pos += pos
+                x += float(elements[i])
+                y += float(elements[i + 1])
+            i += 2
 
             # when M is called, reset start_pos
             # This behavior of Z is defined in svg spec:
             # http://www.w3.org/TR/SVG/paths.html#PathDataClosePathCommand
-            start_pos = current_pos
+            start_x = x
+            start_y = y
 
-            yield COMMAND_CODES['M'], [(current_pos.real, current_pos.imag)]
+            v[2 * n] = x
+            v[2 * n + 1] = y
+            c[n] = MOVETO
+            n += 1
 
             # Implicit moveto commands are treated as lineto commands.
             # So we set command to lineto here, in case there are
@@ -269,179 +384,166 @@ def _parse_path(pathdef, current_pos):
         # CLOSEPATH
         elif command == 'Z':
             # path closure
-            if current_pos != start_pos:
-                verts = [(start_pos.real, start_pos.imag)]
-                yield COMMAND_CODES['L'], verts
+            if x != start_x or y != start_y:
+                v[2 * n] = start_x
+                v[2 * n + 1] = start_y
+                c[n] = LINETO
+                n += 1
 
             # mpl.Path: a point is required but ignored
-            verts = [(start_pos.real, start_pos.imag)]
-            yield COMMAND_CODES['Z'], verts
-
-            current_pos = start_pos
-            start_pos = None
+            v[2 * n] = start_x
+            v[2 * n + 1] = start_y
+            c[n] = CLOSEPOLY
+            n += 1
+
+            x = start_x
+            y = start_y
+            start_x = start_y = None
             command = None  # You can't have implicit commands after closing.
 
         # LINETO
         elif command == 'L':
-            pos = _next_pos(elements)
-            if not absolute:
-                pos += current_pos
-            verts = [(pos.real, pos.imag)]
-            yield COMMAND_CODES['L'], verts
-            current_pos = pos
+            if absolute:
+                x = float(elements[i])
+                y = float(elements[i + 1])
+            else:
+                x += float(elements[i])
+                y += float(elements[i + 1])
+            i += 2
+            v[2 * n] = x
+            v[2 * n + 1] = y
+            c[n] = LINETO
+            n += 1
 
         # HORIZONTAL_PATHTO
         elif command == 'H':
-            x = elements.pop()
-            pos = float(x) + current_pos.imag * 1j
-            if not absolute:
-                pos += current_pos.real
-            verts = [(pos.real, pos.imag)]
-            yield COMMAND_CODES['H'], verts
-            current_pos = pos
+            if absolute:
+                x = float(elements[i])
+            else:
+                x += float(elements[i])
+            i += 1
+            v[2 * n] = x
+            v[2 * n + 1] = y
+            c[n] = LINETO
+            n += 1
 
         # VERTICAL_PATHTO
         elif command == 'V':
-            y = elements.pop()
-            pos = current_pos.real + float(y) * 1j
-            if not absolute:
-                pos += current_pos.imag * 1j
-            verts = [(pos.real, pos.imag)]
-            yield COMMAND_CODES['V'], verts
-            current_pos = pos
-
-        # CUBIC_BEZIER
-        elif command == 'C':
-            control1 = _next_pos(elements)
-            control2 = _next_pos(elements)
-            end = _next_pos(elements)
-            if not absolute:
-                control1 += current_pos
-                control2 += current_pos
-                end += current_pos
-            verts = [
-                 (control1.real, control1.imag),
-                 (control2.real, control2.imag),
-                 (end.real, end.imag)
-            ]
-            yield COMMAND_CODES['C'], verts
-            current_pos = end
-
-        # SMOOTH_CUBIC_BEZIER
-        elif command == 'S':
-            # Smooth curve. First control point is the "reflection" of
-            # the second control point in the previous path.
-            if last_command not in 'CS':
+            if absolute:
+                y = float(elements[i])
+            else:
+                y += float(elements[i])
+            i += 1
+            v[2 * n] = x
+            v[2 * n + 1] = y
+            c[n] = LINETO
+            n += 1
+
+        # CUBIC_BEZIER and SMOOTH_CUBIC_BEZIER
+        elif command == 'C' or command == 'S':
+            if command == 'C':
+                control1_x = float(elements[i])
+                control1_y = float(elements[i + 1])
+                i += 2
+                if not absolute:
+                    control1_x += x
+                    control1_y += y
+            elif last_command == 'C' or last_command == 'S':
+                # The first control point is the reflection of the second
+                # control point on the previous command relative to the
+                # current point.
+                control1_x = x + x - control2_x
+                control1_y = y + y - control2_y
+            else:
                 # If there is no previous command or if the previous command
                 # was not an C, c, S or s, assume the first control point is
                 # coincident with the current point.
-                control1 = current_pos
-            else:
-                # The first control point is assumed to be the reflection of
-                # the second control point on the previous command relative
-                # to the current point.
-                last_control = control2
-                control1 = current_pos + current_pos - last_control
-            control2 = _next_pos(elements)
-            end = _next_pos(elements)
-            if not absolute:
-                control2 += current_pos
-                end += current_pos
-            verts = [
-                (control1.real, control1.imag),
-                (control2.real, control2.imag),
-                (end.real, end.imag)
-            ]
-            yield COMMAND_CODES['S'], verts
-            current_pos = end
-
-        # QUADRATIC_BEZIER
-        elif command == 'Q':
-            control = _next_pos(elements)
-            end = _next_pos(elements)
+                control1_x = x
+                control1_y = y
+            control2_x = float(elements[i])
+            control2_y = float(elements[i + 1])
+            end_x = float(elements[i + 2])
+            end_y = float(elements[i + 3])
+            i += 4
             if not absolute:
-                control += current_pos
-                end += current_pos
-            verts = [
-                (control.real, control.imag),
-                (end.real, end.imag)
-            ]
-            yield COMMAND_CODES['Q'], verts
-            current_pos = end
-
-        # SMOOTH_QUADRATIC_BEZIER
-        elif command == 'T':
-            # Smooth curve. Control point is the "reflection" of
-            # the second control point in the previous path.
-            if last_command not in 'QT':
+                control2_x += x
+                control2_y += y
+                end_x += x
+                end_y += y
+            v[2 * n] = control1_x
+            v[2 * n + 1] = control1_y
+            v[2 * n + 2] = control2_x
+            v[2 * n + 3] = control2_y
+            v[2 * n + 4] = end_x
+            v[2 * n + 5] = end_y
+            c[n] = c[n + 1] = c[n + 2] = CURVE4
+            n += 3
+            x = end_x
+            y = end_y
+
+        # QUADRATIC_BEZIER and SMOOTH_QUADRATIC_BEZIER
+        elif command == 'Q' or command == 'T':
+            if command == 'Q':
+                control_x = float(elements[i])
+                control_y = float(elements[i + 1])
+                i += 2
+                if not absolute:
+                    control_x += x
+                    control_y += y
+            elif last_command == 'Q' or last_command == 'T':
+                # The control point is the reflection of the control point
+                # on the previous command relative to the current point.
+                control_x = x + x - control_x
+                control_y = y + y - control_y
+            else:
                 # If there is no previous command or if the previous command
-                # was not an Q, q, T or t, assume the first control point is
+                # was not an Q, q, T or t, assume the control point is
                 # coincident with the current point.
-                control = current_pos
-            else:
-                # The control point is assumed to be the reflection of
-                # the control point on the previous command relative
-                # to the current point.
-                last_control = control
-                control = current_pos + current_pos - last_control
-            end = _next_pos(elements)
+                control_x = x
+                control_y = y
+            end_x = float(elements[i])
+            end_y = float(elements[i + 1])
+            i += 2
             if not absolute:
-                end += current_pos
-            verts = [
-                (control.real, control.imag),
-                (end.real, end.imag)
-            ]
-            yield COMMAND_CODES['T'], verts
-            current_pos = end
+                end_x += x
+                end_y += y
+            v[2 * n] = control_x
+            v[2 * n + 1] = control_y
+            v[2 * n + 2] = end_x
+            v[2 * n + 3] = end_y
+            c[n] = c[n + 1] = CURVE3
+            n += 2
+            x = end_x
+            y = end_y
 
         # ELLIPTICAL_ARC
         elif command == 'A':
-            radius = _next_pos(elements)
-            rotation = float(elements.pop())
-            large = float(elements.pop())
-            sweep = float(elements.pop())
-            end = _next_pos(elements)
+            radius = complex(float(elements[i]), float(elements[i + 1]))
+            rotation = float(elements[i + 2])
+            large = float(elements[i + 3])
+            sweep = float(elements[i + 4])
+            end_x = float(elements[i + 5])
+            end_y = float(elements[i + 6])
+            i += 7
             if not absolute:
-                end += current_pos
-
-            center, theta1, theta2 = endpoint_to_center(
-                current_pos,
-                radius,
-                rotation,
-                large,
-                sweep,
-                end
-            )
-
-            # Create an arc on the unit circle
-            if theta2 > theta1:
-                arc = Path.arc(theta1=theta1, theta2=theta2)
-            else:
-                arc = Path.arc(theta1=theta2, theta2=theta1)
-
-            # Transform it into an elliptical arc:
-            # * scale the minor and major axes
-            # * translate it to the center
-            # * rotate the x-axis of the ellipse from the x-axis of the current
-            #   coordinate system
-            trans = (
-                transforms.Affine2D()
-                    .scale(radius.real, radius.imag)
-                    .translate(center.real, center.imag)
-                    .rotate_deg_around(center.real, center.imag, rotation)
-            )
-            arc = trans.transform_path(arc)
-
-            verts = np.array(arc.vertices)
-            codes = np.array(arc.codes)
+                end_x += x
+                end_y += y
+
+            arc_vertices = arc_to_beziers(x, y, radius.real, radius.imag,
+                                          rotation, large, sweep, end_x, end_y)
+            m = len(arc_vertices)
+            flat_vertices[2 * n:2 * (n + m)] = arc_vertices.ravel()
             if sweep:
-                # mysterious hack needed to render properly when sweeping the
-                # arc angle in the "positive" angular direction
-                yield codes[1:], verts[1:, :]
+                codes[n:n + m] = CURVE4
             else:
-                yield codes, verts
+                codes[n] = MOVETO
+                codes[n + 1:n + m] = CURVE4
+            n += m
 
-            current_pos = end
+            x = end_x
+            y = end_y
+
+    return flat_vertices[:2 * n].reshape(n, 2), codes[:n]
 
 
 def parse_path(pathdef, current_pos=0 + 0j):
@@ -464,10 +566,208 @@ def parse_path(pathdef, current_pos=0 + 0j):
     matplotlib.patches.PathPatch
     matplotlib.collections.PathCollection
     matplotlib.transforms
+    Notes
+    -----
+    Parsed paths are cached, see `cache_info`, so the returned Path is
+    read-only and may be shared with other callers.
+    """
+    return _cached_parse(pathdef, current_pos)
+
+
+def parse_tokens(tokens, current_pos=0 + 0j):
+    """
+    Build a matplotlib Path object from already tokenized SVG path data,
+    skipping the string parsing done by `parse_path`.
+    Parameters
+    ----------
+    tokens : list
+        Command letters and their numeric arguments in path order, e.g.
+        ['M', 100, 100, 'L', 300, 100, 'z'].
+    current_pos : complex, optional
+        Coordinates of the starting position of the path, given as a complex
+        number. See `parse_path`.
+    Returns
+    -------
+    :class:`matplotlib.path.Path` instance
+    Notes
+    -----
+    As with `parse_path`, the returned Path is cached and read-only.
+    """
+    return _cached_parse(tuple(tokens), current_pos)
+
+
+def parse_token_arrays(tokens, count):
+    """
+    Build the vertices of many paths that share a sequence of commands from
+    tokenized SVG path data whose numbers may be arrays, for example path
+    data evaluated over many sets of parameters at once.
+    Parameters
+    ----------
+    tokens : list
+        Command letters and their numeric arguments in path order, where
+        each argument is a number or an array holding one value per path.
+    count : int
+        Number of paths, the length of the arrays in `tokens`.
+    Returns
+    -------
+    vertices : numpy.ndarray
+        Vertices of each path, of shape (count, V, 2).
+    codes : numpy.ndarray
+        Path codes shared by every path, of length V.
+    Notes
+    -----
+    Arc commands are not supported. A subpath ending away from its start
+    is closed with a line back to the start. Paths for which the line has
+    no length keep it, so that every path shares the same codes.
     """
+    xs = []
+    ys = []
     codes = []
-    verts = []
-    for c, v in _parse_path(pathdef, current_pos):
-        codes.extend(c)
-        verts.extend(v)
-    return Path(verts, codes)
\ No newline at end of file
+    x = y = 0.0
+    start_x = start_y = None
+    control2_x = control2_y = control_x = control_y = 0.0
+    command = None
+    last_command = None
+    count_tokens = len(tokens)
+    i = 0
+    while i < count_tokens:
+        token = tokens[i]
+        if isinstance(token, str) and token in COMMANDS:
+            last_command = command
+            absolute = token in UPPERCASE
+            command = token.upper()
+            i += 1
+        else:
+            if command is None:
+                raise ValueError(
+                    "Unallowed implicit command in {}, position {}".format(
+                    tokens, i))
+            last_command = command
+
+        if command == 'M':
+            if absolute:
+                x, y = tokens[i], tokens[i + 1]
+            else:
+                x, y = x + tokens[i], y + tokens[i + 1]
+            i += 2
+            start_x, start_y = x, y
+            xs.append(x)
+            ys.append(y)
+            codes.append(MOVETO)
+            command = 'L'
+        elif command == 'Z':
+            if np.any(x != start_x) or np.any(y != start_y):
+                xs.append(start_x)
+                ys.append(start_y)
+                codes.append(LINETO)
+            xs.append(start_x)
+            ys.append(start_y)
+            codes.append(CLOSEPOLY)
+            x, y = start_x, start_y
+            start_x = start_y = None
+            command = None
+        elif command == 'L':
+            if absolute:
+                x, y = tokens[i], tokens[i + 1]
+            else:
+                x, y = x + tokens[i], y + tokens[i + 1]
+            i += 2
+            xs.append(x)
+            ys.append(y)
+            codes.append(LINETO)
+        elif command == 'H':
+            x = tokens[i] if absolute else x + tokens[i]
+            i += 1
+            xs.append(x)
+            ys.append(y)
+            codes.append(LINETO)
+        elif command == 'V':
+            y = tokens[i] if absolute else y + tokens[i]
+            i += 1
+            xs.append(x)
+            ys.append(y)
+            codes.append(LINETO)
+        elif command == 'C' or command == 'S':
+            if command == 'C':
+                control1_x, control1_y = tokens[i], tokens[i + 1]
+                i += 2
+                if not absolute:
+                    control1_x, control1_y = control1_x + x, control1_y + y
+            elif last_command == 'C' or last_command == 'S':
+                control1_x, control1_y = x + x - control2_x, y + y - control2_y
+            else:
+                control1_x, control1_y = x, y
+            control2_x, control2_y = tokens[i], tokens[i + 1]
+            end_x, end_y = tokens[i + 2], tokens[i + 3]
+            i += 4
+            if not absolute:
+                control2_x, control2_y = control2_x + x, control2_y + y
+                end_x, end_y = end_x + x, end_y + y
+            xs.extend([control1_x, control2_x, end_x])
+            ys.extend([control1_y, control2_y, end_y])
+            codes.extend([CURVE4] * 3)
+            x, y = end_x, end_y
+        elif command == 'Q' or command == 'T':
+            if command == 'Q':
+                control_x, control_y = tokens[i], tokens[i + 1]
+                i += 2
+                if not absolute:
+                    control_x, control_y = control_x + x, control_y + y
+            elif last_command == 'Q' or last_command == 'T':
+                control_x, control_y = x + x - control_x, y + y - control_y
+            else:
+                control_x, control_y = x, y
+            end_x, end_y = tokens[i], tokens[i + 1]
+            i += 2
+            if not absolute:
+                end_x, end_y = end_x + x, end_y + y
+            xs.extend([control_x, end_x])
+            ys.extend([control_y, end_y])
+            codes.extend([CURVE3] * 2)
+            x, y = end_x, end_y
+        else:
+            raise ValueError("Arc commands cannot be evaluated for arrays of paths")
+
+    vertices = np.empty((count, len(codes), 2))
+    for index in range(len(codes)):
+        vertices[:, index, 0] = xs[index]
+        vertices[:, index, 1] = ys[index]
+    return vertices, np.array(codes, dtype=Path.code_type)
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def _cached_parse(elements, current_pos):
+    # Path data is given either as a string or as a tuple of tokens.
+    # lru_cache is thread-safe and bounded; read-only paths stop callers
+    # from corrupting shared entries.
+    if isinstance(elements, str):
+        verts, codes = _parse_path(elements, current_pos)
+    else:
+        verts, codes = _parse_tokens(elements, current_pos, list(elements))
+    return Path(verts, codes, readonly=True)
+
+
+def cache_info():
+    """
+    Statistics of the cache of parsed paths shared by `parse_path` and
+    `parse_tokens`.
+    Returns
+    -------
+    dict
+        Number of hits, misses and evictions, and the current and
+        maximum size of the cache. Invalid path data is counted as
+        a miss that was evicted.
+    """
+    info = _cached_parse.cache_info()
+    return {'hits': info.hits,
+            'misses': info.misses,
+            'evictions': info.misses - info.currsize,
+            'size': info.currsize,
+            'maxsize': info.maxsize}
+
+
+def cache_clear():
+    """
+    Empty the cache of parsed paths and reset its statistics.
+    """
+    _cached_parse.cache_clear()
@@ -0,0 +1,295 @@
+#!/usr/bin/env python
+
+################################################################################
+# Compiles a directory of parametric SVG glyphs into a Python module holding
+# the default parameters, styles and term map of every glyph, with one
+# generated function per path returning its vertex and code arrays. When the
+# module matches the packaged SVG files, GlyphRenderer loads it instead of
+# parsing any XML. Re-run after editing the packaged glyphs:
+#
+#     python scripts/compile_glyphs.py [glyph_dir] [output_file]
+#
+# By default parasbolv/glyphs is compiled to parasbolv/compiled_glyphs.py.
+################################################################################
+
+import builtins
+import os
+import re
+import sys
+
+REPO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, REPO_DIR)
+
+import parasbolv as psv
+from parasbolv.svgpath2mpl import COMMANDS, UPPERCASE, MOVETO, LINETO, CURVE3, CURVE4, CLOSEPOLY
+
+
+class PathNotCompiled(Exception):
+    pass
+
+
+class PathCompiler:
+    """Generates straight-line Python for a path template, following the
+       same steps as svgpath2mpl._parse_tokens so the vertices match."""
+
+    def __init__(self, parametric_path):
+        self.parametric_path = parametric_path
+        self.lines = []
+        self.variable_count = 0
+        self.pending_vertices = []
+        self.pending_codes = []
+
+    def variable(self, source):
+        name = 'v' + str(self.variable_count)
+        self.variable_count += 1
+        self.lines.append(name + ' = ' + source)
+        return name
+
+    def add(self, x, y, code):
+        self.pending_vertices.append('(' + x + ', ' + y + ')')
+        self.pending_codes.append(str(code))
+
+    def flush(self):
+        if self.pending_vertices:
+            self.lines.append('vertices += [' + ', '.join(self.pending_vertices) + ']')
+            self.lines.append('codes += [' + ', '.join(self.pending_codes) + ']')
+        self.pending_vertices = []
+        self.pending_codes = []
+
+    def tokens(self):
+        expressions = iter(self.parametric_path.expressions)
+        tokens = []
+        for token in self.parametric_path.template:
+            if token is None:
+                tokens.append(self.variable('float(' + next(expressions).strip() + ')'))
+            elif isinstance(token, str):
+                tokens.append(token)
+            else:
+                tokens.append(repr(token))
+        return tokens
+
+    def compile(self):
+        if self.parametric_path.template is None:
+            raise PathNotCompiled('path data cannot be tokenized')
+        tokens = self.tokens()
+        x = y = '0.0'
+        start_x = start_y = None
+        control_x = control_y = control2_x = control2_y = '0.0'
+        command = None
+        i = 0
+        while i < len(tokens):
+            token = tokens[i]
+            if token in COMMANDS:
+                last_command = command
+                absolute = token in UPPERCASE
+                command = token.upper()
+                i += 1
+            else:
+                if command is None:
+                    raise PathNotCompiled('implicit command')
+                last_command = command
+            number = lambda offset: tokens[i + offset]
+            if command == 'M':
+                if absolute:
+                    x, y = number(0), number(1)
+                else:
+                    x = self.variable(x + ' + ' + number(0))
+                    y = self.variable(y + ' + ' + number(1))
+                i += 2
+                start_x, start_y = x, y
+                self.add(x, y, MOVETO)
+                command = 'L'
+            elif command == 'Z':
+                if start_x is None:
+                    raise PathNotCompiled('closepath without a subpath')
+                if x != start_x or y != start_y:
+                    self.flush()
+                    self.lines.append('if ' + x + ' != ' + start_x + ' or ' + y + ' != ' + start_y + ':')
+                    self.lines.append('    vertices.append((' + start_x + ', ' + start_y + '))')
+                    self.lines.append('    codes.append(' + str(LINETO) + ')')
+                self.add(start_x, start_y, CLOSEPOLY)
+                x, y = start_x, start_y
+                start_x = start_y = None
+                command = None
+            elif command in ('L', 'H', 'V'):
+                if command in ('L', 'H'):
+                    x = number(0) if absolute else self.variable(x + ' + ' + number(0))
+                    i += 1
+                if command in ('L', 'V'):
+                    y = number(0) if absolute else self.variable(y + ' + ' + number(0))
+                    i += 1
+                self.add(x, y, LINETO)
+            elif command in ('C', 'S'):
+                if command == 'C':
+                    control1_x, control1_y = number(0), number(1)
+                    i += 2
+                    if not absolute:
+                        control1_x = self.variable(control1_x + ' + ' + x)
+                        control1_y = self.variable(control1_y + ' + ' + y)
+                elif last_command in ('C', 'S'):
+                    control1_x = self.variable(x + ' + ' + x + ' - ' + control2_x)
+                    control1_y = self.variable(y + ' + ' + y + ' - ' + control2_y)
+                else:
+                    control1_x, control1_y = x, y
+                control2_x, control2_y = number(0), number(1)
+                end_x, end_y = number(2), number(3)
+                i += 4
+                if not absolute:
+                    control2_x = self.variable(control2_x + ' + ' + x)
+                    control2_y = self.variable(control2_y + ' + ' + y)
+                    end_x = self.variable(end_x + ' + ' + x)
+                    end_y = self.variable(end_y + ' + ' + y)
+                self.add(control1_x, control1_y, CURVE4)
+                self.add(control2_x, control2_y, CURVE4)
+                self.add(end_x, end_y, CURVE4)
+                x, y = end_x, end_y
+            elif command in ('Q', 'T'):
+                if command == 'Q':
+                    control_x, control_y = number(0), number(1)
+                    i += 2
+                    if not absolute:
+                        control_x = self.variable(control_x + ' + ' + x)
+                        control_y = self.variable(control_y + ' + ' + y)
+                elif last_command in ('Q', 'T'):
+                    control_x = self.variable(x + ' + ' + x + ' - ' + control_x)
+                    control_y = self.variable(y + ' + ' + y + ' - ' + control_y)
+                else:
+                    control_x, control_y = x, y
+                end_x, end_y = number(0), number(1)
+                i += 2
+                if not absolute:
+                    end_x = self.variable(end_x + ' + ' + x)
+                    end_y = self.variable(end_y + ' + ' + y)
+                self.add(control_x, control_y, CURVE3)
+                self.add(end_x, end_y, CURVE3)
+                x, y = end_x, end_y
+            elif command == 'A':
+                end_x, end_y = number(5), number(6)
+                if not absolute:
+                    end_x = self.variable(x + ' + ' + end_x)
+                    end_y = self.variable(y + ' + ' + end_y)
+                self.flush()
+                arc = self.variable('arc_to_beziers(' + ', '.join([x, y] + [number(k) for k in range(5)]
+                                                                  + [end_x, end_y]) + ')')
+                self.lines.append('vertices += ' + arc + '.tolist()')
+                self.lines.append('codes += [' + str(CURVE4) + '] * len(' + arc + ')')
+                self.lines.append('if not ' + number(4) + ':')
+                self.lines.append('    codes[-len(' + arc + ')] = ' + str(MOVETO))
+                i += 7
+                x, y = end_x, end_y
+        self.flush()
+        return self.lines
+
+
+def parameter_lines(parametric_path):
+    lines = []
+    for name in parametric_path.parameters:
+        if hasattr(builtins, name):
+            # Builtins used by the expressions unless a parameter replaces them
+            lines.append(name + ' = p.get(' + repr(name) + ', builtins.' + name + ')')
+        else:
+            lines.append(name + ' = p[' + repr(name) + ']')
+    return lines
+
+
+def compile_parametric_path(parametric_path, name, functions):
+    """Adds the generated functions of a parametric path to functions and
+    returns the source creating its ParametricPath."""
+    values_name = name + '_values'
+    functions.append('def ' + values_name + '(p):')
+    body = parameter_lines(parametric_path)
+    body.append('return (' + ''.join('(' + e.strip() + '), ' for e in parametric_path.expressions) + ')')
+    functions.extend('    ' + line for line in body)
+    functions.append('')
+    path_name = 'None'
+    try:
+        path_lines = PathCompiler(parametric_path).compile()
+    except PathNotCompiled:
+        path_lines = None
+    if path_lines is not None:
+        path_name = name + '_path'
+        functions.append('def ' + path_name + '(p):')
+        body = parameter_lines(parametric_path)
+        body.append('vertices = []')
+        body.append('codes = []')
+        body.extend(path_lines)
+        body.append('return np.array(vertices, dtype=float).reshape(-1, 2), np.array(codes, dtype=np.uint8)')
+        functions.extend('    ' + line for line in body)
+        functions.append('')
+    return ('(' + ', '.join([repr(parametric_path.text),
+                             repr(parametric_path.literals),
+                             repr(parametric_path.expressions),
+                             repr(parametric_path.template),
+                             repr(parametric_path.slot_positions),
+                             repr(parametric_path.parameters),
+                             values_name,
+                             path_name]) + ')')
+
+
+def compile_glyphs(glyph_path, output_file):
+    renderer = psv.GlyphRenderer(glyph_path=glyph_path)
+    functions = []
+    glyph_lines = []
+    for glyph_index, (glyph_type, glyph) in enumerate(renderer.glyphs_library.items()):
+        slug = re.sub(r'\W+', '_', glyph_type).strip('_').lower()
+        prefix = '_' + slug + '_' + str(glyph_index)
+        glyph_lines.append('    ' + repr(glyph_type) + ': {')
+        glyph_lines.append('        \'defaults\': ' + repr(glyph['defaults']) + ',')
+        glyph_lines.append('        \'paths\': [')
+        for path_index, path in enumerate(glyph['paths']):
+            parametric_path = 'None'
+            if path['parametric_path'] is not None:
+                parametric_path = compile_parametric_path(path['parametric_path'],
+                                                          prefix + '_' + str(path_index),
+                                                          functions)
+            glyph_lines.append('            {\'class\': ' + repr(path['class']) +
+                               ', \'id\': ' + repr(path['id']) +
+                               ', \'style\': ' + repr(path['style']) +
+                               ', \'d\': ' + repr(path['d']) +
+                               ',\n             \'parametric_path\': ' + parametric_path + '},')
+        glyph_lines.append('        ],')
+        bounding_box = 'None'
+        if glyph['bounding_box'] is not None:
+            bounding_box = '{' + ', '.join(repr(key) + ': ' +
+                                           compile_parametric_path(value, prefix + '_box_' + key, functions)
+                                           for key, value in glyph['bounding_box'].items()) + '}'
+        glyph_lines.append('        \'bounding_box\': ' + bounding_box + ',')
+        glyph_lines.append('    },')
+    sources = psv.GlyphRenderer.glyph_sources(glyph_path)
+    files = {os.path.basename(infile): (record['glyph_type'], record['terms'])
+             for infile, record in renderer.glyph_file_records.items()}
+    output = ['"""',
+              'Glyphs compiled from parametric SVG files by scripts/compile_glyphs.py.',
+              'Generated file, do not edit.',
+              '"""',
+              '',
+              'import builtins',
+              'import numpy as np',
+              'from parasbolv.svgpath2mpl import arc_to_beziers',
+              '',
+              '# SHA-1 digest of each compiled SVG file',
+              'SOURCES = ' + repr(sources),
+              '',
+              '# Glyph type and terms declared by each compiled SVG file',
+              'FILES = ' + repr(files),
+              '',
+              'GLYPH_TERM_MAP = ' + repr(renderer.glyph_term_map),
+              '',
+              '']
+    output.extend(functions)
+    output.append('')
+    output.append('GLYPHS = {')
+    output.extend(glyph_lines)
+    output.append('}')
+    with open(output_file, 'w') as f:
+        f.write('\n'.join(output) + '\n')
+
+
+if __name__ == '__main__':
+    glyph_path = psv.GlyphRenderer.package_glyph_path()
+    output_file = os.path.join(REPO_DIR, 'parasbolv', 'compiled_glyphs.py')
+    if len(sys.argv) > 1:
+        glyph_path = sys.argv[1]
+    if len(sys.argv) > 2:
+        output_file = sys.argv[2]
+    compile_glyphs(glyph_path, output_file)
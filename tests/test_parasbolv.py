@@ -1,3 +1,4 @@
+import os
 import parasbolv as psv
 import matplotlib.pyplot as plt
 
@@ -61,3 +62,695 @@ def test_plotting_interactions():
                                                             'distance_from_baseline': 27.0}]]
     construct = psv.Construct(part_list, renderer, interaction_list=int_list)
     fig, ax, baseline_start, baseline_end, bounds = construct.draw()
+
+
+def test_glyph_cache(tmp_path):
+    """Test that the on-disk glyph cache matches a fresh load and is invalidated by edits."""
+    import shutil
+    glyph_dir = tmp_path / 'glyphs'
+    shutil.copytree(psv.GlyphRenderer.package_glyph_path(), glyph_dir)
+    cache_dir = tmp_path / 'cache'
+    fresh = psv.GlyphRenderer(glyph_path=str(glyph_dir))
+    cached = psv.GlyphRenderer(glyph_path=str(glyph_dir), use_cache=True, cache_dir=str(cache_dir))
+    assert os.listdir(cache_dir)
+    cached = psv.GlyphRenderer(glyph_path=str(glyph_dir), use_cache=True, cache_dir=str(cache_dir))
+    assert cached.glyphs_library == fresh.glyphs_library
+    assert cached.glyph_term_map == fresh.glyph_term_map
+    # Editing a glyph must invalidate the cache
+    cds_file = glyph_dir / 'CDS.svg'
+    cds_file.write_text(cds_file.read_text().replace('width=30', 'width=40'))
+    cached = psv.GlyphRenderer(glyph_path=str(glyph_dir), use_cache=True, cache_dir=str(cache_dir))
+    assert cached.glyphs_library['CDS']['defaults']['width'] == 40.0
+    # A cache naming a class or module that no longer exists is rebuilt from the SVG files
+    cache_file = psv.GlyphRenderer.glyph_cache_file(str(glyph_dir), cache_dir=str(cache_dir))
+    for stale in (b'cparasbolv.parasbolv\nMovedGlyph\n.', b'cparasbolv.moved\nGlyph\n.'):
+        with open(cache_file, 'wb') as f:
+            f.write(stale)
+        cached = psv.GlyphRenderer(glyph_path=str(glyph_dir), use_cache=True, cache_dir=str(cache_dir))
+        assert cached.glyphs_library['CDS']['defaults']['width'] == 40.0
+        with open(cache_file, 'rb') as f:
+            assert f.read() != stale
+
+
+def test_lazy_glyph_loading():
+    """Test that lazily loaded glyphs are only parsed on use and match eager loading."""
+    eager = psv.GlyphRenderer()
+    lazy = psv.GlyphRenderer(lazy=True)
+    assert sorted(lazy.glyphs_library.keys()) == sorted(eager.glyphs_library.keys())
+    assert lazy.glyph_term_map == eager.glyph_term_map
+    assert not lazy.glyphs_library.is_loaded('CDS')
+    assert lazy.get_baseline_end('CDS', (0, 0), 'forward') == eager.get_baseline_end('CDS', (0, 0), 'forward')
+    assert lazy.glyphs_library.is_loaded('CDS')
+    assert not lazy.glyphs_library.is_loaded('Promoter')
+    assert lazy.glyphs_library['Promoter'] == eager.glyphs_library['Promoter']
+
+
+def test_parametric_path_matches_regex_substitution():
+    """Test that compiled path expressions give the same path data as substituting each expression."""
+    import re
+    renderer = psv.GlyphRenderer()
+    for glyph_type, glyph in renderer.glyphs_library.items():
+        parameters = glyph['defaults'].copy()
+        parameters['width'] = parameters.get('width', 0) * 1.7 + 0.3
+        for path in glyph['paths']:
+            expected = re.sub(r"{([^{}]+)}",
+                              lambda m: str(eval(m.group()[1:-1], dict(parameters))),
+                              path['d'])
+            assert path['parametric_path'].svg_text(dict(parameters)) == expected, glyph_type
+
+
+def test_parametric_path_template_matches_parse_path():
+    """Test that path templates build the same paths as parsing the substituted SVG text."""
+    import numpy as np
+    from parasbolv.svgpath2mpl import parse_path
+    renderer = psv.GlyphRenderer()
+    paths = []
+    for glyph in renderer.glyphs_library.values():
+        for path in glyph['paths']:
+            assert path['parametric_path'].template is not None
+            paths.append((path['parametric_path'], glyph['defaults']))
+    # The packaged glyphs cover relative m and c and implicit repeated commands,
+    # but no arcs or h, v, s, q and t commands, so add paths using those
+    extra_parameters = {'width': 20.0, 'height': 10.0}
+    for text in ['M{0},{0} a{width/2},{height/2} 0 1,0 {width},0 z',
+                 'M{width},0 A{width},{height} 30 0 1 {-width},{height} l5 5 {height} 2',
+                 'm1,1 h{width} v{-height} s{width},1 2,{height} q1,2 3,4 t5 6 Z']:
+        parametric_path = psv.ParametricPath(text)
+        assert parametric_path.template is not None
+        paths.append((parametric_path, extra_parameters))
+    for parametric_path, parameters in paths:
+        expected = parse_path(parametric_path.svg_text(dict(parameters)))
+        result = parametric_path.to_path(dict(parameters))
+        assert np.allclose(result.vertices, expected.vertices)
+        assert np.array_equal(result.codes, expected.codes)
+    # Expressions merging with neighbouring numbers fall back to parsing text
+    assert psv.ParametricPath('M1{width},0 L2,2').template is None
+
+
+def test_glyph_transform():
+    """Test that the glyph transform flips about the baseline, rotates and positions vertices."""
+    import math
+    import numpy as np
+    from matplotlib.path import Path
+    path = Path([[0, 0], [10, 5]], [Path.MOVETO, Path.LINETO])
+    transform = psv.GlyphRenderer.glyph_transform(1.0, (2, 3), 'forward', math.pi/2)
+    moved = psv.GlyphRenderer.transform_paths([path, path], transform)
+    # Flipped about y=1: (0,2), (10,-3). Rotated a quarter turn: (-2,0), (3,10).
+    assert np.allclose(moved[0].vertices, [[0, 3], [5, 13]])
+    assert np.allclose(moved[1].vertices, moved[0].vertices)
+    reverse = psv.GlyphRenderer.glyph_transform(0.0, (0, 0), 'reverse', 0.0)
+    assert np.allclose(psv.GlyphRenderer.transform_paths([path], reverse)[0].vertices, [[0, 0], [-10, 5]])
+
+
+def test_glyph_bounds_without_drawing():
+    """Test that geometry-only glyph bounds match the bounds of the drawn glyph."""
+    import numpy as np
+    renderer = psv.GlyphRenderer()
+    fig, ax = plt.subplots()
+    for glyph_type in renderer.glyphs_library:
+        for orientation in ['forward', 'reverse']:
+            drawn = renderer.draw_glyph(ax, glyph_type, (5, -3), orientation=orientation, rotation=0.4)
+            bounds = renderer.get_glyph_bounds(glyph_type, (5, -3), rotation=0.4, orientation=orientation)
+            if drawn[0][0][0] is None:
+                assert bounds[0] == drawn[0]
+            else:
+                assert np.allclose(bounds[0], drawn[0])
+            assert (bounds[1] is None) == (drawn[1] is None)
+            if bounds[1] is not None:
+                assert np.allclose(bounds[1], drawn[1])
+    n_patches = len(ax.patches)
+    user_parameters = {'width': 40, 'label_parameters': {'text': 'gene'}}
+    bounds, end = renderer.get_glyph_bounds('CDS', (0, 0), user_parameters=user_parameters)
+    assert len(ax.patches) == n_patches
+    assert np.allclose(bounds, ((0, -7.5), (40, 7.5)))
+    bounds, end = renderer.get_glyph_bounds('CDS', (0, 0), user_parameters={'height': 30},
+                                            use_bounding_box=True)
+    assert np.allclose(bounds, ((0, -15), (30, 15)))
+
+
+def test_construct_layout_without_rendering():
+    """Test that a construct computes its bounds without creating a figure."""
+    renderer = psv.GlyphRenderer()
+    fig, ax = plt.subplots()
+    part_list = [["Promoter", 'forward', None, None],
+                 ["CDS", 'reverse', {'vertical_offset': 5}, None],
+                 ["Terminator", 'forward', None, None]]
+    int_list = [[part_list[0], part_list[1], 'inhibition', None]]
+    figures = plt.get_fignums()
+    construct = psv.Construct(part_list, renderer, fig=fig, ax=ax, interaction_list=int_list)
+    assert plt.get_fignums() == figures
+    assert len(ax.patches) == 0 and len(ax.lines) == 0
+    layout = construct.layout
+    assert len(layout['part_positions']) == 3
+    assert len(layout['interactions']) == 1
+    # Reverse receiving parts set the interaction direction during layout
+    assert int_list[0][3] == {'direction': 'reverse'}
+    fig, ax, baseline_start, baseline_end, bounds = construct.draw()
+    assert bounds == list(construct.bounds) == list(layout['bounds'])
+    assert baseline_end == layout['baseline_end']
+    assert construct.draw(draw_for_bounds=True)[:2] == (construct.fig, construct.ax)
+    # Drawing lays out parts and interactions modified in place
+    one_part = psv.Construct([["CDS", 'forward', None, None]], renderer, fig=fig, ax=ax)
+    assert one_part.draw()[4] == [(0, -7.5), (30, 7.5)]
+    one_part.part_list.append(["CDS", 'forward', {'width': 20}, None])
+    assert one_part.draw()[4][1][0] == 53
+    one_part.part_list[1][2]['width'] = 10
+    assert one_part.draw(draw_for_bounds=True)[4][1][0] == 43
+    assert one_part.bounds[1][0] == 43
+
+
+def test_batched_construct_matches_patches():
+    """Test that batched drawing renders the same image as one patch per path."""
+    import numpy as np
+    renderer = psv.GlyphRenderer()
+    part_list = [["Promoter", 'forward', None, None],
+                 ["CDS", 'reverse', {'path_zorders': {'cds': 3}}, {'cds': {'facecolor': (1, 0, 0)}}],
+                 ["Terminator", 'forward', None, None]]
+    images = []
+    for batch in [False, True]:
+        fig, ax = plt.subplots()
+        construct = psv.Construct(part_list, renderer, fig=fig, ax=ax, batch=batch)
+        construct.draw()
+        if batch:
+            # The single zorder 3 path is drawn as a patch
+            assert len(ax.patches) == 1 and len(ax.collections) == 1
+        fig.canvas.draw()
+        images.append(np.asarray(fig.canvas.buffer_rgba()).copy())
+        plt.close(fig)
+    assert np.array_equal(images[0], images[1])
+
+
+def test_glyph_instances_match_draw_glyph():
+    """Test that instanced drawing gives the same patches and returns as repeated draw_glyph calls."""
+    import warnings
+    import numpy as np
+    renderer = psv.GlyphRenderer()
+    positions = [(0, 0), (40, 5), (80, -5), (120, 0)]
+    orientations = ['forward', 'reverse', 'forward', 'reverse']
+    rotations = [0.0, 0.3, 0.0, 1.2]
+    params_array = [{'width': 20}, None, {'width': 20, 'label_parameters': {'text': 'a'}},
+                    {'width': 35, 'path_zorders': {'cds': 4}}]
+    style = {'cds': {'facecolor': (1, 0, 0)}}
+    fig, ax = plt.subplots()
+    expected = [renderer.draw_glyph(ax, 'CDS', *instance, user_style=style)
+                for instance in zip(positions, orientations, rotations, params_array)]
+    fig_instances, ax_instances = plt.subplots()
+    instances = renderer.draw_glyph_instances(ax_instances, 'CDS', positions, orientations,
+                                              rotations, params_array, user_style=style)
+    for (bounds, end), (expected_bounds, expected_end) in zip(instances, expected):
+        assert np.allclose(bounds, expected_bounds)
+        assert np.allclose(end, expected_end)
+    assert len(ax_instances.patches) == len(ax.patches)
+    for patch, expected_patch in zip(ax_instances.patches, ax.patches):
+        assert np.array_equal(patch.get_path().vertices, expected_patch.get_path().vertices)
+        assert patch.get_facecolor() == expected_patch.get_facecolor()
+        assert patch.get_zorder() == expected_patch.get_zorder()
+    assert [t.get_text() for t in ax_instances.texts] == ['a']
+    # Invalid parameters are warned about for each glyph, as by draw_glyph
+    params_array = [{'width': 20, 'colour': 'red'}] * 3
+    with warnings.catch_warnings(record=True) as expected_warnings:
+        warnings.simplefilter('always')
+        for position in positions[:3]:
+            renderer.draw_glyph(ax, 'CDS', position, user_parameters=params_array[0])
+    with warnings.catch_warnings(record=True) as instance_warnings:
+        warnings.simplefilter('always')
+        renderer.draw_glyph_instances(ax_instances, 'CDS', positions[:3], params_array=params_array)
+    assert len(expected_warnings) == 3
+    assert [str(w.message) for w in instance_warnings] == [str(w.message) for w in expected_warnings]
+    plt.close(fig)
+    plt.close(fig_instances)
+
+
+def test_geometry_cache():
+    """Test that the geometry cache reuses evaluated paths, evicts old entries and can be invalidated."""
+    import numpy as np
+    renderer = psv.GlyphRenderer(geometry_cache_size=2)
+    uncached = psv.GlyphRenderer()
+    cache = renderer.geometry_cache
+    fig, ax = plt.subplots()
+    for position, rotation in [((0, 0), 0.0), ((10, 5), 0.5)]:
+        drawn = renderer.draw_glyph(ax, 'CDS', position, 'reverse', rotation, {'width': 20})
+        expected = uncached.draw_glyph(ax, 'CDS', position, 'reverse', rotation, {'width': 20})
+        assert np.allclose(drawn[0], expected[0]) and np.allclose(drawn[1], expected[1])
+        assert np.array_equal(ax.patches[-2].get_path().vertices, ax.patches[-1].get_path().vertices)
+    # Labels and other non-geometry parameters share the entry
+    renderer.get_glyph_bounds('CDS', (0, 0), user_parameters={'width': 20, 'label_parameters': {'text': 'a'}})
+    assert cache.stats() == {'hits': 2, 'misses': 1, 'evictions': 0, 'size': 1, 'maxsize': 2}
+    renderer.get_baseline_end('Promoter', (0, 0), 'forward')
+    renderer.get_baseline_end('Terminator', (0, 0), 'forward')
+    assert cache.stats()['evictions'] == 1
+    cache.invalidate('Terminator')
+    assert cache.stats()['size'] == 1
+    cache.invalidate()
+    assert cache.stats()['size'] == 0
+    assert psv.GlyphRenderer().geometry_cache is None
+    plt.close(fig)
+
+
+def test_evaluate_glyph_paths_over_parameter_arrays(tmp_path):
+    """Test that evaluating a glyph over arrays of parameters matches evaluating each set in turn."""
+    import numpy as np
+    import shutil
+    # Arcs are not used by the packaged glyphs
+    shutil.copytree(psv.GlyphRenderer.package_glyph_path(), tmp_path / 'glyphs')
+    with open(tmp_path / 'glyphs' / 'Arc.svg', 'w') as f:
+        f.write('<svg xmlns="http://www.w3.org/2000/svg" xmlns:parametric="https://parametric-svg.github.io/v0.2" '
+                'glyphtype="Arc" terms="" parametric:defaults="width=10">\n'
+                '<path class="filled-path" id="arc" parametric:d="M{0},{0} a{width/2},{width/2} 0 1,0 {width},0 z" '
+                'd="" style="fill:none;stroke:black" />\n'
+                '</svg>\n')
+    renderer = psv.GlyphRenderer(glyph_path=str(tmp_path / 'glyphs'))
+    assert 'Arc' in renderer.glyphs_library
+    widths = np.linspace(5, 40, 7)
+    for glyph_type, glyph in renderer.glyphs_library.items():
+        parameter_arrays = {'width': widths} if 'width' in glyph['defaults'] else {}
+        if 'height' in glyph['defaults']:
+            parameter_arrays['height'] = 12.5
+        evaluated = renderer.evaluate_glyph_paths(glyph_type, parameter_arrays)
+        assert len(evaluated) == len(glyph['paths'])
+        for index, width in enumerate(widths):
+            parameters = glyph['defaults'].copy()
+            parameters.update(parameter_arrays)
+            parameters['width'] = width
+            for path, result in zip(glyph['paths'], evaluated):
+                expected = path['parametric_path'].to_path(dict(parameters))
+                assert np.array_equal(result['codes'], expected.codes)
+                assert np.array_equal(result['vertices'][index], expected.vertices), glyph_type
+    evaluated = renderer.evaluate_glyph_paths('CDS', {'width': [10, 20]})
+    assert evaluated[0]['vertices'].shape[0] == 2
+    import pytest
+    with pytest.raises(ValueError):
+        renderer.evaluate_glyph_paths('CDS', {'width': [10, 20], 'height': [1, 2, 3]})
+
+
+def test_incremental_path_evaluation():
+    """Test that paths are only re-evaluated when a parameter they depend on changes."""
+    import numpy as np
+    renderer = psv.GlyphRenderer()
+    assert renderer.get_glyph_parameters('CDS', dependencies=True) == {
+        'baseline': ['width'],
+        'cds': ['arrowbody_height', 'width', 'arrowhead_width', 'height']}
+    assert renderer.get_glyph_parameters(dependencies=True)['Promoter']['baseline'] == ['width']
+    baseline, cds = renderer.glyphs_library['CDS']['paths']
+    parameters = renderer.glyphs_library['CDS']['defaults'].copy()
+    first = [baseline['parametric_path'].to_path(parameters), cds['parametric_path'].to_path(parameters)]
+    parameters['height'] = 21.0
+    second = [baseline['parametric_path'].to_path(parameters), cds['parametric_path'].to_path(parameters)]
+    assert second[0] is first[0]
+    assert second[1] is not first[1]
+    assert np.array_equal(second[1].vertices,
+                          psv.ParametricPath(cds['d']).to_path(parameters).vertices)
+    # Array values are evaluated every time rather than compared with the previous ones
+    for width in (np.array(20.0), np.array(25.0)):
+        parameters['width'] = width
+        assert np.isclose(cds['parametric_path'].to_path(parameters).vertices[:, 0].max(), width)
+        assert not any(isinstance(value, np.ndarray) for value in cds['parametric_path'].last_evaluation[0])
+    # Equal paths do not share their last evaluation
+    assert psv.ParametricPath(cds['d']) == cds['parametric_path']
+    assert psv.ParametricPath(cds['d']).last_evaluation is None
+
+
+def test_compiled_glyphs_match_svg_files():
+    """Test that the compiled glyph module is up to date and matches loading the SVG files."""
+    import numpy as np
+    import pytest
+    from parasbolv import compiled_glyphs
+    assert compiled_glyphs.SOURCES == psv.GlyphRenderer.glyph_sources(psv.GlyphRenderer.package_glyph_path())
+    compiled = psv.GlyphRenderer()
+    loaded = psv.GlyphRenderer(use_compiled=False)
+    assert compiled.glyph_term_map == loaded.glyph_term_map
+    assert list(compiled.glyphs_library) == list(loaded.glyphs_library)
+    for glyph_type, glyph in loaded.glyphs_library.items():
+        compiled_glyph = compiled.glyphs_library[glyph_type]
+        assert compiled_glyph['defaults'] == glyph['defaults']
+        assert (compiled_glyph['bounding_box'] is None) == (glyph['bounding_box'] is None)
+        parameter_sets = [glyph['defaults'].copy()]
+        parameter_sets.append({name: value * 1.7 + 3 for name, value in glyph['defaults'].items()})
+        assert len(compiled_glyph['paths']) == len(glyph['paths'])
+        for compiled_path, path in zip(compiled_glyph['paths'], glyph['paths']):
+            for key in ('class', 'id', 'style', 'd'):
+                assert compiled_path[key] == path[key]
+            for parameters in parameter_sets:
+                expected = path['parametric_path'].to_path(dict(parameters))
+                result = compiled_path['parametric_path'].to_path(dict(parameters))
+                assert np.array_equal(result.vertices, expected.vertices), glyph_type
+                assert np.array_equal(result.codes, expected.codes), glyph_type
+    with pytest.raises(NameError):
+        compiled.glyphs_library['CDS']['paths'][1]['parametric_path'].to_path({'width': 1.0})
+
+
+def test_compiled_glyphs_checked_once(monkeypatch):
+    """Test that the compiled glyphs are only compared with the SVG files when the files change."""
+    import warnings
+    from parasbolv import compiled_glyphs
+    import parasbolv.parasbolv as parasbolv_module
+    hashed = []
+    glyph_sources = psv.GlyphRenderer.glyph_sources
+    monkeypatch.setattr(psv.GlyphRenderer, 'glyph_sources',
+                        staticmethod(lambda path: hashed.append(path) or glyph_sources(path)))
+    monkeypatch.setattr(parasbolv_module, '_COMPILED_GLYPHS_CHECK', [])
+    monkeypatch.setattr(compiled_glyphs, 'SOURCES', {})
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        for _ in range(3):
+            renderer = psv.GlyphRenderer()
+            assert 'CDS' in renderer.glyphs_library
+    assert len(hashed) == 1
+    assert len(caught) == 1 and 'out of date' in str(caught[0].message)
+
+
+def test_parallel_glyph_loading(tmp_path):
+    """Test that loading glyphs concurrently matches loading them in turn."""
+    import shutil
+    import pytest
+    glyph_path = psv.GlyphRenderer.package_glyph_path()
+    sequential = psv.GlyphRenderer(glyph_path=glyph_path)
+    for processes in (False, True):
+        parallel = psv.GlyphRenderer(glyph_path=glyph_path, workers=4, processes=processes)
+        assert list(parallel.glyphs_library) == list(sequential.glyphs_library)
+        assert parallel.glyph_term_map == sequential.glyph_term_map
+        for glyph_type, glyph in parallel.glyphs_library.items():
+            assert glyph['defaults'] == sequential.glyphs_library[glyph_type]['defaults']
+            assert [path['d'] for path in glyph['paths']] == \
+                   [path['d'] for path in sequential.glyphs_library[glyph_type]['paths']]
+        assert list(parallel.glyph_load_times) == sorted(parallel.glyph_load_times)
+        assert len(parallel.glyph_load_times) == len(os.listdir(glyph_path))
+    # The main packaged drawings win over their alternates
+    assert sequential.glyphs_library['RNA Location']['paths'][-1]['id'] == 'location-top-path'
+    # Glyphs sharing a type and terms resolve to the first file by name
+    for name in ('CDS.svg', 'Promoter.svg'):
+        shutil.copy(os.path.join(glyph_path, name), tmp_path / name)
+    with open(tmp_path / 'Promoter.svg') as f:
+        text = f.read().replace('glyphtype="Promoter"', 'glyphtype="CDS"').replace('SO:0000167', 'SO:0000316')
+    with open(tmp_path / 'Promoter.svg', 'w') as f:
+        f.write(text)
+    for workers in (None, 2):
+        renderer = psv.GlyphRenderer(glyph_path=str(tmp_path), workers=workers)
+        assert list(renderer.glyphs_library) == ['CDS']
+        assert renderer.glyphs_library['CDS']['paths'][-1]['id'] == 'cds'
+        assert renderer.glyph_term_map == {'SO:0000316': 'CDS'}
+    with open(tmp_path / 'Broken.svg', 'w') as f:
+        f.write('<svg')
+    with pytest.raises(ValueError, match='Broken.svg'):
+        psv.GlyphRenderer(glyph_path=str(tmp_path), workers=2)
+
+
+def test_refresh_reloads_changed_glyphs(tmp_path):
+    """Test that refreshing a renderer only reloads the glyph files that changed."""
+    import shutil
+    glyph_path = psv.GlyphRenderer.package_glyph_path()
+    assert psv.GlyphRenderer().refresh() == {'updated': [], 'removed': []}
+    for name in ('CDS.svg', 'Promoter.svg', 'Terminator.svg'):
+        shutil.copy(os.path.join(glyph_path, name), tmp_path / name)
+    for lazy in (False, True):
+        renderer = psv.GlyphRenderer(glyph_path=str(tmp_path), lazy=lazy, geometry_cache_size=16)
+        term_map = renderer.glyph_term_map
+        for glyph_type in ('CDS', 'Promoter', 'Terminator'):
+            renderer.get_glyph_bounds(glyph_type, (0, 0))
+        terminator = renderer.glyphs_library['Terminator']
+        # Touching a file without editing it reloads nothing
+        os.utime(tmp_path / 'Terminator.svg', ns=(1, 1))
+        assert renderer.refresh() == {'updated': [], 'removed': []}
+        with open(tmp_path / 'CDS.svg') as f:
+            text = f.read()
+        with open(tmp_path / 'CDS.svg', 'w') as f:
+            f.write(text.replace('width=30;height=15', 'width=30;height=20'))
+        os.remove(tmp_path / 'Promoter.svg')
+        shutil.copy(os.path.join(glyph_path, 'Insulator.svg'), tmp_path / 'Insulator.svg')
+        assert renderer.refresh() == {'updated': ['CDS', 'Insulator'], 'removed': ['Promoter']}
+        assert sorted(renderer.glyphs_library) == ['CDS', 'Insulator', 'Terminator']
+        assert renderer.glyphs_library['CDS']['defaults']['height'] == 20
+        assert renderer.glyphs_library['Terminator'] is terminator
+        assert term_map is renderer.glyph_term_map
+        assert sorted(term_map.values()) == ['CDS', 'Insulator', 'Terminator']
+        assert [key[0] for key in renderer.geometry_cache.entries] == ['Terminator']
+        assert renderer.refresh() == {'updated': [], 'removed': []}
+        # Restore the directory for the next pass
+        os.remove(tmp_path / 'Insulator.svg')
+        for name in ('CDS.svg', 'Promoter.svg'):
+            shutil.copy(os.path.join(glyph_path, name), tmp_path / name)
+
+
+def test_geometry_without_pyplot():
+    """Test that importing parasbolv and computing geometry does not import pyplot."""
+    import subprocess
+    import sys
+    code = '\n'.join([
+        'import sys',
+        'import parasbolv as psv',
+        'renderer = psv.GlyphRenderer()',
+        'renderer.get_glyph_bounds("CDS", (0, 0))',
+        'renderer.get_baseline_end("Promoter", (0, 0), "reverse")',
+        'part_list = [["Promoter", "forward", None, None], ["CDS", "forward", None, None]]',
+        'psv.layout_part_list(part_list, renderer, interaction_list=[[part_list[0], part_list[1], "control", None]])',
+        'modules = ("matplotlib.pyplot", "matplotlib.patches", "matplotlib.font_manager")',
+        'print([module for module in modules if module in sys.modules])'])
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([os.path.dirname(os.path.dirname(psv.__file__)),
+                                         env.get('PYTHONPATH', '')])
+    result = subprocess.run([sys.executable, '-c', code], env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            universal_newlines=True, check=True)
+    assert result.stdout.strip() == '[]'
+
+
+def test_interactions_by_index():
+    """Test that interactions can refer to parts by index as well as by the part itself."""
+    import warnings
+    import pytest
+    renderer = psv.GlyphRenderer()
+    part_list = [['Promoter', 'forward', None, None],
+                 ['CDS', 'reverse', None, None],
+                 ['Terminator', 'forward', None, None]]
+    by_part = [[part_list[0], part_list[2], 'control', None],
+               [part_list[2], part_list[1], 'inhibition', None]]
+    by_index = [[0, 2, 'control', None],
+                [2, 1, 'inhibition', None]]
+    expected = psv.layout_part_list(part_list, renderer, interaction_list=by_part)
+    layout = psv.layout_part_list(part_list, renderer, interaction_list=by_index)
+    assert layout['bounds'] == expected['bounds']
+    for interaction, expected_interaction in zip(layout['interactions'], expected['interactions']):
+        assert interaction['sending_bounds'] == expected_interaction['sending_bounds']
+        assert interaction['receiving_bounds'] == expected_interaction['receiving_bounds']
+    # Interactions with reverse receiving parts default to the reverse direction
+    assert by_index[1][3] == {'direction': 'reverse'}
+    with pytest.warns(UserWarning, match='not in the part list'):
+        layout = psv.layout_part_list(part_list, renderer,
+                                      interaction_list=[[0, 3, 'control', None],
+                                                        [['CDS', 'forward', None, None], 1, 'control', None]])
+    assert layout['interactions'] == []
+    # The same part object can appear more than once
+    part_list.append(part_list[0])
+    layout = psv.layout_part_list(part_list, renderer)
+    assert layout['part_positions'][:3] == expected['part_positions']
+
+
+def test_batched_interactions_on_given_axes():
+    """Test that interactions are drawn as a few collections on the given axes."""
+    from matplotlib.collections import LineCollection, PathCollection
+    renderer = psv.GlyphRenderer()
+    part_list = [['CDS', 'forward', None, None] for _ in range(20)]
+    interaction_types = ['control', 'degradation', 'inhibition', 'process', 'stimulation']
+    interaction_list = [[i, (i + 3) % 20, interaction_types[i % 5], None] for i in range(20)]
+    fig, (ax, other_ax) = plt.subplots(2)
+    plt.sca(other_ax)
+    psv.render_part_list(part_list, renderer, fig=fig, ax=ax, interaction_list=interaction_list)
+    assert not other_ax.lines and not other_ax.patches and not other_ax.collections
+    stems = [c for c in ax.collections if isinstance(c, LineCollection)]
+    heads = [c for c in ax.collections if isinstance(c, PathCollection)]
+    assert len(stems) == 1 and len(stems[0].get_segments()) == 20
+    # One group per type, plus the slashes drawn above degradation heads
+    assert len(heads) == 6
+    assert sum(len(head.get_paths()) for head in heads) == 28
+    assert not ax.lines
+    # Single lines are drawn as ordinary Line2D artists
+    fig2, ax2 = plt.subplots()
+    plt.sca(other_ax)
+    bounds = psv.draw_interaction(ax2, ((0, 0), (10, 10)), ((30, 0), (40, 10)), 'degradation', None)
+    assert len(ax2.lines) == 2 and len(ax2.collections) == 1
+    assert bounds == psv.interaction_geometry(((0, 0), (10, 10)), ((30, 0), (40, 10)), 'degradation', None)['bounds']
+    assert not other_ax.lines
+    plt.close(fig)
+    plt.close(fig2)
+
+
+def test_interaction_geometry_arrays_match_scalar():
+    """Test that the vectorized interaction geometry matches computing each interaction in turn."""
+    import random
+    import numpy as np
+    rng = random.Random(0)
+    interaction_types = ['control', 'degradation', 'inhibition', 'process', 'stimulation']
+    sending, receiving, types, parameters = [], [], [], []
+    for index in range(50):
+        for bounds_list in (sending, receiving):
+            x, y = rng.uniform(-50, 50), rng.uniform(-50, 50)
+            bounds_list.append(((x, y), (x + rng.uniform(1, 20), y + rng.uniform(1, 20))))
+        types.append(interaction_types[index % 5])
+        parameters.append({'direction': rng.choice(['forward', 'reverse']),
+                           'headwidth': rng.uniform(2, 9),
+                           'heightskew': rng.uniform(0, 20),
+                           'receiving_length_skew': rng.uniform(-3, 3)})
+    columns = {key: [p[key] for p in parameters] for key in parameters[0]}
+    for rotation in (0.0, 0.3, -2.0):
+        geometry = psv.interaction_geometry_arrays(sending, receiving, types, columns, rotation = rotation)
+        for index in range(50):
+            expected = psv.interaction_geometry(sending[index], receiving[index], types[index],
+                                                dict(parameters[index]), rotation = rotation)
+            assert np.allclose(geometry['stems'][index], np.column_stack((expected['xs'], expected['ys'])))
+            assert np.allclose(geometry['bounds'][index], expected['bounds'])
+            heads = geometry['heads'][types[index]]
+            position = list(heads['indices']).index(index)
+            expected_heads = psv.interaction_head_paths(types[index], *expected['end'],
+                                                        expected['parameters'], expected['head_rotation'])
+            names = ['head', 'circle', 'slash'][:len(expected_heads)]
+            for name, expected_head in zip(names, expected_heads):
+                assert np.allclose(heads[name][position], expected_head['path'].vertices)
+    # Layouts hold the arrays for their valid interactions
+    renderer = psv.GlyphRenderer()
+    part_list = [['CDS', 'forward', None, None], ['CDS', 'reverse', None, None]]
+    layout = psv.layout_part_list(part_list, renderer, interaction_list=[[0, 1, 'process', None]])
+    assert layout['interaction_arrays']['stems'].shape == (1, 4, 2)
+    assert layout['interactions'][0]['bounds'] == tuple(map(tuple, layout['interaction_arrays']['bounds'][0]))
+    assert psv.layout_part_list(part_list, renderer)['interaction_arrays'] is None
+
+
+def test_routed_interaction_lanes():
+    """Test that routing places overlapping interactions in separate lanes, nested ones lower."""
+    import random
+    assert psv.assign_interaction_lanes([]) == []
+    assert psv.assign_interaction_lanes([(0, 2), (1, 3), (2, 4), (3, 5)]) == [0, 1, 2, 0]
+    assert psv.assign_interaction_lanes([(10, 0), (2, 5), (3, 4), (6, 9)]) == [2, 1, 0, 0]
+    rng = random.Random(0)
+    for trial in range(100):
+        intervals = [tuple(sorted((rng.randrange(20), rng.randrange(20)))) for _ in range(30)]
+        lanes = psv.assign_interaction_lanes(intervals)
+        for a, (start_a, end_a) in enumerate(intervals):
+            for b, (start_b, end_b) in enumerate(intervals):
+                if a != b and start_a <= end_b and start_b <= end_a:
+                    assert lanes[a] != lanes[b]
+                if start_b <= start_a and end_a <= end_b and (start_a, end_a) != (start_b, end_b):
+                    assert lanes[a] < lanes[b]
+    # Lanes are assigned separately on each side and raise the lines evenly
+    renderer = psv.GlyphRenderer()
+    part_list = [['CDS', 'forward', None, None] for _ in range(6)]
+    interaction_list = [[0, 2, 'control', None], [1, 3, 'degradation', None], [0, 5, 'process', None],
+                        [2, 4, 'inhibition', {'direction': 'reverse'}]]
+    layout = psv.layout_part_list(part_list, renderer, interaction_list=interaction_list,
+                                  route_interactions=True, lane_spacing=5.0)
+    assert [interaction['lane'] for interaction in layout['interactions']] == [0, 1, 2, 0]
+    line_heights = layout['interaction_arrays']['stems'][:, 1, 1].tolist()
+    assert abs(line_heights[1] - line_heights[0] - 5.0) < 1e-9
+    assert abs(line_heights[2] - line_heights[0] - 10.0) < 1e-9
+    assert line_heights[3] < 0
+    assert interaction_list[0][3] is None
+    unrouted = psv.layout_part_list(part_list, renderer, interaction_list=interaction_list)
+    assert 'lane' not in unrouted['interactions'][0]
+    assert unrouted['bounds'][1][1] < layout['bounds'][1][1]
+    construct = psv.Construct(part_list, renderer, interaction_list=interaction_list, route_interactions=True)
+    assert construct.layout['interactions'][2]['lane'] == 2
+    fig, ax, baseline_start, baseline_end, bounds = construct.draw()
+    assert tuple(bounds) == construct.bounds
+
+
+def test_label_layout():
+    """Test that labels laid out with the construct match drawn labels and extend its bounds."""
+    import matplotlib
+    import numpy as np
+    renderer = psv.GlyphRenderer()
+    # Fonts are shared by labels with the same userfont
+    first = renderer.process_label_params({'text': 'a', 'userfont': {'size': 9, 'family': ['serif']}},
+                                          [[psv.Path([(0, 0), (2, 4)])]])
+    second = renderer.process_label_params({'text': 'b', 'userfont': {'family': ['serif'], 'size': 9}},
+                                           [[psv.Path([(0, 0), (2, 4)])]])
+    assert first['fontproperties'] is second['fontproperties']
+    # Extents follow the fonts that generic family names resolve to
+    extent = psv.parasbolv._text_extent('gene', None, 0.0)
+    with matplotlib.rc_context({'font.family': 'sans-serif', 'font.sans-serif': ['DejaVu Sans Mono']}):
+        assert psv.parasbolv._text_extent('gene', None, 0.0) != extent
+    assert psv.parasbolv._text_extent('gene', None, 0.0) == extent
+    # Fonts and extents are kept in bounded caches
+    hits = psv.parasbolv._cached_text_extent.cache_info().hits
+    psv.parasbolv._text_extent('gene', None, 0.0)
+    assert psv.parasbolv._cached_text_extent.cache_info().hits == hits + 1
+    assert psv.parasbolv._cached_text_extent.cache_info().maxsize == psv.parasbolv.TEXT_EXTENT_CACHE_SIZE
+    assert psv.parasbolv._cached_font_properties.cache_info().maxsize == psv.parasbolv.FONT_CACHE_SIZE
+    assert (first['x'], first['y']) == (1, 2)
+    # Centroids of many glyphs at once match those of each glyph
+    glyph_vertices = [[np.array([[0, 0], [4, 0], [4, 2]])],
+                      [np.array([[0, 0], [2, 2]]), np.array([[10, 10], [10, 12], [12, 12]])]]
+    expected = [renderer.calculate_centroid_of_paths(paths) for paths in glyph_vertices]
+    assert np.allclose(psv.label_centroids(glyph_vertices), expected)
+    part_list = [['CDS', 'forward', {'label_parameters': {'text': 'gene', 'xy_skew': (0, 20)}}, None],
+                 ['Promoter', 'forward', None, None],
+                 ['CDS', 'reverse', {'label_parameters': {'text': 'x', 'rotation': 0.5}}, None]]
+    unlabelled = psv.layout_part_list(part_list, renderer)
+    layout = psv.layout_part_list(part_list, renderer, include_labels=True)
+    assert unlabelled['labels'] is None
+    assert [label['index'] for label in layout['labels']] == [0, 2]
+    assert layout['bounds'][1][1] > unlabelled['bounds'][1][1]
+    fig, ax, baseline_start, baseline_end, bounds = psv.render_part_list(part_list, renderer, include_labels=True)
+    assert len(ax.texts) == 2
+    fig.canvas.draw()
+    for text, label in zip(ax.texts, layout['labels']):
+        assert (text.get_position()) == (label['text_parameters']['x'], label['text_parameters']['y'])
+        drawn = ax.transData.inverted().transform(text.get_window_extent().get_points())
+        assert np.allclose(drawn, label['bounds'], atol=0.5)
+    plt.close(fig)
+
+
+def test_label_collision_avoidance():
+    """Test that placed labels do not overlap and moved labels get leader lines."""
+    renderer = psv.GlyphRenderer()
+    part_list = [['CDS', 'forward', {'width': 8, 'label_parameters': {'text': 'gene' + str(i), 'xy_skew': (0, 12)}}, None]
+                 for i in range(20)]
+    part_list[3][2]['label_parameters']['xy_skew'] = (0, -12)
+    unplaced = psv.layout_part_list(part_list, renderer, include_labels=True)
+    layout = psv.layout_part_list(part_list, renderer, avoid_label_collisions=True, label_leader_lines={'linewidth': 1})
+    labels = layout['labels']
+    assert [label['index'] for label in labels] == list(range(20))
+    assert any(label['tier'] > 0 for label in labels)
+    for a, label in enumerate(labels):
+        (x_min, y_min), (x_max, y_max) = label['bounds']
+        for other in labels[a+1:]:
+            (other_x_min, other_y_min), (other_x_max, other_y_max) = other['bounds']
+            assert x_max <= other_x_min or other_x_max <= x_min or y_max <= other_y_min or other_y_max <= y_min
+        moved = label['bounds'][0][1] - unplaced['labels'][a]['bounds'][0][1]
+        assert label['text_parameters']['y'] - unplaced['labels'][a]['text_parameters']['y'] == moved
+        if label['tier'] == 0:
+            assert moved == 0 and 'leader_line' not in label['label_parameters']
+        else:
+            assert (moved > 0) == (a != 3)
+            assert label['label_parameters']['leader_line'] == {'linewidth': 1, 'xy_skew': (0, 12 if a != 3 else -12)}
+    # The user's label parameters are unchanged
+    assert part_list[1][2]['label_parameters'] == {'text': 'gene1', 'xy_skew': (0, 12)}
+    fig, ax, baseline_start, baseline_end, bounds = psv.render_part_list(part_list, renderer, avoid_label_collisions=True,
+                                                                         label_leader_lines=True)
+    moved_labels = [label for label in labels if label['tier'] > 0]
+    assert len(ax.texts) == 20
+    assert len(ax.collections[-1].get_segments()) == len(moved_labels)
+    plt.close(fig)
+    # Labels placed by the layout can be drawn with draw_glyph
+    fig, ax = plt.subplots()
+    label = moved_labels[0]
+    user_parameters = dict(part_list[label['index']][2], label_parameters=label['label_parameters'])
+    renderer.draw_glyph(ax, 'CDS', layout['part_positions'][label['index']], user_parameters=user_parameters)
+    assert ax.texts[0].get_position() == (label['text_parameters']['x'], label['text_parameters']['y'])
+    line = ax.lines[0].get_xydata()
+    assert line[0][1] == label['text_parameters']['y'] - label['label_parameters']['xy_skew'][1] + 12
+    assert abs(line[1][1] - label['bounds'][0][1]) < 1e-6
+    plt.close(fig)
+
+
+def test_parameters_named_like_builtins(tmp_path):
+    """Test that glyph parameters with the name of a builtin are tracked like any other."""
+    with open(tmp_path / 'Builtin.svg', 'w') as f:
+        f.write('<svg xmlns="http://www.w3.org/2000/svg" xmlns:parametric="https://parametric-svg.github.io/v0.2" '
+                'glyphtype="Builtin" terms="" parametric:defaults="width=30;max=10">\n'
+                '<path class="filled-path" id="shape" parametric:d="M{0},{0} L{width},{-max} L{min(width, 5)},{0} Z" '
+                'd="" style="fill:none;stroke:black" />\n'
+                '</svg>\n')
+    renderer = psv.GlyphRenderer(glyph_path=str(tmp_path))
+    assert renderer.get_glyph_parameters('Builtin', dependencies=True) == {'shape': ['width', 'max']}
+    assert renderer.glyphs_library['Builtin']['paths'][0]['parametric_path'].parameters == ('width', 'max', 'min')
+    assert renderer.get_glyph_bounds('Builtin', (0, 0))[0][1][1] == 10
+    assert renderer.get_glyph_bounds('Builtin', (0, 0), user_parameters={'max': 20})[0][1][1] == 20
+    assert renderer.get_glyph_bounds('Builtin', (0, 0))[0][1][1] == 10
@@ -0,0 +1,244 @@
+import glob
+import os
+import random
+import re
+import numpy as np
+import pytest
+import matplotlib.transforms as transforms
+from matplotlib.path import Path
+import parasbolv as psv
+from parasbolv import svgpath2mpl
+from parasbolv.svgpath2mpl import parse_path, parse_tokens, endpoint_to_center
+
+
+# Reference implementation: the list based parser that parse_path replaced.
+
+REFERENCE_COMMAND_RE = re.compile("([MmZzLlHhVvCcSsQqTtAa])")
+
+def reference_parse_path(pathdef, current_pos=0 + 0j):
+    elements = []
+    for x in REFERENCE_COMMAND_RE.split(pathdef):
+        if x in svgpath2mpl.COMMANDS:
+            elements.append(x)
+        elements.extend(svgpath2mpl.FLOAT_RE.findall(x))
+    elements.reverse()
+
+    def next_pos():
+        return float(elements.pop()) + float(elements.pop()) * 1j
+
+    codes = []
+    verts = []
+    start_pos = None
+    command = None
+    while elements:
+        if elements[-1] in svgpath2mpl.COMMANDS:
+            last_command = command
+            command = elements.pop()
+            absolute = command in svgpath2mpl.UPPERCASE
+            command = command.upper()
+        else:
+            if command is None:
+                raise ValueError(pathdef)
+            last_command = command
+        if command == 'M':
+            pos = next_pos()
+            current_pos = pos if absolute else current_pos + pos
+            start_pos = current_pos
+            codes.append(Path.MOVETO)
+            verts.append((current_pos.real, current_pos.imag))
+            command = 'L'
+        elif command == 'Z':
+            if current_pos != start_pos:
+                codes.append(Path.LINETO)
+                verts.append((start_pos.real, start_pos.imag))
+            codes.append(Path.CLOSEPOLY)
+            verts.append((start_pos.real, start_pos.imag))
+            current_pos = start_pos
+            start_pos = None
+            command = None
+        elif command == 'L':
+            pos = next_pos()
+            if not absolute:
+                pos += current_pos
+            codes.append(Path.LINETO)
+            verts.append((pos.real, pos.imag))
+            current_pos = pos
+        elif command == 'H':
+            pos = float(elements.pop()) + current_pos.imag * 1j
+            if not absolute:
+                pos += current_pos.real
+            codes.append(Path.LINETO)
+            verts.append((pos.real, pos.imag))
+            current_pos = pos
+        elif command == 'V':
+            pos = current_pos.real + float(elements.pop()) * 1j
+            if not absolute:
+                pos += current_pos.imag * 1j
+            codes.append(Path.LINETO)
+            verts.append((pos.real, pos.imag))
+            current_pos = pos
+        elif command in 'CS':
+            if command == 'C':
+                control1 = next_pos()
+                if not absolute:
+                    control1 += current_pos
+            elif last_command not in 'CS':
+                control1 = current_pos
+            else:
+                control1 = current_pos + current_pos - control2
+            control2 = next_pos()
+            end = next_pos()
+            if not absolute:
+                control2 += current_pos
+                end += current_pos
+            codes.extend([Path.CURVE4] * 3)
+            verts.extend([(p.real, p.imag) for p in (control1, control2, end)])
+            current_pos = end
+        elif command in 'QT':
+            if command == 'Q':
+                control = next_pos()
+                if not absolute:
+                    control += current_pos
+            elif last_command not in 'QT':
+                control = current_pos
+            else:
+                control = current_pos + current_pos - control
+            end = next_pos()
+            if not absolute:
+                end += current_pos
+            codes.extend([Path.CURVE3] * 2)
+            verts.extend([(p.real, p.imag) for p in (control, end)])
+            current_pos = end
+        elif command == 'A':
+            radius = next_pos()
+            rotation = float(elements.pop())
+            large = float(elements.pop())
+            sweep = float(elements.pop())
+            end = next_pos()
+            if not absolute:
+                end += current_pos
+            center, theta1, theta2 = endpoint_to_center(current_pos, radius, rotation,
+                                                        large, sweep, end)
+            arc = Path.arc(theta1=min(theta1, theta2), theta2=max(theta1, theta2))
+            trans = (transforms.Affine2D()
+                     .scale(radius.real, radius.imag)
+                     .translate(center.real, center.imag)
+                     .rotate_deg_around(center.real, center.imag, rotation))
+            arc = trans.transform_path(arc)
+            skip = 1 if sweep else 0
+            codes.extend(arc.codes[skip:])
+            verts.extend(arc.vertices[skip:])
+            current_pos = end
+    return Path(verts, codes)
+
+
+def random_number(rng):
+    value = rng.choice([rng.uniform(-50, 50), float(rng.randint(-20, 20)), rng.uniform(0, 1)])
+    style = rng.randrange(4)
+    if style == 0:
+        return repr(value)
+    if style == 1:
+        return f'{value:.3f}'
+    if style == 2:
+        return f'{value:.2e}'
+    return f'{value:g}'
+
+
+def random_pathdef(rng, n_commands=12):
+    separators = [' ', ',', ', ', '  ']
+    parts = ['M', random_number(rng), ',', random_number(rng)]
+    after_close = False
+    for _ in range(n_commands):
+        if after_close:
+            command = rng.choice('Mm')
+        else:
+            command = rng.choice('LlHhVvCcSsQqTtAaZzMm')
+        after_close = command in 'Zz'
+        parts.append(command)
+        if command in 'Aa':
+            for _ in range(rng.randint(1, 2)):
+                parts.extend([f'{rng.uniform(1, 20):.2f}', ' ', f'{rng.uniform(1, 20):.2f}', ' ',
+                              f'{rng.uniform(-90, 90):.1f}', ' ', str(rng.randint(0, 1)), ' ',
+                              str(rng.randint(0, 1)), ' ',
+                              random_number(rng), ' ', random_number(rng), ' '])
+            continue
+        n_params = {'Z': 0, 'H': 1, 'V': 1, 'M': 2, 'L': 2, 'T': 2, 'Q': 4, 'S': 4, 'C': 6}[command.upper()]
+        if n_params == 0:
+            continue
+        # Repeat the arguments to exercise implicit commands
+        for _ in range(rng.randint(1, 3)):
+            for _ in range(n_params):
+                parts.extend([random_number(rng), rng.choice(separators)])
+    return ''.join(parts)
+
+
+def assert_paths_equal(result, expected):
+    assert np.array_equal(result.codes, expected.codes)
+    assert np.allclose(result.vertices, expected.vertices, rtol=1e-12, atol=1e-9, equal_nan=True)
+
+
+def test_packaged_glyph_paths_match_reference():
+    """Test that every packaged glyph path parses to the same Path as the reference parser."""
+    renderer = psv.GlyphRenderer()
+    n_paths = 0
+    for glyph in renderer.glyphs_library.values():
+        for path in glyph['paths']:
+            pathdef = path['parametric_path'].svg_text(dict(glyph['defaults']))
+            assert_paths_equal(parse_path(pathdef), reference_parse_path(pathdef))
+            n_paths += 1
+    assert n_paths > 50
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_random_paths_match_reference(seed):
+    """Test that randomized paths with every command parse to the same Path as the reference parser."""
+    rng = random.Random(seed)
+    for _ in range(25):
+        pathdef = random_pathdef(rng)
+        tokens = svgpath2mpl._tokenize_path(pathdef)
+        tokens = [token if token in svgpath2mpl.COMMANDS else float(token) for token in tokens]
+        try:
+            expected = reference_parse_path(pathdef)
+        except ZeroDivisionError:
+            # Arcs ending where they start are undefined for both parsers
+            with pytest.raises(ZeroDivisionError):
+                parse_path(pathdef)
+            continue
+        assert_paths_equal(parse_path(pathdef), expected)
+        assert_paths_equal(parse_tokens(tokens), expected)
+
+
+def test_parse_path_arrays_and_errors():
+    """Test the array types of parsed paths, relative starting positions and invalid paths."""
+    path = parse_path('m1,2 l3,4 h1 v-1 z', current_pos=10 + 10j)
+    assert path.vertices.dtype == np.float64
+    assert path.codes.dtype == np.uint8
+    assert np.array_equal(path.vertices, [[11, 12], [14, 16], [15, 16], [15, 15], [11, 12], [11, 12]])
+    with pytest.raises(ValueError):
+        parse_path('1,2 L3,4')
+    with pytest.raises(ValueError):
+        parse_path('M0,0 L1,1 Z 3,4')
+
+
+def test_unit_arc_matches_matplotlib():
+    """Test that the cached unit arcs match Path.arc and cannot be modified."""
+    for theta1, theta2 in [(0, 10), (-30, 60), (45, 200), (170, 529.5), (-90, 269.9)]:
+        vertices = svgpath2mpl._unit_arc(theta1, theta2)
+        assert np.allclose(vertices, Path.arc(theta1, theta2).vertices, rtol=0, atol=1e-12)
+        assert not vertices.flags.writeable
+    assert svgpath2mpl._unit_arc(0, 10) is svgpath2mpl._unit_arc(0, 10)
+
+
+def test_parse_path_cache():
+    """Test that repeated path data shares one read-only Path and is counted in the cache statistics."""
+    svgpath2mpl.cache_clear()
+    path = parse_path('M0,0 L10,10 z')
+    assert parse_path('M0,0 L10,10 z') is path
+    assert parse_tokens(['M', 0.0, 0.0, 'L', 10.0, 10.0, 'z']) is parse_tokens(('M', 0, 0, 'L', 10, 10, 'z'))
+    assert parse_path('M0,0 L10,10 z', current_pos=1 + 1j) is not path
+    with pytest.raises(ValueError):
+        path.vertices[0, 0] = 5.0
+    info = svgpath2mpl.cache_info()
+    assert (info['hits'], info['misses'], info['size']) == (2, 3, 3)
+    svgpath2mpl.cache_clear()
+    assert svgpath2mpl.cache_info()['size'] == 0